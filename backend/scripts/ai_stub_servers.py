@@ -0,0 +1,536 @@
+"""
+XplorED - Offline AI Stub Servers
+
+This script runs local stand-ins for the Mistral chat completions API and
+the ElevenLabs text-to-speech API, so the backend can be exercised and
+load-tested without network access or API credits.
+
+Features:
+- Mistral Stub: OpenAI-style ``/v1/chat/completions`` with ``usage``, plain
+  and streamed (SSE) responses; every prompt family in
+  ``features/ai/prompts`` is recognised and answered with content in the
+  shape its caller parses (exercise blocks, quality scores, batch reviews,
+  word analyses, ...)
+- ElevenLabs Stub: ``/v1/text-to-speech/<voice_id>`` returning MP3-framed
+  bytes sized by the text, plus ``/v1/voices``
+- Latency Models: ``fixed:S``, ``uniform:MIN,MAX`` or ``lognormal:MEDIAN,SIGMA``
+  (seconds), globally or per prompt family
+- Fault Injection: a configurable share of requests fails with 503 or 429
+  (``Retry-After: 1``)
+- Counters: ``GET /__stats`` on either server reports requests, errors and
+  prompt families served
+
+Point the backend at the stubs with:
+    MISTRAL_API_URL=http://127.0.0.1:8081/v1/chat/completions
+    ELEVENLABS_BASE_URL=http://127.0.0.1:8082
+    ELEVENLABS_API_KEY=stub
+
+Usage:
+    python scripts/ai_stub_servers.py
+    python scripts/ai_stub_servers.py --mistral-latency lognormal:0.8,0.5 --mistral-error-rate 0.02
+    python scripts/ai_stub_servers.py --family-latency exercise_generation=lognormal:4,0.4
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# === Latency And Fault Profiles ===
+class LatencyModel:
+    """Samples response delays from a named distribution."""
+
+    def __init__(self, spec: str = "fixed:0"):
+        """
+        Parse a latency spec.
+
+        Args:
+            spec: ``fixed:S``, ``uniform:MIN,MAX`` or ``lognormal:MEDIAN,SIGMA`` (seconds)
+
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        self.spec = spec
+        kind, _, raw = spec.partition(":")
+        try:
+            values = [float(value) for value in raw.split(",")] if raw else []
+        except ValueError:
+            raise ValueError(f"Invalid latency spec: {spec}")
+        expected = {"fixed": 1, "uniform": 2, "lognormal": 2}
+        if kind not in expected or len(values) != expected[kind]:
+            raise ValueError(f"Invalid latency spec: {spec}")
+        self.kind = kind
+        self.values = values
+
+    def sample(self, rng: random.Random) -> float:
+        """Return one delay in seconds."""
+        if self.kind == "fixed":
+            return max(0.0, self.values[0])
+        if self.kind == "uniform":
+            return rng.uniform(*self.values)
+        median, sigma = self.values
+        return rng.lognormvariate(math.log(max(median, 1e-6)), sigma)
+
+
+class StubProfile:
+    """Latency and fault settings of one stub server."""
+
+    def __init__(
+        self,
+        latency: str = "fixed:0",
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        family_latency: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the profile.
+
+        Args:
+            latency: Default latency spec
+            error_rate: Share of requests (0-1) answered with ``error_status``
+            error_status: 503 or 429
+            family_latency: Latency specs overriding the default per prompt family
+        """
+        self.latency = LatencyModel(latency)
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.family_latency = {name: LatencyModel(spec) for name, spec in (family_latency or {}).items()}
+
+    def delay(self, family: str, rng: random.Random) -> float:
+        return self.family_latency.get(family, self.latency).sample(rng)
+
+
+class StubStats:
+    """Thread-safe request counters of one stub server."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {"requests": 0, "errors": 0}
+        self._families: Dict[str, int] = {}
+
+    def record(self, family: str, error: bool) -> None:
+        with self._lock:
+            self._counts["requests"] += 1
+            if error:
+                self._counts["errors"] += 1
+            self._families[family] = self._families.get(family, 0) + 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {**self._counts, "families": dict(self._families)}
+
+
+# === Mistral Prompt Families ===
+NOUNS = [
+    "den Apfel", "das Buch", "den Kaffee", "die Zeitung", "das Fahrrad", "den Hund",
+    "die Suppe", "das Auto", "den Brief", "die Jacke", "das Brot", "den Tee",
+    "die Blume", "das Geschenk", "den Film", "die Musik", "das Wasser", "den Kuchen",
+]
+TOPICS = ["food", "family", "travel", "work", "hobbies", "shopping", "weather", "sports", "living"]
+SENTENCES = [
+    ("I have a dog.", "Ich habe einen Hund."),
+    ("We are going to the cinema today.", "Wir gehen heute ins Kino."),
+    ("She drinks coffee every morning.", "Sie trinkt jeden Morgen Kaffee."),
+    ("The weather is nice.", "Das Wetter ist schön."),
+    ("My brother works in Berlin.", "Mein Bruder arbeitet in Berlin."),
+]
+
+
+def _quoted(content: str, label: str) -> str:
+    """Return the value of ``label: 'value'`` (or ``"value"``) in a prompt, or ''."""
+    match = re.search(rf"{label}:\s*['\"](.*?)['\"]\s*$", content, re.MULTILINE)
+    return match.group(1) if match else ""
+
+
+def _exercise_block(content: str, rng: random.Random) -> str:
+    topic = rng.choice(TOPICS)
+    objects = rng.sample(NOUNS, 3)
+    english, german = rng.choice(SENTENCES)
+    block = {
+        "lessonId": f"stub-{uuid.uuid4().hex[:8]}",
+        "title": f"Building confidence in present tense and accusative case in the context of {topic.title()}",
+        "level": "A2",
+        "topic": topic,
+        "exercises": [
+            {
+                "id": "ex1",
+                "type": "gap-fill",
+                "question": f"Ich ____ heute {objects[0]}.",
+                "options": ["kaufe", "kaufst", "kauft", "kaufen"],
+                "correctAnswer": "kaufe",
+            },
+            {
+                "id": "ex2",
+                "type": "translation",
+                "question": f"Translate: {english}",
+                "correctAnswer": german,
+            },
+            {
+                "id": "ex3",
+                "type": "gap-fill",
+                "question": f"Wir ____ {objects[1]} und {objects[2]}.",
+                "options": ["brauchen", "braucht", "brauche", "brauchst"],
+                "correctAnswer": "brauchen",
+            },
+        ],
+        "feedbackPrompt": "Give short, encouraging feedback on present tense and accusative case.",
+    }
+    return json.dumps(block, ensure_ascii=False)
+
+
+def _quality_scores(content: str, rng: random.Random) -> str:
+    topics_line = re.search(r"^Topics:\s*(.*)$", content, re.MULTILINE)
+    topics = [t.strip().lower() for t in topics_line.group(1).split(",") if t.strip()] if topics_line else []
+    matches = _quoted(content, "Reference answer").lower() == _quoted(content, "Student answer").lower()
+    return json.dumps({topic: 5 if matches else rng.randint(1, 3) for topic in topics or ["grammar"]})
+
+
+def _batch_review(content: str, rng: random.Random) -> str:
+    _, _, raw_items = content.partition("Exercises:\n")
+    try:
+        items = json.loads(raw_items.strip())
+    except ValueError:
+        items = []
+    fields = [field for field in ("qualities", "alternatives", "explanation") if f'"{field}":' in content]
+    review = {}
+    for item in items:
+        entry: Dict = {}
+        if "qualities" in fields:
+            correct = str(item.get("student", "")).lower() == str(item.get("reference", "")).lower()
+            entry["qualities"] = {"present tense": 5 if correct else 2, "word order": 5 if correct else 3}
+        if "alternatives" in fields:
+            entry["alternatives"] = [f"{item.get('correct_answer', '')}".strip() or "Das stimmt."]
+        if "explanation" in fields:
+            entry["explanation"] = "The verb agrees with the subject and the object takes the accusative case."
+        review[str(item.get("id"))] = entry
+    return json.dumps(review, ensure_ascii=False)
+
+
+def _reading_exercise(content: str, rng: random.Random) -> str:
+    return json.dumps({
+        "text": "Anna wohnt in Hamburg. Sie arbeitet in einem Café.\n\nAm Wochenende fährt sie gern Fahrrad.",
+        "questions": [
+            {"id": "q1", "question": "Wo wohnt Anna?", "options": ["Hamburg", "Berlin", "München", "Köln"], "correctAnswer": "Hamburg"},
+            {"id": "q2", "question": "Wo arbeitet Anna?", "options": ["Im Café", "Im Büro", "In der Schule", "Im Hotel"], "correctAnswer": "Im Café"},
+            {"id": "q3", "question": "Was macht sie am Wochenende?", "options": ["Fahrrad fahren", "Kochen", "Lesen", "Schwimmen"], "correctAnswer": "Fahrrad fahren"},
+        ],
+    }, ensure_ascii=False)
+
+
+def _word_analysis(content: str, rng: random.Random) -> str:
+    word = _quoted(content, "Analyze this German word") or "Hund"
+    noun = word[:1].isupper()
+    return json.dumps({
+        "base_form": word,
+        "type": "noun" if noun else "verb",
+        "article": "der" if noun else None,
+        "translation": "stub translation",
+        "info": "Stub analysis",
+    }, ensure_ascii=False)
+
+
+# (family, marker in the last user message, content builder); first match wins
+PROMPT_FAMILIES: List[Tuple[str, str, Callable[[str, random.Random], str]]] = [
+    ("batch_review", "You are reviewing several German exercises at once", _batch_review),
+    ("exercise_generation", "You are generating structured grammar and translation exercises", _exercise_block),
+    ("quality_evaluation", "grading a student's", _quality_scores),
+    ("translation_evaluation", "Evaluate this German translation",
+     lambda c, rng: json.dumps({"correct": rng.random() < 0.7, "reason": "Word order and verb form checked."})),
+    ("topic_detection", "identify the grammar topics present",
+     lambda c, rng: json.dumps(["present tense", "accusative case"])),
+    ("alternative_answers", "alternative ways to say",
+     lambda c, rng: json.dumps(["Das ist auch richtig.", "So kann man es ebenfalls sagen."], ensure_ascii=False)),
+    ("explanation", "give a very short grammar or vocabulary explanation",
+     lambda c, rng: "The verb is conjugated for the subject, and the direct object is in the accusative case."),
+    ("feedback", "providing feedback on an exercise",
+     lambda c, rng: "Great effort! Your verb forms are solid. Keep practising the accusative articles."),
+    ("weakness_lesson", "Create a short HTML lesson",
+     lambda c, rng: "<h2>Accusative case</h2><p>The direct object takes the accusative: <em>den</em>, <em>die</em>, <em>das</em>.</p>"),
+    ("reading_exercise", "Return JSON with keys 'text', 'questions'", _reading_exercise),
+    ("reading_explanation", "Explain in one short sentence",
+     lambda c, rng: "The text says she lives in Hamburg."),
+    ("game_sentence", "Create one short (max 8 words) German sentence",
+     lambda c, rng: rng.choice([german for _, german in SENTENCES])),
+    ("word_translation", "Translate the German word", lambda c, rng: "dog"),
+    ("word_analysis", "Analyze this German word", _word_analysis),
+    ("sentence_translation", "Translate this", lambda c, rng: rng.choice([german for _, german in SENTENCES])),
+]
+
+
+def classify_prompt(messages: List[Dict]) -> Tuple[str, Callable[[str, random.Random], str], str]:
+    """Return (family, builder, last user content) for a chat request."""
+    content = ""
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            content = str(message.get("content", ""))
+            break
+    for family, marker, builder in PROMPT_FAMILIES:
+        if marker in content:
+            return family, builder, content
+    return "chat", lambda c, rng: (
+        "**Stub answer.** Here is a short overview:\n\n- Practise a little every day\n- Review your weak topics"
+    ), content
+
+
+# === HTTP Handlers ===
+class _StubHandler(BaseHTTPRequestHandler):
+    """Shared plumbing: JSON bodies, delays, fault injection and ``/__stats``."""
+
+    protocol_version = "HTTP/1.1"
+    profile: StubProfile
+    stats: StubStats
+    rng: random.Random
+
+    def log_message(self, *args) -> None:  # noqa: D401 - silence per-request logs
+        pass
+
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(raw or b"{}")
+        except ValueError:
+            return {}
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json", headers: Optional[Dict] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        try:
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up (timeout or cancellation) while we were "thinking"
+            self.close_connection = True
+
+    def _simulate(self, family: str) -> bool:
+        """Sleep for the family's latency; answer with an injected error if drawn. Returns True if it did."""
+        time.sleep(self.profile.delay(family, self.rng))
+        failed = self.rng.random() < self.profile.error_rate
+        self.stats.record(family, failed)
+        if failed:
+            headers = {"Retry-After": "1"} if self.profile.error_status == 429 else None
+            body = json.dumps({"object": "error", "message": "stub injected failure", "type": "stub_error"}).encode()
+            self._send(self.profile.error_status, body, headers=headers)
+        return failed
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/__stats"):
+            self._send(200, json.dumps(self.stats.snapshot()).encode())
+            return
+        self._send(404, b'{"detail": "not found"}')
+
+
+class MistralStubHandler(_StubHandler):
+    """Answers chat completions in the shape each prompt family expects."""
+
+    def do_POST(self) -> None:
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send(404, b'{"detail": "not found"}')
+            return
+        payload = self._read_json()
+        messages = payload.get("messages") or []
+        family, builder, content = classify_prompt(messages)
+        if self._simulate(family):
+            return
+
+        answer = builder(content, self.rng)
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4
+        completion_tokens = max(1, len(answer) // 4)
+        if payload.get("stream"):
+            self._stream(payload, answer)
+            return
+
+        body = {
+            "id": f"stub-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": answer}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+        self._send(200, json.dumps(body, ensure_ascii=False).encode("utf-8"))
+
+    def _stream(self, payload: Dict, answer: str) -> None:
+        """Send the answer as SSE deltas of a few words each, then ``[DONE]``."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        words = answer.split(" ")
+        for start in range(0, len(words), 3):
+            piece = " ".join(words[start:start + 3]) + (" " if start + 3 < len(words) else "")
+            chunk = {
+                "id": "stub-stream",
+                "object": "chat.completion.chunk",
+                "model": payload.get("model", "stub"),
+                "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            time.sleep(0.01)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+
+# A valid MPEG-1 Layer III frame header (128 kbps, 44.1 kHz) padded to its 417-byte frame size
+MP3_FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+
+
+class ElevenLabsStubHandler(_StubHandler):
+    """Answers text-to-speech and voice listing requests."""
+
+    def do_POST(self) -> None:
+        if not self.path.startswith("/v1/text-to-speech/"):
+            self._send(404, b'{"detail": "not found"}')
+            return
+        text = str(self._read_json().get("text", ""))
+        if self._simulate("tts"):
+            return
+        # Roughly one frame (~26 ms of audio) per two characters
+        audio = b"ID3\x03\x00\x00\x00\x00\x00\x00" + MP3_FRAME * max(1, len(text) // 2)
+        self._send(200, audio, content_type="audio/mpeg")
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/v1/voices"):
+            voice = {"voice_id": "JBFqnCBsd6RMkjVDRZzb", "name": "Stub Voice", "category": "premade"}
+            body = voice if self.path.rstrip("/") != "/v1/voices" else {"voices": [voice]}
+            self._send(200, json.dumps(body).encode())
+            return
+        super().do_GET()
+
+
+# === Server Management ===
+class StubServers:
+    """Both stub servers, running on background threads."""
+
+    def __init__(self, mistral: ThreadingHTTPServer, tts: ThreadingHTTPServer):
+        self.mistral = mistral
+        self.tts = tts
+        for server in (mistral, tts):
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    @property
+    def mistral_url(self) -> str:
+        """Value for ``MISTRAL_API_URL``."""
+        return f"http://127.0.0.1:{self.mistral.server_port}/v1/chat/completions"
+
+    @property
+    def tts_url(self) -> str:
+        """Value for ``ELEVENLABS_BASE_URL``."""
+        return f"http://127.0.0.1:{self.tts.server_port}"
+
+    def stats(self) -> Dict[str, Dict]:
+        return {
+            "mistral": self.mistral.RequestHandlerClass.stats.snapshot(),
+            "tts": self.tts.RequestHandlerClass.stats.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        for server in (self.mistral, self.tts):
+            server.shutdown()
+            server.server_close()
+
+
+def _make_server(handler: type, port: int, profile: StubProfile, seed: Optional[int]) -> ThreadingHTTPServer:
+    """Bind a server whose handler class carries its own profile, counters and RNG."""
+    bound = type(handler.__name__, (handler,), {
+        "profile": profile,
+        "stats": StubStats(),
+        "rng": random.Random(seed),
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), bound)
+    server.daemon_threads = True
+    return server
+
+
+def start_stub_servers(
+    mistral_port: int = 0,
+    tts_port: int = 0,
+    mistral_profile: Optional[StubProfile] = None,
+    tts_profile: Optional[StubProfile] = None,
+    seed: Optional[int] = None,
+) -> StubServers:
+    """
+    Start the Mistral and ElevenLabs stubs in this process.
+
+    Args:
+        mistral_port: Port of the Mistral stub (0 picks a free one)
+        tts_port: Port of the ElevenLabs stub (0 picks a free one)
+        mistral_profile: Latency and faults of the Mistral stub
+        tts_profile: Latency and faults of the ElevenLabs stub
+        seed: Seed for reproducible latencies, faults and content
+
+    Returns:
+        StubServers: The running servers and their URLs
+    """
+    return StubServers(
+        _make_server(MistralStubHandler, mistral_port, mistral_profile or StubProfile(), seed),
+        _make_server(ElevenLabsStubHandler, tts_port, tts_profile or StubProfile(), seed),
+    )
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the latency and fault options (shared with scripts/load_test.py)."""
+    parser.add_argument("--mistral-latency", default="lognormal:0.8,0.5", help="Mistral latency spec")
+    parser.add_argument("--mistral-error-rate", type=float, default=0.0, help="Share of failing Mistral calls")
+    parser.add_argument("--mistral-error-status", type=int, choices=(429, 503), default=503)
+    parser.add_argument(
+        "--family-latency", action="append", default=[], metavar="FAMILY=SPEC",
+        help="Latency spec for one prompt family, e.g. exercise_generation=lognormal:4,0.4",
+    )
+    parser.add_argument("--tts-latency", default="lognormal:0.4,0.3", help="ElevenLabs latency spec")
+    parser.add_argument("--tts-error-rate", type=float, default=0.0, help="Share of failing TTS calls")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible runs")
+
+
+def profiles_from_args(args: argparse.Namespace) -> Tuple[StubProfile, StubProfile]:
+    """Build the (mistral, tts) profiles from parsed ``add_stub_arguments`` options."""
+    family_latency = {}
+    for item in args.family_latency:
+        family, _, spec = item.partition("=")
+        family_latency[family.strip()] = spec.strip()
+    mistral = StubProfile(args.mistral_latency, args.mistral_error_rate, args.mistral_error_status, family_latency)
+    tts = StubProfile(args.tts_latency, args.tts_error_rate)
+    return mistral, tts
+
+
+# === Main Entry Point ===
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run offline Mistral and ElevenLabs stub servers.")
+    parser.add_argument("--mistral-port", type=int, default=8081)
+    parser.add_argument("--tts-port", type=int, default=8082)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    mistral_profile, tts_profile = profiles_from_args(args)
+    servers = start_stub_servers(args.mistral_port, args.tts_port, mistral_profile, tts_profile, args.seed)
+    print(f"MISTRAL_API_URL={servers.mistral_url}")
+    print(f"ELEVENLABS_BASE_URL={servers.tts_url}")
+    print("ELEVENLABS_API_KEY=stub")
+    print("Stub servers running, press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(json.dumps(servers.stats(), indent=2))
+        servers.shutdown()
+
+
+if __name__ == "__main__":
+    main()
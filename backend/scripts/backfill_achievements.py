@@ -0,0 +1,61 @@
+"""
+XplorED - Achievement Backfill
+
+This script evaluates every achievement rule for existing users and records
+the unlocked achievements in the ``user_achievements`` ledger.
+
+Features:
+- Full Backfill: Evaluate every user in the users table
+- Single User: Evaluate one user with --user
+- Idempotent: Achievements already in the ledger are kept, never duplicated
+
+Usage:
+    DB_FILE=database/user_data.db python scripts/backfill_achievements.py
+    python scripts/backfill_achievements.py --user alice
+
+migration_script.py runs it once right after the user_achievements migration
+has been applied. Run it again by hand whenever a new rule is added; the game,
+vocabulary and lesson write paths keep the ledger current afterwards.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+# Add src to path for imports (see migration_script.py)
+if os.path.exists("/app/src"):
+    sys.path.insert(0, "/app/src")
+else:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config.logging_config import setup_logging
+import logging
+
+setup_logging(log_level="INFO")
+logger = logging.getLogger(__name__)
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the backfill and return the process exit code."""
+    parser = argparse.ArgumentParser(description="Fill the user_achievements ledger.")
+    parser.add_argument("--user", default=None, help="Only evaluate this username")
+    args = parser.parse_args(argv)
+
+    from core.services.achievement_service import AchievementService
+
+    try:
+        written = AchievementService.backfill(args.user)
+    except Exception as e:
+        logger.error(f"❌ Achievement backfill failed: {e}")
+        return 1
+
+    logger.info(f"✅ Recorded {written} achievements")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+XplorED - Daily Activity Backfill
+
+This script rebuilds the ``user_daily_activity`` rollup from the raw progress
+tables (lesson_progress, activity_progress, vocabulary_progress, game_progress).
+
+Features:
+- Full Rebuild: Recompute every user's daily rows
+- Single User: Recompute one user with --user
+- Idempotent: Existing rollup rows are replaced, never double counted
+
+Usage:
+    DB_FILE=database/user_data.db python scripts/backfill_daily_activity.py
+    python scripts/backfill_daily_activity.py --user alice
+
+migration_script.py runs it once right after the user_daily_activity
+migration has been applied; the progress write paths keep the rollup current
+afterwards. Run it by hand to repair the rollup.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+# Add src to path for imports (see migration_script.py)
+if os.path.exists("/app/src"):
+    sys.path.insert(0, "/app/src")
+else:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config.logging_config import setup_logging
+import logging
+
+setup_logging(log_level="INFO")
+logger = logging.getLogger(__name__)
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the backfill and return the process exit code."""
+    parser = argparse.ArgumentParser(description="Rebuild the user_daily_activity rollup.")
+    parser.add_argument("--user", default=None, help="Only rebuild this username")
+    args = parser.parse_args(argv)
+
+    from core.services.daily_activity_service import DailyActivityService
+
+    try:
+        written = DailyActivityService.backfill(args.user)
+    except Exception as e:
+        logger.error(f"❌ Daily activity backfill failed: {e}")
+        return 1
+
+    logger.info(f"✅ Wrote {written} daily activity rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
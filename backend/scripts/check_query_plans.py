@@ -0,0 +1,300 @@
+"""
+XplorED - Query Plan Checker
+
+This script runs ``EXPLAIN QUERY PLAN`` over a registry of the application's
+hot-path queries and flags any full table scan.
+
+Features:
+- Query Registry: The real per-user lookups issued by the backend
+- Shared SQL: Queries kept as module constants are imported from the app, so
+  the checker explains exactly what the app runs
+- Plan Inspection: Detects full table scans and temporary sort B-trees
+- CI Friendly: Exits with status 1 when any registered query scans a table
+
+Usage:
+    DB_FILE=database/user_data.db python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --db /path/to/user_data.db --verbose
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+QueryEntry = Tuple[str, str, str, Tuple[Any, ...]]
+
+# === Query Registry ===
+# (name, source, sql, params) - keep in sync with the queries issued by the app.
+# Queries built through the generic helpers live here; queries the app keeps as
+# constants are imported by load_app_queries() instead.
+QUERY_REGISTRY: List[QueryEntry] = [
+    (
+        "vocab_due_for_review",
+        "core/services/vocabulary_service.py",
+        "SELECT rowid AS id, vocab, translation, next_review FROM vocab_log "
+        "WHERE username = ? AND next_review_at <= ? ORDER BY next_review_at ASC LIMIT 20",
+        ("user", 1700000000),
+    ),
+    (
+        "vocab_lookup_by_word",
+        "features/ai/memory/vocabulary_memory.py",
+        "SELECT ef, repetitions, interval_days FROM vocab_log WHERE username = ? AND vocab = ?",
+        ("user", "Haus"),
+    ),
+    (
+        "topic_memory_by_grammar",
+        "features/ai/evaluation/topic_memory.py",
+        "SELECT * FROM topic_memory WHERE username = ? AND grammar = ? LIMIT 1",
+        ("user", "dative case"),
+    ),
+    (
+        "topic_memory_due_queue",
+        "core/database/connection.py",
+        "SELECT * FROM topic_memory WHERE username = ? AND next_repeat_at <= ? "
+        "ORDER BY next_repeat_at ASC LIMIT 20",
+        ("user", 1700000000),
+    ),
+    (
+        "topic_memory_level_progress",
+        "features/ai/memory/level_manager.py",
+        "SELECT DISTINCT grammar FROM topic_memory "
+        "WHERE username = ? AND grammar IN (?, ?, ?) AND quality >= 4",
+        ("user", "nominative case", "present tense", "question words"),
+    ),
+    (
+        "lesson_progress_blocks",
+        "features/lessons/lesson_progress.py",
+        "SELECT block_id, completed FROM lesson_progress WHERE user_id = ? AND lesson_id = ?",
+        ("user", 1),
+    ),
+    (
+        "lesson_progress_by_lesson",
+        "api/routes/lessons.py",
+        "SELECT block_id, completed, updated_at FROM lesson_progress "
+        "WHERE user_id = ? AND lesson_id = ? ORDER BY block_id ASC",
+        ("user", 1),
+    ),
+    (
+        "lesson_rollup_by_lesson",
+        "features/admin/lesson_management.py",
+        "SELECT user_id, completed_blocks FROM lesson_completion_rollup "
+        "WHERE lesson_id = ? AND completed_blocks > 0 ORDER BY user_id",
+        (1,),
+    ),
+    (
+        "game_stats_by_user",
+        "core/services/game_stats_service.py",
+        "SELECT total_rounds, correct_answers, current_streak, best_streak FROM user_game_stats WHERE username = ?",
+        ("user",),
+    ),
+    (
+        "game_level_stats_by_user",
+        "core/services/game_stats_service.py",
+        "SELECT level, total_rounds, correct_answers FROM user_game_level_stats WHERE username = ? ORDER BY level ASC",
+        ("user",),
+    ),
+    (
+        "results_recent_window",
+        "core/services/game_stats_service.py",
+        "SELECT correct, timestamp FROM results WHERE username = ? ORDER BY timestamp DESC LIMIT 40",
+        ("user",),
+    ),
+    (
+        "results_streak_window",
+        "core/services/achievement_service.py",
+        "SELECT MAX(timestamp) AS unlocked_at FROM results WHERE username = ? AND timestamp >= date('now', ?) "
+        "HAVING COUNT(DISTINCT DATE(timestamp)) >= ?",
+        ("user", "-6 days", 7),
+    ),
+    (
+        "achievements_by_user",
+        "core/services/achievement_service.py",
+        "SELECT achievement_id, unlocked_at FROM user_achievements WHERE username = ? ORDER BY unlocked_at DESC",
+        ("user",),
+    ),
+    (
+        "activity_progress_window",
+        "features/progress/progress_analytics.py",
+        "SELECT * FROM activity_progress "
+        "WHERE username = ? AND activity_type = 'exercise' AND completed_at >= ?",
+        ("user", "2024-01-01"),
+    ),
+    (
+        "daily_activity_range",
+        "core/services/daily_activity_service.py",
+        "SELECT * FROM user_daily_activity WHERE username = ? AND activity_date >= ? ORDER BY activity_date ASC",
+        ("user", "2024-01-01"),
+    ),
+    (
+        "session_lookup",
+        "core/session/session_backends.py",
+        "SELECT username, expires_at FROM sessions "
+        "WHERE session_id = ? AND (expires_at IS NULL OR expires_at > ?)",
+        ("session", 1700000000),
+    ),
+    (
+        "sessions_expired",
+        "core/session/session_backends.py",
+        "SELECT COUNT(*) as count FROM sessions WHERE expires_at <= ?",
+        (1700000000,),
+    ),
+    (
+        "sessions_by_user",
+        "core/session/session_backends.py",
+        "SELECT session_id FROM sessions WHERE username = ?",
+        ("user",),
+    ),
+]
+
+
+
+def load_app_queries() -> List[QueryEntry]:
+    """
+    Build registry entries from the SQL constants of the modules that run them.
+
+    DB_FILE must be set before calling, since importing the app connects to it.
+
+    Returns:
+        Registry entries for the catalog page, exercise pool pick and job claim
+    """
+    if str(SRC_DIR) not in sys.path:
+        sys.path.insert(0, str(SRC_DIR))
+
+    from core.processing.job_queue import CLAIM_QUERY
+    from core.services.lesson_catalog_service import LessonCatalogService
+    from features.ai.generation.exercise_pool import PICK_QUERY
+
+    return [
+        (
+            "lesson_catalog_page",
+            "core/services/lesson_catalog_service.py",
+            LessonCatalogService.build_page_query(
+                "(target_user IS NULL OR target_user = ?) AND published = 1", "created_at DESC"
+            ),
+            ("user", 20, 0, "user"),
+        ),
+        (
+            "exercise_pool_pick",
+            "features/ai/generation/exercise_pool.py",
+            PICK_QUERY,
+            ("A1", "general", 20),
+        ),
+        (
+            "job_queue_claim",
+            "core/processing/job_queue.py",
+            CLAIM_QUERY,
+            (1700000000, 1700000000),
+        ),
+    ]
+
+
+FULL_SCAN_PATTERN = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+TEMP_SORT_PATTERN = re.compile(r"USE TEMP B-TREE")
+SUBQUERY_PATTERN = re.compile(r"^(?:CO-ROUTINE|MATERIALIZE) (\w+)")
+
+
+# === Plan Inspection ===
+def explain(conn: sqlite3.Connection, sql: str, params: Tuple[Any, ...]) -> List[str]:
+    """Return the EXPLAIN QUERY PLAN detail lines for a query."""
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [row[-1] for row in rows]
+
+
+def check_query_plans(conn: sqlite3.Connection, queries: List[QueryEntry] = None) -> List[Dict[str, Any]]:
+    """
+    Inspect every registered query and classify its plan.
+
+    Args:
+        conn: Connection to a migrated database
+        queries: Entries to inspect (default: QUERY_REGISTRY)
+
+    Returns:
+        List of dictionaries with name, source, plan, full_scans, temp_sorts and error
+    """
+    report = []
+    for name, source, sql, params in QUERY_REGISTRY if queries is None else queries:
+        entry: Dict[str, Any] = {
+            "name": name,
+            "source": source,
+            "plan": [],
+            "full_scans": [],
+            "temp_sorts": [],
+            "error": None,
+        }
+        try:
+            plan = explain(conn, sql, params)
+            entry["plan"] = plan
+            # Scanning a subquery result reads rows its own plan already fetched
+            subqueries = {m.group(1) for m in map(SUBQUERY_PATTERN.match, plan) if m}
+            for detail in plan:
+                match = FULL_SCAN_PATTERN.match(detail)
+                # "SCAN t USING [COVERING] INDEX" walks an index, not the table
+                if match and " USING " not in detail and match.group(1) not in subqueries:
+                    entry["full_scans"].append(match.group(1))
+                if TEMP_SORT_PATTERN.search(detail):
+                    entry["temp_sorts"].append(detail)
+        except sqlite3.Error as e:
+            entry["error"] = str(e)
+        report.append(entry)
+    return report
+
+
+def resolve_db_path(cli_path: str = "") -> Path:
+    """Resolve the database path from the CLI or DB_FILE."""
+    db_path = Path(cli_path or os.getenv("DB_FILE", "database/user_data.db"))
+    if not db_path.is_absolute() and not db_path.exists():
+        db_path = Path(__file__).resolve().parent.parent / db_path
+    return db_path
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the checker and print a report; return the process exit code."""
+    parser = argparse.ArgumentParser(description="Flag full table scans in hot-path queries.")
+    parser.add_argument("--db", default="", help="SQLite database file (default: $DB_FILE)")
+    parser.add_argument("--verbose", action="store_true", help="Print the full plan of every query")
+    args = parser.parse_args(argv)
+
+    db_path = resolve_db_path(args.db)
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        return 2
+
+    os.environ["DB_FILE"] = str(db_path)
+    queries = QUERY_REGISTRY + load_app_queries()
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        report = check_query_plans(conn, queries)
+    finally:
+        conn.close()
+
+    failures = 0
+    for entry in report:
+        if entry["error"]:
+            failures += 1
+            print(f"❌ {entry['name']} ({entry['source']}): {entry['error']}")
+        elif entry["full_scans"]:
+            failures += 1
+            print(f"❌ {entry['name']} ({entry['source']}): full scan of {', '.join(entry['full_scans'])}")
+        elif entry["temp_sorts"]:
+            print(f"⚠️ {entry['name']} ({entry['source']}): indexed, but sorts with a temp B-tree")
+        else:
+            print(f"✅ {entry['name']}")
+
+        if args.verbose or entry["full_scans"]:
+            for detail in entry["plan"]:
+                print(f"     {detail}")
+
+    print(f"\n{len(report) - failures}/{len(report)} queries use indexes")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
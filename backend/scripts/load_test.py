@@ -0,0 +1,371 @@
+"""
+XplorED - End-to-End Load Test
+
+This script drives realistic user journeys against the backend with many
+concurrent virtual users and reports per-endpoint latency percentiles.
+
+Features:
+- Scenarios: weighted journeys (login, lessons, AI exercise generate →
+  submit → poll results, translation streaming, vocab training, TTS) with
+  ramp-up and think time; a default scenario is built in, more live in
+  ``scripts/load_scenarios/*.json``
+- End-to-end Timings: besides every HTTP call, the time from submitting an
+  exercise block until its enriched results are complete is recorded
+- Report: requests, errors, throughput and p50/p95/p99/max per endpoint, as
+  a table or JSON (``--json``) for comparing runs
+- Offline Mode: ``--offline`` boots the app in-process on a throwaway
+  database with seeded users, fakeredis and the stubs from
+  ``scripts/ai_stub_servers.py``, so runs are reproducible without network
+  access or API credits; ``--durable-jobs N`` also sends AI jobs through
+  the durable queue with an N-thread worker
+
+Usage:
+    python scripts/load_test.py --offline --users 20 --duration 60
+    python scripts/load_test.py --offline --scenario exercise_burst --mistral-latency lognormal:2,0.5
+    python scripts/load_test.py --base-url http://localhost:5050 --users 5 --password secret123
+
+Offline mode needs ``pip install -r requirements/requirements-loadtest.txt``.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from ai_stub_servers import add_stub_arguments, profiles_from_args, start_stub_servers  # noqa: E402
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+SCENARIO_DIR = Path(__file__).resolve().parent / "load_scenarios"
+
+# === Scenario Configuration ===
+DEFAULT_SCENARIO: Dict = {
+    "name": "default",
+    "users": 10,
+    "duration": 60,
+    "ramp_up": 10,
+    "think_time": [0.5, 2.0],
+    "steps": [
+        {"action": "lessons", "weight": 3},
+        {"action": "ai_exercise", "weight": 3},
+        {"action": "translate", "weight": 2},
+        {"action": "vocab_train", "weight": 2},
+        {"action": "tts", "weight": 1},
+    ],
+}
+
+RESULT_POLL_INTERVAL = 0.5
+RESULT_POLL_TIMEOUT = 60.0
+
+
+def load_scenario(name: Optional[str]) -> Dict:
+    """Return the built-in scenario, or one loaded from a path or ``load_scenarios/<name>.json``."""
+    if not name or name == "default":
+        return dict(DEFAULT_SCENARIO)
+    path = Path(name)
+    if not path.exists():
+        path = SCENARIO_DIR / f"{name}.json"
+    if not path.exists():
+        raise SystemExit(f"Scenario not found: {name}")
+    scenario = {**DEFAULT_SCENARIO, **json.loads(path.read_text())}
+    unknown = [step["action"] for step in scenario["steps"] if step["action"] not in ACTIONS]
+    if unknown:
+        raise SystemExit(f"Unknown actions in scenario {name}: {unknown}")
+    return scenario
+
+
+# === Metrics ===
+class Recorder:
+    """Thread-safe latency and error collection per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, List[float]] = {}
+        self._errors: Dict[str, int] = {}
+        self.started = time.perf_counter()
+
+    def record(self, name: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self._latencies.setdefault(name, []).append(seconds)
+            if not ok:
+                self._errors[name] = self._errors.get(name, 0) + 1
+
+    def report(self) -> Dict[str, Dict]:
+        """Return count, errors, rps and latency percentiles (ms) per endpoint."""
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        with self._lock:
+            snapshot = {name: sorted(values) for name, values in self._latencies.items()}
+            errors = dict(self._errors)
+
+        def percentile(values: List[float], pct: float) -> float:
+            index = min(len(values) - 1, max(0, int(round(pct / 100 * len(values))) - 1))
+            return round(values[index] * 1000, 1)
+
+        return {
+            name: {
+                "count": len(values),
+                "errors": errors.get(name, 0),
+                "rps": round(len(values) / elapsed, 2),
+                "p50_ms": percentile(values, 50),
+                "p95_ms": percentile(values, 95),
+                "p99_ms": percentile(values, 99),
+                "max_ms": round(values[-1] * 1000, 1),
+            }
+            for name, values in sorted(snapshot.items())
+        }
+
+
+def print_report(report: Dict[str, Dict], elapsed: float) -> None:
+    header = f"{'endpoint':<34}{'count':>7}{'errors':>8}{'rps':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    print(f"\n=== Load test report ({elapsed:.1f}s) ===")
+    print(header)
+    print("-" * len(header))
+    for name, row in report.items():
+        print(
+            f"{name:<34}{row['count']:>7}{row['errors']:>8}{row['rps']:>8}"
+            f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}{row['max_ms']:>10}"
+        )
+
+
+# === Virtual User ===
+class VirtualUser:
+    """One logged-in client session executing scenario steps."""
+
+    def __init__(self, base_url: str, username: str, password: str, recorder: Recorder):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.recorder = recorder
+        self.session = requests.Session()
+
+    def call(self, name: str, method: str, path: str, stream: bool = False, **kwargs) -> Optional[requests.Response]:
+        """Send one request and record it; streamed bodies are read to the end before timing stops."""
+        started = time.perf_counter()
+        try:
+            resp = self.session.request(method, self.base_url + path, timeout=120, stream=stream, **kwargs)
+            if stream:
+                for _ in resp.iter_content(chunk_size=None):
+                    pass
+            ok = resp.status_code < 400
+        except requests.RequestException:
+            resp, ok = None, False
+        self.recorder.record(name, time.perf_counter() - started, ok)
+        return resp if ok else None
+
+    # === Actions ===
+    def login(self) -> bool:
+        resp = self.call("POST /api/login", "POST", "/api/login", json={"username": self.username, "password": self.password})
+        return resp is not None
+
+    def lessons(self) -> None:
+        self.call("GET /api/lessons", "GET", "/api/lessons")
+
+    def ai_exercise(self) -> None:
+        """Generate a block, submit answers and poll until the enriched results are complete."""
+        resp = self.call("POST /api/ai-exercises", "POST", "/api/ai-exercises", json={})
+        if resp is None:
+            return
+        block = resp.json()
+        exercises = block.get("exercises") or []
+        block_id = block.get("id") or block.get("block_id")
+        if not exercises or not block_id:
+            return
+
+        # Roughly two thirds right, so both the correct and the mistake paths are exercised
+        answers = {
+            str(ex.get("id")): ex.get("correctAnswer") or ex.get("correct_answer") if random.random() < 0.66 else "falsch"
+            for ex in exercises
+        }
+        started = time.perf_counter()
+        submitted = self.call(
+            "POST /api/ai-exercise/<id>/submit", "POST", f"/api/ai-exercise/{block_id}/submit",
+            json={"exercises": exercises, "answers": answers, "exercise_block": block, "block_id": block_id},
+        )
+        if submitted is None:
+            return
+
+        deadline = time.monotonic() + RESULT_POLL_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(RESULT_POLL_INTERVAL)
+            polled = self.call("GET /api/ai-exercise/<id>/results", "GET", f"/api/ai-exercise/{block_id}/results")
+            if polled is not None and polled.json().get("status") == "complete":
+                self.recorder.record("e2e exercise submit→complete", time.perf_counter() - started, True)
+                return
+        self.recorder.record("e2e exercise submit→complete", time.perf_counter() - started, False)
+
+    def translate(self) -> None:
+        self.call("POST /api/translate", "POST", "/api/translate", json={"text": "I have a dog.", "target_lang": "de"})
+        self.call(
+            "POST /api/translate/stream", "POST", "/api/translate/stream", stream=True,
+            json={"english": "I have a dog.", "student_input": random.choice(["Ich habe einen Hund.", "Ich haben ein Hund."])},
+        )
+
+    def vocab_train(self) -> None:
+        # Only the review queue read; the POST handler does not accept the frontend's payload yet
+        self.call("GET /api/vocab-train", "GET", "/api/vocab-train?count=5")
+
+    def tts(self) -> None:
+        self.call("POST /api/tts", "POST", "/api/tts", json={"text": random.choice(["Hallo, wie geht es dir?", "Das Wetter ist schön."])})
+
+
+ACTIONS: Dict[str, Callable[[VirtualUser], None]] = {
+    "lessons": VirtualUser.lessons,
+    "ai_exercise": VirtualUser.ai_exercise,
+    "translate": VirtualUser.translate,
+    "vocab_train": VirtualUser.vocab_train,
+    "tts": VirtualUser.tts,
+}
+
+
+def run_user(user: VirtualUser, scenario: Dict, start_delay: float, stop_at: float) -> None:
+    """Log in after the ramp-up delay, then run weighted steps until the deadline."""
+    time.sleep(start_delay)
+    if time.monotonic() >= stop_at or not user.login():
+        return
+    actions = [ACTIONS[step["action"]] for step in scenario["steps"]]
+    weights = [step.get("weight", 1) for step in scenario["steps"]]
+    low, high = scenario["think_time"]
+    while time.monotonic() < stop_at:
+        random.choices(actions, weights)[0](user)
+        time.sleep(random.uniform(low, high))
+
+
+def run_load(base_url: str, scenario: Dict, usernames: List[str], password: str) -> Recorder:
+    recorder = Recorder()
+    users = [VirtualUser(base_url, name, password, recorder) for name in usernames]
+    stop_at = time.monotonic() + scenario["ramp_up"] + scenario["duration"]
+    step = scenario["ramp_up"] / max(1, len(users))
+    threads = [
+        threading.Thread(target=run_user, args=(user, scenario, index * step, stop_at), daemon=True)
+        for index, user in enumerate(users)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        # Let in-flight journeys (e.g. result polling) finish after the deadline
+        thread.join(timeout=scenario["ramp_up"] + scenario["duration"] + RESULT_POLL_TIMEOUT + 30)
+    return recorder
+
+
+# === Offline Environment ===
+def start_offline_backend(args: argparse.Namespace, usernames: List[str], password: str) -> str:
+    """Start the stubs and an in-process backend on a fresh database; return its base URL."""
+    mistral_profile, tts_profile = profiles_from_args(args)
+    stubs = start_stub_servers(mistral_profile=mistral_profile, tts_profile=tts_profile, seed=args.seed)
+
+    workdir = Path(tempfile.mkdtemp(prefix="xplored-load-"))
+    os.environ.update({
+        "DB_FILE": str(workdir / "user_data.db"),
+        "SKIP_DOTENV": "true",
+        "FLASK_ENV": "production",
+        "MISTRAL_API_URL": stubs.mistral_url,
+        "MISTRAL_API_KEY": "stub",
+        "ELEVENLABS_BASE_URL": stubs.tts_url,
+        "ELEVENLABS_API_KEY": "stub",
+    })
+    if args.durable_jobs:
+        os.environ["DURABLE_JOBS"] = "true"
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_DIR / "src")}
+    for script in ("scripts/migration_script.py", "scripts/migrations/schema_migration.py"):
+        subprocess.run([sys.executable, script], cwd=BACKEND_DIR, env=env, check=True, capture_output=True)
+
+    try:
+        import fakeredis  # type: ignore
+    except ImportError:
+        raise SystemExit("--offline needs fakeredis: pip install -r requirements/requirements-loadtest.txt")
+
+    sys.path.insert(0, str(BACKEND_DIR / "src"))
+    from external.redis import redis_client  # noqa: E402
+    # The singleton already tried (and failed) to connect on import; swap in fakeredis on the instance
+    redis_client._client = fakeredis.FakeRedis(decode_responses=True)
+
+    import main  # noqa: E402
+    from config.extensions import limiter  # noqa: E402
+    from core.database.connection import insert_row  # noqa: E402
+    from features.auth.user_accounts import create_user_account  # noqa: E402
+    from werkzeug.serving import make_server  # type: ignore
+
+    # The load generator shares one IP; per-IP login limits would throttle the run itself
+    limiter.enabled = False
+
+    vocab = [("Hund", "dog", "noun", "der"), ("Apfel", "apple", "noun", "der"), ("laufen", "to run", "verb", None)]
+    for username in usernames:
+        create_user_account(username, password)
+        for word, translation, word_type, article in vocab:
+            insert_row("vocab_log", {
+                "username": username, "vocab": word, "translation": translation,
+                "word_type": word_type, "article": article, "next_review": "2020-01-01 00:00:00",
+            })
+
+    if args.durable_jobs:
+        from core.processing.job_queue import JobWorker  # noqa: E402
+        JobWorker(app=main.app, concurrency=args.durable_jobs).start()
+
+    server = make_server("127.0.0.1", 0, main.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Offline backend on http://127.0.0.1:{server.server_port} (db {workdir})")
+    print(f"Mistral stub {stubs.mistral_url}, ElevenLabs stub {stubs.tts_url}")
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+# === Main Entry Point ===
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run an end-to-end load test against the backend.")
+    parser.add_argument("--base-url", default="http://localhost:5050", help="Backend URL (ignored with --offline)")
+    parser.add_argument("--scenario", default=None, help="Scenario name in load_scenarios/ or path to a JSON file")
+    parser.add_argument("--users", type=int, default=None, help="Override the scenario's virtual users")
+    parser.add_argument("--duration", type=float, default=None, help="Override the scenario's duration (seconds)")
+    parser.add_argument("--ramp-up", type=float, default=None, help="Override the scenario's ramp-up (seconds)")
+    parser.add_argument("--user-prefix", default="loadtest", help="Usernames are <prefix>_<n>")
+    parser.add_argument("--password", default="LoadTest123!", help="Password of the load test users")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the report to this file")
+    parser.add_argument("--offline", action="store_true", help="Run against an in-process backend with AI stubs")
+    parser.add_argument(
+        "--durable-jobs", type=int, default=0, metavar="THREADS",
+        help="With --offline: route AI jobs through the durable queue and consume it with this many worker threads",
+    )
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    scenario = load_scenario(args.scenario)
+    for key, value in (("users", args.users), ("duration", args.duration), ("ramp_up", args.ramp_up)):
+        if value is not None:
+            scenario[key] = value
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    usernames = [f"{args.user_prefix}_{index}" for index in range(scenario["users"])]
+    base_url = start_offline_backend(args, usernames, args.password) if args.offline else args.base_url
+
+    print(
+        f"Scenario '{scenario['name']}': {scenario['users']} users, "
+        f"{scenario['ramp_up']}s ramp-up, {scenario['duration']}s steady state"
+    )
+    recorder = run_load(base_url, scenario, usernames, args.password)
+    elapsed = time.perf_counter() - recorder.started
+    report = recorder.report()
+    print_report(report, elapsed)
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps({
+            "scenario": scenario,
+            "offline": args.offline,
+            "elapsed_s": round(elapsed, 1),
+            "endpoints": report,
+        }, indent=2))
+        print(f"\nReport written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
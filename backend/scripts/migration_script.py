@@ -6,6 +6,8 @@ It creates all necessary tables and ensures the database is properly initialized
 
 Features:
 - Database Schema Creation: Create all required tables
+- Versioned Migrations: Apply run-once migrations from migrations/versioned_migrations.py
+- Post-Migration Backfills: Populate new rollup tables right after their migration
 - Environment Detection: Handle Docker and local environments
 - Error Handling: Graceful error handling for Docker and local environments
 - Logging: Proper logging configuration
@@ -13,11 +15,12 @@ Features:
 For detailed architecture information, see: docs/backend_structure.md
 """
 
+import importlib
 import sqlite3
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 # Add src to path for imports
 # In Docker: /app/scripts/migration_script.py -> /app/src/
@@ -27,17 +30,30 @@ if os.path.exists("/app"):
     sys.path.insert(0, "/app/src")
 else:
     # Local development environment
-    sys.path.insert(0, str(Path(__file__).parent / "src"))
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# Versioned migrations live next to this script; import the module directly so the
+# migrations package (which runs schema_migration on import) is not triggered
+sys.path.insert(0, str(Path(__file__).resolve().parent / "migrations"))
 
 # Import logging configuration
 from config.logging_config import setup_logging
 import logging
+from versioned_migrations import apply_versioned_migrations
 
 # Setup logging
 setup_logging(log_level="INFO")
 logger = logging.getLogger(__name__)
 
 
+# Backfill scripts (in this directory) to run once, right after the versioned
+# migration that creates their table; they need the application services
+POST_MIGRATION_BACKFILLS = {
+    4: "backfill_daily_activity",
+    5: "backfill_achievements",
+}
+
+
 def load_environment_variables() -> None:
     """Load environment variables from .env files with fallback paths."""
     try:
@@ -430,6 +446,26 @@ def create_ai_exercise_blocks_table(cursor: sqlite3.Cursor) -> None:
     logger.info("AI exercise blocks table created/verified")
 
 
+def run_post_migration_backfills(db_path: Path, applied: List[int]) -> None:
+    """Run the backfill of every migration applied by this run."""
+    pending = [POST_MIGRATION_BACKFILLS[version] for version in applied if version in POST_MIGRATION_BACKFILLS]
+    if not pending:
+        return
+
+    # The services open their own pooled connection from DB_FILE
+    os.environ["DB_FILE"] = str(db_path)
+    for module_name in pending:
+        logger.info(f"Running {module_name}")
+        try:
+            backfill = importlib.import_module(module_name)
+            exit_code = backfill.main([])
+        except Exception as e:
+            logger.error(f"❌ {module_name} crashed: {e}")
+            exit_code = 1
+        if exit_code != 0:
+            logger.error(f"❌ {module_name} failed; run scripts/{module_name}.py manually")
+
+
 def run_migration() -> None:
     """Execute the complete database migration process."""
     logger.info("🔄 Starting database migration...")
@@ -462,11 +498,20 @@ def run_migration() -> None:
         create_ai_exercise_results_table(cursor)
         create_topic_memory_status_table(cursor)
         create_ai_exercise_blocks_table(cursor)
-
-        # Commit changes and close connection
         conn.commit()
+
+        # Apply run-once versioned migrations (indexes, rollups, ...)
+        applied = apply_versioned_migrations(conn)
+        if applied:
+            logger.info(f"Applied versioned migrations: {applied}")
+        else:
+            logger.info("Versioned migrations up to date")
+
+        # Close connection
         conn.close()
 
+        run_post_migration_backfills(db_path, applied)
+
         logger.info("✅ Database migration completed successfully!")
 
     except Exception as e:
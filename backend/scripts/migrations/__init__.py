@@ -6,6 +6,7 @@ following clean architecture principles as outlined in the documentation.
 
 Migration Components:
 - schema_migration: Database schema creation and updates
+- versioned_migrations: Run-once migrations tracked in schema_migrations
 - Database initialization scripts
 - Schema versioning and updates
 
@@ -593,4 +593,15 @@ cursor.execute(
 print("✅ 'ai_exercise_results' table created (if not exists).")
 
 conn.commit()
+
+# ✅ Apply run-once versioned migrations (indexes, rollups, ...)
+try:
+    from .versioned_migrations import apply_versioned_migrations
+except ImportError:
+    # Executed as a standalone script rather than as part of the package
+    sys.path.append(str(Path(__file__).resolve().parent))
+    from versioned_migrations import apply_versioned_migrations
+applied = apply_versioned_migrations(conn)
+print(f"✅ Versioned migrations applied: {applied}" if applied else "ℹ️ Versioned migrations up to date.")
+
 print("✅ Migration completed.")
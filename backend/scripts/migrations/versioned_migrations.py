@@ -0,0 +1,778 @@
+"""
+XplorED - Versioned Schema Migrations
+
+This module provides ordered, run-once schema migrations for the XplorED platform,
+following clean architecture principles as outlined in the documentation.
+
+Migration Components:
+- Version Tracking: ``schema_migrations`` records every applied version
+- Migration Registry: ``MIGRATIONS`` lists (version, name, function) in order
+- Atomic Application: Each migration runs in its own transaction
+
+Unlike the idempotent table setup in ``migration_script.py``, migrations here
+run exactly once per database. Append new entries to ``MIGRATIONS`` with the
+next version number; never edit a migration that has already shipped.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+import os
+import sqlite3
+from typing import Callable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default session lifetime, matching core/session/session_backends.py
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", str(7 * 24 * 3600)))
+
+
+# === Helpers ===
+def _table_exists(cursor: sqlite3.Cursor, table: str) -> bool:
+    """Return True if ``table`` exists in the database."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    return cursor.fetchone() is not None
+
+
+def _create_index(
+    cursor: sqlite3.Cursor,
+    name: str,
+    table: str,
+    columns: Sequence[str],
+    unique: bool = False,
+) -> None:
+    """Create an index if its table exists; log and skip otherwise."""
+    if not _table_exists(cursor, table):
+        logger.warning(f"Skipping index {name}: table '{table}' does not exist")
+        return
+    unique_sql = "UNIQUE " if unique else ""
+    cursor.execute(
+        f"CREATE {unique_sql}INDEX IF NOT EXISTS {name} ON {table}({', '.join(columns)});"
+    )
+    logger.info(f"Index {name} created on {table}({', '.join(columns)})")
+
+
+def _dedupe_vocab_log(cursor: sqlite3.Cursor) -> int:
+    """
+    Collapse duplicate (username, vocab) rows before the unique index is built.
+
+    The row the learner has reviewed most is kept (then the most recently
+    reviewed one, then the newest), so its spaced-repetition state survives.
+
+    Returns:
+        int: Number of duplicate rows removed
+    """
+    cursor.execute("PRAGMA table_info(vocab_log);")
+    columns = {col[1] for col in cursor.fetchall()}
+    order = [f"COALESCE({column}, 0) DESC" for column in ("repetitions",) if column in columns]
+    order += [
+        f"COALESCE({column}, '') DESC"
+        for column in ("last_review", "last_reviewed", "next_review")
+        if column in columns
+    ]
+    order.append("rowid DESC")
+
+    cursor.execute(
+        f"""
+        DELETE FROM vocab_log WHERE rowid IN (
+            SELECT rowid FROM (
+                SELECT rowid, ROW_NUMBER() OVER (
+                    PARTITION BY username, vocab ORDER BY {', '.join(order)}
+                ) AS rank
+                FROM vocab_log
+            )
+            WHERE rank > 1
+        );
+        """
+    )
+    removed = max(cursor.rowcount, 0)
+    if removed:
+        logger.warning(f"Removed {removed} duplicate vocab_log rows, keeping each word's most reviewed row")
+    else:
+        logger.info("No duplicate vocab_log rows found")
+    return removed
+
+
+# === Migrations ===
+def _migration_0001_hot_path_indexes(cursor: sqlite3.Cursor) -> None:
+    """Add composite and covering indexes for per-user hot-path lookups."""
+    # activity_progress is written by progress tracking but was never created by a migration
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS activity_progress (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            block_id TEXT,
+            score INTEGER,
+            total_questions INTEGER,
+            completion_percentage REAL,
+            activity_type TEXT,
+            completed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+    )
+
+    # lesson_progress is only created by schema_migration.py; make sure it exists here too
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS lesson_progress (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            lesson_id INTEGER NOT NULL,
+            block_id TEXT NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(user_id, lesson_id, block_id)
+        );
+        """
+    )
+
+    # vocab_log: bulk upserts rely on the (username, vocab) unique key
+    if _table_exists(cursor, "vocab_log"):
+        _dedupe_vocab_log(cursor)
+    _create_index(cursor, "idx_vocab_unique", "vocab_log", ["username", "vocab"], unique=True)
+    _create_index(cursor, "idx_vocab_log_user_next_review", "vocab_log", ["username", "next_review"])
+
+    # topic_memory: per-topic lookups and level progress (covering on quality)
+    _create_index(cursor, "idx_topic_memory_user_grammar", "topic_memory", ["username", "grammar", "quality"])
+
+    # lesson_progress: completed-block counts per lesson without touching the table
+    _create_index(
+        cursor,
+        "idx_lesson_progress_user_lesson_completed",
+        "lesson_progress",
+        ["user_id", "lesson_id", "completed", "block_id"],
+    )
+
+    # results: game history per user ordered by time (covering for statistics)
+    _create_index(cursor, "idx_results_user_timestamp", "results", ["username", "timestamp", "level", "correct"])
+
+    # activity_progress: per-user activity windows
+    _create_index(
+        cursor,
+        "idx_activity_progress_user_type_completed",
+        "activity_progress",
+        ["username", "activity_type", "completed_at"],
+    )
+
+    # sessions: session_id is the primary key; logout-everywhere deletes by username
+    _create_index(cursor, "idx_sessions_username", "sessions", ["username"])
+
+    # Refresh planner statistics so the new indexes are picked up immediately
+    cursor.execute("ANALYZE;")
+
+
+def _add_epoch_due_column(cursor: sqlite3.Cursor, table: str, source: str, target: str) -> None:
+    """Mirror an ISO due-date column into an indexed integer epoch column."""
+    if not _table_exists(cursor, table):
+        logger.warning(f"Skipping {table}.{target}: table '{table}' does not exist")
+        return
+
+    cursor.execute(f"PRAGMA table_info({table});")
+    if target not in [col[1] for col in cursor.fetchall()]:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {target} INTEGER;")
+
+    # Backfill; naive ISO strings are read as UTC, matching datetime('now') comparisons
+    epoch_sql = f"CAST(strftime('%s', {{row}}.{source}) AS INTEGER)"
+    cursor.execute(f"UPDATE {table} SET {target} = {epoch_sql.format(row=table)};")
+
+    # Keep the epoch in sync for every writer, including ones that only set the ISO column
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_{target}_insert
+        AFTER INSERT ON {table}
+        BEGIN
+            UPDATE {table} SET {target} = {epoch_sql.format(row='NEW')} WHERE rowid = NEW.rowid;
+        END;
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_{target}_update
+        AFTER UPDATE OF {source} ON {table}
+        BEGIN
+            UPDATE {table} SET {target} = {epoch_sql.format(row='NEW')} WHERE rowid = NEW.rowid;
+        END;
+        """
+    )
+    logger.info(f"Added {table}.{target} mirrored from {source}")
+
+
+def _migration_0002_epoch_due_dates(cursor: sqlite3.Cursor) -> None:
+    """Store spaced-repetition due dates as sargable integer epochs."""
+    _add_epoch_due_column(cursor, "vocab_log", "next_review", "next_review_at")
+    _add_epoch_due_column(cursor, "topic_memory", "next_repeat", "next_repeat_at")
+
+    # Due queues are a single range scan per user in due order
+    _create_index(cursor, "idx_vocab_log_user_next_review_at", "vocab_log", ["username", "next_review_at"])
+    _create_index(cursor, "idx_topic_memory_user_next_repeat_at", "topic_memory", ["username", "next_repeat_at"])
+
+    # Superseded by the epoch index; nothing filters on the ISO column any more
+    cursor.execute("DROP INDEX IF EXISTS idx_vocab_log_user_next_review;")
+
+    cursor.execute("ANALYZE;")
+
+
+def _migration_0003_lesson_completion_rollup(cursor: sqlite3.Cursor) -> None:
+    """Materialize completed-block counts per (lesson, user) from lesson_progress."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS lesson_completion_rollup (
+            lesson_id INTEGER NOT NULL,
+            user_id TEXT NOT NULL,
+            completed_blocks INTEGER NOT NULL DEFAULT 0,
+            progress_rows INTEGER NOT NULL DEFAULT 0,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (lesson_id, user_id)
+        );
+        """
+    )
+
+    cursor.execute("DELETE FROM lesson_completion_rollup;")
+    cursor.execute(
+        """
+        INSERT INTO lesson_completion_rollup (lesson_id, user_id, completed_blocks, progress_rows)
+        SELECT lesson_id, user_id, SUM(CASE WHEN completed = 1 THEN 1 ELSE 0 END), COUNT(*)
+        FROM lesson_progress
+        GROUP BY lesson_id, user_id;
+        """
+    )
+
+    # Incremental maintenance: every writer of lesson_progress keeps the rollup current
+    add_new = """
+        INSERT INTO lesson_completion_rollup (lesson_id, user_id, completed_blocks, progress_rows)
+        VALUES (NEW.lesson_id, NEW.user_id, CASE WHEN NEW.completed = 1 THEN 1 ELSE 0 END, 1)
+        ON CONFLICT(lesson_id, user_id) DO UPDATE SET
+            completed_blocks = completed_blocks + excluded.completed_blocks,
+            progress_rows = progress_rows + 1,
+            updated_at = CURRENT_TIMESTAMP;
+    """
+    remove_old = """
+        UPDATE lesson_completion_rollup SET
+            completed_blocks = completed_blocks - CASE WHEN OLD.completed = 1 THEN 1 ELSE 0 END,
+            progress_rows = progress_rows - 1,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE lesson_id = OLD.lesson_id AND user_id = OLD.user_id;
+        DELETE FROM lesson_completion_rollup
+        WHERE lesson_id = OLD.lesson_id AND user_id = OLD.user_id AND progress_rows <= 0;
+    """
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_lesson_progress_rollup_insert
+        AFTER INSERT ON lesson_progress
+        BEGIN {add_new} END;
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_lesson_progress_rollup_delete
+        AFTER DELETE ON lesson_progress
+        BEGIN {remove_old} END;
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_lesson_progress_rollup_update
+        AFTER UPDATE OF lesson_id, user_id, completed ON lesson_progress
+        BEGIN {remove_old} {add_new} END;
+        """
+    )
+    logger.info("Created lesson_completion_rollup with maintenance triggers")
+
+
+def _migration_0004_user_daily_activity(cursor: sqlite3.Cursor) -> None:
+    """Add the per-user daily activity rollup and the raw tables it summarizes."""
+    # Written by progress tracking but never created by a migration
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS vocabulary_progress (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            word TEXT,
+            correct INTEGER DEFAULT 0,
+            repetitions INTEGER DEFAULT 0,
+            reviewed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            activity_type TEXT
+        );
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS game_progress (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            game_type TEXT,
+            score REAL DEFAULT 0,
+            level INTEGER DEFAULT 0,
+            completed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            activity_type TEXT
+        );
+        """
+    )
+
+    # One row per user and UTC day; filled by the write paths and by
+    # scripts/backfill_daily_activity.py, which migration_script.py runs
+    # right after this migration
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS user_daily_activity (
+            username TEXT NOT NULL,
+            activity_date TEXT NOT NULL,
+            lesson_updates INTEGER NOT NULL DEFAULT 0,
+            lesson_blocks_completed INTEGER NOT NULL DEFAULT 0,
+            exercises INTEGER NOT NULL DEFAULT 0,
+            exercise_score REAL NOT NULL DEFAULT 0,
+            exercise_questions INTEGER NOT NULL DEFAULT 0,
+            exercise_percent_sum REAL NOT NULL DEFAULT 0,
+            vocab_reviews INTEGER NOT NULL DEFAULT 0,
+            vocab_correct INTEGER NOT NULL DEFAULT 0,
+            vocab_repetitions INTEGER NOT NULL DEFAULT 0,
+            games INTEGER NOT NULL DEFAULT 0,
+            game_score REAL NOT NULL DEFAULT 0,
+            game_max_level INTEGER NOT NULL DEFAULT 0,
+            game_types TEXT NOT NULL DEFAULT '[]',
+            activity_hours TEXT NOT NULL DEFAULT '{}',
+            total_activities INTEGER NOT NULL DEFAULT 0,
+            last_activity_at DATETIME,
+            PRIMARY KEY (username, activity_date)
+        );
+        """
+    )
+
+    _create_index(cursor, "idx_vocabulary_progress_user_reviewed", "vocabulary_progress", ["username", "reviewed_at"])
+    _create_index(cursor, "idx_game_progress_user_completed", "game_progress", ["username", "completed_at"])
+    logger.info("Created user_daily_activity")
+
+
+def _migration_0005_user_achievements(cursor: sqlite3.Cursor) -> None:
+    """Add the achievement ledger written by the achievement rules."""
+    # One row per unlocked achievement; filled on write and by
+    # scripts/backfill_achievements.py, which migration_script.py runs right
+    # after this migration
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS user_achievements (
+            username TEXT NOT NULL,
+            achievement_id TEXT NOT NULL,
+            unlocked_at DATETIME,
+            recorded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (username, achievement_id)
+        );
+        """
+    )
+
+    # Profile reads list a user's achievements newest first straight from the index
+    _create_index(
+        cursor,
+        "idx_user_achievements_user_unlocked",
+        "user_achievements",
+        ["username", "unlocked_at", "achievement_id"],
+    )
+    logger.info("Created user_achievements")
+
+
+def _game_stats_backfill_sql(table: str, keys: Sequence[str], where: str = "username IS NOT NULL") -> str:
+    """
+    Build the window-function backfill of a game stats table grouped by ``keys``.
+
+    Only results rows matching ``where`` are read. The statement avoids common
+    table expressions so triggers (which do not support them) can reuse it.
+    """
+    partition = ", ".join(keys)
+    key_select = ", ".join(f"t.{key}" for key in keys)
+    key_join = " AND ".join(f"r.{key} = t.{key}" for key in keys)
+    ordered = f"""
+            SELECT {partition}, level, timestamp, is_correct,
+                ROW_NUMBER() OVER (PARTITION BY {partition} ORDER BY timestamp, id) AS rn,
+                ROW_NUMBER() OVER (PARTITION BY {partition}, is_correct ORDER BY timestamp, id) AS rn_by_outcome
+            FROM (
+                SELECT id, username, COALESCE(level, 0) AS level, timestamp,
+                    CASE WHEN correct = 1 THEN 1 ELSE 0 END AS is_correct
+                FROM results
+                WHERE {where}
+            )
+    """
+    return f"""
+        INSERT INTO {table} (
+            {partition}, total_rounds, correct_answers, highest_level,
+            current_streak, best_streak, first_played, last_played
+        )
+        SELECT {key_select}, t.total_rounds, t.correct_answers, t.highest_level,
+            COALESCE(MAX(CASE WHEN r.run_end = t.last_rn THEN r.run_length END), 0),
+            COALESCE(MAX(r.run_length), 0),
+            t.first_played, t.last_played
+        FROM (
+            SELECT {partition}, COUNT(*) AS total_rounds, SUM(is_correct) AS correct_answers,
+                MAX(level) AS highest_level, MIN(timestamp) AS first_played,
+                MAX(timestamp) AS last_played, MAX(rn) AS last_rn
+            FROM ({ordered})
+            GROUP BY {partition}
+        ) AS t
+        LEFT JOIN (
+            -- Gaps and islands: consecutive correct answers share rn - rn_by_outcome
+            SELECT {partition}, COUNT(*) AS run_length, MAX(rn) AS run_end
+            FROM ({ordered})
+            WHERE is_correct = 1
+            GROUP BY {partition}, rn - rn_by_outcome
+        ) AS r ON {key_join}
+        GROUP BY {key_select};
+    """
+
+
+def _game_stats_upsert_sql(table: str, keys: Sequence[str]) -> str:
+    """Build the trigger statement folding one NEW results row into a game stats table."""
+    columns = ", ".join(keys)
+    values = ", ".join("COALESCE(NEW.level, 0)" if key == "level" else f"NEW.{key}" for key in keys)
+    correct = "CASE WHEN NEW.correct = 1 THEN 1 ELSE 0 END"
+    # SET expressions see the row before the update, so the streak reads the old value
+    return f"""
+        INSERT INTO {table} (
+            {columns}, total_rounds, correct_answers, highest_level,
+            current_streak, best_streak, first_played, last_played
+        )
+        VALUES ({values}, 1, {correct}, COALESCE(NEW.level, 0), {correct}, {correct}, NEW.timestamp, NEW.timestamp)
+        ON CONFLICT({columns}) DO UPDATE SET
+            total_rounds = total_rounds + 1,
+            correct_answers = correct_answers + excluded.correct_answers,
+            highest_level = MAX(highest_level, excluded.highest_level),
+            current_streak = CASE WHEN excluded.correct_answers = 1 THEN current_streak + 1 ELSE 0 END,
+            best_streak = MAX(best_streak, CASE WHEN excluded.correct_answers = 1 THEN current_streak + 1 ELSE 0 END),
+            first_played = CASE WHEN first_played IS NULL OR excluded.first_played < first_played
+                THEN excluded.first_played ELSE first_played END,
+            last_played = CASE WHEN last_played IS NULL OR excluded.last_played > last_played
+                THEN excluded.last_played ELSE last_played END,
+            updated_at = CURRENT_TIMESTAMP;
+    """
+
+
+def _migration_0006_user_game_stats(cursor: sqlite3.Cursor) -> None:
+    """Maintain per-user and per-level game aggregates over the results table."""
+    # results is created by migration_script.py; make sure it exists here too
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT,
+            level INTEGER,
+            correct INTEGER,
+            answer TEXT,
+            timestamp TEXT
+        );
+        """
+    )
+
+    stats_columns = """
+            total_rounds INTEGER NOT NULL DEFAULT 0,
+            correct_answers INTEGER NOT NULL DEFAULT 0,
+            highest_level INTEGER NOT NULL DEFAULT 0,
+            current_streak INTEGER NOT NULL DEFAULT 0,
+            best_streak INTEGER NOT NULL DEFAULT 0,
+            first_played TEXT,
+            last_played TEXT,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    """
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS user_game_stats (
+            username TEXT NOT NULL PRIMARY KEY,
+            {stats_columns}
+        );
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS user_game_level_stats (
+            username TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            {stats_columns},
+            PRIMARY KEY (username, level)
+        );
+        """
+    )
+
+    cursor.execute("DELETE FROM user_game_stats;")
+    cursor.execute("DELETE FROM user_game_level_stats;")
+    cursor.execute(_game_stats_backfill_sql("user_game_stats", ["username"]))
+    cursor.execute(_game_stats_backfill_sql("user_game_level_stats", ["username", "level"]))
+
+    # Rounds are appended in play order, so streaks can be folded in one row at a time
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_results_game_stats_insert
+        AFTER INSERT ON results
+        WHEN NEW.username IS NOT NULL
+        BEGIN
+            {_game_stats_upsert_sql("user_game_stats", ["username"])}
+            {_game_stats_upsert_sql("user_game_level_stats", ["username", "level"])}
+        END;
+        """
+    )
+    # Results are only deleted per user (account deletion); drop the aggregates with them
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_results_game_stats_delete
+        AFTER DELETE ON results
+        BEGIN
+            DELETE FROM user_game_stats WHERE username = OLD.username;
+            DELETE FROM user_game_level_stats WHERE username = OLD.username;
+        END;
+        """
+    )
+    logger.info("Created user_game_stats and user_game_level_stats with maintenance triggers")
+
+
+def _migration_0007_session_expiry(cursor: sqlite3.Cursor) -> None:
+    """Give SQLite sessions a sliding expiry so the table can be pruned."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            username TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+    )
+    cursor.execute("PRAGMA table_info(sessions);")
+    if "expires_at" not in [col[1] for col in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE sessions ADD COLUMN expires_at INTEGER;")
+
+    # Existing sessions get a full default TTL (7 days, see SESSION_TTL_SECONDS) from now
+    cursor.execute(
+        "UPDATE sessions SET expires_at = CAST(strftime('%s', 'now') AS INTEGER) + ? WHERE expires_at IS NULL;",
+        (SESSION_TTL_SECONDS,),
+    )
+
+    # Pruning deletes by expiry; lookups stay on the primary key
+    _create_index(cursor, "idx_sessions_expires_at", "sessions", ["expires_at"])
+
+
+def _migration_0008_ai_response_cache(cursor: sqlite3.Cursor) -> None:
+    """Add the SQLite tier of the Mistral response cache (used when Redis is absent)."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ai_response_cache (
+            cache_key TEXT PRIMARY KEY,
+            prompt_type TEXT NOT NULL DEFAULT 'default',
+            body TEXT NOT NULL,
+            created_at INTEGER NOT NULL,
+            expires_at INTEGER NOT NULL
+        );
+        """
+    )
+
+    # Expiry pruning and size trimming order by expires_at; admin purges filter by prompt type
+    _create_index(cursor, "idx_ai_response_cache_expires_at", "ai_response_cache", ["expires_at"])
+    _create_index(cursor, "idx_ai_response_cache_prompt_type", "ai_response_cache", ["prompt_type"])
+
+
+def _migration_0009_job_queue(cursor: sqlite3.Cursor) -> None:
+    """Add the SQLite tier of the durable job queue (used when Redis is absent)."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS job_queue (
+            id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL,
+            idempotency_key TEXT UNIQUE,
+            available_at REAL NOT NULL,
+            lease_until REAL,
+            worker TEXT,
+            last_error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        """
+    )
+
+    # Claims scan runnable jobs by status in availability order
+    _create_index(cursor, "idx_job_queue_status_available", "job_queue", ["status", "available_at"])
+
+
+def _migration_0010_exercise_pool(cursor: sqlite3.Cursor) -> None:
+    """Add the pool of pre-generated exercise blocks per (CEFR level, grammar topic)."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS exercise_pool (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            level TEXT NOT NULL,
+            topic TEXT NOT NULL,
+            block TEXT NOT NULL,
+            questions TEXT NOT NULL,
+            times_served INTEGER NOT NULL DEFAULT 0,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            last_served_at DATETIME
+        );
+        """
+    )
+
+    # Serving picks the least served blocks of one pool
+    _create_index(cursor, "idx_exercise_pool_level_topic", "exercise_pool", ["level", "topic", "times_served"])
+
+
+def _game_stats_rebuild_sql(username: str) -> str:
+    """Build the trigger statements recomputing both game stats tables for one user."""
+    where = f"username = {username}"
+    return f"""
+            DELETE FROM user_game_stats WHERE {where};
+            DELETE FROM user_game_level_stats WHERE {where};
+            {_game_stats_backfill_sql("user_game_stats", ["username"], where)}
+            {_game_stats_backfill_sql("user_game_level_stats", ["username", "level"], where)}
+    """
+
+
+def _migration_0011_game_stats_recompute(cursor: sqlite3.Cursor) -> None:
+    """Recompute game aggregates from the remaining rows on deletes and late inserts."""
+    cursor.execute("DROP TRIGGER IF EXISTS trg_results_game_stats_insert;")
+    cursor.execute("DROP TRIGGER IF EXISTS trg_results_game_stats_delete;")
+
+    # A round is the user's latest when no row sorts after it (same order as the backfill)
+    later_round = """
+        EXISTS (
+            SELECT 1 FROM results AS later
+            WHERE later.username = NEW.username
+                AND (COALESCE(later.timestamp, '') > COALESCE(NEW.timestamp, '')
+                    OR (COALESCE(later.timestamp, '') = COALESCE(NEW.timestamp, '') AND later.id > NEW.id))
+        )
+    """
+
+    # In-order rounds fold into the running streak in O(1)
+    cursor.execute(
+        f"""
+        CREATE TRIGGER trg_results_game_stats_insert
+        AFTER INSERT ON results
+        WHEN NEW.username IS NOT NULL AND NOT {later_round}
+        BEGIN
+            {_game_stats_upsert_sql("user_game_stats", ["username"])}
+            {_game_stats_upsert_sql("user_game_level_stats", ["username", "level"])}
+        END;
+        """
+    )
+    # Back-dated rounds change streaks already folded in; recompute the user
+    cursor.execute(
+        f"""
+        CREATE TRIGGER trg_results_game_stats_insert_late
+        AFTER INSERT ON results
+        WHEN NEW.username IS NOT NULL AND {later_round}
+        BEGIN
+            {_game_stats_rebuild_sql("NEW.username")}
+        END;
+        """
+    )
+    # Account deletion drops the aggregates first, which skips the per-row recompute
+    cursor.execute(
+        f"""
+        CREATE TRIGGER trg_results_game_stats_delete
+        AFTER DELETE ON results
+        WHEN EXISTS (SELECT 1 FROM user_game_stats WHERE username = OLD.username)
+        BEGIN
+            {_game_stats_rebuild_sql("OLD.username")}
+        END;
+        """
+    )
+
+    # Aggregates folded from out-of-order rounds under the old trigger are rebuilt
+    cursor.execute("DELETE FROM user_game_stats;")
+    cursor.execute("DELETE FROM user_game_level_stats;")
+    cursor.execute(_game_stats_backfill_sql("user_game_stats", ["username"]))
+    cursor.execute(_game_stats_backfill_sql("user_game_level_stats", ["username", "level"]))
+    logger.info("Replaced game stats triggers with per-user recomputation")
+
+
+def _migration_0012_lesson_catalog_index(cursor: sqlite3.Cursor) -> None:
+    """Index the published lesson catalog in its page order."""
+    if _table_exists(cursor, "lesson_content"):
+        _create_index(cursor, "idx_lesson_content_published_created", "lesson_content", ["published", "created_at"])
+
+
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]] = [
+    (1, "hot_path_indexes", _migration_0001_hot_path_indexes),
+    (2, "epoch_due_dates", _migration_0002_epoch_due_dates),
+    (3, "lesson_completion_rollup", _migration_0003_lesson_completion_rollup),
+    (4, "user_daily_activity", _migration_0004_user_daily_activity),
+    (5, "user_achievements", _migration_0005_user_achievements),
+    (6, "user_game_stats", _migration_0006_user_game_stats),
+    (7, "session_expiry", _migration_0007_session_expiry),
+    (8, "ai_response_cache", _migration_0008_ai_response_cache),
+    (9, "job_queue", _migration_0009_job_queue),
+    (10, "exercise_pool", _migration_0010_exercise_pool),
+    (11, "game_stats_recompute", _migration_0011_game_stats_recompute),
+    (12, "lesson_catalog_index", _migration_0012_lesson_catalog_index),
+]
+
+
+# === Runner ===
+def ensure_migrations_table(cursor: sqlite3.Cursor) -> None:
+    """Create the schema_migrations bookkeeping table."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+    )
+
+
+def get_applied_versions(cursor: sqlite3.Cursor) -> List[int]:
+    """Return the versions already applied to the database."""
+    ensure_migrations_table(cursor)
+    cursor.execute("SELECT version FROM schema_migrations ORDER BY version;")
+    return [row[0] for row in cursor.fetchall()]
+
+
+def apply_versioned_migrations(conn: sqlite3.Connection) -> List[int]:
+    """
+    Apply every pending migration in version order.
+
+    Each migration and its bookkeeping row are committed together, so a failed
+    migration leaves no partial schema change and is retried on the next run.
+
+    Args:
+        conn: Open SQLite connection (any pending transaction is committed first)
+
+    Returns:
+        List[int]: Versions applied by this call
+
+    Raises:
+        sqlite3.Error: If a migration fails
+    """
+    conn.commit()
+    cursor = conn.cursor()
+    applied = set(get_applied_versions(cursor))
+    conn.commit()
+
+    newly_applied: List[int] = []
+    for version, name, migrate in MIGRATIONS:
+        if version in applied:
+            logger.debug(f"Migration {version:04d}_{name} already applied")
+            continue
+
+        logger.info(f"Applying migration {version:04d}_{name}")
+        try:
+            cursor.execute("BEGIN")
+            migrate(cursor)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (?, ?);",
+                (version, name),
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            logger.error(f"Migration {version:04d}_{name} failed; rolled back")
+            raise
+        newly_applied.append(version)
+
+    return newly_applied
+
+
+# === Export Configuration ===
+__all__ = [
+    "MIGRATIONS",
+    "ensure_migrations_table",
+    "get_applied_versions",
+    "apply_versioned_migrations",
+]
@@ -8,13 +8,45 @@ Middleware Components:
 - Session-based authentication helpers
 - HTTP request/response handling
 - Web framework specific authentication logic
+- Request-scoped memoization of the resolved user on ``flask.g``
+- Attribution of the request's AI calls to the resolved user
 
 For detailed architecture information, see: docs/backend_structure.md
 """
 
-from flask import request, jsonify, abort, make_response  # type: ignore
+from flask import request, jsonify, abort, make_response, g  # type: ignore
 from typing import Optional
 from core.session import session_manager
+from external.mistral.async_client import set_ai_user
+
+
+def _resolve_current_user() -> Optional[str]:
+    """
+    Resolve the session cookie once per request.
+
+    The result is memoized on ``flask.g`` keyed by the session ID, so
+    ``require_user``, ``is_admin`` and later ``get_current_user`` calls in
+    the same request share one lookup (itself served by the session cache).
+    The user is also set as the owner of the request's AI calls, which the
+    Mistral scheduler uses for per-user fairness.
+
+    Returns:
+        Optional[str]: Current username if authenticated, None otherwise
+    """
+    session_id = request.cookies.get("session_id")
+    cached = g.get("_session_user")
+    if cached is not None and cached[0] == session_id:
+        return cached[1]
+
+    username = session_manager.get_user(session_id)
+    g._session_user = (session_id, username)
+    set_ai_user(username)
+    return username
+
+
+def forget_current_user() -> None:
+    """Drop the memoized user of this request (e.g. after logout)."""
+    g.pop("_session_user", None)
 
 
 def is_admin() -> bool:
@@ -24,9 +56,7 @@ def is_admin() -> bool:
     Returns:
         bool: True if current user is 'admin', False otherwise
     """
-    session_id = request.cookies.get("session_id")
-    user = session_manager.get_user(session_id)
-    return user == "admin"
+    return _resolve_current_user() == "admin"
 
 
 def get_current_user() -> Optional[str]:
@@ -36,8 +66,7 @@ def get_current_user() -> Optional[str]:
     Returns:
         Optional[str]: Current username if authenticated, None otherwise
     """
-    session_id = request.cookies.get("session_id")
-    return session_manager.get_user(session_id)
+    return _resolve_current_user()
 
 
 def require_user() -> str:
@@ -52,8 +81,7 @@ def require_user() -> str:
     Raises:
         HTTPException: 401 Unauthorized if no valid session found
     """
-    session_id = request.cookies.get("session_id")
-    username = session_manager.get_user(session_id)
+    username = _resolve_current_user()
     if not username:
         abort(make_response(jsonify({"msg": "Unauthorized"}), 401))
     return username  # type: ignore
@@ -81,4 +109,5 @@ __all__ = [
     "get_current_user",
     "require_user",
     "require_admin",
+    "forget_current_user",
 ]
@@ -36,6 +36,7 @@ from core.database.connection import select_one, select_rows, update_row, delete
 from api.middleware.auth import get_current_user
 from core.database.connection import insert_row
 from config.blueprint import admin_bp
+from external.mistral.response_cache import get_response_cache_stats, purge_response_cache
 from flask import request, jsonify  # type: ignore
 from features.auth import authenticate_admin
 from features.admin.game_management import get_all_game_results
@@ -544,46 +545,17 @@ def delete_user_route(username: str):
         if not user:
             return jsonify({"error": "User not found"}), 404
 
-        # Delete user data from all tables
-        deletion_stats = {
-            "users": 0,
-            "results": 0,
-            "vocab_log": 0,
-            "sessions": 0,
-            "lesson_progress": 0
-        }
-
-        try:
-            # Delete from results table
-            result = delete_rows("results", "WHERE username = ?", (username,))
-            deletion_stats["results"] = result
-
-            # Delete from vocab_log table
-            result = delete_rows("vocab_log", "WHERE username = ?", (username,))
-            deletion_stats["vocab_log"] = result
-
-            # Delete from sessions table
-            result = delete_rows("sessions", "WHERE username = ?", (username,))
-            deletion_stats["sessions"] = result
-
-            # Delete from lesson_progress table
-            result = delete_rows("lesson_progress", "WHERE user_id = ?", (username,))
-            deletion_stats["lesson_progress"] = result
-
-            # Finally, delete from users table
-            result = delete_rows("users", "WHERE username = ?", (username,))
-            deletion_stats["users"] = result
-
-            return jsonify({
-                "message": "User deleted successfully",
-                "username": username,
-                "deletion_stats": deletion_stats
-            })
-
-        except Exception as e:
-            logger.error(f"Error during user deletion: {e}")
+        # One transaction across every user table, including the rollups and achievements
+        success, error = delete_user_data(username)
+        if not success:
+            logger.error(f"Error during user deletion: {error}")
             return jsonify({"error": "Failed to delete user data"}), 500
 
+        return jsonify({
+            "message": "User deleted successfully",
+            "username": username
+        })
+
     except DatabaseError as e:
         logger.error(f"Error deleting user {username}: {e}")
         return jsonify({"error": "Failed to delete user"}), 500
@@ -725,6 +697,63 @@ def update_system_settings_route():
         return jsonify({"error": "Failed to update system settings"}), 500
 
 
+@admin_bp.route("/system/ai-cache", methods=["GET"])
+def get_ai_cache_stats_route():
+    """
+    Get Mistral response cache statistics (admin only).
+
+    Returns:
+        JSON response with hit/miss counters and hit rates per prompt type
+        for this worker, or unauthorized error
+    """
+    try:
+        # Check admin privileges
+        if not is_admin():
+            return jsonify({"error": "Unauthorized - Admin access required"}), 401
+
+        return jsonify({
+            "ai_cache": get_response_cache_stats(),
+            "generated_at": datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        logger.error(f"Error getting AI cache statistics: {e}")
+        return jsonify({"error": "Failed to retrieve AI cache statistics"}), 500
+
+
+@admin_bp.route("/system/ai-cache", methods=["DELETE"])
+def purge_ai_cache_route():
+    """
+    Purge cached Mistral responses (admin only).
+
+    Use after prompt templates change so stale answers are not served.
+
+    Query Parameters:
+        - prompt_type: Only purge responses of this prompt type (e.g. translation)
+
+    Returns:
+        JSON response with removed entries per tier or unauthorized error
+    """
+    try:
+        # Check admin privileges
+        if not is_admin():
+            return jsonify({"error": "Unauthorized - Admin access required"}), 401
+
+        prompt_type = request.args.get("prompt_type") or None
+        removed = purge_response_cache(prompt_type)
+        logger.info(f"Admin {get_current_user()} purged the AI response cache ({prompt_type or 'all'})")
+
+        return jsonify({
+            "message": "AI response cache purged",
+            "prompt_type": prompt_type,
+            "removed": removed
+        })
+
+    except Exception as e:
+        logger.error(f"Error purging AI cache: {e}")
+        return jsonify({"error": "Failed to purge AI cache"}), 500
+
+
 # === Content Management Routes ===
 @admin_bp.route("/content/lessons", methods=["GET"])
 def get_content_lessons_route():
@@ -16,6 +16,7 @@ from datetime import datetime
 
 from flask import request, jsonify # type: ignore
 from api.middleware.auth import require_user
+from core.processing import dispatch_job, idempotency_key
 from core.database.connection import select_one, insert_row, select_rows
 from config.blueprint import ai_bp
 from config.extensions import limiter
@@ -24,10 +25,10 @@ from features.exercise import (
     parse_submission_data,
     evaluate_first_exercise,
     create_immediate_results,
-    evaluate_remaining_exercises_async,
+    store_pending_results,
 )
 from features.ai.evaluation import process_ai_answers
-from shared.exceptions import DatabaseError, AIEvaluationError
+from shared.exceptions import DatabaseError, AIEvaluationError, TaskQueueFullError
 
 
 logger = logging.getLogger(__name__)
@@ -195,31 +196,25 @@ def submit_ai_exercise(block_id, data=None):
         # Evaluate first exercise immediately for fast feedback
         first_result_with_details = evaluate_first_exercise(exercises, answers)
 
-        # Capture the Flask app before starting background thread
-        from flask import current_app # type: ignore
-        app = current_app._get_current_object()
-
-        # Start background task to evaluate remaining exercises
-        from threading import Thread
-        def background_task():
-            logger.info("Starting background task for full evaluation and topic memory updates")
-            try:
-                with app.app_context():
-                    exercise_block = data.get("exercise_block")
-                    logger.info(f"Exercise block from data: topic='{exercise_block.get('topic') if exercise_block else 'None'}'")
-                    if username:  # Ensure username is not None
-                        logger.info(f"Calling evaluate_remaining_exercises_async for user {username}, block {block_id}")
-                        evaluate_remaining_exercises_async(username, block_id, exercises, answers, first_result_with_details, exercise_block)
-                    else:
-                        logger.error("Username is None in background task")
-            except Exception as e:
-                logger.error(f"Error in background task: {e}")
-                import traceback
-                logger.error(f"Background task traceback: {traceback.format_exc()}")
-
-        logger.info("Starting background thread")
-        Thread(target=background_task, daemon=True).start()
-        logger.info("Background thread started")
+        # Queue evaluation of the remaining exercises (durably when DURABLE_JOBS is enabled);
+        # the key makes a double-submitted block run once
+        exercise_block = data.get("exercise_block")
+        logger.info(f"Exercise block from data: topic='{exercise_block.get('topic') if exercise_block else 'None'}'")
+        # Pollers see the block as processing even before a worker picks the job up
+        store_pending_results(username, block_id, exercises, first_result_with_details)
+        job_id = dispatch_job(
+            "exercise_evaluation",
+            {
+                "username": username,
+                "block_id": block_id,
+                "exercises": exercises,
+                "answers": answers,
+                "first_result": first_result_with_details,
+                "exercise_block": exercise_block,
+            },
+            key=idempotency_key("exercise_evaluation", username, block_id, answers),
+        )
+        logger.info(f"Background evaluation queued as job {job_id}")
 
         # Create immediate results
         immediate_results = create_immediate_results(exercises, first_result_with_details)
@@ -236,6 +231,9 @@ def submit_ai_exercise(block_id, data=None):
     except ValueError as e:
         logger.error(f"Validation error submitting AI exercise: {e}")
         return jsonify({"error": str(e)}), 400
+    except TaskQueueFullError as e:
+        logger.warning(f"Rejected AI exercise submission, background queue full: {e}")
+        return jsonify({"error": "Server is busy, please try again shortly"}), 503
     except Exception as e:
         logger.error(f"Error submitting AI exercise: {e}")
         logger.error(f"Exception type: {type(e)}")
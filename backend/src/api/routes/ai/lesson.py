@@ -149,6 +149,7 @@ def ai_weakness_lesson():
                 "You are a helpful German teacher.",
                 user_prompt,
                 temperature=0.7,
+                prompt_type="generation",
             )
             if resp.status_code == 200:
                 raw_html = resp.json()["choices"][0]["message"]["content"].strip()
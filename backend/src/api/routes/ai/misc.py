@@ -136,6 +136,7 @@ def ask_ai():
                 "You are a helpful German teacher.",
                 ai_context_prompt(weaknesses_summary, lesson_progress_summary, question),
                 temperature=0.7,
+                prompt_type="chat",
             )
             if resp.status_code == 200:
                 answer = resp.json()["choices"][0]["message"]["content"].strip()
@@ -299,6 +300,7 @@ def ask_ai_context():
                 "You are a helpful German teacher.",
                 ai_question_prompt(context, question),
                 temperature=0.7,
+                prompt_type="chat",
             )
             if resp.status_code == 200:
                 answer = resp.json()["choices"][0]["message"]["content"].strip()
@@ -15,6 +15,7 @@ from datetime import datetime
 from flask import request, jsonify, current_app # type: ignore
 from api.middleware.auth import require_user
 from config.blueprint import ai_bp
+from core.processing import submit_task
 from external.mistral.client import send_prompt
 from features.ai.generation.reading_helpers import (
     ai_reading_exercise
@@ -33,9 +34,9 @@ from features.ai.prompts import (
 )
 from features.ai.memory.vocabulary_memory import (
     extract_words,
-    save_vocab
+    save_vocab_batch
 )
-from shared.exceptions import DatabaseError, AIEvaluationError
+from shared.exceptions import DatabaseError, AIEvaluationError, TaskQueueFullError
 
 
 logger = logging.getLogger(__name__)
@@ -208,15 +209,18 @@ def submit_reading_exercise():
         # Save vocabulary to user's learning profile
         def save_vocab_bg():
             try:
-                for word_tuple in vocabulary_words:
-                    word = word_tuple[0] if isinstance(word_tuple, tuple) else word_tuple
-                    save_vocab(username, word)
+                save_vocab_batch(username, [
+                    (word_tuple[0], None) if isinstance(word_tuple, tuple) else (word_tuple, None)
+                    for word_tuple in vocabulary_words
+                ])
             except Exception as e:
                 logger.error(f"Error saving vocabulary for user {username}: {e}")
 
         # Run vocabulary saving in background
-        from threading import Thread
-        Thread(target=save_vocab_bg, daemon=True).start()
+        try:
+            submit_task("default", save_vocab_bg)
+        except TaskQueueFullError as e:
+            logger.warning(f"Skipping vocabulary save for user {username}: {e}")
 
         return jsonify({
             "exercise_id": exercise_id,
@@ -35,7 +35,8 @@ import os
 
 from infrastructure.imports import Imports
 from core.database.connection import select_one, update_row, insert_row
-from api.middleware.auth import get_current_user, require_user, is_admin
+from api.middleware.auth import get_current_user, require_user, is_admin, forget_current_user
+from core.session import session_manager
 from features.auth import (
     authenticate_user,
     authenticate_admin,
@@ -212,13 +213,9 @@ def logout_route():
         session_id = request.cookies.get("session_id")
 
         if session_id:
-            # Invalidate session
-            update_row(
-                "sessions",
-                {"active": False, "ended_at": datetime.now().isoformat()},
-                "WHERE session_id = ?",
-                (session_id,)
-            )
+            # Invalidate session (database row and session cache)
+            destroy_user_session(session_id)
+            forget_current_user()
 
         # Clear session cookie
         response = jsonify({"message": "Logout successful"})
@@ -265,12 +262,7 @@ def get_session_route():
         session_info = None
 
         if session_id:
-            session_info = select_one(
-                "sessions",
-                columns="session_id, username, created_at",
-                where="session_id = ?",
-                params=(session_id,)
-            )
+            session_info = session_manager.get_session_info(session_id)
 
         if not session_info:
             return jsonify({"error": "Invalid session"}), 401
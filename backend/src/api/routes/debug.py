@@ -35,8 +35,23 @@ import os
 from flask import request, jsonify # type: ignore
 from infrastructure.imports import Imports
 from api.middleware.auth import is_admin
-from core.database.connection import select_one, select_rows, insert_row, update_row, delete_rows
+from core.database.connection import select_one, select_rows, insert_row, update_row, delete_rows, get_pool_stats
 from config.blueprint import debug_bp
+from core.processing import get_background_stats, get_job_queue_stats
+from core.processing.job_queue import job_queue
+from external.mistral.transport import get_transport_stats
+from external.mistral.single_flight import get_single_flight_stats
+from external.mistral.async_client import get_async_client_stats
+from external.mistral.resilience import get_resilience_stats
+from features.ai.generation.exercise_pool import (
+    get_exercise_pool_stats,
+    schedule_pool_refill,
+    cefr_for_level,
+    normalize_topic,
+    pool_topics,
+    DEFAULT_POOL_TOPIC,
+)
+from features.ai.generation.exercise_prefetch import get_prefetch_stats
 from features.debug import (
     get_all_database_data,
     debug_user_ai_data,
@@ -85,7 +100,8 @@ def get_system_health_route():
             "health_info": {                           # Detailed health information
                 "overall_status": bool,                # Overall system status
                 "database": str,                       # Database status (connected, disconnected, error)
-                "external_services": str,              # External services status
+                "external_services": str,              # External services status (available, degraded)
+                "ai_circuit": str,                     # Mistral circuit breaker (closed, open, half_open)
                 "performance": str,                    # Performance status (normal, slow, critical)
                 "memory_usage": float,                 # Memory usage percentage
                 "cpu_usage": float,                    # CPU usage percentage
@@ -135,15 +151,24 @@ def get_system_health_route():
         include_metrics = request.args.get("include_metrics", "false").lower() == "true"
 
         # Get system health
+        breaker_state = get_resilience_stats()["breaker"]["state"]
         health_info = {
             "overall_status": True,
             "database": "connected",
-            "external_services": "available",
+            "external_services": "available" if breaker_state == "closed" else "degraded",
+            "ai_circuit": breaker_state,
             "performance": "normal"
         }
 
+        if not health_info.get("overall_status"):
+            status = "unhealthy"
+        elif health_info["external_services"] != "available":
+            status = "degraded"
+        else:
+            status = "healthy"
+
         return jsonify({
-            "status": "healthy" if health_info.get("overall_status") else "unhealthy",
+            "status": status,
             "timestamp": datetime.now().isoformat(),
             "health_info": health_info,
             "version": os.getenv("APP_VERSION", "unknown"),
@@ -1438,6 +1463,376 @@ def get_cache_stats_route():
         return jsonify({"error": "Internal server error"}), 500
 
 
+@debug_bp.route("/db-pool", methods=["GET"])
+def get_db_pool_stats_route():
+    """
+    Get SQLite connection pool statistics for the current worker process.
+
+    JSON Response Structure:
+        {
+            "opened": int,                              # Connections opened since start
+            "closed": int,                              # Connections closed by the pool
+            "checkouts": int,                           # get_connection() calls
+            "reused": int,                              # Checkouts served by an open connection
+            "recycled": int,                            # Connections discarded after errors/age
+            "errors": int,                              # Database errors observed
+            "open_connections": int,                    # Currently open pooled connections
+            "reuse_ratio": float,                       # reused / checkouts
+            "pid": int,                                 # Worker process id
+            "config": dict                              # Pragma and pool configuration
+        }
+
+    Status Codes:
+        - 200: Success
+        - 401: Unauthorized (admin access required)
+        - 500: Internal server error
+    """
+    try:
+        # Check admin privileges
+        if not is_admin():
+            return jsonify({"error": "Unauthorized - Admin access required"}), 401
+
+        return jsonify(get_pool_stats())
+
+    except Exception as e:
+        logger.error(f"Error getting database pool statistics: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@debug_bp.route("/background-tasks", methods=["GET"])
+def get_background_tasks_route():
+    """
+    Get background task executor statistics for the current worker process.
+
+    JSON Response Structure:
+        {
+            "workers": int,                             # Configured worker threads
+            "workers_alive": int,                       # Worker threads running
+            "accepting": bool,                          # False while draining on shutdown
+            "queues": {                                 # Per named queue
+                str: {
+                    "priority": int,                    # Lower runs first
+                    "queued": int,                      # Tasks waiting
+                    "running": int,                     # Tasks executing
+                    "max_size": int,                    # Queue bound
+                    "max_running": int,                 # Workers the queue may occupy
+                    "submitted": int,                   # Tasks accepted
+                    "completed": int,                   # Tasks finished without error
+                    "failed": int,                      # Tasks that raised
+                    "rejected": int,                    # Tasks refused by backpressure
+                    "wait_p50_seconds": float,          # Median time queued
+                    "wait_p95_seconds": float,          # 95th percentile time queued
+                    "run_p50_seconds": float,           # Median run time
+                    "run_p95_seconds": float,           # 95th percentile run time
+                    "run_max_seconds": float            # Slowest recent run
+                }
+            }
+        }
+
+    Status Codes:
+        - 200: Success
+        - 401: Unauthorized (admin access required)
+        - 500: Internal server error
+    """
+    try:
+        # Check admin privileges
+        if not is_admin():
+            return jsonify({"error": "Unauthorized - Admin access required"}), 401
+
+        return jsonify(get_background_stats())
+
+    except Exception as e:
+        logger.error(f"Error getting background task statistics: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@debug_bp.route("/job-queue", methods=["GET"])
+def get_job_queue_route():
+    """
+    Get durable job queue counts and the most recent dead letters.
+
+    Query Parameters:
+        - limit (int, optional): Dead letters to return (default: 20)
+
+    JSON Response Structure:
+        {
+            "durable": bool,                            # DURABLE_JOBS enabled in this process
+            "backend": str,                             # auto, redis or sqlite
+            "redis": {                                  # Present when Redis is reachable
+                "queued": int,                          # Jobs waiting in the stream
+                "running": int,                         # Claimed, not yet acknowledged
+                "retrying": int,                        # Waiting out a retry backoff
+                "dead": int                             # Dead-lettered jobs
+            },
+            "sqlite": {...},                            # Same counts for the fallback table
+            "dead_letters": [                           # Most recent first
+                {
+                    "id": str,                          # Job ID
+                    "kind": str,                        # Job kind
+                    "attempts": int,                    # Attempts made
+                    "error": str                        # Last error
+                }
+            ]
+        }
+
+    Status Codes:
+        - 200: Success
+        - 401: Unauthorized (admin access required)
+        - 500: Internal server error
+    """
+    try:
+        # Check admin privileges
+        if not is_admin():
+            return jsonify({"error": "Unauthorized - Admin access required"}), 401
+
+        limit = min(int(request.args.get("limit", 20)), 200)
+        return jsonify(get_job_queue_stats(limit))
+
+    except Exception as e:
+        logger.error(f"Error getting job queue statistics: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@debug_bp.route("/job-queue/dead/<job_id>/retry", methods=["POST"])
+def retry_dead_job_route(job_id):
+    """
+    Move a dead-lettered job back onto the queue with fresh attempts.
+
+    Path Parameters:
+        - job_id (str, required): ID of the dead-lettered job
+
+    Status Codes:
+        - 200: Job requeued
+        - 401: Unauthorized (admin access required)
+        - 404: No dead-lettered job with this ID
+        - 500: Internal server error
+    """
+    try:
+        # Check admin privileges
+        if not is_admin():
+            return jsonify({"error": "Unauthorized - Admin access required"}), 401
+
+        if not job_queue.requeue_dead(job_id):
+            return jsonify({"error": "Dead-lettered job not found"}), 404
+        return jsonify({"message": "Job requeued", "job_id": job_id})
+
+    except Exception as e:
+        logger.error(f"Error requeueing job {job_id}: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@debug_bp.route("/exercise-pool", methods=["GET"])
+def get_exercise_pool_route():
+    """
+    Get pre-generated exercise pool counters, pool sizes and prefetch counters.
+
+    JSON Response Structure:
+        {
+            "enabled": bool,                            # EXERCISE_POOL_ENABLED
+            "low_watermark": int,                       # Pools below this are refilled
+            "target": int,                              # Blocks a refill tops a pool up to
+            "max_serves": int,                          # Serves before a block is retired
+            "hit_rate": float,                          # hits / (hits + misses)
+            "hits": int,                                # Requests served from the pool
+            "misses": int,                              # Requests that generated live
+            "refills_started": int,                     # Refills queued
+            "refills_skipped": int,                     # Refills dropped by backpressure
+            "blocks_added": int,                        # Generated blocks stored
+            "blocks_rejected": int,                     # Invalid or repeated blocks dropped
+            "generation_failures": int,                 # Failed generation calls
+            "refilling": [str],                         # "level/topic" pools being refilled
+            "pools": [
+                {
+                    "level": str,                       # CEFR level
+                    "topic": str,                       # Grammar topic
+                    "available": int,                   # Blocks in the pool
+                    "served": int                       # Serves of those blocks
+                }
+            ],
+            "prefetch": {                               # Next-block prefetches (this worker)
+                "started": int,                         # Prefetches queued
+                "coalesced": int,                       # Dropped, one already in flight for the user
+                "skipped_ready": int,                   # Dropped, a valid next block was waiting
+                "stored": int,                          # Next blocks written
+                "conflicts": int,                       # Dropped, blocks changed during generation
+                "in_flight": int                        # Users with a prefetch queued or running
+            }
+        }
+
+    Status Codes:
+        - 200: Success
+        - 401: Unauthorized (admin access required)
+        - 500: Internal server error
+    """
+    try:
+        # Check admin privileges
+        if not is_admin():
+            return jsonify({"error": "Unauthorized - Admin access required"}), 401
+
+        return jsonify({**get_exercise_pool_stats(), "prefetch": get_prefetch_stats()})
+
+    except Exception as e:
+        logger.error(f"Error getting exercise pool statistics: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@debug_bp.route("/exercise-pool/refill", methods=["POST"])
+def refill_exercise_pool_route():
+    """
+    Top one exercise pool up to its target, e.g. to warm it before launch.
+
+    Request Body:
+        - level (int, optional): Skill level 0-10 (default: 0)
+        - topic (str, optional): Curriculum grammar topic of the level (default: general)
+
+    Status Codes:
+        - 202: Refill queued
+        - 400: Topic has no pool at this level
+        - 401: Unauthorized (admin access required)
+        - 409: Pool is already being refilled or the queue is full
+        - 500: Internal server error
+    """
+    try:
+        # Check admin privileges
+        if not is_admin():
+            return jsonify({"error": "Unauthorized - Admin access required"}), 401
+
+        data = request.get_json(silent=True) or {}
+        level = cefr_for_level(data.get("level", 0))
+        topic = normalize_topic(data.get("topic")) or DEFAULT_POOL_TOPIC
+
+        if topic not in pool_topics(level):
+            return jsonify({"error": "Unknown pool topic", "level": level, "topics": pool_topics(level)}), 400
+        if not schedule_pool_refill(level, topic, force=True):
+            return jsonify({"error": "Refill already running or queue full", "level": level, "topic": topic}), 409
+        return jsonify({"message": "Refill queued", "level": level, "topic": topic}), 202
+
+    except Exception as e:
+        logger.error(f"Error queueing exercise pool refill: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@debug_bp.route("/mistral-transport", methods=["GET"])
+def get_mistral_transport_stats_route():
+    """
+    Get Mistral HTTP transport statistics for the current worker process.
+
+    JSON Response Structure:
+        {
+            "pool_size": int,                           # Keep-alive connections per host
+            "max_retries": int,                         # Retries after the first attempt
+            "timeouts": {str: [float, float]},          # (connect, read) seconds per prompt type
+            "latency": {                                # Per prompt type
+                str: {
+                    "count": int,                       # Completed calls
+                    "avg_seconds": float,               # Mean call time incl. retries
+                    "max_seconds": float,               # Slowest call
+                    "attempts": int,                    # HTTP attempts
+                    "retries": int,                     # Attempts beyond the first
+                    "errors": int,                      # Calls that ended non-200 or raised
+                    "status": {str: int},               # Final status codes
+                    "buckets": {str: int}               # Cumulative counts per upper bound
+                }
+            },
+            "single_flight": {                          # Coalescing of identical requests
+                "leaders": int,                         # Requests sent upstream
+                "shared_local": int,                    # Callers served by a request in this process
+                "shared_remote": int,                   # Callers served by another worker's request
+                "fallbacks": int,                       # Waits that ended in an own request
+                "in_flight": int                        # Keys currently in flight
+            },
+            "scheduler": {                              # Async client queue and budget
+                "queue_depth": int,                     # Calls waiting for a slot
+                "queue_depth_by_user": {str: int},      # Waiting calls per user
+                "in_flight": int,                       # Calls running upstream
+                "in_flight_by_user": {str: int},        # Running calls per user
+                "tokens_available": int,                # Remaining tokens-per-minute budget
+                "paused_for_seconds": float,            # Pause left after a 429
+                "admitted": int,                        # Calls given a slot
+                "rejected": int,                        # Calls refused because the queue was full
+                "queue_timeouts": int,                  # Calls that gave up waiting
+                "rate_limited": int,                    # 429 responses seen
+                "peak_queue_depth": int,                # Deepest queue so far
+                "avg_wait_seconds": float,              # Mean wait for a slot
+                "max_wait_seconds": float               # Longest wait for a slot
+            }
+        }
+
+    Status Codes:
+        - 200: Success
+        - 401: Unauthorized (admin access required)
+        - 500: Internal server error
+    """
+    try:
+        # Check admin privileges
+        if not is_admin():
+            return jsonify({"error": "Unauthorized - Admin access required"}), 401
+
+        return jsonify({
+            **get_transport_stats(),
+            "single_flight": get_single_flight_stats(),
+            "scheduler": get_async_client_stats(),
+        })
+
+    except Exception as e:
+        logger.error(f"Error getting Mistral transport statistics: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@debug_bp.route("/mistral-health", methods=["GET"])
+def get_mistral_health_route():
+    """
+    Get the health of the Mistral integration for the current worker process.
+
+    Responds with 503 while the circuit breaker is open so monitors can
+    alert on it directly.
+
+    JSON Response Structure:
+        {
+            "status": str,                              # healthy, recovering (half open), unavailable (open)
+            "breaker": {
+                "state": str,                           # closed, open, half_open
+                "consecutive_failures": int,            # Failures since the last success
+                "threshold": int,                       # Failures that open the breaker
+                "cooldown_seconds": float,              # Open period before a probe
+                "retry_in_seconds": float,              # Time left until the next probe
+                "last_error": str,                      # Reason of the last failure
+                "last_opened": str,                     # When the breaker last opened
+                "opened": int,                          # Times the breaker opened
+                "short_circuited": int                  # Calls refused without a request
+            },
+            "hedging": {
+                "enabled": bool,                        # Hedged requests on
+                "percentile": float,                    # Latency quantile that triggers a hedge
+                "budget": float,                        # Maximum share of hedged calls
+                "delay_seconds": {str: float},          # Current hedge delay per prompt type
+                "calls": int,                           # Upstream calls executed
+                "hedges_sent": int,                     # Hedged requests sent
+                "hedges_won": int                       # Hedges that answered first
+            }
+        }
+
+    Status Codes:
+        - 200: Breaker closed or half open
+        - 401: Unauthorized (admin access required)
+        - 503: Breaker open
+        - 500: Internal server error
+    """
+    try:
+        # Check admin privileges
+        if not is_admin():
+            return jsonify({"error": "Unauthorized - Admin access required"}), 401
+
+        stats = get_resilience_stats()
+        state = stats["breaker"]["state"]
+        status = {"closed": "healthy", "half_open": "recovering"}.get(state, "unavailable")
+        return jsonify({"status": status, **stats}), 503 if state == "open" else 200
+
+    except Exception as e:
+        logger.error(f"Error getting Mistral health: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
 @debug_bp.route("/clear-user-cache/<username>", methods=["POST"])
 def clear_user_cache_route(username: str):
     """
@@ -34,6 +34,7 @@ from infrastructure.imports import Imports
 from api.middleware.auth import get_current_user, require_user
 from core.database.connection import select_one, select_rows, insert_row, update_row
 from config.blueprint import game_bp
+from core.services import AchievementService
 from features.game import (
     get_user_game_level,
     generate_game_sentence,
@@ -663,14 +664,11 @@ def get_game_results_route():
         # Get results summary
         summary = get_game_statistics(user)
 
-        # Get user achievements
-        achievements = select_rows(
-            "user_achievements",
-            columns="*",
-            where="username = ?",
-            params=(user,),
-            order_by="earned_at DESC"
-        )
+        # Get user achievements from the ledger (newest first)
+        achievements = [
+            {**achievement, "earned_at": achievement["unlocked_at"]}
+            for achievement in AchievementService.get_unlocked(user)
+        ]
 
         return jsonify({
             "results": results,
@@ -34,8 +34,9 @@ from infrastructure.imports import Imports
 from api.middleware.auth import get_current_user, require_user
 from core.database.connection import select_one, select_rows, insert_row, update_row
 from config.blueprint import lessons_bp
-from core.services import LessonService
+from core.services import LessonService, DailyActivityService, AchievementService
 from features.lessons import (
+    get_lesson_catalog,
     validate_block_completion,
     update_lesson_content,
     publish_lesson,
@@ -133,9 +134,7 @@ def get_lesson_progress_single_route(lesson_id: int):
                 {
                     "block_id": str,            # Block identifier
                     "completed": bool,          # Completion status
-                    "completed_at": str,        # Completion timestamp
-                    "time_spent": int,          # Time spent in seconds
-                    "score": float              # Performance score
+                    "completed_at": str         # Completion timestamp (null if open)
                 }
             ]
         }
@@ -377,13 +376,14 @@ def mark_lesson_completed_route():
 
         # Mark all blocks as completed for this lesson
         total_blocks = lesson.get("num_blocks", 0)
-        current_time = datetime.now().isoformat()
+        now = datetime.now()
+        current_time = now.isoformat()
 
         if total_blocks == 0:
             # For lessons with no blocks, create a manual completion record
             existing_manual_completion = select_one(
                 "lesson_progress",
-                columns="id",
+                columns="completed, updated_at",
                 where="user_id = ? AND lesson_id = ? AND block_id = 'manual_completion'",
                 params=(user, lesson_id)
             )
@@ -408,6 +408,7 @@ def mark_lesson_completed_route():
                     "completed": True,
                     "updated_at": current_time
                 })
+            DailyActivityService.record_lesson_progress(user, existing_manual_completion, True, occurred_at=now)
         else:
             # Get existing blocks for this lesson
             existing_blocks = select_rows(
@@ -424,7 +425,7 @@ def mark_lesson_completed_route():
                 # Check if progress record exists
                 existing_progress = select_one(
                     "lesson_progress",
-                    columns="id",
+                    columns="completed, updated_at",
                     where="user_id = ? AND lesson_id = ? AND block_id = ?",
                     params=(user, lesson_id, block_id)
                 )
@@ -449,6 +450,9 @@ def mark_lesson_completed_route():
                         "completed": True,
                         "updated_at": current_time
                     })
+                DailyActivityService.record_lesson_progress(user, existing_progress, True, occurred_at=now)
+
+        AchievementService.record_event(user, "lesson")
 
         return jsonify({
             "lesson_id": lesson_id,
@@ -534,12 +538,13 @@ def update_lesson_progress_single_route():
         if not block:
             return jsonify({"error": "Block not found"}), 404
 
-        current_time = datetime.now().isoformat()
+        now = datetime.now()
+        current_time = now.isoformat()
 
         # Check if progress record exists
         existing_progress = select_one(
             "lesson_progress",
-            columns="id",
+            columns="completed, updated_at",
             where="user_id = ? AND lesson_id = ? AND block_id = ?",
             params=(user, lesson_id, block_id)
         )
@@ -565,6 +570,10 @@ def update_lesson_progress_single_route():
                 "updated_at": current_time
             })
 
+        DailyActivityService.record_lesson_progress(user, existing_progress, completed, occurred_at=now)
+        if completed:
+            AchievementService.record_event(user, "lesson")
+
         return jsonify({
             "lesson_id": lesson_id,
             "block_id": block_id,
@@ -630,87 +639,18 @@ def get_lessons_route():
         limit = int(request.args.get("limit", 20))
         offset = int(request.args.get("offset", 0))
 
-        # Build query conditions
-        where_conditions = []
-        params = []
-
-        if skill_level:
-            where_conditions.append("skill_level = ?")
-            params.append(skill_level)
-
-        if published:
-            where_conditions.append("published = 1")
-
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-
-        # Get lessons
-        lessons = select_rows(
-            "lesson_content",
-            columns="id, lesson_id, title, skill_level, num_blocks, published, created_at",
-            where=where_clause,
-            params=tuple(params),
-            order_by="created_at DESC",
+        # Get the page of lessons with the user's progress (constant query count)
+        lessons, total_lessons = get_lesson_catalog(
+            user,
+            skill_level=skill_level,
+            published=published,
             limit=limit,
-            offset=offset
-        )
-
-        # Get user progress for each lesson
-        for lesson in lessons:
-            lesson_id = lesson["lesson_id"]
-
-            # Get user progress for this lesson
-            progress_rows = select_rows(
-                "lesson_progress",
-                columns="*",
-                where="user_id = ? AND lesson_id = ?",
-                params=(user, lesson_id)
-            )
-
-            # Calculate completion
-            completed_blocks = len([p for p in progress_rows if p.get("completed")])
-            total_blocks = lesson.get("num_blocks", 0)
-
-            # For lessons with no interactive blocks but AI exercises enabled, check AI exercise completion
-            if total_blocks == 0:
-                # Check if AI exercises are enabled
-                ai_enabled = lesson.get("ai_enabled", 0)
-
-                if ai_enabled:
-                    # Check if AI exercises are completed
-                    ai_progress = [p for p in progress_rows if "ai" in p.get("block_id", "")]
-                    completion_percentage = 100.0 if ai_progress and all(p.get("completed") for p in ai_progress) else 0.0
-                    is_completed = bool(ai_progress and all(p.get("completed") for p in ai_progress))
-                else:
-                    # No blocks and no AI exercises - student must manually mark as complete
-                    # Check if there's a manual completion record
-                    manual_completion = select_one(
-                        "lesson_progress",
-                        columns="completed",
-                        where="user_id = ? AND lesson_id = ? AND block_id = 'manual_completion'",
-                        params=(user, lesson_id)
-                    )
-                    completion_percentage = 100.0 if manual_completion and manual_completion.get("completed") else 0.0
-                    is_completed = bool(manual_completion and manual_completion.get("completed"))
-            else:
-                completion_percentage = (completed_blocks / total_blocks * 100) if total_blocks > 0 else 0
-                is_completed = completed_blocks >= total_blocks
-
-            # Add progress information to lesson
-            lesson["completed"] = is_completed
-            lesson["percent_complete"] = round(completion_percentage, 2)
-            lesson["last_attempt"] = progress_rows[-1].get("updated_at") if progress_rows else None
-
-        # Get total count
-        total_lessons = select_one(
-            "lesson_content",
-            columns="COUNT(*) as total",
-            where=where_clause,
-            params=tuple(params)
+            offset=offset,
         )
 
         return jsonify({
             "lessons": lessons,
-            "total": total_lessons.get("total", 0) if total_lessons else 0,
+            "total": total_lessons,
             "limit": limit,
             "offset": offset
         })
@@ -1057,9 +997,7 @@ def get_lesson_progress_route(lesson_id: int):
                 {
                     "block_id": str,            # Block identifier
                     "completed": bool,          # Completion status
-                    "completed_at": str,        # Completion timestamp
-                    "time_spent": int,          # Time spent in seconds
-                    "score": float              # Performance score
+                    "completed_at": str         # Completion timestamp (null if open)
                 }
             ]
         }
@@ -1084,27 +1022,34 @@ def get_lesson_progress_route(lesson_id: int):
         if not lesson:
             return jsonify({"error": "Lesson not found"}), 404
 
-        # Get user progress
-        progress = select_one(
+        # Get the progress rows written by the progress POST routes
+        progress_rows = select_rows(
             "lesson_progress",
-            columns="*",
-            where="user = ? AND lesson_id = ?",
-            params=(user, lesson_id)
-        )
-
-        # Get block progress
-        block_progress = select_rows(
-            "block_progress",
-            columns="*",
-            where="user = ? AND lesson_id = ?",
+            columns="block_id, completed, updated_at",
+            where="user_id = ? AND lesson_id = ?",
             params=(user, lesson_id),
             order_by="block_id ASC"
         )
 
+        block_progress = [
+            {
+                "block_id": row["block_id"],
+                "completed": bool(row["completed"]),
+                "completed_at": row["updated_at"] if row["completed"] else None
+            }
+            for row in progress_rows
+            if row["block_id"] != "manual_completion"
+        ]
+        manually_completed = any(
+            row["block_id"] == "manual_completion" and row["completed"] for row in progress_rows
+        )
+
         # Calculate completion
-        completed_blocks = len([b for b in block_progress if b.get("completed")])
-        total_blocks = lesson.get("num_blocks", 0)
+        completed_blocks = len([b for b in block_progress if b["completed"]])
+        total_blocks = lesson.get("num_blocks") or 0
         completion_percentage = (completed_blocks / total_blocks * 100) if total_blocks > 0 else 0
+        last_activity = max((row["updated_at"] for row in progress_rows if row["updated_at"]), default=None)
+        is_completed = completed_blocks >= total_blocks if total_blocks > 0 else manually_completed
 
         return jsonify({
             "lesson_id": lesson_id,
@@ -1113,8 +1058,8 @@ def get_lesson_progress_route(lesson_id: int):
                 "completed_blocks": completed_blocks,
                 "total_blocks": total_blocks,
                 "completion_percentage": round(completion_percentage, 2),
-                "last_activity": progress.get("updated_at") if progress else None,
-                "is_completed": completed_blocks >= total_blocks
+                "last_activity": last_activity,
+                "is_completed": is_completed
             },
             "block_progress": block_progress
         })
@@ -1138,8 +1083,6 @@ def update_lesson_progress_route(lesson_id: int):
     Request Body:
         - block_id (str, required): Block identifier
         - completed (bool, optional): Completion status (default: true)
-        - time_spent (int, optional): Time spent in seconds
-        - score (float, optional): Performance score
 
     JSON Response Structure:
         {
@@ -1166,8 +1109,6 @@ def update_lesson_progress_route(lesson_id: int):
 
         block_id = data.get("block_id")
         completed = data.get("completed", True)
-        time_spent = data.get("time_spent")
-        score = data.get("score")
 
         if not block_id:
             return jsonify({"error": "Block ID is required"}), 400
@@ -1183,50 +1124,51 @@ def update_lesson_progress_route(lesson_id: int):
         if not lesson:
             return jsonify({"error": "Lesson not found"}), 404
 
-        # Update block progress
-        progress_data = {
-            "user": user,
-            "lesson_id": lesson_id,
-            "block_id": block_id,
-            "completed": completed,
-            "updated_at": datetime.now().isoformat()
-        }
-
-        if time_spent is not None:
-            progress_data["time_spent"] = time_spent
-
-        if score is not None:
-            progress_data["score"] = score
+        now = datetime.now()
+        current_time = now.isoformat()
 
         # Check if progress record exists
         existing_progress = select_one(
-            "block_progress",
-            columns="id",
-            where="user = ? AND lesson_id = ? AND block_id = ?",
+            "lesson_progress",
+            columns="completed, updated_at",
+            where="user_id = ? AND lesson_id = ? AND block_id = ?",
             params=(user, lesson_id, block_id)
         )
 
         if existing_progress:
             # Update existing progress
             success = update_row(
-                "block_progress",
-                progress_data,
-                "WHERE user = ? AND lesson_id = ? AND block_id = ?",
+                "lesson_progress",
+                {
+                    "completed": int(bool(completed)),
+                    "updated_at": current_time
+                },
+                "user_id = ? AND lesson_id = ? AND block_id = ?",
                 (user, lesson_id, block_id)
             )
         else:
             # Create new progress record
-            success = insert_row("block_progress", progress_data)
+            success = insert_row("lesson_progress", {
+                "user_id": user,
+                "lesson_id": lesson_id,
+                "block_id": block_id,
+                "completed": int(bool(completed)),
+                "updated_at": current_time
+            })
 
         if not success:
             return jsonify({"error": "Failed to update progress"}), 500
 
+        DailyActivityService.record_lesson_progress(user, existing_progress, completed, occurred_at=now)
+        if completed:
+            AchievementService.record_event(user, "lesson")
+
         return jsonify({
             "message": "Progress updated successfully",
             "lesson_id": lesson_id,
             "block_id": block_id,
             "completed": completed,
-            "updated_at": progress_data["updated_at"]
+            "updated_at": current_time
         })
 
     except DatabaseError as e:
@@ -41,6 +41,7 @@ from features.translation import (
     cleanup_expired_jobs,
 )
 from features.ai.generation.feedback_helpers import format_feedback_block
+from shared.cancellation import CancellationToken, cancel_scope, check_cancelled
 from shared.exceptions import DatabaseError
 
 
@@ -236,23 +237,25 @@ def stream_translation_route():
                 try:
                     logger.info(f"Starting translation for: '{english}' -> '{student_input}'")
 
-                    # Add a simple timeout mechanism
-                    import time
-                    start_time = time.time()
-                    timeout = 30  # 30 seconds timeout
-
-                    # First, get the German translation
+                    # One 30 second budget for both AI calls; the Mistral transport
+                    # shrinks its timeouts to what is left and stops once it runs out
                     from features.ai.memory.vocabulary_memory import translate_to_german
-                    logger.info("Calling translate_to_german...")
-
-                    # Check timeout before each major operation
-                    if time.time() - start_time > timeout:
-                        raise Exception("Translation timeout - taking too long")
-
-                    german = translate_to_german(english, username)
-                    logger.info(f"Got German translation: '{german}'")
-
-                    if not isinstance(german, str) or "❌" in german:
+                    from features.ai.evaluation import evaluate_translation_ai
+                    with cancel_scope(CancellationToken(30)):
+                        # First, get the German translation
+                        logger.info("Calling translate_to_german...")
+                        german = translate_to_german(english, username)
+                        logger.info(f"Got German translation: '{german}'")
+
+                        translated = isinstance(german, str) and "❌" not in german
+                        if translated:
+                            # Evaluate the student's translation
+                            check_cancelled()
+                            logger.info("Calling evaluate_translation_ai...")
+                            correct, reason = evaluate_translation_ai(english, german, student_input)
+                            logger.info(f"Evaluation result: correct={correct}, reason={reason}")
+
+                    if not translated:
                         logger.error(f"Translation failed: {german}")
                         # Send error feedback block
                         error_feedback = format_feedback_block(
@@ -266,16 +269,6 @@ def stream_translation_route():
                         yield f"data: {json.dumps({'feedbackBlock': error_feedback})}\n\n"
                         return
 
-                    # Check timeout before evaluation
-                    if time.time() - start_time > timeout:
-                        raise Exception("Evaluation timeout - taking too long")
-
-                    # Evaluate the student's translation
-                    from features.ai.evaluation import evaluate_translation_ai
-                    logger.info("Calling evaluate_translation_ai...")
-                    correct, reason = evaluate_translation_ai(english, german, student_input)
-                    logger.info(f"Evaluation result: correct={correct}, reason={reason}")
-
                     # Build the feedback block
                     feedback_block = format_feedback_block(
                         user_answer=student_input,
@@ -292,10 +285,9 @@ def stream_translation_route():
                     logger.info("Feedback block streamed successfully")
 
                     # Trigger grammar/dictionary analysis in the background (async, not blocking feedback)
-                    from threading import Thread
                     from features.ai.generation.translate_helpers import update_memory_async
-                    Thread(target=update_memory_async, args=(username, english, german, student_input), daemon=True).start()
-                    logger.info("Background memory update started")
+                    update_memory_async(username, english, german, student_input)
+                    logger.info("Background memory update queued")
 
                 except Exception as e:
                     logger.error(f"Error in translation stream: {e}")
@@ -26,7 +26,7 @@ from datetime import datetime
 
 from infrastructure.imports import Imports
 from api.middleware.auth import get_current_user
-from core.database.connection import select_rows, insert_row, select_one, update_row, delete_rows, fetch_topic_memory
+from core.database.connection import select_rows, insert_row, select_one, update_row, delete_rows, fetch_topic_memory, fetch_due_topic_memory, transaction
 from config.blueprint import user_bp
 from features.vocabulary import (
     lookup_vocabulary_word,
@@ -296,7 +296,7 @@ def vocab_train():
     and accepts training results to update word mastery levels.
 
     GET Request:
-        Retrieves words due for review or training.
+        Retrieves the next words due for review, earliest due first.
 
     POST Request:
         Submits training results to update word progress.
@@ -457,45 +457,46 @@ def save_vocab_words():
         saved_words = []
         duplicates_skipped = 0
 
-        for word_data in words:
-            # Check if word already exists
-            existing = select_one(
-                "vocabulary",
-                columns="id",
-                where="username = ? AND word = ?",
-                params=(user, word_data["word"])
-            )
-
-            if existing:
-                duplicates_skipped += 1
-                continue
-
-            # Insert new word
-            vocab_data = {
-                "username": user,
-                "word": word_data["word"],
-                "translation": word_data["translation"],
-                "part_of_speech": word_data.get("part_of_speech", ""),
-                "difficulty": word_data.get("difficulty", "medium"),
-                "example_sentence": word_data.get("example_sentence", ""),
-                "notes": word_data.get("notes", ""),
-                "source": source,
-                "status": "learning",
-                "mastery_level": 0.0,
-                "review_count": 0,
-                "added_at": datetime.now().isoformat()
-            }
-
-            word_id = insert_row("vocabulary", vocab_data)
-
-            if word_id:
-                saved_words.append({
-                    "id": word_id,
+        with transaction():
+            for word_data in words:
+                # Check if word already exists
+                existing = select_one(
+                    "vocabulary",
+                    columns="id",
+                    where="username = ? AND word = ?",
+                    params=(user, word_data["word"])
+                )
+
+                if existing:
+                    duplicates_skipped += 1
+                    continue
+
+                # Insert new word
+                vocab_data = {
+                    "username": user,
                     "word": word_data["word"],
                     "translation": word_data["translation"],
+                    "part_of_speech": word_data.get("part_of_speech", ""),
+                    "difficulty": word_data.get("difficulty", "medium"),
+                    "example_sentence": word_data.get("example_sentence", ""),
+                    "notes": word_data.get("notes", ""),
+                    "source": source,
                     "status": "learning",
-                    "added_at": vocab_data["added_at"]
-                })
+                    "mastery_level": 0.0,
+                    "review_count": 0,
+                    "added_at": datetime.now().isoformat()
+                }
+
+                word_id = insert_row("vocabulary", vocab_data)
+
+                if word_id:
+                    saved_words.append({
+                        "id": word_id,
+                        "word": word_data["word"],
+                        "translation": word_data["translation"],
+                        "status": "learning",
+                        "added_at": vocab_data["added_at"]
+                    })
 
         return jsonify({
             "message": f"Successfully saved {len(saved_words)} vocabulary words",
@@ -724,6 +725,45 @@ def get_topic_memory():
         return jsonify({"error": "Failed to retrieve topic memory"}), 500
 
 
+@user_bp.route("/topic-memory/due", methods=["GET"])
+def get_due_topic_memory():
+    """
+    Get the user's grammar topics that are due for review.
+
+    This endpoint returns the next due topics in review order so clients
+    can prefetch a batch of reviews with a single request.
+
+    Query Parameters:
+        - limit (int, optional): Maximum number of topics (default: 20, max: 100)
+
+    JSON Response Structure:
+        Array of topic memory entries (same fields as GET /topic-memory),
+        ordered by next_repeat ascending
+
+    Status Codes:
+        - 200: Success
+        - 400: Invalid limit
+        - 401: Unauthorized
+        - 500: Internal server error
+    """
+    user = get_current_user()
+    if not user:
+        return jsonify({"msg": "Unauthorized"}), 401
+
+    try:
+        limit = int(request.args.get("limit", 20))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    try:
+        due_topics = fetch_due_topic_memory(user, limit=max(1, min(limit, 100)))
+        return jsonify(due_topics or [])
+
+    except Exception as e:
+        logger.error(f"Error getting due topic memory for user {user}: {e}")
+        return jsonify({"error": "Failed to retrieve due topics"}), 500
+
+
 @user_bp.route("/topic-memory", methods=["DELETE"])
 def clear_topic_memory_route():
     """
@@ -32,17 +32,16 @@ def setup_logging(
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_file: Path to log file (defaults to logs/app.log)
+        log_file: Path to log file (defaults to ``LOG_FILE`` or logs/app.log)
         max_bytes: Maximum size of log file before rotation
         backup_count: Number of backup log files to keep
     """
-    # Create logs directory if it doesn't exist
-    logs_dir = Path(__file__).parent.parent.parent / "logs"
-    logs_dir.mkdir(exist_ok=True)
-
     # Default log file path
     if log_file is None:
-        log_file = logs_dir / "app.log"
+        log_file = get_log_file_path()
+
+    # Create logs directory if it doesn't exist
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
 
     # Convert string log level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
@@ -128,8 +127,10 @@ def get_log_file_path() -> Path:
     Get the current log file path.
 
     Returns:
-        Path to the current log file
+        Path to the current log file (``LOG_FILE`` when set)
     """
+    if os.getenv("LOG_FILE"):
+        return Path(os.environ["LOG_FILE"])
     logs_dir = Path(__file__).parent.parent.parent / "logs"
     return logs_dir / "app.log"
 
@@ -6,6 +6,7 @@ following clean architecture principles as outlined in the documentation.
 
 Database Components:
 - connection: Database connection and query management
+- pool: Thread-local SQLite connection pool with tuned pragmas
 - db_helpers: Database helper utilities and convenient imports
 
 Note: Database migrations have been moved to scripts/migrations/ for better separation.
@@ -15,16 +16,23 @@ For detailed architecture information, see: docs/backend_structure.md
 
 from . import connection
 from . import db_helpers
+from . import pool
 
 # Re-export commonly used items for convenience
 from .connection import (
     get_connection,
+    get_pool,
+    get_pool_stats,
+    transaction,
     execute_query,
     fetch_all,
     fetch_one,
     insert_row,
     update_row,
     delete_rows,
+    execute_many,
+    bulk_insert,
+    bulk_upsert,
     select_rows,
     select_one,
 )
@@ -36,6 +44,7 @@ from .db_helpers import (
     fetch_all as db_fetch_all,
     fetch_one as db_fetch_one,
     fetch_topic_memory,
+    fetch_due_topic_memory,
     fetch_custom,
     fetch_one_custom,
     insert_row as db_insert_row,
@@ -51,9 +60,13 @@ __all__ = [
     # Module imports
     "connection",
     "db_helpers",
+    "pool",
 
     # Connection management
     "get_connection",
+    "get_pool",
+    "get_pool_stats",
+    "transaction",
     "db_get_connection",
 
     # Query execution
@@ -66,6 +79,7 @@ __all__ = [
     "db_fetch_all",
     "db_fetch_one",
     "fetch_topic_memory",
+    "fetch_due_topic_memory",
     "fetch_custom",
     "fetch_one_custom",
 
@@ -73,6 +87,9 @@ __all__ = [
     "insert_row",
     "update_row",
     "delete_rows",
+    "execute_many",
+    "bulk_insert",
+    "bulk_upsert",
     "db_insert_row",
     "db_update_row",
     "db_delete_rows",
@@ -5,10 +5,12 @@ This module provides SQLite database connection and query management utilities,
 following clean architecture principles as outlined in the documentation.
 
 Database Operations:
-- Connection Management: Database file handling and connection creation
+- Connection Management: Pooled thread-local connections (see core.database.pool)
+- Transactions: Unit-of-work grouping of writes with savepoint nesting
 - Query Execution: SQL query execution with parameter binding
 - Data Retrieval: Fetch operations for single and multiple rows
 - Data Modification: Insert, update, and delete operations
+- Bulk Operations: Chunked executemany, bulk insert and bulk upsert
 - Query Building: Dynamic SQL query construction utilities
 
 For detailed architecture information, see: docs/backend_structure.md
@@ -16,10 +18,13 @@ For detailed architecture information, see: docs/backend_structure.md
 
 import os
 import sqlite3
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Union, Tuple
+from typing import Iterator, List, Optional, Sequence, Union, Tuple
 from shared.exceptions import ConfigurationError, DatabaseError
 from shared.types import DatabaseRow, DatabaseList, DatabaseResult
+from core.database.pool import ConnectionPool
 
 # === Environment Configuration ===
 try:
@@ -44,6 +49,9 @@ DB = os.getenv("DB_FILE")
 if not DB:
     raise ConfigurationError("❌ DB_FILE is not set in .env or environment variables.")
 
+# Rows per executemany() call for the bulk helpers
+DEFAULT_BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "500"))
+
 # Ensure the directory for the database exists
 db_path = Path(DB)
 db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -52,9 +60,15 @@ if not db_path.exists():
 
 
 # === Connection Management ===
+_pool = ConnectionPool(DB)
+
+
 def get_connection():
     """
-    Return a connection to the configured SQLite database file.
+    Return the calling thread's pooled connection to the SQLite database.
+
+    The connection is long-lived and shared by every query the thread runs,
+    so ``close()`` on it only releases an open transaction.
 
     Returns:
         sqlite3.Connection: Database connection object
@@ -64,7 +78,95 @@ def get_connection():
     """
     if not DB:
         raise ConfigurationError("Database file path is not configured")
-    return sqlite3.connect(DB)
+    return _pool.connection()
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide connection pool."""
+    return _pool
+
+
+def get_pool_stats() -> dict:
+    """
+    Return connection pool statistics for diagnostics.
+
+    Returns:
+        dict: Pool counters and pragma configuration
+    """
+    return _pool.stats()
+
+
+# === Transactions ===
+@contextmanager
+def transaction(immediate: bool = True) -> Iterator[sqlite3.Connection]:
+    """
+    Group every write made inside the block into a single commit.
+
+    All helpers in this module (``insert_row``, ``update_row``, ``execute_query``
+    ...) called inside the block join the transaction instead of committing on
+    their own. Nested ``transaction()`` blocks become savepoints, so an inner
+    failure only undoes the inner block when the caller handles the exception.
+
+    Keep slow work (AI calls, HTTP requests) outside the block: the SQLite write
+    lock is held until the outermost block exits.
+
+    Args:
+        immediate: Take the write lock up front with ``BEGIN IMMEDIATE`` to avoid
+            lock-upgrade failures under concurrent writers (default: True)
+
+    Yields:
+        sqlite3.Connection: The pooled connection owning the transaction
+
+    Raises:
+        DatabaseError: If the transaction cannot be started or committed
+    """
+    conn = get_connection()
+
+    if conn.uow_depth:
+        savepoint = f"uow_{conn.uow_depth}"
+        conn.execute(f"SAVEPOINT {savepoint}")
+        conn.uow_depth += 1
+        try:
+            yield conn
+        except BaseException:
+            conn.uow_depth -= 1
+            conn.execute(f"ROLLBACK TO {savepoint}")
+            conn.execute(f"RELEASE {savepoint}")
+            raise
+        conn.uow_depth -= 1
+        conn.execute(f"RELEASE {savepoint}")
+        return
+
+    try:
+        if conn.in_transaction:
+            # Flush an implicit transaction left open by a legacy caller
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    except sqlite3.Error as e:
+        _pool.recycle(e)
+        raise DatabaseError(f"Could not start transaction: {e}")
+
+    conn.uow_depth = 1
+    try:
+        yield conn
+    except BaseException:
+        conn.uow_depth = 0
+        try:
+            conn.rollback()
+        except sqlite3.Error as e:
+            _pool.recycle(e)
+        raise
+
+    conn.uow_depth = 0
+    try:
+        conn.commit()
+    except sqlite3.Error as e:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        _pool.recycle(e)
+        raise DatabaseError(f"Could not commit transaction: {e}")
 
 
 # === Query Execution ===
@@ -86,8 +188,8 @@ def execute_query(query: str, params: Tuple = (), fetch: bool = False, many: boo
     """
     try:
         with get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
             try:
                 if many:
@@ -116,6 +218,8 @@ def execute_query(query: str, params: Tuple = (), fetch: bool = False, many: boo
         logger.error(f"Database execute_query error: {e}")
         logger.error(f"Query: {query}")
         logger.error(f"Params: {params}")
+        if isinstance(e, sqlite3.Error):
+            _pool.recycle(e)
         if fetch:
             return []
         return None
@@ -207,6 +311,31 @@ def fetch_topic_memory(username: str, include_correct: bool = False) -> Union[Da
         return False
 
 
+def fetch_due_topic_memory(username: str, limit: int = 20, now: Optional[int] = None) -> DatabaseList:
+    """
+    Fetch the next topic memory entries due for review, earliest first.
+
+    Uses the indexed ``(username, next_repeat_at)`` epoch column so the whole
+    queue is one range read instead of a scan over every topic of the user.
+
+    Args:
+        username: Username to fetch the queue for
+        limit: Maximum number of entries to return
+        now: Epoch seconds to treat as the current time (default: now)
+
+    Returns:
+        DatabaseList: Due topic memory entries (empty list on error)
+    """
+    now = int(time.time()) if now is None else int(now)
+    return fetch_all(
+        "topic_memory",
+        "WHERE username = ? AND next_repeat_at <= ?",
+        (username, now),
+        order_by="next_repeat_at ASC",
+        limit=max(1, int(limit)),
+    )
+
+
 # === Data Modification Operations ===
 def insert_row(table: str, data: DatabaseRow) -> bool:
     """
@@ -261,6 +390,129 @@ def delete_rows(table: str, where_clause: str = "", params: Tuple = ()) -> bool:
     return execute_query(query, params) is True
 
 
+# === Bulk Operations ===
+def execute_many(query: str, rows: Sequence[Tuple], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Run one statement for many parameter tuples in chunked ``executemany`` calls.
+
+    All chunks share a single transaction (or join the caller's), so either
+    every row is written or none is.
+
+    Args:
+        query: SQL statement with ``?`` placeholders
+        rows: Parameter tuples, one per execution
+        batch_size: Rows per ``executemany`` call (default: DB_BATCH_SIZE)
+
+    Returns:
+        int: Number of parameter tuples executed
+
+    Raises:
+        DatabaseError: If any chunk fails
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    batch_size = max(1, int(batch_size))
+
+    try:
+        with transaction() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(rows), batch_size):
+                cursor.executemany(query, rows[start:start + batch_size])
+        return len(rows)
+    except DatabaseError:
+        raise
+    except sqlite3.Error as e:
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.error(f"Database execute_many error: {e}")
+        logger.error(f"Query: {query}")
+        logger.error(f"Rows: {len(rows)}")
+        raise DatabaseError(f"Bulk statement failed: {e}")
+
+
+def _bulk_columns(rows: Sequence[DatabaseRow]) -> List[str]:
+    """Return the union of row keys, preserving first-seen order."""
+    columns: List[str] = []
+    for row in rows:
+        for key in row.keys():
+            if key not in columns:
+                columns.append(key)
+    return columns
+
+
+def bulk_insert(table: str, rows: Sequence[DatabaseRow], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Insert many rows into the specified table.
+
+    Rows may omit columns present in other rows; missing values become NULL.
+
+    Args:
+        table: Table name to insert into
+        rows: Dictionaries of column names and values
+        batch_size: Rows per ``executemany`` call (default: DB_BATCH_SIZE)
+
+    Returns:
+        int: Number of rows inserted
+
+    Raises:
+        DatabaseError: If the insert fails (no rows are written)
+    """
+    if not rows:
+        return 0
+    columns = _bulk_columns(rows)
+    placeholders = ", ".join(["?" for _ in columns])
+    query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    params = [tuple(row.get(col) for col in columns) for row in rows]
+    return execute_many(query, params, batch_size)
+
+
+def bulk_upsert(
+    table: str,
+    rows: Sequence[DatabaseRow],
+    conflict_cols: Sequence[str],
+    update_cols: Optional[Sequence[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Insert many rows, updating existing ones via ``INSERT ... ON CONFLICT``.
+
+    ``conflict_cols`` must match a PRIMARY KEY or UNIQUE index on the table.
+
+    Args:
+        table: Table name to upsert into
+        rows: Dictionaries of column names and values
+        conflict_cols: Columns identifying an existing row
+        update_cols: Columns to overwrite on conflict (default: every non-key
+            column); pass an empty list to keep existing rows untouched
+        batch_size: Rows per ``executemany`` call (default: DB_BATCH_SIZE)
+
+    Returns:
+        int: Number of rows processed
+
+    Raises:
+        DatabaseError: If the upsert fails (no rows are written)
+    """
+    if not rows:
+        return 0
+    columns = _bulk_columns(rows)
+    if update_cols is None:
+        update_cols = [col for col in columns if col not in conflict_cols]
+
+    placeholders = ", ".join(["?" for _ in columns])
+    query = (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT({', '.join(conflict_cols)}) "
+    )
+    if update_cols:
+        query += "DO UPDATE SET " + ", ".join(f"{col} = excluded.{col}" for col in update_cols)
+    else:
+        query += "DO NOTHING"
+
+    params = [tuple(row.get(col) for col in columns) for row in rows]
+    return execute_many(query, params, batch_size)
+
+
 # === Custom Query Operations ===
 def fetch_custom(query: str, params: Tuple = ()) -> DatabaseList:
     """
@@ -354,6 +606,11 @@ def select_one(
 __all__ = [
     # Connection management
     "get_connection",
+    "get_pool",
+    "get_pool_stats",
+
+    # Transactions
+    "transaction",
 
     # Query execution
     "execute_query",
@@ -362,6 +619,7 @@ __all__ = [
     "fetch_all",
     "fetch_one",
     "fetch_topic_memory",
+    "fetch_due_topic_memory",
     "fetch_custom",
     "fetch_one_custom",
 
@@ -370,6 +628,11 @@ __all__ = [
     "update_row",
     "delete_rows",
 
+    # Bulk operations
+    "execute_many",
+    "bulk_insert",
+    "bulk_upsert",
+
     # Modern interface
     "select_rows",
     "select_one",
@@ -9,6 +9,7 @@ Database Operations:
 - Query Execution: SQL query execution functions
 - Data Retrieval: Fetch operations for data access
 - Data Modification: Insert, update, and delete operations
+- Bulk Operations: Chunked executemany, bulk insert and bulk upsert
 
 For detailed architecture information, see: docs/backend_structure.md
 """
@@ -17,6 +18,8 @@ For detailed architecture information, see: docs/backend_structure.md
 from core.database.connection import (
     # Connection management
     get_connection,
+    get_pool_stats,
+    transaction,
 
     # Query execution
     execute_query,
@@ -25,6 +28,7 @@ from core.database.connection import (
     fetch_all,
     fetch_one,
     fetch_topic_memory,
+    fetch_due_topic_memory,
     fetch_custom,
     fetch_one_custom,
 
@@ -33,6 +37,11 @@ from core.database.connection import (
     update_row,
     delete_rows,
 
+    # Bulk operations
+    execute_many,
+    bulk_insert,
+    bulk_upsert,
+
     # Modern interface
     select_rows,
     select_one,
@@ -43,6 +52,8 @@ from core.database.connection import (
 __all__ = [
     # Connection management
     "get_connection",
+    "get_pool_stats",
+    "transaction",
 
     # Query execution
     "execute_query",
@@ -51,6 +62,7 @@ __all__ = [
     "fetch_all",
     "fetch_one",
     "fetch_topic_memory",
+    "fetch_due_topic_memory",
     "fetch_custom",
     "fetch_one_custom",
 
@@ -59,6 +71,11 @@ __all__ = [
     "update_row",
     "delete_rows",
 
+    # Bulk operations
+    "execute_many",
+    "bulk_insert",
+    "bulk_upsert",
+
     # Modern interface
     "select_rows",
     "select_one",
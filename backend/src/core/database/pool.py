@@ -0,0 +1,245 @@
+"""
+XplorED - SQLite Connection Pool
+
+This module provides a thread-local SQLite connection pool for the database layer,
+following clean architecture principles as outlined in the documentation.
+
+Pool Behaviour:
+- Thread Affinity: Each worker thread owns one long-lived connection
+- Tuned Pragmas: WAL journal, synchronous=NORMAL, busy_timeout, mmap and cache sizes
+- Recycling: Connections are discarded and reopened after fatal errors
+- Fork Safety: Connections inherited from a parent process are never reused
+- Statistics: Open/reuse/recycle counters exposed for diagnostics
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# === Pool Configuration ===
+DEFAULT_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+DEFAULT_MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+DEFAULT_CACHE_SIZE_KB = int(os.getenv("DB_CACHE_SIZE_KB", "20000"))
+DEFAULT_MAX_AGE_SECONDS = int(os.getenv("DB_POOL_MAX_AGE", "3600"))
+
+
+# === Pooled Connection ===
+class PooledConnection(sqlite3.Connection):
+    """
+    SQLite connection that stays open when callers ``close()`` it.
+
+    Legacy call sites still do ``conn = get_connection(); ...; conn.close()``.
+    For a pooled connection ``close()`` only rolls back an unfinished
+    transaction so the write lock is released; the pool owns the real close.
+
+    While a unit of work is active (``uow_depth > 0``) the connection ignores
+    ``commit()``, ``close()`` and ``with conn:`` so that nested helpers join
+    the surrounding transaction instead of committing it piecemeal.
+    """
+
+    uow_depth = 0
+
+    def commit(self) -> None:  # type: ignore[override]
+        """Commit unless a unit of work owns the transaction."""
+        if self.uow_depth:
+            return
+        super().commit()
+
+    def __exit__(self, exc_type, exc_value, traceback):  # type: ignore[override]
+        if self.uow_depth:
+            return False
+        return super().__exit__(exc_type, exc_value, traceback)
+
+    def close(self) -> None:  # type: ignore[override]
+        """Release the connection back to the pool instead of closing it."""
+        if self.uow_depth:
+            return
+        try:
+            if self.in_transaction:
+                self.rollback()
+        except sqlite3.Error:
+            pass
+
+    def _close_physical(self) -> None:
+        """Close the underlying SQLite handle."""
+        super().close()
+
+
+# === Connection Pool ===
+class ConnectionPool:
+    """Thread-local pool handing each thread one long-lived SQLite connection."""
+
+    def __init__(
+        self,
+        db_path: str,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        cache_size_kb: int = DEFAULT_CACHE_SIZE_KB,
+        max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        self.db_path = db_path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.mmap_size = mmap_size
+        self.cache_size_kb = cache_size_kb
+        self.max_age_seconds = max_age_seconds
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._stats = {
+            "opened": 0,
+            "closed": 0,
+            "checkouts": 0,
+            "reused": 0,
+            "recycled": 0,
+            "errors": 0,
+        }
+
+    # --- internals ---
+    def _bump(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def _open(self) -> PooledConnection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000.0,
+            check_same_thread=False,
+            factory=PooledConnection,
+        )
+        cursor = conn.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode=WAL;")
+            cursor.execute("PRAGMA synchronous=NORMAL;")
+            cursor.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)};")
+            cursor.execute(f"PRAGMA mmap_size={int(self.mmap_size)};")
+            # Negative cache_size is interpreted by SQLite as KiB rather than pages
+            cursor.execute(f"PRAGMA cache_size=-{int(self.cache_size_kb)};")
+            cursor.execute("PRAGMA temp_store=MEMORY;")
+        finally:
+            cursor.close()
+
+        self._bump("opened")
+        logger.debug(f"Opened pooled SQLite connection for thread {threading.get_ident()}")
+        return conn
+
+    def _discard_local(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        self._local.opened_at = None
+        if conn is not None:
+            try:
+                conn._close_physical()
+            except sqlite3.Error:
+                pass
+            self._bump("closed")
+
+    def _reset_after_fork(self) -> None:
+        # Connections must never cross a fork; start with fresh state in the child
+        self._local = threading.local()
+        self._pid = os.getpid()
+
+    # --- public API ---
+    def connection(self) -> PooledConnection:
+        """
+        Return the calling thread's connection, opening it on first use.
+
+        Returns:
+            PooledConnection: Long-lived connection owned by the current thread
+        """
+        if os.getpid() != self._pid:
+            self._reset_after_fork()
+
+        self._bump("checkouts")
+        conn = getattr(self._local, "conn", None)
+        opened_at = getattr(self._local, "opened_at", None)
+
+        if conn is not None and self.max_age_seconds > 0 and opened_at is not None:
+            if time.monotonic() - opened_at > self.max_age_seconds and not conn.in_transaction and not conn.uow_depth:
+                self._discard_local()
+                self._bump("recycled")
+                conn = None
+
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            self._local.opened_at = time.monotonic()
+        else:
+            self._bump("reused")
+
+        # Row factories set by previous callers must not leak to the next one
+        conn.row_factory = None
+        return conn
+
+    def recycle(self, error: Optional[BaseException] = None) -> None:
+        """
+        Discard the calling thread's connection after an error.
+
+        Args:
+            error: The exception that triggered recycling (for logging only)
+        """
+        self._bump("errors")
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+
+        if conn.uow_depth:
+            # The surrounding unit of work decides between commit and rollback
+            return
+
+        if isinstance(error, sqlite3.IntegrityError):
+            # Constraint violations leave the connection perfectly usable
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                self._discard_local()
+                self._bump("recycled")
+            return
+
+        if error is not None:
+            logger.warning(f"Recycling pooled SQLite connection after error: {error}")
+        self._discard_local()
+        self._bump("recycled")
+
+    def close_thread_connection(self) -> None:
+        """Close the calling thread's connection, if any."""
+        self._discard_local()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return pool counters and configuration.
+
+        Returns:
+            Dict[str, Any]: Pool statistics
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["open_connections"] = stats["opened"] - stats["closed"]
+        stats["reuse_ratio"] = round(stats["reused"] / stats["checkouts"], 4) if stats["checkouts"] else 0.0
+        stats["pid"] = self._pid
+        stats["config"] = {
+            "db_path": self.db_path,
+            "journal_mode": "wal",
+            "synchronous": "normal",
+            "busy_timeout_ms": self.busy_timeout_ms,
+            "mmap_size": self.mmap_size,
+            "cache_size_kb": self.cache_size_kb,
+            "max_age_seconds": self.max_age_seconds,
+        }
+        return stats
+
+
+# === Export Configuration ===
+__all__ = [
+    "PooledConnection",
+    "ConnectionPool",
+]
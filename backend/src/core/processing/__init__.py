@@ -6,7 +6,8 @@ following clean architecture principles as outlined in the documentation.
 
 Processing Components:
 - html_processor: HTML content processing and lesson block management
-- background: Background processing and async task execution
+- background: Bounded background task executor with prioritised queues
+- job_queue: Durable Redis/SQLite job queue for AI pipelines and its worker
 - Content Cleaning: Remove unwanted HTML elements and styling
 - Block Management: Lesson block identification and manipulation
 - AI Data Handling: Exercise payload processing and cleanup
@@ -23,10 +24,20 @@ from .html_processor import (
 )
 
 from .background import (
+    submit_task,
+    get_background_stats,
     run_in_background,
     run_with_timeout,
 )
 
+from .job_queue import (
+    register_job,
+    dispatch_job,
+    should_retry_job,
+    idempotency_key,
+    get_job_queue_stats,
+)
+
 __all__ = [
     # HTML processing
     "clean_html",
@@ -36,6 +47,15 @@ __all__ = [
     "ansi_to_html",
 
     # Background processing
+    "submit_task",
+    "get_background_stats",
     "run_in_background",
     "run_with_timeout",
+
+    # Durable jobs
+    "register_job",
+    "dispatch_job",
+    "should_retry_job",
+    "idempotency_key",
+    "get_job_queue_stats",
 ]
@@ -5,37 +5,387 @@ This module provides background processing and asynchronous task execution utili
 following clean architecture principles as outlined in the documentation.
 
 Background Processing Components:
-- Asynchronous task execution
-- Thread management
-- Background job utilities
+- Task Executor: one bounded pool of ``BACKGROUND_WORKERS`` threads per
+  process, so the thread count stays flat however many requests queue work
+- Named Queues: ``interactive`` (work a user is waiting for), ``default``
+  (memory and vocabulary bookkeeping) and ``prefetch`` (speculative work);
+  workers always take the highest-priority queue first, and each queue can
+  cap how many workers it occupies
+- Backpressure: every queue is bounded; a full queue waits briefly for room
+  and then rejects the task with ``TaskQueueFullError``
+- Metrics: per-queue counts plus queue-wait and run-time percentiles
+- Graceful Drain: on interpreter exit, queued and running tasks get up to
+  ``BACKGROUND_DRAIN_TIMEOUT`` seconds to finish
+- Context: tasks run in a copy of the submitter's context variables, so
+  request-scoped values such as the AI call owner carry over
+- Timeouts: ``run_with_timeout`` gives the call a cancellation token (see
+  ``shared.cancellation``) that the Mistral and TTS transports honour, and
+  counts threads that keep running after their timeout as leaked
 
 For detailed architecture information, see: docs/backend_structure.md
 """
 
+import atexit
+import contextvars
+import logging
+import os
 import threading
-from typing import Any, Callable
-from shared.exceptions import TimeoutError
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from shared.cancellation import CancellationToken, cancel_scope, current_token
+from shared.exceptions import TaskQueueFullError, TimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+# === Executor Configuration ===
+BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", "8"))
+BACKGROUND_QUEUE_MAX = int(os.getenv("BACKGROUND_QUEUE_MAX", "256"))
+BACKGROUND_PREFETCH_QUEUE_MAX = int(os.getenv("BACKGROUND_PREFETCH_QUEUE_MAX", "32"))
+BACKGROUND_PREFETCH_WORKERS = int(os.getenv("BACKGROUND_PREFETCH_WORKERS", str(max(1, BACKGROUND_WORKERS // 4))))
+BACKGROUND_SUBMIT_TIMEOUT = float(os.getenv("BACKGROUND_SUBMIT_TIMEOUT", "2"))
+BACKGROUND_DRAIN_TIMEOUT = float(os.getenv("BACKGROUND_DRAIN_TIMEOUT", "30"))
+# Seconds a timed-out call gets to notice its cancellation before its thread counts as leaked
+TIMEOUT_CANCEL_GRACE = float(os.getenv("TIMEOUT_CANCEL_GRACE", "5"))
+
+# Recent timings kept per queue for the percentiles
+METRICS_WINDOW = 500
+
+# name -> (priority, max queued tasks, max running tasks); lower priority runs first
+TASK_QUEUES: Dict[str, Tuple[int, int, int]] = {
+    "interactive": (0, BACKGROUND_QUEUE_MAX, BACKGROUND_WORKERS),
+    "default": (1, BACKGROUND_QUEUE_MAX, BACKGROUND_WORKERS),
+    "prefetch": (2, BACKGROUND_PREFETCH_QUEUE_MAX, BACKGROUND_PREFETCH_WORKERS),
+}
+
+
+# === Queue State ===
+class _TaskQueue:
+    """Pending tasks, running count and timing metrics of one named queue."""
+
+    def __init__(self, name: str, priority: int, max_size: int, max_running: int):
+        self.name = name
+        self.priority = priority
+        self.max_size = max(1, max_size)
+        self.max_running = max(1, max_running)
+        self.pending: Deque[Tuple[Future, Callable, float]] = deque()
+        self.running = 0
+        self.counts = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self.wait_times: Deque[float] = deque(maxlen=METRICS_WINDOW)
+        self.run_times: Deque[float] = deque(maxlen=METRICS_WINDOW)
+
+    def stats(self) -> Dict[str, Any]:
+        def percentile(values: List[float], pct: float) -> float:
+            if not values:
+                return 0.0
+            ordered = sorted(values)
+            return round(ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))], 3)
+
+        waits, runs = list(self.wait_times), list(self.run_times)
+        return {
+            "priority": self.priority,
+            "queued": len(self.pending),
+            "running": self.running,
+            "max_size": self.max_size,
+            "max_running": self.max_running,
+            **self.counts,
+            "wait_p50_seconds": percentile(waits, 50),
+            "wait_p95_seconds": percentile(waits, 95),
+            "run_p50_seconds": percentile(runs, 50),
+            "run_p95_seconds": percentile(runs, 95),
+            "run_max_seconds": round(max(runs), 3) if runs else 0.0,
+        }
+
+
+# === Task Executor ===
+class TaskExecutor:
+    """
+    Bounded, prioritised worker pool for fire-and-forget background work.
+
+    Workers start lazily on the first submission (and again after a fork),
+    so importing the module never spawns threads.
+    """
+
+    def __init__(self, workers: int = BACKGROUND_WORKERS, queues: Optional[Dict[str, Tuple[int, int, int]]] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            workers: Number of worker threads
+            queues: Queue name -> (priority, max queued, max running)
+        """
+        self.workers = max(1, workers)
+        self._queues = {
+            name: _TaskQueue(name, priority, max_size, max_running)
+            for name, (priority, max_size, max_running) in (queues or TASK_QUEUES).items()
+        }
+        self._by_priority = sorted(self._queues.values(), key=lambda queue: queue.priority)
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._pid: Optional[int] = None
+        self._accepting = True
+
+    def _ensure_workers(self) -> None:
+        """Start the worker threads in this process if they are not running (call with the lock held)."""
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._threads = []
+        for queue in self._queues.values():
+            # Tasks queued before a fork belong to the parent process
+            queue.pending.clear()
+            queue.running = 0
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"bg-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(
+        self,
+        queue: str,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """
+        Queue ``func(*args, **kwargs)`` on a named queue.
+
+        Args:
+            queue: Queue name (``interactive``, ``default`` or ``prefetch``)
+            func: Function to execute in background
+            *args: Positional arguments to pass to the function
+            timeout: Seconds to wait for room in a full queue (default
+                ``BACKGROUND_SUBMIT_TIMEOUT``; 0 rejects immediately)
+            **kwargs: Keyword arguments to pass to the function
+
+        Returns:
+            Future: Resolves with the function's result or exception
+
+        Raises:
+            TaskQueueFullError: If the queue stays full or the executor is shutting down
+            ValueError: If the queue name is unknown
+        """
+        task_queue = self._queues.get(queue)
+        if task_queue is None:
+            raise ValueError(f"Unknown background queue: {queue}")
+
+        context = contextvars.copy_context()
+        future: Future = Future()
+        wait = BACKGROUND_SUBMIT_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + wait
+
+        with self._cond:
+            self._ensure_workers()
+            while self._accepting and len(task_queue.pending) >= task_queue.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            if not self._accepting or len(task_queue.pending) >= task_queue.max_size:
+                task_queue.counts["rejected"] += 1
+                reason = "shutting down" if not self._accepting else f"{task_queue.max_size} tasks queued"
+                raise TaskQueueFullError(f"Background queue '{queue}' rejected {getattr(func, '__name__', 'task')}: {reason}")
+
+            task_queue.pending.append((future, lambda: context.run(func, *args, **kwargs), time.monotonic()))
+            task_queue.counts["submitted"] += 1
+            self._cond.notify_all()
+        return future
+
+    def _next_task(self) -> Optional[Tuple[_TaskQueue, Future, Callable, float]]:
+        """Pop the oldest task of the highest-priority queue below its running cap (call with the lock held)."""
+        for task_queue in self._by_priority:
+            if task_queue.pending and task_queue.running < task_queue.max_running:
+                future, call, queued_at = task_queue.pending.popleft()
+                task_queue.running += 1
+                return task_queue, future, call, queued_at
+        return None
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                task = self._next_task()
+                while task is None:
+                    self._cond.wait()
+                    task = self._next_task()
+                # A slot in the queue was freed for blocked submitters
+                self._cond.notify_all()
+
+            task_queue, future, call, queued_at = task
+            started = time.monotonic()
+            failed = False
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(call())
+                except BaseException as e:
+                    failed = True
+                    future.set_exception(e)
+                    logger.error(f"Background task in queue '{task_queue.name}' failed: {e}", exc_info=True)
+
+            with self._cond:
+                task_queue.running -= 1
+                task_queue.counts["failed" if failed else "completed"] += 1
+                task_queue.wait_times.append(started - queued_at)
+                task_queue.run_times.append(time.monotonic() - started)
+                self._cond.notify_all()
+
+    def drain(self, timeout: float = BACKGROUND_DRAIN_TIMEOUT) -> bool:
+        """
+        Stop accepting tasks and wait for queued and running ones to finish.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            bool: True if everything finished in time
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._accepting = False
+            self._cond.notify_all()
+            if self._pid != os.getpid():
+                return True
+            while any(queue.pending or queue.running for queue in self._queues.values()):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    left = sum(len(queue.pending) + queue.running for queue in self._queues.values())
+                    logger.warning(f"Background drain timed out with {left} tasks unfinished")
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Return worker count and per-queue metrics."""
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "workers_alive": sum(thread.is_alive() for thread in self._threads) if self._pid == os.getpid() else 0,
+                "accepting": self._accepting,
+                "queues": {name: queue.stats() for name, queue in self._queues.items()},
+            }
+
+
+# === Global Executor ===
+task_executor = TaskExecutor()
+
+
+@atexit.register
+def _drain_on_exit() -> None:
+    task_executor.drain()
+
+
+def submit_task(queue: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """
+    Queue a function on a named background queue of the shared executor.
+
+    Args:
+        queue: Queue name (``interactive``, ``default`` or ``prefetch``)
+        func: Function to execute in background
+        *args: Positional arguments to pass to the function
+        **kwargs: Keyword arguments to pass to the function
+
+    Returns:
+        Future: Resolves with the function's result or exception
+
+    Raises:
+        TaskQueueFullError: If the queue stays full
+    """
+    return task_executor.submit(queue, func, *args, **kwargs)
+
+
+def get_background_stats() -> Dict[str, Any]:
+    """Return the shared executor's worker and queue metrics and the timeout counters."""
+    return {**task_executor.stats(), "timeouts": get_timeout_stats()}
 
 
 def run_in_background(func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
     """
-    Execute a function asynchronously in a daemon thread.
+    Execute a function asynchronously on the shared executor's ``default`` queue.
 
     This utility allows for non-blocking execution of time-consuming operations
-    such as AI processing, database updates, or external API calls.
+    such as AI processing, database updates, or external API calls. The
+    function runs in a copy of the caller's context variables.
 
     Args:
         func: Function to execute in background
         *args: Positional arguments to pass to the function
         **kwargs: Keyword arguments to pass to the function
+
+    Raises:
+        TaskQueueFullError: If the queue stays full
     """
-    thread = threading.Thread(target=func, args=args, kwargs=kwargs, daemon=True)
-    thread.start()
+    task_executor.submit("default", func, *args, **kwargs)
+
+
+# === Timeouts ===
+class _TimeoutTracker:
+    """Counts ``run_with_timeout`` calls and the threads still running after their timeout."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # thread -> monotonic time its token was cancelled
+        self._abandoned: Dict[threading.Thread, float] = {}
+        self._counts = {"calls": 0, "timeouts": 0, "stopped_in_grace": 0, "stopped_late": 0}
+
+    def started(self) -> None:
+        with self._lock:
+            self._counts["calls"] += 1
+
+    def timed_out(self, thread: threading.Thread) -> None:
+        with self._lock:
+            self._counts["timeouts"] += 1
+            if thread.is_alive():
+                self._abandoned[thread] = time.monotonic()
+
+    def finished(self, thread: threading.Thread) -> None:
+        with self._lock:
+            cancelled_at = self._abandoned.pop(thread, None)
+            if cancelled_at is not None:
+                late = time.monotonic() - cancelled_at > TIMEOUT_CANCEL_GRACE
+                self._counts["stopped_late" if late else "stopped_in_grace"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            # A thread can finish between its timeout and being registered here
+            for thread in [thread for thread in self._abandoned if not thread.is_alive()]:
+                del self._abandoned[thread]
+                self._counts["stopped_in_grace"] += 1
+            overdue = [now - cancelled_at for cancelled_at in self._abandoned.values()]
+            return {
+                **self._counts,
+                "cancel_grace_seconds": TIMEOUT_CANCEL_GRACE,
+                # Timed out, cancelled, and still running
+                "abandoned_threads": len(overdue),
+                # ... for longer than the grace period: work that ignores cancellation
+                "leaked_threads": sum(1 for seconds in overdue if seconds > TIMEOUT_CANCEL_GRACE),
+                "oldest_leak_seconds": round(max(overdue), 1) if overdue else 0.0,
+            }
+
+
+_timeouts = _TimeoutTracker()
+
+
+def get_timeout_stats() -> Dict[str, Any]:
+    """Return ``run_with_timeout`` counters, including currently leaked threads."""
+    return _timeouts.stats()
 
 
 def run_with_timeout(func: Callable[..., Any], timeout: float, *args: Any, **kwargs: Any) -> Any:
     """
-    Execute a function with a timeout.
+    Execute a function with a timeout, cancelling it when the timeout passes.
+
+    The function runs on its own thread in a copy of the caller's context,
+    with a cancellation token bound that expires after ``timeout`` seconds
+    (sooner if the caller's own token does). Mistral and TTS calls made
+    under it shrink their socket timeouts to the remaining budget and stop
+    retrying once it is cancelled; long loops can call
+    ``shared.cancellation.check_cancelled()``. A thread still running
+    ``TIMEOUT_CANCEL_GRACE`` seconds after cancellation is reported as
+    leaked in ``get_background_stats()``.
 
     Args:
         func: Function to execute
@@ -51,18 +401,28 @@ def run_with_timeout(func: Callable[..., Any], timeout: float, *args: Any, **kwa
     """
     result = [None]
     exception = [None]
+    token = CancellationToken(timeout, parent=current_token())
+    context = contextvars.copy_context()
 
     def target():
         try:
-            result[0] = func(*args, **kwargs)
+            with cancel_scope(token):
+                result[0] = func(*args, **kwargs)
         except Exception as e:
             exception[0] = e
+        finally:
+            _timeouts.finished(thread)
 
-    thread = threading.Thread(target=target, daemon=True)
+    thread = threading.Thread(
+        target=context.run, args=(target,), name=f"timeout-{getattr(func, '__name__', 'call')}", daemon=True
+    )
+    _timeouts.started()
     thread.start()
     thread.join(timeout=timeout)
 
     if thread.is_alive():
+        token.cancel(f"timed out after {timeout:g}s")
+        _timeouts.timed_out(thread)
         raise TimeoutError(f"Function {func.__name__} did not complete within {timeout} seconds")
 
     if exception[0]:
@@ -71,7 +431,13 @@ def run_with_timeout(func: Callable[..., Any], timeout: float, *args: Any, **kwa
     return result[0]
 
 
+# === Export Configuration ===
 __all__ = [
+    "TaskExecutor",
+    "task_executor",
+    "submit_task",
+    "get_background_stats",
     "run_in_background",
     "run_with_timeout",
+    "get_timeout_stats",
 ]
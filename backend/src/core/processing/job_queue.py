@@ -0,0 +1,746 @@
+"""
+XplorED - Durable Job Queue
+
+This module provides a durable queue for AI pipelines (translation jobs,
+feedback generation, exercise evaluation), so their work survives a web
+worker restart and can run in a separate worker process.
+
+Job Queue Components:
+- Handler Registry: ``@register_job(kind)`` names a job function; jobs carry
+  only the kind and JSON keyword arguments
+- Dispatch: ``dispatch_job`` enqueues durably when ``DURABLE_JOBS`` is on and
+  otherwise runs the handler on the in-process background executor
+- Redis Backend: a stream with a consumer group; unacknowledged jobs are
+  reclaimed after ``JOB_VISIBILITY_TIMEOUT`` seconds (``XAUTOCLAIM``)
+- SQLite Backend: the ``job_queue`` table with leases, used while Redis is
+  unreachable; the worker drains it as well, so jobs queued during an
+  outage are not stranded
+- Reliability: acknowledgement after success, retries with exponential
+  backoff up to ``JOB_MAX_ATTEMPTS``, idempotency keys (a duplicate of a job
+  that is still queued or running is dropped) and a dead-letter queue
+- Handler Failures: a handler re-raises a failure when ``should_retry_job``
+  says so (transient error, attempts left) and records its terminal error
+  status otherwise
+- Worker: ``JobWorker`` consumes the queue on a fixed number of threads,
+  keeps leases alive while jobs run and stops gracefully (``worker.py``)
+
+Delivery is at-least-once: a job can run again after a crash, so handlers
+must tolerate repeats (all current ones overwrite their result keys).
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests  # type: ignore
+
+from core.processing.background import submit_task
+from shared.exceptions import AIEvaluationError, ProcessingError, TimeoutError as XplorEDTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+# === Job Queue Configuration ===
+DURABLE_JOBS = os.getenv("DURABLE_JOBS", "false").lower() == "true"
+# auto (Redis when reachable, else SQLite), redis or sqlite
+JOB_QUEUE_BACKEND = os.getenv("JOB_QUEUE_BACKEND", "auto").lower()
+JOB_VISIBILITY_TIMEOUT = int(os.getenv("JOB_VISIBILITY_TIMEOUT", "120"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_BACKOFF = float(os.getenv("JOB_RETRY_BACKOFF", "5"))
+JOB_IDEMPOTENCY_TTL = int(os.getenv("JOB_IDEMPOTENCY_TTL", "3600"))
+JOB_RECORD_TTL = int(os.getenv("JOB_RECORD_TTL", str(24 * 3600)))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+JOB_DEAD_LETTER_MAX = int(os.getenv("JOB_DEAD_LETTER_MAX", "1000"))
+
+REDIS_STREAM = "jobs:stream"
+REDIS_GROUP = "job-workers"
+REDIS_DELAYED = "jobs:delayed"
+REDIS_DEAD = "jobs:dead"
+REDIS_JOB_PREFIX = "jobs:job:"
+REDIS_IDEMPOTENCY_PREFIX = "jobs:idem:"
+# Statuses in which a job still counts as in flight for idempotency
+LIVE_STATUSES = ("queued", "running", "retrying")
+JOB_TABLE = "job_queue"
+# Oldest due job, or a running job whose lease expired (params: now, now)
+CLAIM_QUERY = (
+    f"SELECT id, kind, payload, attempts, max_attempts, last_error FROM {JOB_TABLE} "
+    "WHERE (status = 'queued' AND available_at <= ?) OR (status = 'running' AND lease_until < ?) "
+    "ORDER BY available_at LIMIT 1;"
+)
+
+# Failures worth another attempt: AI upstream errors (including an open
+# circuit), timeouts and connection problems
+TRANSIENT_JOB_ERRORS = (
+    AIEvaluationError,
+    XplorEDTimeoutError,
+    TimeoutError,
+    ConnectionError,
+    requests.exceptions.RequestException,
+)
+
+
+# === Handler Registry ===
+# kind -> (handler, background executor queue used when DURABLE_JOBS is off)
+_handlers: Dict[str, Tuple[Callable[..., Any], str]] = {}
+
+
+def register_job(kind: str, queue: str = "interactive") -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Register a function as the handler of a job kind.
+
+    Args:
+        kind: Job kind used by ``dispatch_job``
+        queue: Background executor queue for in-process runs
+
+    Returns:
+        Callable: Decorator returning the function unchanged
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        _handlers[kind] = (func, queue)
+        return func
+    return decorator
+
+
+def get_job_handler(kind: str) -> Optional[Callable[..., Any]]:
+    """Return the handler registered for a job kind, if any."""
+    entry = _handlers.get(kind)
+    return entry[0] if entry else None
+
+
+def idempotency_key(*parts: Any) -> str:
+    """Build a compact idempotency key from JSON-serialisable parts."""
+    material = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+class Job:
+    """A claimed job: its record plus the backend handle needed to settle it."""
+
+    def __init__(self, job_id: str, kind: str, payload: Dict[str, Any], attempts: int, max_attempts: int, backend: str, receipt: str = ""):
+        self.id = job_id
+        self.kind = kind
+        self.payload = payload
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self.backend = backend
+        self.receipt = receipt
+
+
+def _retry_delay(attempts: int) -> float:
+    return JOB_RETRY_BACKOFF * (2 ** max(0, attempts - 1))
+
+
+# The durable job the current worker thread is running (None for in-process runs)
+_current_job: contextvars.ContextVar[Optional[Job]] = contextvars.ContextVar("current_job", default=None)
+
+
+def should_retry_job(error: BaseException) -> bool:
+    """
+    Whether a job handler should re-raise ``error`` so the queue retries the job.
+
+    Args:
+        error: The failure the handler caught
+
+    Returns:
+        bool: True for a transient error (``TRANSIENT_JOB_ERRORS``) while the
+            durable job has attempts left; False on its last attempt and for
+            in-process runs, which are never retried
+    """
+    job = _current_job.get()
+    return job is not None and job.attempts < job.max_attempts and isinstance(error, TRANSIENT_JOB_ERRORS)
+
+
+# === Redis Backend ===
+class RedisJobBackend:
+    """Stream-based queue: one consumer group, job records in hashes, retries in a sorted set."""
+
+    name = "redis"
+
+    def __init__(self, client):
+        self.client = client
+        self._group_ready = False
+
+    def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            self.client.xgroup_create(REDIS_STREAM, REDIS_GROUP, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    def enqueue(self, job_id: str, kind: str, payload: str, max_attempts: int, key: Optional[str]) -> str:
+        self._ensure_group()
+        if key:
+            idem_key = f"{REDIS_IDEMPOTENCY_PREFIX}{key}"
+            if not self.client.set(idem_key, job_id, nx=True, ex=JOB_IDEMPOTENCY_TTL):
+                existing = self.client.get(idem_key)
+                if existing and self.client.hget(f"{REDIS_JOB_PREFIX}{existing}", "status") in LIVE_STATUSES:
+                    return existing
+                # The earlier job already finished: this is a new request, not a duplicate
+                self.client.set(idem_key, job_id, ex=JOB_IDEMPOTENCY_TTL)
+        record_key = f"{REDIS_JOB_PREFIX}{job_id}"
+        now = time.time()
+        self.client.hset(record_key, mapping={
+            "kind": kind, "payload": payload, "status": "queued", "attempts": 0,
+            "max_attempts": max_attempts, "created_at": now, "updated_at": now,
+        })
+        self.client.expire(record_key, JOB_RECORD_TTL)
+        self.client.xadd(REDIS_STREAM, {"job_id": job_id})
+        return job_id
+
+    def _promote_delayed(self) -> None:
+        """Move retries whose backoff has elapsed back onto the stream."""
+        for job_id in self.client.zrangebyscore(REDIS_DELAYED, "-inf", time.time(), start=0, num=50):
+            # Only the worker whose ZREM succeeds re-adds the job
+            if self.client.zrem(REDIS_DELAYED, job_id):
+                self.client.xadd(REDIS_STREAM, {"job_id": job_id})
+
+    def claim(self, consumer: str, block: float) -> Optional[Job]:
+        self._ensure_group()
+        self._promote_delayed()
+
+        # Jobs whose worker died (no ack within the visibility timeout) come first
+        reclaimed = self.client.xautoclaim(
+            REDIS_STREAM, REDIS_GROUP, consumer, min_idle_time=JOB_VISIBILITY_TIMEOUT * 1000, start_id="0-0", count=1,
+        )
+        messages = reclaimed[1] if reclaimed and len(reclaimed) > 1 else []
+        if not messages:
+            read = self.client.xreadgroup(REDIS_GROUP, consumer, {REDIS_STREAM: ">"}, count=1, block=int(block * 1000))
+            messages = read[0][1] if read else []
+        if not messages:
+            return None
+
+        message_id, fields = messages[0]
+        job_id = (fields or {}).get("job_id")
+        record_key = f"{REDIS_JOB_PREFIX}{job_id}"
+        record = self.client.hgetall(record_key) if job_id else {}
+        if not record:
+            # Record expired or message malformed: nothing left to run
+            self._drop(message_id)
+            return None
+
+        attempts = self.client.hincrby(record_key, "attempts", 1)
+        max_attempts = int(record.get("max_attempts", JOB_MAX_ATTEMPTS))
+        job = Job(job_id, record["kind"], json.loads(record["payload"]), attempts, max_attempts, self.name, message_id)
+        if attempts > max_attempts:
+            self._dead_letter(job, record.get("error") or "worker lost the job too often")
+            return None
+        self.client.hset(record_key, mapping={"status": "running", "worker": consumer, "updated_at": time.time()})
+        return job
+
+    def touch(self, job: Job, consumer: str) -> None:
+        # Re-claiming by the same consumer resets the idle time that XAUTOCLAIM checks
+        self.client.xclaim(REDIS_STREAM, REDIS_GROUP, consumer, min_idle_time=0, message_ids=[job.receipt], justid=True)
+
+    def ack(self, job: Job) -> None:
+        self._drop(job.receipt)
+        self.client.hset(f"{REDIS_JOB_PREFIX}{job.id}", mapping={"status": "done", "updated_at": time.time()})
+
+    def fail(self, job: Job, error: str) -> None:
+        self._drop(job.receipt)
+        if job.attempts >= job.max_attempts:
+            self._dead_letter(job, error)
+            return
+        self.client.hset(f"{REDIS_JOB_PREFIX}{job.id}", mapping={"status": "retrying", "error": error, "updated_at": time.time()})
+        self.client.zadd(REDIS_DELAYED, {job.id: time.time() + _retry_delay(job.attempts)})
+
+    def _drop(self, message_id: str) -> None:
+        self.client.xack(REDIS_STREAM, REDIS_GROUP, message_id)
+        self.client.xdel(REDIS_STREAM, message_id)
+
+    def _dead_letter(self, job: Job, error: str) -> None:
+        self._drop(job.receipt)
+        self.client.hset(f"{REDIS_JOB_PREFIX}{job.id}", mapping={"status": "dead", "error": error, "updated_at": time.time()})
+        self.client.xadd(
+            REDIS_DEAD, {"job_id": job.id, "kind": job.kind, "error": error[:500], "attempts": job.attempts},
+            maxlen=JOB_DEAD_LETTER_MAX, approximate=True,
+        )
+
+    def requeue(self, job_id: str) -> bool:
+        record_key = f"{REDIS_JOB_PREFIX}{job_id}"
+        if self.client.hget(record_key, "status") != "dead":
+            return False
+        self.client.hset(record_key, mapping={"status": "queued", "attempts": 0, "updated_at": time.time()})
+        self.client.expire(record_key, JOB_RECORD_TTL)
+        self.client.xadd(REDIS_STREAM, {"job_id": job_id})
+        letters = [entry_id for entry_id, fields in self.client.xrange(REDIS_DEAD) if fields.get("job_id") == job_id]
+        if letters:
+            self.client.xdel(REDIS_DEAD, *letters)
+        return True
+
+    def dead_letters(self, limit: int) -> List[Dict[str, Any]]:
+        return [{"id": fields.get("job_id"), **fields} for _, fields in self.client.xrevrange(REDIS_DEAD, count=limit)]
+
+    def stats(self) -> Dict[str, Any]:
+        self._ensure_group()
+        pending = self.client.xpending(REDIS_STREAM, REDIS_GROUP).get("pending", 0)
+        return {
+            "queued": max(0, self.client.xlen(REDIS_STREAM) - pending),
+            "running": pending,
+            "retrying": self.client.zcard(REDIS_DELAYED),
+            "dead": self.client.xlen(REDIS_DEAD),
+        }
+
+
+# === SQLite Backend ===
+class SQLiteJobBackend:
+    """Table-based queue with leases; claims take the write lock so one worker wins each job."""
+
+    name = "sqlite"
+
+    def __init__(self):
+        self._table_ready = False
+
+    def _ensure_table(self) -> None:
+        """Create the queue table if missing (normally done by migration 0009)."""
+        if self._table_ready:
+            return
+        from core.database.connection import execute_query
+
+        execute_query(
+            f"""
+            CREATE TABLE IF NOT EXISTS {JOB_TABLE} (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                idempotency_key TEXT UNIQUE,
+                available_at REAL NOT NULL,
+                lease_until REAL,
+                worker TEXT,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            """
+        )
+        execute_query(f"CREATE INDEX IF NOT EXISTS idx_{JOB_TABLE}_status_available ON {JOB_TABLE}(status, available_at);")
+        self._table_ready = True
+
+    def enqueue(self, job_id: str, kind: str, payload: str, max_attempts: int, key: Optional[str]) -> str:
+        from core.database.connection import execute_query, fetch_one, transaction
+
+        self._ensure_table()
+        now = time.time()
+        with transaction():
+            if key:
+                existing = fetch_one(
+                    JOB_TABLE, "WHERE idempotency_key = ? AND created_at > ? AND status IN ('queued', 'running')",
+                    (key, now - JOB_IDEMPOTENCY_TTL), columns="id",
+                )
+                if existing:
+                    return existing["id"]
+                # A finished or expired job may still hold the key; release it
+                execute_query(f"UPDATE {JOB_TABLE} SET idempotency_key = NULL WHERE idempotency_key = ?;", (key,))
+            execute_query(
+                f"INSERT INTO {JOB_TABLE} (id, kind, payload, status, attempts, max_attempts, idempotency_key, "
+                "available_at, created_at, updated_at) VALUES (?, ?, ?, 'queued', 0, ?, ?, ?, ?, ?);",
+                (job_id, kind, payload, max_attempts, key, now, now, now),
+            )
+        return job_id
+
+    def claim(self, consumer: str, block: float = 0) -> Optional[Job]:
+        from core.database.connection import execute_query, fetch_one_custom, transaction
+
+        self._ensure_table()
+        while True:
+            now = time.time()
+            with transaction():
+                row = fetch_one_custom(CLAIM_QUERY, (now, now))
+                if not row:
+                    return None
+                attempts = row["attempts"] + 1
+                if attempts > row["max_attempts"]:
+                    execute_query(
+                        f"UPDATE {JOB_TABLE} SET status = 'dead', last_error = ?, updated_at = ? WHERE id = ?;",
+                        (row["last_error"] or "worker lost the job too often", now, row["id"]),
+                    )
+                    continue
+                execute_query(
+                    f"UPDATE {JOB_TABLE} SET status = 'running', attempts = ?, lease_until = ?, worker = ?, updated_at = ? "
+                    "WHERE id = ?;",
+                    (attempts, now + JOB_VISIBILITY_TIMEOUT, consumer, now, row["id"]),
+                )
+            return Job(row["id"], row["kind"], json.loads(row["payload"]), attempts, row["max_attempts"], self.name)
+
+    def touch(self, job: Job, consumer: str) -> None:
+        from core.database.connection import execute_query
+
+        execute_query(
+            f"UPDATE {JOB_TABLE} SET lease_until = ? WHERE id = ? AND status = 'running';",
+            (time.time() + JOB_VISIBILITY_TIMEOUT, job.id),
+        )
+
+    def ack(self, job: Job) -> None:
+        from core.database.connection import execute_query
+
+        now = time.time()
+        execute_query(f"UPDATE {JOB_TABLE} SET status = 'done', lease_until = NULL, updated_at = ? WHERE id = ?;", (now, job.id))
+        # Finished rows are only kept for idempotency and inspection
+        execute_query(f"DELETE FROM {JOB_TABLE} WHERE status = 'done' AND updated_at < ?;", (now - JOB_RECORD_TTL,))
+
+    def fail(self, job: Job, error: str) -> None:
+        from core.database.connection import execute_query
+
+        now = time.time()
+        if job.attempts >= job.max_attempts:
+            execute_query(
+                f"UPDATE {JOB_TABLE} SET status = 'dead', last_error = ?, lease_until = NULL, updated_at = ? WHERE id = ?;",
+                (error, now, job.id),
+            )
+            return
+        execute_query(
+            f"UPDATE {JOB_TABLE} SET status = 'queued', last_error = ?, lease_until = NULL, available_at = ?, "
+            "updated_at = ? WHERE id = ?;",
+            (error, now + _retry_delay(job.attempts), now, job.id),
+        )
+
+    def requeue(self, job_id: str) -> bool:
+        from core.database.connection import execute_query, fetch_one
+
+        self._ensure_table()
+        if not fetch_one(JOB_TABLE, "WHERE id = ? AND status = 'dead'", (job_id,), columns="id"):
+            return False
+        now = time.time()
+        execute_query(
+            f"UPDATE {JOB_TABLE} SET status = 'queued', attempts = 0, available_at = ?, updated_at = ? WHERE id = ?;",
+            (now, now, job_id),
+        )
+        return True
+
+    def dead_letters(self, limit: int) -> List[Dict[str, Any]]:
+        from core.database.connection import fetch_custom
+
+        self._ensure_table()
+        return fetch_custom(
+            f"SELECT id, kind, attempts, last_error AS error, updated_at FROM {JOB_TABLE} "
+            "WHERE status = 'dead' ORDER BY updated_at DESC LIMIT ?;",
+            (limit,),
+        )
+
+    def has_work(self) -> bool:
+        from core.database.connection import fetch_one_custom
+
+        self._ensure_table()
+        now = time.time()
+        return bool(fetch_one_custom(
+            f"SELECT 1 AS found FROM {JOB_TABLE} WHERE (status = 'queued' AND available_at <= ?) "
+            "OR (status = 'running' AND lease_until < ?) LIMIT 1;",
+            (now, now),
+        ))
+
+    def stats(self) -> Dict[str, Any]:
+        from core.database.connection import fetch_custom
+
+        self._ensure_table()
+        counts = {"queued": 0, "running": 0, "retrying": 0, "dead": 0}
+        rows = fetch_custom(
+            f"SELECT status, attempts > 0 AS retried, COUNT(*) AS count FROM {JOB_TABLE} GROUP BY status, retried;"
+        )
+        for row in rows:
+            status = "retrying" if row["status"] == "queued" and row["retried"] else row["status"]
+            if status in counts:
+                counts[status] += row["count"]
+        return counts
+
+
+# === Durable Queue ===
+class DurableJobQueue:
+    """Routes jobs to Redis when reachable and to SQLite otherwise, and consumes both."""
+
+    def __init__(self, backend: str = JOB_QUEUE_BACKEND):
+        """
+        Initialize the queue; backends are resolved on use.
+
+        Args:
+            backend: ``auto``, ``redis`` or ``sqlite``
+        """
+        self.backend = backend
+        self._sqlite = SQLiteJobBackend()
+        self._redis_backend: Optional[RedisJobBackend] = None
+        self._lock = threading.Lock()
+
+    def _redis(self) -> Optional[RedisJobBackend]:
+        if self.backend not in ("auto", "redis"):
+            return None
+        try:
+            from external.redis import redis_client
+        except Exception:
+            return None
+        client = redis_client.client
+        if client is None:
+            return None
+        with self._lock:
+            if self._redis_backend is None or self._redis_backend.client is not client:
+                self._redis_backend = RedisJobBackend(client)
+            return self._redis_backend
+
+    def _backend_for(self, job: Job):
+        return self._redis() if job.backend == "redis" else self._sqlite
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], key: Optional[str] = None, max_attempts: int = JOB_MAX_ATTEMPTS) -> str:
+        """
+        Add a job to the queue.
+
+        Args:
+            kind: Registered job kind
+            payload: JSON-serialisable keyword arguments of the handler
+            key: Idempotency key; a second enqueue with the same key while
+                the first job is still queued or running (and at most
+                ``JOB_IDEMPOTENCY_TTL`` old) returns the first job's ID
+            max_attempts: Attempts before the job is dead-lettered
+
+        Returns:
+            str: The job ID
+        """
+        body = json.dumps(payload, ensure_ascii=False, default=str)
+        job_id = uuid.uuid4().hex
+        redis = self._redis()
+        if redis is not None:
+            try:
+                return redis.enqueue(job_id, kind, body, max_attempts, key)
+            except Exception as e:
+                if self.backend == "redis":
+                    raise
+                logger.warning(f"Redis job enqueue failed, using SQLite: {e}")
+        return self._sqlite.enqueue(job_id, kind, body, max_attempts, key)
+
+    def claim(self, consumer: str, block: float = JOB_POLL_INTERVAL) -> Optional[Job]:
+        """
+        Lease the next runnable job.
+
+        Args:
+            consumer: Unique name of the claiming worker thread
+            block: Seconds to wait for a job
+
+        Returns:
+            Optional[Job]: The leased job, or None if none arrived in time
+        """
+        # SQLite only holds jobs while Redis is (or was) unreachable; drain those first
+        if self.backend in ("auto", "sqlite") and self._sqlite.has_work():
+            job = self._sqlite.claim(consumer)
+            if job is not None:
+                return job
+        started = time.monotonic()
+        redis = self._redis()
+        job = redis.claim(consumer, block) if redis is not None else None
+        if job is None:
+            # Not every server honours BLOCK (e.g. fakeredis); never spin on an empty queue
+            time.sleep(max(0.0, block - (time.monotonic() - started)))
+        return job
+
+    def touch(self, job: Job, consumer: str) -> None:
+        """Extend the lease of a running job."""
+        self._backend_for(job).touch(job, consumer)
+
+    def ack(self, job: Job) -> None:
+        """Mark a job done."""
+        self._backend_for(job).ack(job)
+
+    def fail(self, job: Job, error: str) -> None:
+        """Schedule a retry, or dead-letter the job after its last attempt."""
+        self._backend_for(job).fail(job, error)
+
+    def requeue_dead(self, job_id: str) -> bool:
+        """Give a dead-lettered job a fresh set of attempts."""
+        redis = self._redis()
+        if redis is not None and redis.requeue(job_id):
+            return True
+        return self._sqlite.requeue(job_id)
+
+    def dead_letters(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Return the most recent dead-lettered jobs."""
+        redis = self._redis()
+        letters = redis.dead_letters(limit) if redis is not None else []
+        return letters + self._sqlite.dead_letters(limit)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-backend job counts."""
+        stats: Dict[str, Any] = {"durable": DURABLE_JOBS, "backend": self.backend}
+        redis = self._redis()
+        if redis is not None:
+            stats["redis"] = redis.stats()
+        stats["sqlite"] = self._sqlite.stats()
+        return stats
+
+
+job_queue = DurableJobQueue()
+
+
+# === Dispatch ===
+def dispatch_job(kind: str, payload: Dict[str, Any], key: Optional[str] = None) -> str:
+    """
+    Run a registered job durably or on the in-process executor.
+
+    With ``DURABLE_JOBS`` the job is enqueued for ``worker.py``; otherwise
+    (or if enqueueing fails) it is submitted to the background executor
+    queue it was registered with, inside the current Flask app context.
+
+    Args:
+        kind: Registered job kind
+        payload: JSON-serialisable keyword arguments of the handler
+        key: Idempotency key (durable mode only)
+
+    Returns:
+        str: The job ID
+
+    Raises:
+        ProcessingError: If no handler is registered for the kind
+        TaskQueueFullError: If the in-process executor queue is full
+    """
+    if kind not in _handlers:
+        raise ProcessingError(f"No handler registered for job kind '{kind}'")
+
+    if DURABLE_JOBS:
+        try:
+            job_id = job_queue.enqueue(kind, payload, key)
+            logger.info(f"Enqueued {kind} job {job_id}")
+            return job_id
+        except Exception as e:
+            logger.error(f"Durable enqueue of {kind} job failed, running in-process: {e}")
+
+    handler, queue = _handlers[kind]
+    from flask import current_app, has_app_context  # type: ignore
+    from external.mistral.async_client import bind_ai_user
+
+    app = current_app._get_current_object() if has_app_context() else None
+    if payload.get("username"):
+        handler = bind_ai_user(payload["username"], handler)
+
+    def run() -> None:
+        if app is None:
+            handler(**payload)
+            return
+        with app.app_context():
+            handler(**payload)
+
+    submit_task(queue, run)
+    return uuid.uuid4().hex
+
+
+# === Worker ===
+class JobWorker:
+    """Consumes the durable queue on a fixed number of threads."""
+
+    def __init__(self, app=None, concurrency: int = 4, queue: Optional[DurableJobQueue] = None):
+        """
+        Initialize the worker.
+
+        Args:
+            app: Flask app whose context jobs run in (optional)
+            concurrency: Number of consumer threads
+            queue: Queue to consume (defaults to the global one)
+        """
+        self.app = app
+        self.concurrency = max(1, concurrency)
+        self.queue = queue or job_queue
+        self.stopping = threading.Event()
+        self._name = f"{os.uname().nodename if hasattr(os, 'uname') else 'worker'}-{os.getpid()}"
+        self._active: Dict[str, Tuple[Job, str]] = {}
+        self._active_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self.counts = {"done": 0, "failed": 0}
+
+    def start(self) -> None:
+        """Start the consumer threads and the lease heartbeat."""
+        for index in range(self.concurrency):
+            thread = threading.Thread(target=self._consume, args=(f"{self._name}-{index}",), name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        threading.Thread(target=self._heartbeat, name="job-heartbeat", daemon=True).start()
+        logger.info(f"Job worker {self._name} started with {self.concurrency} threads")
+
+    def stop(self, timeout: float = JOB_VISIBILITY_TIMEOUT) -> None:
+        """Stop claiming and wait for running jobs; unfinished ones are reclaimed after their lease."""
+        self.stopping.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        logger.info(f"Job worker {self._name} stopped: {self.counts}")
+
+    def _heartbeat(self) -> None:
+        interval = max(1.0, JOB_VISIBILITY_TIMEOUT / 3)
+        while not self.stopping.wait(interval):
+            with self._active_lock:
+                active = list(self._active.values())
+            for job, consumer in active:
+                try:
+                    self.queue.touch(job, consumer)
+                except Exception as e:
+                    logger.warning(f"Could not extend lease of job {job.id}: {e}")
+
+    def _consume(self, consumer: str) -> None:
+        while not self.stopping.is_set():
+            try:
+                job = self.queue.claim(consumer)
+            except Exception as e:
+                logger.error(f"Job claim failed: {e}")
+                self.stopping.wait(JOB_POLL_INTERVAL)
+                continue
+            if job is not None:
+                self.run_job(job, consumer)
+
+    def run_job(self, job: Job, consumer: str) -> None:
+        """Run one claimed job and settle it."""
+        handler = get_job_handler(job.kind)
+        if handler is None:
+            job.attempts = job.max_attempts
+            self.queue.fail(job, f"no handler registered for '{job.kind}'")
+            return
+
+        from external.mistral.async_client import ai_user_scope
+
+        with self._active_lock:
+            self._active[job.id] = (job, consumer)
+        started = time.perf_counter()
+        outcome = "failed"
+        job_token = _current_job.set(job)
+        try:
+            with ai_user_scope(job.payload.get("username")):
+                if self.app is not None:
+                    with self.app.app_context():
+                        handler(**job.payload)
+                else:
+                    handler(**job.payload)
+            self.queue.ack(job)
+            outcome = "done"
+            logger.info(f"Job {job.kind}:{job.id} done in {time.perf_counter() - started:.2f}s (attempt {job.attempts})")
+        except Exception as e:
+            self.queue.fail(job, f"{type(e).__name__}: {e}")
+            outcome = "failed"
+            logger.error(f"Job {job.kind}:{job.id} failed on attempt {job.attempts}/{job.max_attempts}: {e}")
+        finally:
+            _current_job.reset(job_token)
+            with self._active_lock:
+                self._active.pop(job.id, None)
+                self.counts[outcome] += 1
+
+
+def get_job_queue_stats(dead_letter_limit: int = 20) -> Dict[str, Any]:
+    """Return queue counts and the most recent dead letters."""
+    return {**job_queue.stats(), "dead_letters": job_queue.dead_letters(dead_letter_limit)}
+
+
+# === Export Configuration ===
+__all__ = [
+    "register_job",
+    "dispatch_job",
+    "should_retry_job",
+    "idempotency_key",
+    "DurableJobQueue",
+    "JobWorker",
+    "job_queue",
+    "get_job_queue_stats",
+]
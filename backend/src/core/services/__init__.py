@@ -7,30 +7,42 @@ following clean architecture principles as outlined in the documentation.
 Service Components:
 - user_service: Core user business logic and statistics
 - game_service: Core game business logic and evaluation
+- game_stats_service: Trigger-maintained per-user and per-level game aggregates
 - exercise_service: Core exercise evaluation business logic
 - vocabulary_service: Core vocabulary business logic and analytics
 - lesson_service: Core lesson business logic and progress tracking
+- lesson_catalog_service: Lesson catalog pages with aggregated user progress
 - progress_service: Core progress business logic and analytics
+- daily_activity_service: Per-user daily activity rollup behind the progress analytics
+- achievement_service: Event-driven achievement rules and the user_achievements ledger
 
 Note: Import management has been moved to infrastructure/imports/ for better separation.
 
 For detailed architecture information, see: docs/backend_structure.md
 """
 
+from .game_stats_service import GameStatsService
 from .user_service import UserService
 from .game_service import GameService
 from .exercise_service import ExerciseService
 from .vocabulary_service import VocabularyService
 from .lesson_service import LessonService
+from .lesson_catalog_service import LessonCatalogService
+from .daily_activity_service import DailyActivityService
 from .progress_service import ProgressService
+from .achievement_service import AchievementService
 
 # === Export Configuration ===
 __all__ = [
     # Core business logic services
     "UserService",
     "GameService",
+    "GameStatsService",
     "ExerciseService",
     "VocabularyService",
     "LessonService",
+    "LessonCatalogService",
     "ProgressService",
+    "DailyActivityService",
+    "AchievementService",
 ]
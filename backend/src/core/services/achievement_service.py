@@ -0,0 +1,243 @@
+"""
+XplorED - Achievement Service
+
+This module provides the event-driven achievement engine,
+following clean architecture principles as outlined in the documentation.
+
+Achievement Components:
+- Declarative rules: metadata, triggering events and a milestone query each
+- Event evaluation: only rules listening to the event and not yet unlocked run
+- Achievement ledger: unlocked achievements stored once in ``user_achievements``
+
+Reading a user's achievements is a single indexed query on the ledger.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.database.connection import select_rows, fetch_one_custom, bulk_upsert
+from shared.types import AnalyticsData, AnalyticsList
+
+logger = logging.getLogger(__name__)
+
+
+class AchievementService:
+    """Achievement rules evaluated on write and stored in a per-user ledger."""
+
+    TABLE = "user_achievements"
+    EVENT_TYPES = ("game", "vocabulary", "lesson")
+
+    # Milestone queries: (sql, params builder). Each returns one row with
+    # ``unlocked_at`` once the threshold is reached and nothing before.
+    MILESTONE_QUERIES: Dict[str, Tuple[str, Callable[[str, int], Tuple]]] = {
+        "nth_game": (
+            "SELECT timestamp AS unlocked_at FROM results WHERE username = ? "
+            "ORDER BY timestamp ASC LIMIT 1 OFFSET ?",
+            lambda username, threshold: (username, threshold - 1),
+        ),
+        "nth_perfect_game": (
+            "SELECT timestamp AS unlocked_at FROM results WHERE username = ? AND correct = 1 "
+            "ORDER BY timestamp ASC LIMIT 1 OFFSET ?",
+            lambda username, threshold: (username, threshold - 1),
+        ),
+        "nth_vocab": (
+            "SELECT created_at AS unlocked_at FROM vocab_log WHERE username = ? "
+            "ORDER BY created_at ASC LIMIT 1 OFFSET ?",
+            lambda username, threshold: (username, threshold - 1),
+        ),
+        "nth_lesson": (
+            "SELECT r.updated_at AS unlocked_at FROM lesson_completion_rollup AS r "
+            "JOIN lesson_content AS lc ON lc.lesson_id = r.lesson_id "
+            "WHERE r.user_id = ? AND r.completed_blocks > 0 AND r.completed_blocks >= lc.num_blocks "
+            "ORDER BY r.updated_at ASC LIMIT 1 OFFSET ?",
+            lambda username, threshold: (username, threshold - 1),
+        ),
+        "game_streak": (
+            "SELECT MAX(timestamp) AS unlocked_at FROM results "
+            "WHERE username = ? AND timestamp >= date('now', ?) "
+            "HAVING COUNT(DISTINCT DATE(timestamp)) >= ?",
+            lambda username, threshold: (username, f"-{threshold - 1} days", threshold),
+        ),
+    }
+
+    # Declarative achievement rules, in display order
+    RULES: Tuple[AnalyticsData, ...] = (
+        {
+            "id": "first_game", "title": "First Steps", "description": "Played your first game",
+            "icon": "🎮", "category": "gaming", "events": ("game",), "query": "nth_game", "threshold": 1,
+        },
+        {
+            "id": "tenth_game", "title": "Getting the Hang of It", "description": "Played 10 games",
+            "icon": "🎯", "category": "gaming", "events": ("game",), "query": "nth_game", "threshold": 10,
+        },
+        {
+            "id": "perfect_score", "title": "Perfect Score", "description": "Achieved a perfect score in a game",
+            "icon": "⭐", "category": "performance", "events": ("game",), "query": "nth_perfect_game", "threshold": 1,
+        },
+        {
+            "id": "vocab_10", "title": "Word Collector", "description": "Learned 10 vocabulary words",
+            "icon": "📚", "category": "vocabulary", "events": ("vocabulary",), "query": "nth_vocab", "threshold": 10,
+        },
+        {
+            "id": "vocab_50", "title": "Vocabulary Master", "description": "Learned 50 vocabulary words",
+            "icon": "📖", "category": "vocabulary", "events": ("vocabulary",), "query": "nth_vocab", "threshold": 50,
+        },
+        {
+            "id": "first_lesson", "title": "Student", "description": "Completed your first lesson",
+            "icon": "📝", "category": "learning", "events": ("lesson",), "query": "nth_lesson", "threshold": 1,
+        },
+        {
+            "id": "fifth_lesson", "title": "Dedicated Learner", "description": "Completed 5 lessons",
+            "icon": "🎓", "category": "learning", "events": ("lesson",), "query": "nth_lesson", "threshold": 5,
+        },
+        {
+            "id": "streak_7", "title": "Week Warrior", "description": "Maintained a 7-day learning streak",
+            "icon": "🔥", "category": "consistency", "events": ("game",), "query": "game_streak", "threshold": 7,
+        },
+        {
+            "id": "streak_30", "title": "Consistency King", "description": "Maintained a 30-day learning streak",
+            "icon": "👑", "category": "consistency", "events": ("game",), "query": "game_streak", "threshold": 30,
+        },
+    )
+
+    # Rule fields that are engine configuration rather than display data
+    RULE_INTERNAL_FIELDS = ("events", "query", "threshold")
+
+    @staticmethod
+    def record_event(username: str, event_type: str) -> List[str]:
+        """
+        Evaluate the rules listening to an event and store new unlocks.
+
+        Call this after the event's row has been written. Failures are logged
+        and never propagate; the event itself is already stored.
+
+        Args:
+            username: The user the event belongs to
+            event_type: One of game, vocabulary or lesson
+
+        Returns:
+            IDs of the achievements unlocked by this event
+        """
+        try:
+            if event_type not in AchievementService.EVENT_TYPES:
+                raise ValueError(f"Unknown achievement event type: {event_type}")
+            return AchievementService._evaluate(username, (event_type,))
+
+        except Exception as e:
+            logger.warning(f"Failed to evaluate achievements for user {username}: {e}")
+            return []
+
+    @staticmethod
+    def get_unlocked(username: str) -> AnalyticsList:
+        """
+        Get the user's unlocked achievements from the ledger, newest first.
+
+        Args:
+            username: The username to read
+
+        Returns:
+            List of achievements with rule metadata and ``unlocked_at``
+        """
+        rows = select_rows(
+            AchievementService.TABLE,
+            columns=["achievement_id", "unlocked_at"],
+            where="username = ?",
+            params=(username,),
+            order_by="unlocked_at DESC",
+        )
+
+        rules = {rule["id"]: rule for rule in AchievementService.RULES}
+        achievements = []
+        for row in rows or []:
+            rule = rules.get(row["achievement_id"])
+            if rule is None:
+                # Retired rule; keep the ledger row but stop showing it
+                continue
+            achievement = AchievementService.describe(rule)
+            achievement["unlocked_at"] = row["unlocked_at"]
+            achievements.append(achievement)
+        return achievements
+
+    @staticmethod
+    def describe(rule: AnalyticsData) -> AnalyticsData:
+        """Return the display fields of a rule."""
+        return {key: value for key, value in rule.items() if key not in AchievementService.RULE_INTERNAL_FIELDS}
+
+    @staticmethod
+    def backfill(username: Optional[str] = None) -> int:
+        """
+        Evaluate every rule for existing users and fill the ledger.
+
+        Already unlocked achievements are kept, so the backfill can be re-run.
+
+        Args:
+            username: Only backfill this user (default: every user)
+
+        Returns:
+            Number of achievements newly recorded
+        """
+        if username:
+            usernames = [username]
+        else:
+            usernames = [row["username"] for row in select_rows("users", columns="username") or []]
+
+        written = 0
+        for user in usernames:
+            written += len(AchievementService._evaluate(user, AchievementService.EVENT_TYPES))
+
+        logger.info(f"Backfilled {written} achievements for {len(usernames)} users")
+        return written
+
+    # Private helper methods
+
+    @staticmethod
+    def _evaluate(username: str, event_types: Tuple[str, ...]) -> List[str]:
+        """Run the pending rules for the given events and record unlocks."""
+        rules = [
+            rule for rule in AchievementService.RULES
+            if any(event in rule["events"] for event in event_types)
+        ]
+        if not rules:
+            return []
+
+        unlocked = {
+            row["achievement_id"]
+            for row in select_rows(
+                AchievementService.TABLE,
+                columns="achievement_id",
+                where="username = ?",
+                params=(username,),
+            ) or []
+        }
+
+        recorded_at = datetime.datetime.utcnow().isoformat()
+        new_rows = []
+        for rule in rules:
+            if rule["id"] in unlocked:
+                continue
+            unlocked_at = AchievementService._check_rule(username, rule)
+            if unlocked_at:
+                new_rows.append({
+                    "username": username,
+                    "achievement_id": rule["id"],
+                    "unlocked_at": unlocked_at,
+                    "recorded_at": recorded_at,
+                })
+
+        if new_rows:
+            # A concurrent evaluation may have recorded the same unlock first
+            bulk_upsert(AchievementService.TABLE, new_rows, ("username", "achievement_id"), update_cols=[])
+            logger.info(f"User {username} unlocked achievements: {', '.join(row['achievement_id'] for row in new_rows)}")
+        return [row["achievement_id"] for row in new_rows]
+
+    @staticmethod
+    def _check_rule(username: str, rule: AnalyticsData) -> Optional[str]:
+        """Return when the rule's milestone was reached, or None if it was not."""
+        query, build_params = AchievementService.MILESTONE_QUERIES[rule["query"]]
+        row = fetch_one_custom(query, build_params(username, rule["threshold"]))
+        unlocked_at = row.get("unlocked_at") if row else None
+        # SQLite CURRENT_TIMESTAMP values use a space separator; store ISO so the ledger sorts consistently
+        return str(unlocked_at).replace(" ", "T", 1) if unlocked_at else None
@@ -0,0 +1,333 @@
+"""
+XplorED - Daily Activity Service
+
+This module provides the per-user daily activity rollup,
+following clean architecture principles as outlined in the documentation.
+
+Daily Activity Components:
+- Incremental rollup updates from the progress write paths
+- Range reads of at most one row per user and day for analytics
+- Backfill of the rollup from the raw progress tables
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import json
+import logging
+import datetime
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+from core.database.connection import select_one, select_rows, delete_rows, bulk_upsert, transaction
+from shared.exceptions import DatabaseError
+from shared.types import AnalyticsData, AnalyticsList
+
+logger = logging.getLogger(__name__)
+
+
+class DailyActivityService:
+    """Per-user, per-day activity rollup backing the progress analytics."""
+
+    TABLE = "user_daily_activity"
+    KEY_COLUMNS = ("username", "activity_date")
+    ACTIVITY_TYPES = ("lesson", "exercise", "vocabulary", "game")
+
+    # Counter columns and their defaults for a fresh day
+    COUNTER_DEFAULTS = {
+        "lesson_updates": 0,
+        "lesson_blocks_completed": 0,
+        "exercises": 0,
+        "exercise_score": 0.0,
+        "exercise_questions": 0,
+        "exercise_percent_sum": 0.0,
+        "vocab_reviews": 0,
+        "vocab_correct": 0,
+        "vocab_repetitions": 0,
+        "games": 0,
+        "game_score": 0.0,
+        "game_max_level": 0,
+        "total_activities": 0,
+    }
+
+    # (table, user column, timestamp column, extra columns, where) for the backfill
+    RAW_SOURCES = {
+        "lesson": ("lesson_progress", "user_id", "updated_at", ["completed"], ""),
+        "exercise": ("activity_progress", "username", "completed_at", ["score", "total_questions"], "activity_type = 'exercise'"),
+        "vocabulary": ("vocabulary_progress", "username", "reviewed_at", ["correct", "repetitions"], ""),
+        "game": ("game_progress", "username", "completed_at", ["game_type", "score", "level"], ""),
+    }
+
+    @staticmethod
+    def record_activity(
+        username: str,
+        activity_type: str,
+        occurred_at: Optional[datetime.datetime] = None,
+        **metrics,
+    ) -> bool:
+        """
+        Add one activity to the user's rollup row for its day.
+
+        Failures are logged and reported via the return value; the activity
+        itself has already been stored by the caller.
+
+        Args:
+            username: The user who performed the activity
+            activity_type: One of exercise, vocabulary or game; lesson rows go
+                through ``record_lesson_progress``
+            occurred_at: When the activity happened (default: now, UTC)
+            **metrics: score, total_questions, correct, repetitions, level or
+                game_type depending on the activity type
+
+        Returns:
+            True if the rollup was updated
+        """
+        try:
+            if activity_type not in DailyActivityService.ACTIVITY_TYPES:
+                raise ValueError(f"Unknown activity type: {activity_type}")
+            if activity_type == "lesson":
+                raise ValueError("Lesson activity is recorded with record_lesson_progress")
+
+            occurred_at = occurred_at or datetime.datetime.utcnow()
+            with transaction():
+                DailyActivityService._update_day(
+                    username,
+                    occurred_at,
+                    lambda day: DailyActivityService._apply_activity(day, activity_type, occurred_at, metrics),
+                )
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to update daily activity rollup for user {username}: {e}")
+            return False
+
+    @staticmethod
+    def record_lesson_progress(
+        username: str,
+        previous: Optional[AnalyticsData],
+        completed: bool,
+        occurred_at: Optional[datetime.datetime] = None,
+    ) -> bool:
+        """
+        Move one lesson_progress row's contribution to its new state.
+
+        The rollup counts each lesson_progress row once, on the day of its
+        ``updated_at``, exactly like ``backfill()``. Saving the same block again
+        therefore retracts the row's previous state before counting the new one
+        instead of adding another lesson update.
+
+        Args:
+            username: The user who owns the lesson_progress row
+            previous: The row as it was before the write (None if it was inserted)
+            completed: The row's new completion state
+            occurred_at: The row's new ``updated_at`` (default: now, UTC)
+
+        Returns:
+            True if the rollup was updated
+        """
+        try:
+            occurred_at = occurred_at or datetime.datetime.utcnow()
+            # Rows with an unreadable timestamp were never counted by the backfill
+            previous_at = DailyActivityService._parse_timestamp(previous.get("updated_at")) if previous else None
+            previous_completed = int((previous or {}).get("completed") or 0)
+
+            with transaction():
+                if previous_at is not None:
+                    DailyActivityService._update_day(
+                        username,
+                        previous_at,
+                        lambda day: DailyActivityService._retract_lesson(day, previous_at, previous_completed),
+                    )
+                DailyActivityService._update_day(
+                    username,
+                    occurred_at,
+                    lambda day: DailyActivityService._apply_activity(
+                        day, "lesson", occurred_at, {"completed": int(bool(completed))}
+                    ),
+                )
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to update daily activity rollup for user {username}: {e}")
+            return False
+
+    @staticmethod
+    def get_daily_activity(username: str, start_date: datetime.datetime) -> AnalyticsList:
+        """
+        Get the user's rollup rows from ``start_date`` onwards, oldest first.
+
+        Args:
+            username: The username to read
+            start_date: First day to include
+
+        Returns:
+            List of day rows with ``game_types`` and ``activity_hours`` decoded
+        """
+        rows = select_rows(
+            DailyActivityService.TABLE,
+            columns="*",
+            where="username = ? AND activity_date >= ?",
+            params=(username, start_date.strftime("%Y-%m-%d")),
+            order_by="activity_date ASC",
+        )
+        return [DailyActivityService._load_day(row, username, row["activity_date"]) for row in rows or []]
+
+    @staticmethod
+    def backfill(username: Optional[str] = None) -> int:
+        """
+        Rebuild the rollup from the raw progress tables.
+
+        Args:
+            username: Only rebuild this user (default: every user)
+
+        Returns:
+            Number of rollup rows written
+
+        Raises:
+            DatabaseError: If the rollup cannot be rewritten
+        """
+        days: Dict[Tuple[str, str], AnalyticsData] = {}
+
+        for activity_type, source in DailyActivityService.RAW_SOURCES.items():
+            for user, occurred_at, metrics in DailyActivityService._read_raw(source, username):
+                activity_date = occurred_at.strftime("%Y-%m-%d")
+                key = (user, activity_date)
+                if key not in days:
+                    days[key] = DailyActivityService._load_day(None, user, activity_date)
+                DailyActivityService._apply_activity(days[key], activity_type, occurred_at, metrics)
+
+        rows = [DailyActivityService._dump_day(day) for day in days.values()]
+        with transaction():
+            where_clause, params = ("WHERE username = ?", (username,)) if username else ("", ())
+            if not delete_rows(DailyActivityService.TABLE, where_clause, params):
+                raise DatabaseError("Failed to clear daily activity rollup")
+            if rows:
+                bulk_upsert(DailyActivityService.TABLE, rows, DailyActivityService.KEY_COLUMNS)
+
+        logger.info(f"Backfilled {len(rows)} daily activity rows" + (f" for user {username}" if username else ""))
+        return len(rows)
+
+    # Private helper methods
+
+    @staticmethod
+    def _update_day(username: str, occurred_at: datetime.datetime, change) -> None:
+        """Read the day row for ``occurred_at``, apply ``change`` to it and store it."""
+        activity_date = occurred_at.strftime("%Y-%m-%d")
+        existing = select_one(
+            DailyActivityService.TABLE,
+            columns="*",
+            where="username = ? AND activity_date = ?",
+            params=(username, activity_date),
+        )
+        day = DailyActivityService._load_day(existing, username, activity_date)
+        change(day)
+        bulk_upsert(
+            DailyActivityService.TABLE,
+            [DailyActivityService._dump_day(day)],
+            DailyActivityService.KEY_COLUMNS,
+        )
+
+    @staticmethod
+    def _load_day(row: Optional[AnalyticsData], username: str, activity_date: str) -> AnalyticsData:
+        """Turn a stored row (or nothing) into a mutable day record."""
+        day = dict(DailyActivityService.COUNTER_DEFAULTS)
+        day.update({"username": username, "activity_date": activity_date, "last_activity_at": None})
+        day["game_types"] = []
+        day["activity_hours"] = {}
+
+        if row:
+            for column in DailyActivityService.COUNTER_DEFAULTS:
+                if row.get(column) is not None:
+                    day[column] = row[column]
+            day["last_activity_at"] = row.get("last_activity_at")
+            day["game_types"] = json.loads(row.get("game_types") or "[]")
+            day["activity_hours"] = {int(hour): count for hour, count in json.loads(row.get("activity_hours") or "{}").items()}
+        return day
+
+    @staticmethod
+    def _dump_day(day: AnalyticsData) -> AnalyticsData:
+        """Serialize a day record for storage."""
+        row = dict(day)
+        row["game_types"] = json.dumps(sorted(day["game_types"]))
+        row["activity_hours"] = json.dumps({str(hour): count for hour, count in sorted(day["activity_hours"].items())})
+        return row
+
+    @staticmethod
+    def _apply_activity(day: AnalyticsData, activity_type: str, occurred_at: datetime.datetime, metrics: AnalyticsData) -> None:
+        """Add one activity's metrics to a day record in place."""
+        if activity_type == "lesson":
+            day["lesson_updates"] += 1
+            day["lesson_blocks_completed"] += 1 if int(metrics.get("completed") or 0) == 1 else 0
+        elif activity_type == "exercise":
+            score = float(metrics.get("score") or 0)
+            total_questions = int(metrics.get("total_questions") or 0)
+            day["exercises"] += 1
+            day["exercise_score"] += score
+            day["exercise_questions"] += total_questions
+            day["exercise_percent_sum"] += (score / total_questions) * 100 if total_questions > 0 else 0
+        elif activity_type == "vocabulary":
+            day["vocab_reviews"] += 1
+            day["vocab_correct"] += 1 if int(metrics.get("correct") or 0) == 1 else 0
+            day["vocab_repetitions"] += int(metrics.get("repetitions") or 0)
+        elif activity_type == "game":
+            day["games"] += 1
+            day["game_score"] += float(metrics.get("score") or 0)
+            day["game_max_level"] = max(day["game_max_level"], int(metrics.get("level") or 0))
+            game_type = metrics.get("game_type")
+            if game_type and game_type not in day["game_types"]:
+                day["game_types"].append(game_type)
+
+        day["total_activities"] += 1
+        hours = Counter(day["activity_hours"])
+        hours[occurred_at.hour] += 1
+        day["activity_hours"] = dict(hours)
+
+        timestamp = occurred_at.isoformat()
+        if not day["last_activity_at"] or timestamp > day["last_activity_at"]:
+            day["last_activity_at"] = timestamp
+
+    @staticmethod
+    def _retract_lesson(day: AnalyticsData, occurred_at: datetime.datetime, completed: int) -> None:
+        """Remove one previously counted lesson_progress row from a day record in place."""
+        day["lesson_updates"] = max(0, day["lesson_updates"] - 1)
+        day["lesson_blocks_completed"] = max(0, day["lesson_blocks_completed"] - (1 if completed == 1 else 0))
+        day["total_activities"] = max(0, day["total_activities"] - 1)
+
+        hours = Counter(day["activity_hours"])
+        hours[occurred_at.hour] -= 1
+        day["activity_hours"] = {hour: count for hour, count in hours.items() if count > 0}
+
+    @staticmethod
+    def _read_raw(source: Tuple, username: Optional[str]) -> Iterable[Tuple[str, datetime.datetime, AnalyticsData]]:
+        """Yield (user, timestamp, metrics) for every raw row of one source table."""
+        table, user_column, time_column, extra_columns, where = source
+        conditions = [where] if where else []
+        params: Tuple = ()
+        if username:
+            conditions.append(f"{user_column} = ?")
+            params = (username,)
+
+        rows = select_rows(
+            table,
+            columns=[f"{user_column} AS username", f"{time_column} AS occurred_at"] + extra_columns,
+            where=" AND ".join(conditions) if conditions else None,
+            params=params,
+        ) or []
+
+        for row in rows:
+            occurred_at = DailyActivityService._parse_timestamp(row.get("occurred_at"))
+            if occurred_at is None or not row.get("username"):
+                continue
+            yield row["username"], occurred_at, row
+
+    @staticmethod
+    def _parse_timestamp(value) -> Optional[datetime.datetime]:
+        """Parse a stored timestamp; unparseable values are skipped."""
+        if not value:
+            return None
+        try:
+            parsed = datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo:
+            parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return parsed
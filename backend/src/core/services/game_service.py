@@ -19,6 +19,7 @@ from typing import Optional, List
 from core.database.connection import select_one, fetch_one, insert_row
 from core.authentication import user_exists
 from core.services.user_service import UserService
+from core.services.achievement_service import AchievementService
 from shared.exceptions import ValidationError
 from shared.types import GameData, GameList
 
@@ -326,6 +327,7 @@ class GameService:
         """Save game result to database."""
         try:
             insert_row("results", result)
+            AchievementService.record_event(result.get("username"), "game")
             logger.debug(f"Saved game result for user {result.get('username')}")
         except Exception as e:
             logger.error(f"Error saving game result: {e}")
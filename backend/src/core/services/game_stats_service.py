@@ -0,0 +1,160 @@
+"""
+XplorED - Game Statistics Service
+
+This module provides the per-user game aggregates,
+following clean architecture principles as outlined in the documentation.
+
+Game Statistics Components:
+- User aggregates: counts, streaks and play dates from ``user_game_stats``
+- Level aggregates: per-level totals and streaks from ``user_game_level_stats``
+- Recent windows: bounded window-function queries over the newest rounds
+
+Both aggregate tables are maintained by triggers on ``results`` (see
+migration 0006), so reads cost the same regardless of a player's history.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+from typing import Optional
+
+from core.database.connection import select_one, select_rows, fetch_one_custom
+from shared.types import AnalyticsData, AnalyticsList
+
+logger = logging.getLogger(__name__)
+
+
+class GameStatsService:
+    """Reads of the trigger-maintained game aggregates."""
+
+    USER_TABLE = "user_game_stats"
+    LEVEL_TABLE = "user_game_level_stats"
+    STATS_COLUMNS = [
+        "total_rounds", "correct_answers", "highest_level",
+        "current_streak", "best_streak", "first_played", "last_played",
+    ]
+
+    RECENT_ROUNDS = 10
+    IMPROVEMENT_WINDOW = 20
+
+    # Newest rounds ranked with a window function; the inner LIMIT keeps the
+    # scan on idx_results_user_timestamp bounded to two improvement windows
+    RECENT_WINDOW_QUERY = """
+        SELECT
+            SUM(CASE WHEN rn <= {recent} THEN 1 ELSE 0 END) AS recent_games,
+            SUM(CASE WHEN rn <= {recent} THEN is_correct ELSE 0 END) AS recent_correct,
+            SUM(CASE WHEN rn <= {window} THEN 1 ELSE 0 END) AS window_games,
+            SUM(CASE WHEN rn <= {window} THEN is_correct ELSE 0 END) AS window_correct,
+            SUM(CASE WHEN rn > {window} THEN 1 ELSE 0 END) AS previous_games,
+            SUM(CASE WHEN rn > {window} THEN is_correct ELSE 0 END) AS previous_correct
+        FROM (
+            SELECT
+                CASE WHEN correct = 1 THEN 1 ELSE 0 END AS is_correct,
+                ROW_NUMBER() OVER (ORDER BY timestamp DESC) AS rn
+            FROM (
+                SELECT correct, timestamp FROM results
+                WHERE username = ?
+                ORDER BY timestamp DESC
+                LIMIT {limit}
+            )
+        )
+    """
+
+    # The player's first rounds, used as the baseline once two windows exist
+    FIRST_WINDOW_QUERY = """
+        SELECT COUNT(*) AS games, SUM(CASE WHEN correct = 1 THEN 1 ELSE 0 END) AS correct
+        FROM (
+            SELECT correct FROM results
+            WHERE username = ?
+            ORDER BY timestamp ASC
+            LIMIT ?
+        )
+    """
+
+    @staticmethod
+    def get_user_stats(username: str) -> Optional[AnalyticsData]:
+        """
+        Get the user's overall game aggregate.
+
+        Args:
+            username: The username to read
+
+        Returns:
+            Aggregate row, or None if the user has not played
+        """
+        return select_one(
+            GameStatsService.USER_TABLE,
+            columns=GameStatsService.STATS_COLUMNS,
+            where="username = ?",
+            params=(username,),
+        )
+
+    @staticmethod
+    def get_level_stats(username: str) -> AnalyticsList:
+        """
+        Get the user's per-level game aggregates.
+
+        Args:
+            username: The username to read
+
+        Returns:
+            One aggregate row per level played, lowest level first
+        """
+        return select_rows(
+            GameStatsService.LEVEL_TABLE,
+            columns=["level"] + GameStatsService.STATS_COLUMNS,
+            where="username = ?",
+            params=(username,),
+            order_by="level ASC",
+        ) or []
+
+    @staticmethod
+    def get_recent_window(username: str, total_rounds: int) -> AnalyticsData:
+        """
+        Get recent performance and the improvement rate from the newest rounds.
+
+        The improvement rate compares the newest 20 rounds with the first 20
+        once the user has 40 rounds, and with the 20 before them otherwise.
+
+        Args:
+            username: The username to read
+            total_rounds: The user's total rounds from the aggregate
+
+        Returns:
+            Dictionary with ``recent_performance`` and ``improvement_rate``
+        """
+        window = GameStatsService.IMPROVEMENT_WINDOW
+        result = {"recent_performance": [], "improvement_rate": 0.0}
+        if total_rounds <= 0:
+            return result
+
+        query = GameStatsService.RECENT_WINDOW_QUERY.format(
+            recent=GameStatsService.RECENT_ROUNDS, window=window, limit=window * 2
+        )
+        row = fetch_one_custom(query, (username,)) or {}
+
+        recent_games = row.get("recent_games") or 0
+        if recent_games:
+            recent_correct = row.get("recent_correct") or 0
+            result["recent_performance"] = {
+                "games": recent_games,
+                "correct": recent_correct,
+                "accuracy": round((recent_correct / recent_games) * 100, 2),
+            }
+
+        if total_rounds < window:
+            return result
+
+        if total_rounds >= window * 2:
+            baseline = fetch_one_custom(GameStatsService.FIRST_WINDOW_QUERY, (username, window)) or {}
+            baseline_games, baseline_correct = baseline.get("games") or 0, baseline.get("correct") or 0
+        else:
+            baseline_games, baseline_correct = row.get("previous_games") or 0, row.get("previous_correct") or 0
+
+        window_games = row.get("window_games") or 0
+        if window_games and baseline_games and baseline_correct:
+            recent_accuracy = (row.get("window_correct") or 0) / window_games
+            baseline_accuracy = baseline_correct / baseline_games
+            result["improvement_rate"] = round(((recent_accuracy - baseline_accuracy) / baseline_accuracy) * 100, 2)
+
+        return result
@@ -0,0 +1,167 @@
+"""
+XplorED - Lesson Catalog Service
+
+This module provides the lesson catalog query service,
+following clean architecture principles as outlined in the documentation.
+
+Lesson Catalog Components:
+- Lesson pages with per-user progress aggregated in one GROUP BY query
+- Completion rules for block, AI-exercise and manually completed lessons
+- Catalog counts for pagination
+
+A page of lessons costs a constant number of queries regardless of its size.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+from typing import Optional, Tuple
+from core.database.connection import fetch_custom, select_one
+from shared.types import LessonList, LessonData
+
+logger = logging.getLogger(__name__)
+
+
+class LessonCatalogService:
+    """Lesson catalog queries with per-user progress aggregates."""
+
+    # Columns returned for every lesson in the catalog
+    LESSON_COLUMNS = (
+        "id", "lesson_id", "title", "skill_level", "num_blocks",
+        "published", "created_at", "target_user", "ai_enabled",
+    )
+
+    # Intermediate aggregates that are not part of the catalog entry
+    INTERNAL_COLUMNS = ("progress_rows", "ai_blocks", "ai_completed", "manual_completed")
+
+    # Page of lessons joined once to the user's progress rows
+    PAGE_QUERY = """
+        SELECT
+            {lesson_columns},
+            COUNT(lp.block_id) AS progress_rows,
+            COALESCE(SUM(CASE WHEN lp.completed THEN 1 ELSE 0 END), 0) AS completed_blocks,
+            COALESCE(SUM(CASE WHEN instr(lp.block_id, 'ai') > 0 THEN 1 ELSE 0 END), 0) AS ai_blocks,
+            COALESCE(SUM(CASE WHEN instr(lp.block_id, 'ai') > 0 AND lp.completed THEN 1 ELSE 0 END), 0) AS ai_completed,
+            MAX(CASE WHEN lp.block_id = 'manual_completion' THEN lp.completed END) AS manual_completed,
+            MAX(lp.updated_at) AS last_attempt
+        FROM (
+            SELECT {columns}
+            FROM lesson_content
+            WHERE {where}
+            ORDER BY {order_by}
+            LIMIT ? OFFSET ?
+        ) AS lc
+        LEFT JOIN lesson_progress AS lp
+            ON lp.lesson_id = lc.lesson_id AND lp.user_id = ?
+        GROUP BY lc.id
+        ORDER BY {outer_order_by}
+    """
+
+    @staticmethod
+    def get_lesson_page(
+        username: str,
+        where: str = "1=1",
+        params: Tuple = (),
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order_by: str = "created_at DESC",
+    ) -> LessonList:
+        """
+        Get a page of lessons with the user's progress in a single query.
+
+        Args:
+            username: The user whose progress is aggregated
+            where: WHERE clause on lesson_content (trusted, built by callers)
+            params: Parameters for the WHERE clause
+            limit: Maximum number of lessons (None for all)
+            offset: Pagination offset
+            order_by: ORDER BY clause on lesson_content columns
+
+        Returns:
+            List of lessons with completed, percent_complete, completed_blocks
+            and last_attempt fields
+        """
+        try:
+            query = LessonCatalogService.build_page_query(where, order_by)
+            page_limit = -1 if limit is None else int(limit)
+            rows = fetch_custom(query, tuple(params) + (page_limit, int(offset), username))
+
+            lessons = [LessonCatalogService.apply_progress(dict(row)) for row in rows or []]
+            logger.debug(f"Loaded catalog page of {len(lessons)} lessons for user {username}")
+            return lessons
+
+        except Exception as e:
+            logger.error(f"Error loading lesson catalog page for user {username}: {e}")
+            return []
+
+    @staticmethod
+    def build_page_query(where: str = "1=1", order_by: str = "created_at DESC") -> str:
+        """
+        Render the catalog page query for a WHERE and ORDER BY clause.
+
+        Args:
+            where: WHERE clause on lesson_content
+            order_by: ORDER BY clause on lesson_content columns
+
+        Returns:
+            SQL taking the WHERE parameters followed by limit, offset and username
+        """
+        return LessonCatalogService.PAGE_QUERY.format(
+            lesson_columns=", ".join(f"lc.{col}" for col in LessonCatalogService.LESSON_COLUMNS),
+            columns=", ".join(LessonCatalogService.LESSON_COLUMNS),
+            where=where,
+            order_by=order_by,
+            outer_order_by=", ".join(f"lc.{part.strip()}" for part in order_by.split(",")),
+        )
+
+    @staticmethod
+    def count_lessons(where: str = "1=1", params: Tuple = ()) -> int:
+        """
+        Count catalog lessons matching a WHERE clause.
+
+        Args:
+            where: WHERE clause on lesson_content
+            params: Parameters for the WHERE clause
+
+        Returns:
+            Number of matching lessons
+        """
+        row = select_one("lesson_content", columns="COUNT(*) as total", where=where, params=tuple(params))
+        return row.get("total", 0) if row else 0
+
+    @staticmethod
+    def apply_progress(lesson: LessonData) -> LessonData:
+        """
+        Derive completion fields from the aggregated progress columns.
+
+        Lessons with blocks are complete once every block is; lessons without
+        blocks are complete when all AI exercise blocks are (if AI exercises are
+        enabled) or when the learner marked them complete manually.
+
+        Args:
+            lesson: Catalog row including the progress aggregates
+
+        Returns:
+            The same dictionary with ``completed`` and ``percent_complete`` set
+            and the intermediate aggregates removed
+        """
+        total_blocks = lesson.get("num_blocks") or 0
+        completed_blocks = lesson.get("completed_blocks") or 0
+
+        if total_blocks == 0:
+            if lesson.get("ai_enabled"):
+                ai_blocks = lesson.get("ai_blocks") or 0
+                is_completed = ai_blocks > 0 and (lesson.get("ai_completed") or 0) == ai_blocks
+            else:
+                is_completed = bool(lesson.get("manual_completed"))
+            completion_percentage = 100.0 if is_completed else 0.0
+        else:
+            completion_percentage = completed_blocks / total_blocks * 100
+            is_completed = completed_blocks >= total_blocks
+
+        for column in LessonCatalogService.INTERNAL_COLUMNS:
+            lesson.pop(column, None)
+
+        lesson["completed"] = is_completed
+        lesson["percent_complete"] = round(completion_percentage, 2)
+        return lesson
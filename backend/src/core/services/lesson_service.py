@@ -13,10 +13,14 @@ Lesson Service Components:
 For detailed architecture information, see: docs/backend_structure.md
 """
 
+import datetime
 import logging
 from typing import List, Optional
 from core.database.connection import select_rows, select_one, update_row, insert_row
 from core.authentication import user_exists
+from core.services.lesson_catalog_service import LessonCatalogService
+from core.services.daily_activity_service import DailyActivityService
+from core.services.achievement_service import AchievementService
 from shared.exceptions import ValidationError
 from shared.types import LessonList, LessonData, ProgressData, AnalyticsData
 
@@ -49,28 +53,15 @@ class LessonService:
 
             logger.info(f"Getting lesson summary for user {username}")
 
-            # Get all published lessons for the user
-            lessons = select_rows(
-                "lesson_content",
-                columns=[
-                    "lesson_id",
-                    "title",
-                    "created_at",
-                    "target_user",
-                    "num_blocks",
-                    "ai_enabled",
-                ],
+            # Get all published lessons for the user with progress in one query
+            lessons = LessonCatalogService.get_lesson_page(
+                username,
                 where="(target_user IS NULL OR target_user = ?) AND published = 1",
                 params=(username,),
                 order_by="created_at DESC",
             )
 
-            results = []
-
-            for lesson in lessons:
-                lesson_id = lesson["lesson_id"]
-                lesson_summary = LessonService._build_lesson_summary(username, lesson_id, lesson)
-                results.append(lesson_summary)
+            results = [LessonService._build_lesson_summary(lesson) for lesson in lessons]
 
             logger.info(f"Retrieved {len(results)} lesson summaries for user {username}")
             return results
@@ -254,12 +245,13 @@ class LessonService:
                 params=(username, lesson_id, block_id),
             )
 
+            now = datetime.datetime.utcnow()
             if existing_progress:
                 # Update existing progress
                 success = update_row(
                     "lesson_progress",
-                    {"completed": completed, "updated_at": "datetime('now')"},
-                    "WHERE user_id = ? AND lesson_id = ? AND block_id = ?",
+                    {"completed": completed, "updated_at": now},
+                    "user_id = ? AND lesson_id = ? AND block_id = ?",
                     (username, lesson_id, block_id),
                 )
             else:
@@ -269,12 +261,15 @@ class LessonService:
                     "lesson_id": lesson_id,
                     "block_id": block_id,
                     "completed": completed,
-                    "created_at": "datetime('now')",
-                    "updated_at": "datetime('now')",
+                    "created_at": now,
+                    "updated_at": now,
                 }
                 success = insert_row("lesson_progress", progress_data)
 
             if success:
+                DailyActivityService.record_lesson_progress(username, existing_progress, completed, occurred_at=now)
+                if completed:
+                    AchievementService.record_event(username, "lesson")
                 logger.info(f"Successfully updated lesson progress for user {username}, lesson {lesson_id}, block {block_id}")
             else:
                 logger.error(f"Failed to update lesson progress for user {username}, lesson {lesson_id}, block {block_id}")
@@ -464,42 +459,19 @@ class LessonService:
             return []
 
     @staticmethod
-    def _build_lesson_summary(username: str, lesson_id: int, lesson_data: LessonData) -> LessonData:
-        """Build a lesson summary with progress information."""
-        try:
-            # Get user progress for this lesson
-            progress = LessonService.get_lesson_progress(username, lesson_id)
-
-            summary = {
-                "lesson_id": lesson_id,
-                "title": lesson_data["title"],
-                "created_at": lesson_data["created_at"],
-                "target_user": lesson_data["target_user"],
-                "num_blocks": lesson_data["num_blocks"],
-                "ai_enabled": bool(lesson_data["ai_enabled"]),
-                "progress": {
-                    "completed_blocks": progress["completed_blocks"],
-                    "total_blocks": progress["total_blocks"],
-                    "completion_percentage": progress["completion_percentage"],
-                    "is_completed": progress["is_completed"]
-                }
-            }
-
-            return summary
-
-        except Exception as e:
-            logger.error(f"Error building lesson summary for user {username}, lesson {lesson_id}: {e}")
-            return {
-                "lesson_id": lesson_id,
-                "title": lesson_data.get("title", "Unknown"),
-                "created_at": lesson_data.get("created_at"),
-                "target_user": lesson_data.get("target_user"),
-                "num_blocks": lesson_data.get("num_blocks", 0),
-                "ai_enabled": bool(lesson_data.get("ai_enabled", False)),
-                "progress": {
-                    "completed_blocks": 0,
-                    "total_blocks": 0,
-                    "completion_percentage": 0.0,
-                    "is_completed": False
-                }
+    def _build_lesson_summary(lesson_data: LessonData) -> LessonData:
+        """Build a lesson summary from a lesson catalog row."""
+        return {
+            "lesson_id": lesson_data["lesson_id"],
+            "title": lesson_data.get("title", "Unknown"),
+            "created_at": lesson_data.get("created_at"),
+            "target_user": lesson_data.get("target_user"),
+            "num_blocks": lesson_data.get("num_blocks") or 0,
+            "ai_enabled": bool(lesson_data.get("ai_enabled", False)),
+            "progress": {
+                "completed_blocks": lesson_data.get("completed_blocks", 0),
+                "total_blocks": lesson_data.get("num_blocks") or 0,
+                "completion_percentage": lesson_data.get("percent_complete", 0.0),
+                "is_completed": lesson_data.get("completed", False)
             }
+        }
@@ -21,6 +21,7 @@ from collections import Counter
 from core.database.connection import select_rows, select_one, update_row, insert_row, delete_rows
 from core.authentication import user_exists
 from core.services import LessonService, VocabularyService, UserService
+from core.services.daily_activity_service import DailyActivityService
 from shared.exceptions import ValidationError
 from shared.types import ProgressData, AnalyticsData, AnalyticsList
 
@@ -63,20 +64,24 @@ class ProgressService:
 
             summary = ProgressService._build_base_summary(username, days, start_date, end_date)
 
-            # Get activity data for each type
-            lesson_data = ProgressService._get_lesson_activity_data(username, start_date)
-            exercise_data = ProgressService._get_exercise_activity_data(username, start_date)
-            vocabulary_data = ProgressService._get_vocabulary_activity_data(username, start_date)
-            game_data = ProgressService._get_game_activity_data(username, start_date)
+            # One range read of the daily rollup covers every activity type
+            daily_rows = DailyActivityService.get_daily_activity(username, start_date)
 
             # Update summary with activity data
-            summary.update(ProgressService._process_lesson_activity(lesson_data, summary))
-            summary.update(ProgressService._process_exercise_activity(exercise_data, summary))
-            summary.update(ProgressService._process_vocabulary_activity(vocabulary_data, summary))
-            summary.update(ProgressService._process_game_activity(game_data, summary))
+            breakdown = {}
+            for processor in (
+                ProgressService._process_lesson_activity,
+                ProgressService._process_exercise_activity,
+                ProgressService._process_vocabulary_activity,
+                ProgressService._process_game_activity,
+            ):
+                result = processor(daily_rows, summary)
+                breakdown.update(result.pop("activity_breakdown"))
+                summary.update(result)
+            summary["activity_breakdown"] = breakdown
 
             # Calculate derived metrics
-            summary.update(ProgressService._calculate_derived_metrics(summary, lesson_data, exercise_data, vocabulary_data, game_data))
+            summary.update(ProgressService._calculate_derived_metrics(summary, daily_rows))
 
             logger.info(f"Generated progress summary for user {username}: {summary['total_activities']} activities, {summary['streak_days']} day streak")
             return summary
@@ -121,17 +126,20 @@ class ProgressService:
 
             trends = ProgressService._build_base_trends(username, days, start_date, end_date)
 
+            # One range read of the daily rollup feeds every trend below
+            daily_rows = DailyActivityService.get_daily_activity(username, start_date)
+
             # Get daily activity breakdown
-            trends["daily_activity"] = ProgressService._get_daily_activity_breakdown(username, start_date, days)
+            trends["daily_activity"] = ProgressService._get_daily_activity_breakdown(daily_rows, end_date, days)
 
             # Calculate activity trends
             trends["activity_trends"] = ProgressService._calculate_activity_trends(trends["daily_activity"], days)
 
             # Calculate performance trends
-            trends["performance_trends"] = ProgressService._calculate_performance_trends(username, start_date, days)
+            trends["performance_trends"] = ProgressService._calculate_performance_trends(daily_rows, end_date)
 
             # Analyze learning patterns
-            trends["learning_patterns"] = ProgressService._analyze_learning_patterns(username, start_date, days)
+            trends["learning_patterns"] = ProgressService._analyze_learning_patterns(daily_rows)
 
             # Generate recommendations
             trends["recommendations"] = ProgressService._generate_recommendations(trends)
@@ -195,6 +203,7 @@ class ProgressService:
             success = insert_row("activity_progress", progress_data)
 
             if success:
+                DailyActivityService.record_activity(username, "exercise", score=score, total_questions=total_questions)
                 logger.info(f"Successfully tracked exercise progress for user {username}, block {block_id}")
             else:
                 logger.error(f"Failed to track exercise progress for user {username}, block {block_id}")
@@ -253,6 +262,7 @@ class ProgressService:
             success = insert_row("vocabulary_progress", progress_data)
 
             if success:
+                DailyActivityService.record_activity(username, "vocabulary", correct=int(correct), repetitions=repetitions)
                 logger.info(f"Successfully tracked vocabulary progress for user {username}, word {word}")
             else:
                 logger.error(f"Failed to track vocabulary progress for user {username}, word {word}")
@@ -311,6 +321,7 @@ class ProgressService:
             success = insert_row("game_progress", progress_data)
 
             if success:
+                DailyActivityService.record_activity(username, "game", game_type=game_type, score=score, level=level)
                 logger.info(f"Successfully tracked game progress for user {username}, game {game_type}, level {level}")
             else:
                 logger.error(f"Failed to track game progress for user {username}, game {game_type}, level {level}")
@@ -363,6 +374,9 @@ class ProgressService:
                         success = False
                         logger.error(f"Failed to reset progress for table {table}")
 
+            # Rebuild the user's daily rollup from whatever raw progress remains
+            DailyActivityService.backfill(username)
+
             if success:
                 logger.info(f"Successfully reset progress for user {username}")
             else:
@@ -452,80 +466,47 @@ class ProgressService:
         }
 
     @staticmethod
-    def _get_lesson_activity_data(username: str, start_date: datetime.datetime) -> AnalyticsList:
-        """Get lesson activity data for the period."""
-        return select_rows(
-                "lesson_progress",
-            columns=["lesson_id", "block_id", "completed", "updated_at"],
-            where="user_id = ? AND updated_at >= ?",
-            params=(username, start_date.isoformat())
-        ) or []
-
-    @staticmethod
-    def _get_exercise_activity_data(username: str, start_date: datetime.datetime) -> AnalyticsList:
-        """Get exercise activity data for the period."""
-        return select_rows(
-            "activity_progress",
-            columns=["block_id", "score", "total_questions", "completion_percentage", "completed_at"],
-            where="username = ? AND activity_type = 'exercise' AND completed_at >= ?",
-            params=(username, start_date.isoformat())
-        ) or []
-
-    @staticmethod
-    def _get_vocabulary_activity_data(username: str, start_date: datetime.datetime) -> AnalyticsList:
-        """Get vocabulary activity data for the period."""
-        return select_rows(
-            "vocabulary_progress",
-            columns=["word", "correct", "repetitions", "reviewed_at"],
-            where="username = ? AND reviewed_at >= ?",
-            params=(username, start_date.isoformat())
-        ) or []
+    def _sum_days(daily_rows: AnalyticsList, column: str) -> float:
+        """Sum one rollup column across days."""
+        return sum(day.get(column, 0) or 0 for day in daily_rows)
 
     @staticmethod
-    def _get_game_activity_data(username: str, start_date: datetime.datetime) -> AnalyticsList:
-        """Get game activity data for the period."""
-        return select_rows(
-            "game_progress",
-            columns=["game_type", "score", "level", "completed_at"],
-            where="username = ? AND completed_at >= ?",
-            params=(username, start_date.isoformat())
-        ) or []
-
-    @staticmethod
-    def _process_lesson_activity(lesson_data: AnalyticsList, summary: AnalyticsData) -> AnalyticsData:
+    def _process_lesson_activity(daily_rows: AnalyticsList, summary: AnalyticsData) -> AnalyticsData:
         """Process lesson activity data and update summary."""
-        if not lesson_data:
+        total_blocks = ProgressService._sum_days(daily_rows, "lesson_updates")
+        if not total_blocks:
             return {"lessons_completed": 0, "activity_breakdown": {"lessons": {}}}
 
-        completed_lessons = sum(1 for p in lesson_data if p.get("completed", 0) == 1)
+        completed_lessons = ProgressService._sum_days(daily_rows, "lesson_blocks_completed")
 
         return {
             "lessons_completed": completed_lessons,
             "activity_breakdown": {
                 "lessons": {
-                    "total_blocks": len(lesson_data),
+                    "total_blocks": total_blocks,
                     "completed_blocks": completed_lessons,
-                    "completion_rate": (completed_lessons / len(lesson_data)) * 100 if lesson_data else 0
+                    "completion_rate": (completed_lessons / total_blocks) * 100
                 }
             }
         }
 
     @staticmethod
-    def _process_exercise_activity(exercise_data: AnalyticsList, summary: AnalyticsData) -> AnalyticsData:
+    def _process_exercise_activity(daily_rows: AnalyticsList, summary: AnalyticsData) -> AnalyticsData:
         """Process exercise activity data and update summary."""
-        if not exercise_data:
+        total_exercises = ProgressService._sum_days(daily_rows, "exercises")
+        if not total_exercises:
             return {"exercises_completed": 0, "average_score": 0.0, "activity_breakdown": {"exercises": {}}}
 
-        total_score = sum(p.get("score", 0) for p in exercise_data)
-        total_questions = sum(p.get("total_questions", 0) for p in exercise_data)
+        total_score = ProgressService._sum_days(daily_rows, "exercise_score")
+        total_questions = ProgressService._sum_days(daily_rows, "exercise_questions")
         average_score = (total_score / total_questions) * 100 if total_questions > 0 else 0
 
         return {
-            "exercises_completed": len(exercise_data),
+            "exercises_completed": total_exercises,
             "average_score": average_score,
             "activity_breakdown": {
                 "exercises": {
-                    "total_exercises": len(exercise_data),
+                    "total_exercises": total_exercises,
                     "average_score": average_score,
                     "total_questions": total_questions
                 }
@@ -533,49 +514,51 @@ class ProgressService:
         }
 
     @staticmethod
-    def _process_vocabulary_activity(vocab_data: AnalyticsList, summary: AnalyticsData) -> AnalyticsData:
+    def _process_vocabulary_activity(daily_rows: AnalyticsList, summary: AnalyticsData) -> AnalyticsData:
         """Process vocabulary activity data and update summary."""
-        if not vocab_data:
+        total_reviews = ProgressService._sum_days(daily_rows, "vocab_reviews")
+        if not total_reviews:
             return {"vocabulary_reviews": 0, "activity_breakdown": {"vocabulary": {}}}
 
-        correct_reviews = sum(1 for p in vocab_data if p.get("correct", 0) == 1)
+        correct_reviews = ProgressService._sum_days(daily_rows, "vocab_correct")
 
         return {
-            "vocabulary_reviews": len(vocab_data),
+            "vocabulary_reviews": total_reviews,
             "activity_breakdown": {
                 "vocabulary": {
-                    "total_reviews": len(vocab_data),
+                    "total_reviews": total_reviews,
                     "correct_reviews": correct_reviews,
-                    "accuracy_rate": (correct_reviews / len(vocab_data)) * 100 if vocab_data else 0,
-                    "total_repetitions": sum(p.get("repetitions", 0) for p in vocab_data)
+                    "accuracy_rate": (correct_reviews / total_reviews) * 100,
+                    "total_repetitions": ProgressService._sum_days(daily_rows, "vocab_repetitions")
                 }
             }
         }
 
     @staticmethod
-    def _process_game_activity(game_data: AnalyticsList, summary: AnalyticsData) -> AnalyticsData:
+    def _process_game_activity(daily_rows: AnalyticsList, summary: AnalyticsData) -> AnalyticsData:
         """Process game activity data and update summary."""
-        if not game_data:
+        total_games = ProgressService._sum_days(daily_rows, "games")
+        if not total_games:
             return {"games_played": 0, "activity_breakdown": {"games": {}}}
 
-        game_scores = [p.get("score", 0) for p in game_data]
+        game_types = set()
+        for day in daily_rows:
+            game_types.update(day.get("game_types", []))
 
         return {
-            "games_played": len(game_data),
+            "games_played": total_games,
             "activity_breakdown": {
                 "games": {
-                    "total_games": len(game_data),
-                    "average_score": sum(game_scores) / len(game_scores) if game_scores else 0,
-                    "highest_level": max(p.get("level", 0) for p in game_data) if game_data else 0,
-                    "game_types": list(set(p.get("game_type", "") for p in game_data))
+                    "total_games": total_games,
+                    "average_score": ProgressService._sum_days(daily_rows, "game_score") / total_games,
+                    "highest_level": max(day.get("game_max_level", 0) for day in daily_rows),
+                    "game_types": sorted(game_types)
                 }
             }
         }
 
     @staticmethod
-    def _calculate_derived_metrics(summary: AnalyticsData, lesson_data: AnalyticsList,
-                                 exercise_data: AnalyticsList, vocab_data: AnalyticsList,
-                                 game_data: AnalyticsList) -> AnalyticsData:
+    def _calculate_derived_metrics(summary: AnalyticsData, daily_rows: AnalyticsList) -> AnalyticsData:
         """Calculate derived metrics from activity data."""
         # Calculate total activities
         total_activities = (
@@ -585,121 +568,74 @@ class ProgressService:
             summary["games_played"]
         )
 
-        # Calculate streak days
-        all_activities = lesson_data + exercise_data + vocab_data + game_data
-        streak_days = ProgressService._calculate_streak_days(all_activities)
-
-        # Calculate recent activity
-        recent_activity = ProgressService._get_recent_activity(all_activities)
-
         return {
             "total_activities": total_activities,
-            "streak_days": streak_days,
-            "recent_activity": recent_activity
+            "streak_days": ProgressService._calculate_streak_days(daily_rows),
+            "recent_activity": ProgressService._get_recent_activity(daily_rows)
         }
 
     @staticmethod
-    def _calculate_streak_days(all_activities: AnalyticsList) -> int:
-        """Calculate consecutive days with activity."""
-        if not all_activities:
-            return 0
-
-        # Get unique dates with activity
-        activity_dates = set()
-        for activity in all_activities:
-            date_field = activity.get("updated_at") or activity.get("completed_at") or activity.get("reviewed_at")
-            if date_field:
-                try:
-                    activity_date = datetime.datetime.fromisoformat(date_field.replace('Z', '+00:00')).date()
-                    activity_dates.add(activity_date)
-                except:
-                    continue
-
+    def _calculate_streak_days(daily_rows: AnalyticsList) -> int:
+        """Calculate consecutive days with activity, ending today."""
+        activity_dates = {
+            day["activity_date"] for day in daily_rows if day.get("total_activities", 0) > 0
+        }
         if not activity_dates:
             return 0
 
-        # Calculate streak
-        sorted_dates = sorted(activity_dates, reverse=True)
         current_streak = 0
-        current_date = datetime.date.today()
-
-        for date in sorted_dates:
-            if (current_date - date).days == current_streak:
-                current_streak += 1
-            else:
-                break
+        current_date = datetime.datetime.utcnow().date()
+        while (current_date - datetime.timedelta(days=current_streak)).isoformat() in activity_dates:
+            current_streak += 1
 
         return current_streak
 
     @staticmethod
-    def _get_recent_activity(all_activities: AnalyticsList, limit: int = 10) -> AnalyticsList:
-        """Get recent activity from all activities."""
+    def _get_recent_activity(daily_rows: AnalyticsList, limit: int = 10) -> AnalyticsList:
+        """Get the most recent per-day activity entries, newest first."""
+        type_columns = [
+            ("lesson", "lesson_updates", ["lesson_blocks_completed"]),
+            ("exercise", "exercises", ["exercise_score", "exercise_questions"]),
+            ("vocabulary", "vocab_reviews", ["vocab_correct", "vocab_repetitions"]),
+            ("game", "games", ["game_score", "game_max_level", "game_types"]),
+        ]
+
         recent_activities = []
-        for activity in all_activities:
-            date_field = activity.get("updated_at") or activity.get("completed_at") or activity.get("reviewed_at")
-            if date_field:
-                try:
-                    activity_date = datetime.datetime.fromisoformat(date_field.replace('Z', '+00:00'))
-                    recent_activities.append({
-                        "type": "lesson" if "lesson_id" in activity else "exercise" if "score" in activity else "vocabulary" if "word" in activity else "game",
-                        "date": activity_date.isoformat(),
-                        "details": activity
-                    })
-                except:
+        for day in reversed(daily_rows):
+            for activity_type, count_column, detail_columns in type_columns:
+                if not day.get(count_column):
                     continue
+                details = {"count": day[count_column]}
+                details.update({column: day.get(column) for column in detail_columns})
+                recent_activities.append({
+                    "type": activity_type,
+                    "date": day.get("last_activity_at") or day["activity_date"],
+                    "details": details
+                })
+            if len(recent_activities) >= limit:
+                break
 
-        # Sort by date and take last N
-        recent_activities.sort(key=lambda x: x["date"], reverse=True)
         return recent_activities[:limit]
 
     @staticmethod
-    def _get_daily_activity_breakdown(username: str, start_date: datetime.datetime, days: int) -> AnalyticsData:
-        """Get daily activity breakdown for the period."""
+    def _get_daily_activity_breakdown(daily_rows: AnalyticsList, end_date: datetime.datetime, days: int) -> AnalyticsData:
+        """Get daily activity breakdown for the period, including idle days."""
+        by_date = {day["activity_date"]: day for day in daily_rows}
         daily_activity = {}
-        end_date = datetime.datetime.utcnow()
 
         for i in range(days):
-            current_date = end_date - datetime.timedelta(days=i)
-            date_str = current_date.strftime("%Y-%m-%d")
-
-            # Count activities for this date
-            lesson_count = len(select_rows(
-                "lesson_progress",
-                columns=["id"],
-                where="user_id = ? AND DATE(updated_at) = ?",
-                params=(username, date_str)
-            ) or [])
-
-            exercise_count = len(select_rows(
-                "activity_progress",
-                columns=["id"],
-                where="username = ? AND activity_type = 'exercise' AND DATE(completed_at) = ?",
-                params=(username, date_str)
-            ) or [])
-
-            vocab_count = len(select_rows(
-                "vocabulary_progress",
-                columns=["id"],
-                where="username = ? AND DATE(reviewed_at) = ?",
-                params=(username, date_str)
-            ) or [])
-
-            game_count = len(select_rows(
-                "game_progress",
-                columns=["id"],
-                where="username = ? AND DATE(completed_at) = ?",
-                params=(username, date_str)
-            ) or [])
-
-            daily_activity[date_str] = {
-                "lessons": lesson_count,
-                "exercises": exercise_count,
-                "vocabulary": vocab_count,
-                "games": game_count,
-                "total": lesson_count + exercise_count + vocab_count + game_count
+            date_str = (end_date - datetime.timedelta(days=i)).strftime("%Y-%m-%d")
+            day = by_date.get(date_str, {})
+            counts = {
+                "lessons": day.get("lesson_updates", 0),
+                "exercises": day.get("exercises", 0),
+                "vocabulary": day.get("vocab_reviews", 0),
+                "games": day.get("games", 0),
             }
+            counts["total"] = sum(counts.values())
+            daily_activity[date_str] = counts
 
-            return daily_activity
+        return daily_activity
 
     @staticmethod
     def _calculate_activity_trends(daily_activity: AnalyticsData, days: int) -> AnalyticsData:
@@ -716,29 +652,12 @@ class ProgressService:
         }
 
     @staticmethod
-    def _calculate_performance_trends(username: str, start_date: datetime.datetime, days: int) -> AnalyticsData:
+    def _calculate_performance_trends(daily_rows: AnalyticsList, end_date: datetime.datetime) -> AnalyticsData:
         """Calculate performance trends for the period."""
-        exercise_scores = []
-        end_date = datetime.datetime.utcnow()
+        exercise_days = [day for day in daily_rows if day.get("exercises")]
+        total_exercises = ProgressService._sum_days(exercise_days, "exercises")
 
-        for i in range(days):
-            current_date = end_date - datetime.timedelta(days=i)
-            date_str = current_date.strftime("%Y-%m-%d")
-
-            exercises = select_rows(
-                "activity_progress",
-                columns=["score", "total_questions"],
-                where="username = ? AND activity_type = 'exercise' AND DATE(completed_at) = ?",
-                params=(username, date_str)
-            ) or []
-
-            for exercise in exercises:
-                score = exercise.get("score", 0)
-                total = exercise.get("total_questions", 1)
-                if total > 0:
-                    exercise_scores.append((date_str, (score / total) * 100))
-
-        if not exercise_scores:
+        if not total_exercises:
             return {
                 "average_score": 0,
                 "performance_change": 0,
@@ -746,49 +665,33 @@ class ProgressService:
                 "trend_direction": "stable"
             }
 
-        # Calculate performance improvement
-        recent_scores = [score for date, score in exercise_scores if date >= (end_date - datetime.timedelta(days=3)).strftime("%Y-%m-%d")]
-        older_scores = [score for date, score in exercise_scores if date < (end_date - datetime.timedelta(days=3)).strftime("%Y-%m-%d")]
+        # Compare the last three days with the rest of the period
+        cutoff = (end_date - datetime.timedelta(days=3)).strftime("%Y-%m-%d")
+        recent_days = [day for day in exercise_days if day["activity_date"] >= cutoff]
+        older_days = [day for day in exercise_days if day["activity_date"] < cutoff]
 
-        if recent_scores and older_scores:
-            recent_avg = sum(recent_scores) / len(recent_scores)
-            older_avg = sum(older_scores) / len(older_scores)
+        if recent_days and older_days:
+            recent_avg = ProgressService._sum_days(recent_days, "exercise_percent_sum") / ProgressService._sum_days(recent_days, "exercises")
+            older_avg = ProgressService._sum_days(older_days, "exercise_percent_sum") / ProgressService._sum_days(older_days, "exercises")
             performance_change = ((recent_avg - older_avg) / older_avg) * 100 if older_avg > 0 else 0
         else:
             performance_change = 0
 
         return {
-            "average_score": sum(score for _, score in exercise_scores) / len(exercise_scores),
+            "average_score": ProgressService._sum_days(exercise_days, "exercise_percent_sum") / total_exercises,
             "performance_change": round(performance_change, 2),
-            "total_exercises": len(exercise_scores),
+            "total_exercises": total_exercises,
             "trend_direction": "improving" if performance_change > 5 else "declining" if performance_change < -5 else "stable"
         }
 
     @staticmethod
-    def _analyze_learning_patterns(username: str, start_date: datetime.datetime, days: int) -> AnalyticsData:
+    def _analyze_learning_patterns(daily_rows: AnalyticsList) -> AnalyticsData:
         """Analyze learning patterns for the period."""
-        activity_times = []
-        end_date = datetime.datetime.utcnow()
-
-        for i in range(days):
-            current_date = end_date - datetime.timedelta(days=i)
-            date_str = current_date.strftime("%Y-%m-%d")
-
-            activities = select_rows(
-                "activity_progress",
-                columns=["completed_at"],
-                where="username = ? AND DATE(completed_at) = ?",
-                params=(username, date_str)
-            ) or []
-
-            for activity in activities:
-                try:
-                    activity_time = datetime.datetime.fromisoformat(activity["completed_at"].replace('Z', '+00:00'))
-                    activity_times.append(activity_time.hour)
-                except:
-                    continue
+        time_counts = Counter()
+        for day in daily_rows:
+            time_counts.update(day.get("activity_hours", {}))
 
-        if not activity_times:
+        if not time_counts:
             return {
                 "most_active_hour": None,
                 "activity_distribution": {},
@@ -796,13 +699,12 @@ class ProgressService:
             }
 
         # Find most common activity time
-        time_counts = Counter(activity_times)
-        most_common_time = time_counts.most_common(1)[0][0] if time_counts else None
+        most_common_time = time_counts.most_common(1)[0][0]
 
         return {
             "most_active_hour": most_common_time,
             "activity_distribution": dict(time_counts),
-            "preferred_time": "morning" if most_common_time and 6 <= most_common_time < 12 else "afternoon" if 12 <= most_common_time < 18 else "evening" if 18 <= most_common_time < 22 else "night"
+            "preferred_time": "morning" if 6 <= most_common_time < 12 else "afternoon" if 12 <= most_common_time < 18 else "evening" if 18 <= most_common_time < 22 else "night"
         }
 
     @staticmethod
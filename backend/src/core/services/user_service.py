@@ -17,6 +17,7 @@ import logging
 from typing import Optional
 from core.database.connection import select_one, fetch_one, select_rows
 from core.authentication import user_exists
+from core.services.game_stats_service import GameStatsService
 from shared.exceptions import ValidationError
 from shared.types import AnalyticsData
 
@@ -194,14 +195,10 @@ class UserService:
     def _get_game_statistics(username: str) -> AnalyticsData:
         """Get user's game performance statistics."""
         try:
-            # Get game results
-            results = select_rows(
-                "results",
-                where="username = ?",
-                params=(username,)
-            )
+            # Aggregate maintained by triggers on results
+            stats = GameStatsService.get_user_stats(username)
 
-            if not results:
+            if not stats or not stats.get("total_rounds"):
                 return {
                     "total_games": 0,
                     "average_score": 0.0,
@@ -211,10 +208,10 @@ class UserService:
                     "last_activity": None
                 }
 
-            total_games = len(results)
-            total_correct = sum(1 for r in results if r.get("correct", 0) == 1)
+            total_games = stats["total_rounds"]
+            total_correct = stats.get("correct_answers") or 0
             average_score = (total_correct / total_games * 100) if total_games > 0 else 0.0
-            best_score = max((r.get("correct", 0) for r in results), default=0)
+            best_score = 1 if total_correct > 0 else 0
 
             return {
                 "total_games": total_games,
@@ -222,7 +219,7 @@ class UserService:
                 "best_score": best_score,
                 "total_play_time": 0,  # TODO: Implement play time tracking
                 "completion_rate": round(total_correct / total_games, 2) if total_games > 0 else 0.0,
-                "last_activity": results[-1].get("timestamp") if results else None
+                "last_activity": stats.get("last_played")
             }
 
         except Exception as e:
@@ -15,6 +15,7 @@ For detailed architecture information, see: docs/backend_structure.md
 
 import logging
 import datetime
+import time
 from typing import List, Optional, Tuple
 from core.database.connection import select_one, select_rows, fetch_custom, insert_row, update_row, delete_rows
 from core.authentication import user_exists
@@ -32,6 +33,10 @@ class VocabularyService:
     # Vocabulary columns for consistent queries
     VOCAB_COLUMNS = "vocab, translation, article, word_type, details, created_at, next_review, context, exercise, repetitions, quality, last_review"
 
+    # Due-date filter on the indexed epoch column (kept in sync with next_review by triggers)
+    DUE_WHERE = "username = ? AND next_review_at <= ?"
+    DUE_QUEUE_MAX = 100
+
     @staticmethod
     def lookup_vocabulary_word(user: str, word: str) -> LookupResult:
         """
@@ -136,7 +141,7 @@ class VocabularyService:
                 columns=VocabularyService.VOCAB_COLUMNS,
                 where="username = ?",
                 params=(user,),
-                order_by="datetime(next_review) ASC",
+                order_by="next_review_at ASC",
             )
             entries = [dict(row) for row in rows] if rows else []
 
@@ -186,7 +191,7 @@ class VocabularyService:
             mastered_count = mastered_result.get("count", 0) if mastered_result else 0
 
             # Get due for review
-            due_result = select_one("vocab_log", columns="COUNT(*) as count", where="username = ? AND datetime(next_review) <= datetime('now')", params=(user,))
+            due_result = select_one("vocab_log", columns="COUNT(*) as count", where=VocabularyService.DUE_WHERE, params=(user, VocabularyService._now_epoch()))
             due_for_review = due_result.get("count", 0) if due_result else 0
 
             # Get average quality score
@@ -319,13 +324,8 @@ class VocabularyService:
             logger.info(f"Selecting vocabulary word due for review for user '{user}'")
 
             # Get word due for review
-            row = select_one(
-                "vocab_log",
-                columns=VocabularyService.VOCAB_COLUMNS,
-                where="username = ? AND datetime(next_review) <= datetime('now')",
-                params=(user,),
-                order_by="datetime(next_review) ASC"
-            )
+            queue = VocabularyService.get_due_vocabulary_queue(user, limit=1)
+            row = queue[0] if queue else None
 
             if row:
                 result = dict(row)
@@ -342,6 +342,48 @@ class VocabularyService:
             logger.error(f"Error selecting vocabulary word for user '{user}': {e}")
             return None
 
+    @staticmethod
+    def get_due_vocabulary_queue(
+        user: str,
+        limit: int = 20,
+        word_type: Optional[str] = None,
+        now: Optional[int] = None,
+    ) -> VocabularyList:
+        """
+        Get the next vocabulary words due for review, earliest first.
+
+        Reads one indexed range of ``(username, next_review_at)`` so the trainer
+        can prefetch a batch of cards with a single query.
+
+        Args:
+            user: The username to get the queue for
+            limit: Maximum number of words to return (capped at DUE_QUEUE_MAX)
+            word_type: Optional word type filter
+            now: Epoch seconds to treat as the current time (default: now)
+
+        Returns:
+            List of vocabulary entries including their ``id`` (rowid)
+        """
+        if not user:
+            raise ValueError("User is required")
+
+        limit = max(1, min(int(limit or 1), VocabularyService.DUE_QUEUE_MAX))
+        where = VocabularyService.DUE_WHERE
+        params: tuple = (user, VocabularyService._now_epoch() if now is None else int(now))
+        if word_type:
+            where += " AND word_type = ?"
+            params += (word_type,)
+
+        rows = select_rows(
+            "vocab_log",
+            columns=f"rowid AS id, {VocabularyService.VOCAB_COLUMNS}, next_review_at",
+            where=where,
+            params=params,
+            order_by="next_review_at ASC",
+            limit=limit,
+        )
+        return [dict(row) for row in rows] if rows else []
+
     @staticmethod
     def update_vocab_after_review(vocab_id: int, user: str, quality: int) -> bool:
         """
@@ -410,6 +452,11 @@ class VocabularyService:
             logger.error(f"Error updating vocabulary {vocab_id} for user '{user}': {e}")
             return False
 
+    @staticmethod
+    def _now_epoch() -> int:
+        """Return the current time as epoch seconds for due-date comparisons."""
+        return int(time.time())
+
     @staticmethod
     def _normalize_word(word: str) -> str:
         """Normalize a word for searching."""
@@ -6,13 +6,23 @@ following clean architecture principles as outlined in the documentation.
 
 Session Components:
 - session_manager: Core session management functionality
+- session_cache: Two-tier cache behind session resolution
+- session_backends: Redis and SQLite session stores with sliding expiry
 
 For detailed architecture information, see: docs/backend_structure.md
 """
 
+from .session_cache import SessionCache, session_cache
+from .session_backends import SessionBackend, SQLiteSessionBackend, RedisSessionBackend, create_session_backend
 from .session_manager import SessionManager, session_manager
 
 __all__ = [
+    "SessionCache",
+    "session_cache",
+    "SessionBackend",
+    "SQLiteSessionBackend",
+    "RedisSessionBackend",
+    "create_session_backend",
     "SessionManager",
     "session_manager",
 ]
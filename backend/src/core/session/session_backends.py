@@ -0,0 +1,365 @@
+"""
+XplorED - Session Backends
+
+This module provides the storage backends behind the session manager,
+following clean architecture principles as outlined in the documentation.
+
+Session Backend Components:
+- SessionBackend: interface shared by every store
+- SQLiteSessionBackend: ``sessions`` table with expiry, read-only lookups
+- RedisSessionBackend: TTL keys plus a per-user session set; sessions still
+  in SQLite are moved over on first use, so switching backends logs no one out
+- create_session_backend: pick a backend from ``SESSION_BACKEND``
+
+Both backends expire sessions after ``SESSION_TTL_SECONDS`` of inactivity
+(sliding expiry). SQLite renews a session at most once per half TTL so
+lookups normally stay read-only, and expired rows are pruned on creation.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from core.database.connection import execute_query, fetch_one, select_rows, delete_rows, update_row
+from shared.exceptions import DatabaseError
+from shared.types import UserData
+
+logger = logging.getLogger(__name__)
+
+
+# === Backend Configuration ===
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", str(7 * 24 * 3600)))
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "auto").lower()
+REDIS_SESSION_PREFIX = "session:id:"
+REDIS_USER_SESSIONS_PREFIX = "session:user_sessions:"
+
+
+# === Backend Interface ===
+class SessionBackend(ABC):
+    """Storage interface for sessions; every method works on session IDs."""
+
+    name = "base"
+    # True when every worker sees the same store (no shared cache tier needed)
+    shared = False
+
+    def __init__(self, ttl: int = SESSION_TTL_SECONDS):
+        """
+        Initialize the backend.
+
+        Args:
+            ttl: Seconds of inactivity after which a session expires
+        """
+        self.ttl = ttl
+
+    @abstractmethod
+    def create(self, session_id: str, username: str) -> None:
+        """Store a new session; raise DatabaseError if it cannot be stored."""
+
+    @abstractmethod
+    def get_user(self, session_id: str) -> Optional[str]:
+        """Return the session's username and extend its expiry, or None."""
+
+    @abstractmethod
+    def get_info(self, session_id: str) -> Optional[UserData]:
+        """Return session_id, username, created_at and expires_at, or None."""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Remove one session."""
+
+    @abstractmethod
+    def delete_user(self, username: str) -> List[str]:
+        """Remove every session of a user and return their IDs."""
+
+    @abstractmethod
+    def count_user(self, username: str) -> int:
+        """Return the number of live sessions of a user."""
+
+    def prune_expired(self) -> int:
+        """Remove expired sessions and return how many were removed."""
+        return 0
+
+
+# === SQLite Backend ===
+class SQLiteSessionBackend(SessionBackend):
+    """Sessions in the SQLite ``sessions`` table with an ``expires_at`` epoch."""
+
+    name = "sqlite"
+    shared = False
+
+    def __init__(self, ttl: int = SESSION_TTL_SECONDS):
+        super().__init__(ttl)
+        self._init_session_table()
+
+    def _init_session_table(self) -> None:
+        """Create the sessions table (and its expiry column) if missing."""
+        try:
+            execute_query(
+                """
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    username TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    expires_at INTEGER
+                );
+                """
+            )
+            # Databases created before migration 0007 lack the expiry column
+            columns = execute_query("PRAGMA table_info(sessions);", fetch=True) or []
+            if "expires_at" not in [column.get("name") for column in columns]:
+                execute_query("ALTER TABLE sessions ADD COLUMN expires_at INTEGER;")
+        except Exception as e:
+            raise DatabaseError(f"Failed to initialize sessions table: {str(e)}")
+
+    def create(self, session_id: str, username: str) -> None:
+        self.prune_expired()
+        stored = execute_query(
+            "INSERT INTO sessions (session_id, username, expires_at) VALUES (?, ?, ?);",
+            (session_id, username, int(time.time()) + self.ttl),
+        )
+        if not stored:
+            raise DatabaseError(f"Failed to store session for user {username}")
+
+    def get_user(self, session_id: str) -> Optional[str]:
+        now = int(time.time())
+        row = fetch_one(
+            "sessions",
+            "WHERE session_id = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (session_id, now),
+            columns="username, expires_at",
+        )
+        if not row:
+            return None
+
+        # Sliding expiry without a write per request: renew once half the TTL is used
+        expires_at = row.get("expires_at")
+        if expires_at is None or expires_at - now < self.ttl // 2:
+            update_row("sessions", {"expires_at": now + self.ttl}, "session_id = ?", (session_id,))
+        return row.get("username")
+
+    def get_info(self, session_id: str) -> Optional[UserData]:
+        return fetch_one(
+            "sessions",
+            "WHERE session_id = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (session_id, int(time.time())),
+            columns="session_id, username, created_at, expires_at",
+        )
+
+    def delete(self, session_id: str) -> None:
+        delete_rows("sessions", "WHERE session_id = ?", (session_id,))
+
+    def delete_user(self, username: str) -> List[str]:
+        rows = select_rows("sessions", columns="session_id", where="username = ?", params=(username,))
+        delete_rows("sessions", "WHERE username = ?", (username,))
+        return [row["session_id"] for row in rows or []]
+
+    def count_user(self, username: str) -> int:
+        row = fetch_one(
+            "sessions",
+            "WHERE username = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (username, int(time.time())),
+            columns="COUNT(*) as count",
+        )
+        return row.get("count", 0) if row else 0
+
+    def prune_expired(self) -> int:
+        expired = fetch_one(
+            "sessions",
+            "WHERE expires_at <= ?",
+            (int(time.time()),),
+            columns="COUNT(*) as count",
+        )
+        count = expired.get("count", 0) if expired else 0
+        if count:
+            delete_rows("sessions", "WHERE expires_at <= ?", (int(time.time()),))
+            logger.info(f"Pruned {count} expired sessions")
+        return count
+
+
+# === Redis Backend ===
+class RedisSessionBackend(SessionBackend):
+    """Sessions as Redis keys with a sliding TTL and a per-user session set."""
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, client, ttl: int = SESSION_TTL_SECONDS, fallback: Optional[SessionBackend] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            client: Connected ``redis.Redis`` client (``redis_client.client``)
+            ttl: Seconds of inactivity after which a session expires
+            fallback: Backend holding sessions created before the switch to
+                Redis; a session missing in Redis is looked up there and moved
+        """
+        super().__init__(ttl)
+        self.client = client
+        self.fallback = fallback
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return REDIS_SESSION_PREFIX + session_id
+
+    @staticmethod
+    def _user_key(username: str) -> str:
+        return REDIS_USER_SESSIONS_PREFIX + username
+
+    def _store(self, session_id: str, username: str, created_at: str) -> bool:
+        """Write a session and its user index entry; False if the ID is taken."""
+        # MULTI/EXEC: the session hash, its TTL and the user index appear together
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hsetnx(self._key(session_id), "username", username)
+        pipe.hset(self._key(session_id), "created_at", created_at)
+        pipe.expire(self._key(session_id), self.ttl)
+        pipe.sadd(self._user_key(username), session_id)
+        pipe.expire(self._user_key(username), self.ttl)
+        return bool(pipe.execute()[0])
+
+    def _migrate(self, session_id: str) -> Optional[str]:
+        """Move a session found only in the fallback backend into Redis; return its username."""
+        if self.fallback is None:
+            return None
+        info = self.fallback.get_info(session_id)
+        if not info:
+            return None
+        username = info["username"]
+        created_at = str(info.get("created_at") or time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()))
+        try:
+            self._store(session_id, username, created_at)
+        except Exception as e:
+            # Still valid in the fallback; try moving it again on the next request
+            logger.error(f"Failed to move session {session_id} to Redis: {e}")
+            return username
+        self.fallback.delete(session_id)
+        logger.info(f"Moved session of user {username} from {self.fallback.name} to Redis")
+        return username
+
+    def create(self, session_id: str, username: str) -> None:
+        created_at = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+        try:
+            created = self._store(session_id, username, created_at)
+        except Exception as e:
+            raise DatabaseError(f"Failed to store session for user {username}: {str(e)}")
+        if not created:
+            raise DatabaseError(f"Session ID collision for user {username}")
+
+    def get_user(self, session_id: str) -> Optional[str]:
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hget(self._key(session_id), "username")
+            pipe.expire(self._key(session_id), self.ttl)
+            username, _ = pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to read session {session_id} from Redis: {e}")
+            return None
+        if username:
+            # Keep the user index alive as long as its newest session
+            self.client.expire(self._user_key(username), self.ttl)
+            return username
+        return self._migrate(session_id)
+
+    def get_info(self, session_id: str) -> Optional[UserData]:
+        try:
+            data = self.client.hgetall(self._key(session_id))
+            if not data and self._migrate(session_id):
+                data = self.client.hgetall(self._key(session_id))
+            ttl = self.client.ttl(self._key(session_id))
+        except Exception as e:
+            logger.error(f"Failed to read session {session_id} from Redis: {e}")
+            return None
+        if not data or "username" not in data:
+            return None
+        return {
+            "session_id": session_id,
+            "username": data["username"],
+            "created_at": data.get("created_at"),
+            "expires_at": int(time.time()) + ttl if ttl and ttl > 0 else None,
+        }
+
+    def delete(self, session_id: str) -> None:
+        try:
+            username = self.client.hget(self._key(session_id), "username")
+            pipe = self.client.pipeline(transaction=True)
+            pipe.delete(self._key(session_id))
+            if username:
+                pipe.srem(self._user_key(username), session_id)
+            pipe.execute()
+        except Exception as e:
+            raise DatabaseError(f"Failed to delete session {session_id}: {str(e)}")
+        if self.fallback is not None:
+            self.fallback.delete(session_id)
+
+    def delete_user(self, username: str) -> List[str]:
+        try:
+            session_ids = list(self.client.smembers(self._user_key(username)))
+            pipe = self.client.pipeline(transaction=True)
+            for session_id in session_ids:
+                pipe.delete(self._key(session_id))
+            pipe.delete(self._user_key(username))
+            pipe.execute()
+        except Exception as e:
+            raise DatabaseError(f"Failed to delete sessions for user {username}: {str(e)}")
+        if self.fallback is not None:
+            session_ids += self.fallback.delete_user(username)
+        return session_ids
+
+    def count_user(self, username: str) -> int:
+        stored = self.fallback.count_user(username) if self.fallback is not None else 0
+        try:
+            session_ids = list(self.client.smembers(self._user_key(username)))
+            if not session_ids:
+                return stored
+            pipe = self.client.pipeline(transaction=False)
+            for session_id in session_ids:
+                pipe.exists(self._key(session_id))
+            alive = pipe.execute()
+            # Drop IDs whose session key already expired
+            expired = [session_id for session_id, exists in zip(session_ids, alive) if not exists]
+            if expired:
+                self.client.srem(self._user_key(username), *expired)
+            return stored + len(session_ids) - len(expired)
+        except Exception as e:
+            logger.error(f"Failed to count sessions for user {username}: {e}")
+            return stored
+
+
+# === Backend Selection ===
+def create_session_backend(name: str = SESSION_BACKEND) -> SessionBackend:
+    """
+    Create the configured session backend.
+
+    Args:
+        name: ``redis``, ``sqlite`` or ``auto`` (Redis when reachable, else SQLite)
+
+    Returns:
+        SessionBackend: The backend to use
+    """
+    if name in ("redis", "auto"):
+        try:
+            from external.redis import redis_client
+            if redis_client.client is not None:
+                logger.info("Using Redis session backend")
+                # Sessions created while SQLite was the backend stay valid
+                return RedisSessionBackend(redis_client.client, fallback=SQLiteSessionBackend())
+        except Exception as e:
+            logger.warning(f"Redis session backend unavailable: {e}")
+        if name == "redis":
+            logger.warning("SESSION_BACKEND=redis but Redis is not reachable; falling back to SQLite")
+
+    logger.info("Using SQLite session backend")
+    return SQLiteSessionBackend()
+
+
+# === Export Configuration ===
+__all__ = [
+    "SessionBackend",
+    "SQLiteSessionBackend",
+    "RedisSessionBackend",
+    "create_session_backend",
+    "SESSION_TTL_SECONDS",
+]
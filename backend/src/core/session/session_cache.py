@@ -0,0 +1,190 @@
+"""
+XplorED - Session Cache
+
+This module provides the session-to-user resolution cache,
+following clean architecture principles as outlined in the documentation.
+
+Session Cache Components:
+- Local tier: bounded in-process LRU with a per-entry TTL
+- Shared tier: optional Redis keys so every worker sees the same sessions
+- Invalidation: per session and per user, on logout and session destruction
+
+Only successful lookups are cached. The local tier of another worker may
+serve a destroyed session for at most ``SESSION_CACHE_LOCAL_TTL`` seconds;
+keep it short when running several workers.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# === Cache Configuration ===
+DEFAULT_LOCAL_TTL_SECONDS = int(os.getenv("SESSION_CACHE_LOCAL_TTL", "30"))
+DEFAULT_LOCAL_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_SIZE", "10000"))
+DEFAULT_REDIS_TTL_SECONDS = int(os.getenv("SESSION_CACHE_TTL", "300"))
+REDIS_TIER_ENABLED = os.getenv("SESSION_CACHE_REDIS", "true").lower() == "true"
+REDIS_KEY_PREFIX = "session:user:"
+
+
+# === Session Cache ===
+class SessionCache:
+    """Two-tier (process LRU, optional Redis) cache of session_id -> username."""
+
+    def __init__(
+        self,
+        local_ttl: int = DEFAULT_LOCAL_TTL_SECONDS,
+        max_entries: int = DEFAULT_LOCAL_MAX_ENTRIES,
+        redis_ttl: int = DEFAULT_REDIS_TTL_SECONDS,
+        use_redis: bool = REDIS_TIER_ENABLED,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            local_ttl: Seconds a local entry stays valid (0 disables the local tier)
+            max_entries: Local entries kept before the least recently used is evicted
+            redis_ttl: Seconds a Redis entry stays valid
+            use_redis: Whether to use the shared Redis tier when Redis is reachable
+        """
+        self.local_ttl = local_ttl
+        self.max_entries = max_entries
+        self.redis_ttl = redis_ttl
+        self.use_redis = use_redis
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"local_hits": 0, "redis_hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, session_id: str) -> Optional[str]:
+        """
+        Look up a cached username.
+
+        Args:
+            session_id: The session ID to resolve
+
+        Returns:
+            Optional[str]: The cached username, or None on a miss
+        """
+        if not session_id:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None:
+                username, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(session_id)
+                    self._stats["local_hits"] += 1
+                    return username
+                del self._entries[session_id]
+
+        redis = self._redis()
+        if redis is not None:
+            username = redis.get(REDIS_KEY_PREFIX + session_id)
+            if username:
+                self._store_local(session_id, username)
+                with self._lock:
+                    self._stats["redis_hits"] += 1
+                return username
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def set(self, session_id: str, username: str) -> None:
+        """
+        Cache the username of a session in every tier.
+
+        Args:
+            session_id: The session ID
+            username: The username the session belongs to
+        """
+        if not session_id or not username:
+            return
+        self._store_local(session_id, username)
+        redis = self._redis()
+        if redis is not None:
+            redis.setex(REDIS_KEY_PREFIX + session_id, self.redis_ttl, username)
+
+    def invalidate(self, session_ids: Iterable[str]) -> None:
+        """
+        Drop sessions from every tier.
+
+        Args:
+            session_ids: The session IDs to forget
+        """
+        session_ids = [session_id for session_id in session_ids if session_id]
+        with self._lock:
+            for session_id in session_ids:
+                self._entries.pop(session_id, None)
+
+        redis = self._redis()
+        if redis is not None:
+            for session_id in session_ids:
+                redis.delete(REDIS_KEY_PREFIX + session_id)
+
+    def invalidate_user(self, username: str, session_ids: Iterable[str] = ()) -> None:
+        """
+        Drop every cached session of a user.
+
+        Local entries are found by username; Redis entries need the session
+        IDs, which the caller reads from the session store.
+
+        Args:
+            username: The user whose sessions are forgotten
+            session_ids: Known session IDs of the user
+        """
+        with self._lock:
+            local_ids = [session_id for session_id, (user, _) in self._entries.items() if user == username]
+        self.invalidate(list(session_ids) + local_ids)
+
+    def clear(self) -> None:
+        """Drop every local entry (the Redis tier expires on its own)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and eviction counters plus the local size."""
+        with self._lock:
+            return {**self._stats, "local_size": len(self._entries)}
+
+    # === Internals ===
+    def _store_local(self, session_id: str, username: str) -> None:
+        """Insert or refresh a local entry, evicting the least recently used."""
+        if self.local_ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[session_id] = (username, time.monotonic() + self.local_ttl)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _redis(self):
+        """Return the shared Redis client if the tier is enabled and connected."""
+        if not self.use_redis:
+            return None
+        try:
+            from external.redis import redis_client
+        except Exception:
+            return None
+        return redis_client if redis_client.client is not None else None
+
+
+# === Global Instance ===
+session_cache = SessionCache()
+
+
+# === Export Configuration ===
+__all__ = [
+    "SessionCache",
+    "session_cache",
+]
@@ -8,6 +8,8 @@ Session Management Components:
 - Session creation and validation
 - User session tracking
 - Session cleanup and management
+- Pluggable storage through ``session_backends`` (Redis or SQLite)
+- Cached resolution through ``session_cache`` (invalidated on destroy)
 
 For detailed architecture information, see: docs/backend_structure.md
 """
@@ -16,44 +18,43 @@ import os
 import uuid
 import logging
 from typing import Optional
-from core.database.connection import execute_query, insert_row, fetch_one, delete_rows
+from core.session.session_backends import SessionBackend, create_session_backend
+from core.session.session_cache import SessionCache, session_cache
 from shared.exceptions import DatabaseError
+from shared.types import UserData
 
 logger = logging.getLogger(__name__)
 
 
 class SessionManager:
     """
-    SQLite-backed session manager for user authentication and session tracking.
+    Session manager for user authentication and session tracking.
 
-    Provides methods for creating, validating, and destroying user sessions
-    with persistent storage in the database.
+    Provides methods for creating, validating, and destroying user sessions.
+    Storage is delegated to a session backend (Redis when configured and
+    reachable, SQLite otherwise); lookups go through the session cache first.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        cache: Optional[SessionCache] = None,
+        backend: Optional[SessionBackend] = None,
+    ):
         """
-        Initialize the session manager and ensure the sessions table exists.
+        Initialize the session manager and its storage backend.
 
         Args:
             db_path: Path to the SQLite database file (optional, uses DB_FILE env var if not provided)
+            cache: Session resolution cache (optional, defaults to the shared ``session_cache``)
+            backend: Session store (optional, chosen by ``SESSION_BACKEND``)
         """
         self.db_path = db_path or os.getenv("DB_FILE")
-        self._init_session_table()
-
-    def _init_session_table(self) -> None:
-        """Create the sessions table if it doesn't exist."""
-        try:
-            execute_query(
-                """
-                CREATE TABLE IF NOT EXISTS sessions (
-                    session_id TEXT PRIMARY KEY,
-                    username TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-                """
-            )
-        except Exception as e:
-            raise DatabaseError(f"Failed to initialize sessions table: {str(e)}")
+        self.cache = cache or session_cache
+        self.backend = backend or create_session_backend()
+        if self.backend.shared:
+            # The store itself is shared by all workers; a Redis cache tier would only duplicate it
+            self.cache.use_redis = False
 
     def create_session(self, username: str) -> str:
         """
@@ -70,10 +71,8 @@ class SessionManager:
         """
         try:
             session_id = str(uuid.uuid4())
-            insert_row(
-                "sessions",
-                {"session_id": session_id, "username": username},
-            )
+            self.backend.create(session_id, username)
+            self.cache.set(session_id, username)
             logger.info(f"Created session for user {username}")
             return session_id
         except Exception as e:
@@ -83,6 +82,9 @@ class SessionManager:
         """
         Retrieve the username associated with a session ID.
 
+        Cached sessions are resolved without touching the session store;
+        otherwise the lookup also extends the session's sliding expiry.
+
         Args:
             session_id: The session ID to look up
 
@@ -92,21 +94,40 @@ class SessionManager:
         if not session_id:
             return None
 
+        cached = self.cache.get(session_id)
+        if cached:
+            return cached
+
         try:
-            row = fetch_one(
-                "sessions",
-                "WHERE session_id = ?",
-                (session_id,),
-                columns="username",
-            )
-            return row.get("username") if row else None
+            username = self.backend.get_user(session_id)
+            if username:
+                self.cache.set(session_id, username)
+            return username
         except Exception as e:
             logger.error(f"Failed to retrieve user for session {session_id}: {str(e)}")
             return None
 
+    def get_session_info(self, session_id: str) -> Optional[UserData]:
+        """
+        Get the stored details of a live session.
+
+        Args:
+            session_id: The session ID to look up
+
+        Returns:
+            Optional[UserData]: session_id, username, created_at and expires_at, or None
+        """
+        if not session_id:
+            return None
+        try:
+            return self.backend.get_info(session_id)
+        except Exception as e:
+            logger.error(f"Failed to read session {session_id}: {str(e)}")
+            return None
+
     def destroy_session(self, session_id: str) -> None:
         """
-        Remove a specific session from the database.
+        Remove a specific session from the session store.
 
         Args:
             session_id: The session ID to destroy
@@ -115,7 +136,8 @@ class SessionManager:
             DatabaseError: When session destruction fails
         """
         try:
-            delete_rows("sessions", "WHERE session_id = ?", (session_id,))
+            self.backend.delete(session_id)
+            self.cache.invalidate([session_id])
             logger.info(f"Destroyed session {session_id}")
         except Exception as e:
             raise DatabaseError(f"Failed to destroy session {session_id}: {str(e)}")
@@ -131,7 +153,8 @@ class SessionManager:
             DatabaseError: When session destruction fails
         """
         try:
-            delete_rows("sessions", "WHERE username = ?", (username,))
+            session_ids = self.backend.delete_user(username)
+            self.cache.invalidate_user(username, session_ids)
             logger.info(f"Destroyed all sessions for user {username}")
         except Exception as e:
             raise DatabaseError(f"Failed to destroy sessions for user {username}: {str(e)}")
@@ -147,17 +170,27 @@ class SessionManager:
             int: Number of active sessions
         """
         try:
-            result = fetch_one(
-                "sessions",
-                "WHERE username = ?",
-                (username,),
-                columns="COUNT(*) as count",
-            )
-            return result.get("count", 0) if result else 0
+            return self.backend.count_user(username)
         except Exception as e:
             logger.error(f"Failed to get session count for user {username}: {str(e)}")
             return 0
 
+    def prune_expired_sessions(self) -> int:
+        """
+        Remove expired sessions from the session store.
+
+        Redis expires sessions on its own; SQLite also prunes on every
+        session creation.
+
+        Returns:
+            int: Number of sessions removed
+        """
+        try:
+            return self.backend.prune_expired()
+        except Exception as e:
+            logger.error(f"Failed to prune expired sessions: {str(e)}")
+            return 0
+
 
 # === Global Instance ===
 session_manager = SessionManager()
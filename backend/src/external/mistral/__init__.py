@@ -6,15 +6,47 @@ following clean architecture principles as outlined in the documentation.
 
 Components:
 - client: HTTP client for Mistral AI API requests
+- transport: Pooled keep-alive session with retries and latency histograms
+- response_cache: Content-addressed cache for deterministic prompts
+- single_flight: Coalescing of identical in-flight requests
+- async_client: Event-loop scheduler with per-user fairness and a token budget
+- resilience: Hedged requests and the circuit breaker
 - Configuration: API endpoints and model settings
 
 For detailed architecture information, see: docs/backend_structure.md
 """
 
 from .client import build_payload, send_request, send_prompt
+from .transport import MistralTransport, mistral_transport, get_transport_stats
+from .response_cache import ResponseCache, get_response_cache_stats, purge_response_cache
+from .single_flight import SingleFlight, get_single_flight_stats
+from .async_client import (
+    AsyncMistralClient,
+    get_async_client_stats,
+    ai_user_scope,
+    bind_ai_user,
+    set_ai_user,
+)
+from .resilience import CircuitBreaker, MistralResilience, get_resilience_stats
 
 __all__ = [
     "build_payload",
     "send_request",
     "send_prompt",
+    "MistralTransport",
+    "mistral_transport",
+    "get_transport_stats",
+    "ResponseCache",
+    "get_response_cache_stats",
+    "purge_response_cache",
+    "SingleFlight",
+    "get_single_flight_stats",
+    "AsyncMistralClient",
+    "get_async_client_stats",
+    "ai_user_scope",
+    "bind_ai_user",
+    "set_ai_user",
+    "CircuitBreaker",
+    "MistralResilience",
+    "get_resilience_stats",
 ]
@@ -0,0 +1,476 @@
+"""
+XplorED - Mistral Async Client
+
+This module schedules every upstream Mistral call on a dedicated asyncio
+event loop, following clean architecture principles as outlined in the documentation.
+
+Async Client Components:
+- Dedicated loop: one daemon thread runs the event loop; requests wait there
+  as cheap coroutines instead of as blocked threads
+- Global semaphore: at most ``MISTRAL_MAX_CONCURRENCY`` calls are in flight
+  per process; the HTTP work runs on an executor of exactly that size
+- Per-user fairness: each user has a FIFO queue and free slots are handed
+  out round-robin across users, with at most ``MISTRAL_MAX_PER_USER`` in
+  flight for any one user
+- Token budget: a tokens-per-minute bucket charged with an estimate before
+  the call and corrected with the reported ``usage`` afterwards; rate limit
+  headers and 429 ``Retry-After`` pause or drain the bucket
+- Graceful degradation: a full queue rejects at once and a caller that
+  waits longer than ``MISTRAL_QUEUE_TIMEOUT`` gives up, both with
+  ``AIEvaluationError`` that callers already handle
+- Sync facade: ``call`` blocks a Flask handler or background thread until
+  its turn has come and the call has finished
+- Queue depth, wait time and budget metrics
+
+The user a call is charged to comes from a context variable set by the auth
+middleware for requests and by ``bind_ai_user`` for background work. The
+HTTP work runs in a copy of the caller's context, so that user and the
+caller's cancellation token (``shared.cancellation``) reach the transport;
+a caller with a deadline also waits for a slot no longer than it has left.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, TypeVar
+
+from shared.cancellation import current_token
+from shared.exceptions import AIEvaluationError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# === Async Client Configuration ===
+MISTRAL_SCHEDULER = os.getenv("MISTRAL_SCHEDULER", "true").lower() == "true"
+MISTRAL_MAX_CONCURRENCY = int(os.getenv("MISTRAL_MAX_CONCURRENCY", "8"))
+MISTRAL_MAX_PER_USER = int(os.getenv("MISTRAL_MAX_PER_USER", str(max(1, MISTRAL_MAX_CONCURRENCY // 2))))
+# 0 disables the token budget
+MISTRAL_TOKENS_PER_MINUTE = int(os.getenv("MISTRAL_TOKENS_PER_MINUTE", "500000"))
+MISTRAL_QUEUE_MAX = int(os.getenv("MISTRAL_QUEUE_MAX", "256"))
+MISTRAL_QUEUE_TIMEOUT = float(os.getenv("MISTRAL_QUEUE_TIMEOUT", "30"))
+# Completion tokens assumed for a call until its real usage is known
+MISTRAL_COMPLETION_TOKENS_ESTIMATE = int(os.getenv("MISTRAL_COMPLETION_TOKENS_ESTIMATE", "512"))
+
+ANONYMOUS_USER = "anonymous"
+
+# Remaining-token headers reported by the provider, first match wins
+RATE_LIMIT_REMAINING_HEADERS = (
+    "x-ratelimitbysize-remaining-minute",
+    "ratelimitbysize-remaining",
+    "x-ratelimit-remaining-tokens",
+)
+
+
+# === Request Attribution ===
+_ai_user: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("ai_user", default=None)
+
+
+def current_ai_user() -> Optional[str]:
+    """Return the user AI calls in this context are charged to."""
+    return _ai_user.get()
+
+
+def set_ai_user(username: Optional[str]) -> None:
+    """Charge AI calls in this context to ``username`` (``None`` clears it)."""
+    _ai_user.set(username)
+
+
+@contextmanager
+def ai_user_scope(username: Optional[str]) -> Iterator[None]:
+    """Charge AI calls made inside the block to ``username``."""
+    token = _ai_user.set(username)
+    try:
+        yield
+    finally:
+        _ai_user.reset(token)
+
+
+def bind_ai_user(username: Optional[str], func: Callable[..., T]) -> Callable[..., T]:
+    """Wrap ``func`` so its AI calls are charged to ``username`` in whichever thread runs it."""
+    def bound(*args: Any, **kwargs: Any) -> T:
+        with ai_user_scope(username):
+            return func(*args, **kwargs)
+
+    bound.__name__ = getattr(func, "__name__", "bound")
+    return bound
+
+
+def estimate_tokens(messages: List[Dict]) -> int:
+    """Rough token estimate of a request: ~4 characters per prompt token plus the expected completion."""
+    chars = sum(len(str(message.get("content", ""))) for message in messages)
+    return chars // 4 + MISTRAL_COMPLETION_TOKENS_ESTIMATE
+
+
+class _Ticket:
+    """One queued call waiting for a slot."""
+
+    __slots__ = ("user", "tokens", "admitted", "enqueued")
+
+    def __init__(self, user: str, tokens: int, admitted: "asyncio.Future[None]"):
+        self.user = user
+        self.tokens = tokens
+        self.admitted = admitted
+        self.enqueued = time.monotonic()
+
+
+# === Async Client ===
+class AsyncMistralClient:
+    """Fair, budgeted scheduler for Mistral calls running on its own event loop."""
+
+    def __init__(
+        self,
+        enabled: bool = MISTRAL_SCHEDULER,
+        max_concurrency: int = MISTRAL_MAX_CONCURRENCY,
+        max_per_user: int = MISTRAL_MAX_PER_USER,
+        tokens_per_minute: int = MISTRAL_TOKENS_PER_MINUTE,
+        queue_max: int = MISTRAL_QUEUE_MAX,
+        queue_timeout: float = MISTRAL_QUEUE_TIMEOUT,
+    ):
+        """
+        Initialize the client; the loop thread is started on first use.
+
+        Args:
+            enabled: When False ``call`` runs the request directly
+            max_concurrency: Calls in flight at once across all users
+            max_per_user: Calls in flight at once for one user
+            tokens_per_minute: Token budget per minute (0 disables it)
+            queue_max: Calls allowed to wait before new ones are rejected
+            queue_timeout: Seconds a call may wait for a slot
+        """
+        self.enabled = enabled
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_user = max(1, max_per_user)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.queue_max = queue_max
+        self.queue_timeout = queue_timeout
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._start_lock = threading.Lock()
+
+        # Loop-owned state: only touched from the loop thread
+        self._queues: "OrderedDict[str, Deque[_Ticket]]" = OrderedDict()
+        self._queued = 0
+        self._in_flight = 0
+        self._user_in_flight: Dict[str, int] = {}
+        self._tokens = float(self.tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._stats: Dict[str, float] = {
+            "admitted": 0,
+            "rejected": 0,
+            "queue_timeouts": 0,
+            "rate_limited": 0,
+            "peak_queue_depth": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+            "tokens_charged": 0,
+        }
+
+    # === Public API ===
+    def call(
+        self,
+        fn: Callable[[], T],
+        tokens: int = 0,
+        username: Optional[str] = None,
+    ) -> T:
+        """
+        Run a blocking upstream call once the scheduler admits it (sync facade).
+
+        Args:
+            fn: Performs the HTTP request and returns its response
+            tokens: Estimated tokens of the call (see ``estimate_tokens``)
+            username: User to charge; defaults to ``current_ai_user()``
+
+        Returns:
+            T: Whatever ``fn`` returned
+
+        Raises:
+            AIEvaluationError: When the queue is full or the wait times out
+            Exception: Whatever ``fn`` raised
+        """
+        if not self.enabled:
+            return fn()
+        loop = self._ensure_started()
+        if threading.current_thread() is self._thread:
+            # Never block the loop on itself
+            return fn()
+        user = username or current_ai_user() or ANONYMOUS_USER
+        queue_timeout = self.queue_timeout
+        cancel_token = current_token()
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+            remaining = cancel_token.remaining()
+            if remaining is not None:
+                queue_timeout = min(queue_timeout, remaining)
+        # The executor thread would otherwise run without the caller's context variables
+        context = contextvars.copy_context()
+        future = asyncio.run_coroutine_threadsafe(
+            self.run(lambda: context.run(fn), tokens, user, queue_timeout), loop
+        )
+        return future.result()
+
+    async def run(
+        self,
+        fn: Callable[[], T],
+        tokens: int = 0,
+        username: str = ANONYMOUS_USER,
+        queue_timeout: Optional[float] = None,
+    ) -> T:
+        """
+        Wait for a slot and budget, then run ``fn`` on the bounded executor.
+
+        Must be awaited on this client's loop (``call`` does that for threads).
+
+        Args:
+            fn: Performs the HTTP request and returns its response
+            tokens: Estimated tokens of the call
+            username: User to charge
+            queue_timeout: Seconds to wait for a slot (default ``self.queue_timeout``)
+
+        Returns:
+            T: Whatever ``fn`` returned
+        """
+        loop = asyncio.get_running_loop()
+        wait_limit = self.queue_timeout if queue_timeout is None else queue_timeout
+        if self._queued >= self.queue_max:
+            self._stats["rejected"] += 1
+            logger.warning(f"🌐 [MISTRAL] Queue full ({self._queued} waiting), rejecting call for {username}")
+            raise AIEvaluationError("AI service is busy, please try again shortly")
+
+        ticket = _Ticket(username, tokens, loop.create_future())
+        self._queues.setdefault(username, deque()).append(ticket)
+        self._queued += 1
+        self._stats["peak_queue_depth"] = max(self._stats["peak_queue_depth"], self._queued)
+        self._dispatch()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(ticket.admitted), wait_limit)
+        except asyncio.TimeoutError:
+            if not ticket.admitted.done():
+                self._withdraw(ticket)
+                self._stats["queue_timeouts"] += 1
+                logger.warning(
+                    f"🌐 [MISTRAL] {username} waited {wait_limit:g}s for an AI slot, giving up"
+                )
+                raise AIEvaluationError(f"No AI capacity within {wait_limit:g} seconds")
+
+        waited = time.monotonic() - ticket.enqueued
+        self._stats["wait_seconds_total"] += waited
+        self._stats["wait_seconds_max"] = max(self._stats["wait_seconds_max"], waited)
+
+        try:
+            result = await loop.run_in_executor(self._executor, fn)
+        finally:
+            self._in_flight -= 1
+            remaining = self._user_in_flight.get(username, 1) - 1
+            if remaining > 0:
+                self._user_in_flight[username] = remaining
+            else:
+                self._user_in_flight.pop(username, None)
+            self._dispatch()
+
+        self._settle(ticket, result)
+        return result
+
+    def stats(self) -> Dict:
+        """Return queue depth, in-flight counts, wait times and the token budget."""
+        if self._loop is None:
+            return {**self._config(), "started": False}
+        future = asyncio.run_coroutine_threadsafe(self._snapshot(), self._loop)
+        try:
+            return future.result(timeout=2)
+        except Exception as e:
+            return {**self._config(), "error": str(e)}
+
+    # === Internals ===
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread and the HTTP executor on first use."""
+        if self._loop is None:
+            with self._start_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_concurrency,
+                        thread_name_prefix="mistral-io",
+                    )
+                    self._thread = threading.Thread(
+                        target=self._run_loop, args=(loop,), name="mistral-aio", daemon=True
+                    )
+                    self._thread.start()
+                    self._loop = loop
+        return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill, up to one minute's budget."""
+        if self.tokens_per_minute:
+            earned = (now - self._refilled_at) * self.tokens_per_minute / 60.0
+            self._tokens = min(float(self.tokens_per_minute), self._tokens + earned)
+        self._refilled_at = now
+
+    def _dispatch(self) -> None:
+        """Admit waiting calls round-robin across users while slots and budget allow."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        now = time.monotonic()
+        self._refill(now)
+        while self._queues and self._in_flight < self.max_concurrency:
+            if now < self._paused_until:
+                self._schedule(self._paused_until - now)
+                return
+
+            user = next(
+                (name for name in self._queues if self._user_in_flight.get(name, 0) < self.max_per_user),
+                None,
+            )
+            if user is None:
+                return
+
+            queue = self._queues[user]
+            ticket = queue[0]
+            if self.tokens_per_minute:
+                needed = min(ticket.tokens, self.tokens_per_minute)
+                if self._tokens < needed:
+                    self._schedule((needed - self._tokens) * 60.0 / self.tokens_per_minute)
+                    return
+                self._tokens -= ticket.tokens
+
+            queue.popleft()
+            if queue:
+                self._queues.move_to_end(user)
+            else:
+                del self._queues[user]
+            self._queued -= 1
+            self._in_flight += 1
+            self._user_in_flight[user] = self._user_in_flight.get(user, 0) + 1
+            self._stats["admitted"] += 1
+            self._stats["tokens_charged"] += ticket.tokens
+            ticket.admitted.set_result(None)
+
+    def _schedule(self, delay: float) -> None:
+        """Run the dispatcher again after ``delay`` seconds."""
+        self._timer = self._loop.call_later(max(delay, 0.01), self._dispatch)
+
+    def _withdraw(self, ticket: _Ticket) -> None:
+        """Remove a ticket that gave up waiting."""
+        ticket.admitted.cancel()
+        queue = self._queues.get(ticket.user)
+        if queue is not None and ticket in queue:
+            queue.remove(ticket)
+            self._queued -= 1
+            if not queue:
+                del self._queues[ticket.user]
+
+    def _settle(self, ticket: _Ticket, response: Any) -> None:
+        """Correct the budget with the call's real usage and the provider's rate limit signals."""
+        headers = getattr(response, "headers", None)
+        status = getattr(response, "status_code", None)
+        if headers is None:
+            return
+
+        if status == 200:
+            try:
+                used = int(response.json().get("usage", {}).get("total_tokens", 0))
+            except Exception:
+                used = 0
+            if used:
+                self._stats["tokens_charged"] += used - ticket.tokens
+                if self.tokens_per_minute:
+                    self._tokens += ticket.tokens - used
+
+        if self.tokens_per_minute:
+            for name in RATE_LIMIT_REMAINING_HEADERS:
+                value = headers.get(name)
+                if value is None:
+                    continue
+                try:
+                    self._tokens = min(self._tokens, float(value))
+                except ValueError:
+                    pass
+                break
+
+        if status == 429:
+            self._stats["rate_limited"] += 1
+            if self.tokens_per_minute:
+                self._tokens = min(self._tokens, 0.0)
+            try:
+                pause = float(headers.get("Retry-After", "1"))
+            except ValueError:
+                pause = 1.0
+            self._paused_until = max(self._paused_until, time.monotonic() + min(max(pause, 0.0), 60.0))
+            logger.warning(f"🌐 [MISTRAL] Rate limited, pausing new calls for {pause:g}s")
+            self._dispatch()
+
+    def _config(self) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "max_concurrency": self.max_concurrency,
+            "max_per_user": self.max_per_user,
+            "tokens_per_minute": self.tokens_per_minute,
+            "queue_max": self.queue_max,
+            "queue_timeout": self.queue_timeout,
+        }
+
+    async def _snapshot(self) -> Dict:
+        """Collect the stats on the loop thread, where the state is consistent."""
+        self._refill(time.monotonic())
+        admitted = self._stats["admitted"]
+        return {
+            **self._config(),
+            "started": True,
+            "queue_depth": self._queued,
+            "queue_depth_by_user": {user: len(queue) for user, queue in self._queues.items()},
+            "in_flight": self._in_flight,
+            "in_flight_by_user": dict(self._user_in_flight),
+            "tokens_available": int(self._tokens) if self.tokens_per_minute else None,
+            "paused_for_seconds": round(max(0.0, self._paused_until - time.monotonic()), 2),
+            "admitted": int(admitted),
+            "rejected": int(self._stats["rejected"]),
+            "queue_timeouts": int(self._stats["queue_timeouts"]),
+            "rate_limited": int(self._stats["rate_limited"]),
+            "peak_queue_depth": int(self._stats["peak_queue_depth"]),
+            "avg_wait_seconds": round(self._stats["wait_seconds_total"] / admitted, 4) if admitted else 0.0,
+            "max_wait_seconds": round(self._stats["wait_seconds_max"], 4),
+            "tokens_charged": int(self._stats["tokens_charged"]),
+        }
+
+
+# === Global Instance ===
+async_mistral_client = AsyncMistralClient()
+
+
+def get_async_client_stats() -> Dict:
+    """Return the shared scheduler's queue, concurrency and budget metrics."""
+    return async_mistral_client.stats()
+
+
+# === Export Configuration ===
+__all__ = [
+    "AsyncMistralClient",
+    "async_mistral_client",
+    "get_async_client_stats",
+    "estimate_tokens",
+    "current_ai_user",
+    "set_ai_user",
+    "ai_user_scope",
+    "bind_ai_user",
+]
@@ -7,6 +7,14 @@ advanced language processing capabilities, following clean architecture principl
 Features:
 - Request payload building with configurable parameters
 - HTTP request handling with comprehensive error management
+- Pooled keep-alive transport with retries and per prompt type timeouts
+- Opt-in content-addressed response cache for deterministic prompts
+- Single-flight coalescing of identical concurrent requests
+- Fair, budgeted scheduling of upstream calls on the async client's loop
+- Hedged requests past the observed p95 and a circuit breaker that fails
+  fast while the upstream is failing
+- Cancellation: a caller's token (``shared.cancellation``) bounds the queue
+  wait, socket timeouts and retries of its requests
 - Streaming support for real-time responses
 - Automatic Markdown formatting for structured outputs
 
@@ -19,7 +27,13 @@ import traceback
 import logging
 from typing import List, Optional
 from shared.constants import MISTRAL_API_URL, MISTRAL_MODEL
-from shared.exceptions import AIEvaluationError
+from shared.cancellation import clamp_timeout
+from shared.exceptions import AIEvaluationError, AIServiceUnavailableError, OperationCancelledError
+from .transport import mistral_transport
+from .response_cache import response_cache, response_cache_key
+from .single_flight import single_flight
+from .async_client import async_mistral_client, estimate_tokens
+from .resilience import mistral_resilience
 
 logger = logging.getLogger(__name__)
 
@@ -61,58 +75,141 @@ def build_payload(
     return payload
 
 
+def _cached_response(body: str, source: str = "HIT") -> requests.Response:
+    """Rebuild a 200 response from a cached or shared body so callers can use ``.json()``."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body.encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "application/json"
+    response.headers["X-Cache"] = source
+    response.url = MISTRAL_API_URL
+    return response
+
+
 # === Request Handling ===
 def send_request(
     messages: list[dict],
     temperature: float = 0.7,
-    stream: bool = False
+    stream: bool = False,
+    prompt_type: str = "default",
+    cache: bool = False,
+    coalesce: Optional[bool] = None,
 ) -> requests.Response:
     """
     Send a request to the Mistral API and return the raw response.
 
+    Transient failures (429, 5xx, connection errors) are retried by the
+    shared transport before an error is raised. Identical cacheable
+    requests in flight at the same time share one upstream call, and every
+    non-streamed upstream call waits for a slot of the async client (global
+    concurrency, per-user fairness and token budget) and is hedged once it
+    runs past the observed p95. While the circuit breaker is open no request
+    is sent and ``AIServiceUnavailableError`` is raised immediately (prompts
+    with ``cache=True`` are still served from the response cache).
+
     Args:
         messages: List of message dictionaries with role and content
         temperature: Controls response randomness (0.0-1.0)
         stream: Enable streaming responses
+        prompt_type: Selects timeouts and the latency series (see ``PROMPT_TIMEOUTS``)
+        cache: Serve and store the response through the response cache
+            (only for prompts whose answer does not depend on the user)
+        coalesce: Share the response of an identical request already in flight
+            (default: same as ``cache``; those prompts are user-independent,
+            so a sampled answer may be handed to several users)
 
     Returns:
         requests.Response: Raw API response
 
     Raises:
-        AIEvaluationError: When API request fails
+        AIServiceUnavailableError: While the circuit breaker is open
+        AIEvaluationError: When API request fails or the caller's
+            cancellation token fires first
     """
     logger.info(f"🌐 [MISTRAL] Starting send_request")
     logger.info(f"🌐 [MISTRAL] API URL: {MISTRAL_API_URL}")
     logger.info(f"🌐 [MISTRAL] Messages count: {len(messages)}")
-    logger.info(f"🌐 [MISTRAL] Temperature: {temperature}, Stream: {stream}")
+    logger.info(f"🌐 [MISTRAL] Temperature: {temperature}, Stream: {stream}, Prompt type: {prompt_type}")
 
     try:
         payload = build_payload(messages, temperature, stream)
         logger.info(f"🌐 [MISTRAL] Built payload with model: {payload.get('model')}")
 
-        logger.info(f"🌐 [MISTRAL] About to make HTTP POST request to Mistral API...")
-        # Send request to Mistral API
-        response = requests.post(
-            MISTRAL_API_URL,
-            headers=HEADERS,
-            json=payload,
-            timeout=60,
-            stream=stream
-        )
-        logger.info(f"🌐 [MISTRAL] HTTP request completed with status: {response.status_code}")
-
-        # Handle non-200 responses
-        if response.status_code != 200:
-            error_msg = f"Mistral API error: {response.status_code} - {response.text}"
-            logger.error(f"🌐 [MISTRAL] {error_msg}")
-            raise AIEvaluationError(error_msg)
+        # Identity of the request for the cache and coalescing
+        request_key = None
+        if not stream:
+            request_key = response_cache_key(payload["model"], messages, temperature)
+
+        if cache and request_key:
+            cached = response_cache.get(request_key, prompt_type)
+            if cached is not None:
+                logger.info(f"🌐 [MISTRAL] Response cache hit for {prompt_type} prompt")
+                return _cached_response(cached)
+
+        try:
+            mistral_resilience.guard()
+        except AIServiceUnavailableError:
+            logger.warning(f"🌐 [MISTRAL] Circuit open, failing {prompt_type} request fast")
+            raise
+
+        def post() -> requests.Response:
+            logger.info(f"🌐 [MISTRAL] About to make HTTP POST request to Mistral API...")
+            def upstream() -> requests.Response:
+                # Send request to Mistral API over the pooled transport
+                return mistral_transport.post(
+                    MISTRAL_API_URL,
+                    HEADERS,
+                    payload,
+                    prompt_type=prompt_type,
+                    stream=stream,
+                )
+
+            if stream:
+                # A stream is consumed by the caller after this returns, so it holds no slot
+                response = mistral_resilience.execute(upstream, prompt_type, hedge=False)
+            else:
+                response = async_mistral_client.call(
+                    lambda: mistral_resilience.execute(upstream, prompt_type),
+                    tokens=estimate_tokens(messages),
+                )
+            logger.info(f"🌐 [MISTRAL] HTTP request completed with status: {response.status_code}")
+
+            # Handle non-200 responses
+            if response.status_code != 200:
+                error_msg = f"Mistral API error: {response.status_code} - {response.text}"
+                logger.error(f"🌐 [MISTRAL] {error_msg}")
+                raise AIEvaluationError(error_msg)
+
+            if cache and request_key:
+                response_cache.set(request_key, response.text, prompt_type)
+            return response
+
+        if coalesce is None:
+            coalesce = cache
+        if coalesce and request_key:
+            response = single_flight.do(
+                f"{prompt_type}:{request_key}",
+                post,
+                encode=lambda shared: shared.text,
+                decode=lambda body: _cached_response(body, "SHARED"),
+                timeout=clamp_timeout(2 * mistral_transport.timeout_for(prompt_type)[1]),
+            )
+        else:
+            response = post()
 
         logger.info(f"🌐 [MISTRAL] Request successful, returning response")
         return response
 
+    except AIEvaluationError:
+        raise
+    except OperationCancelledError as e:
+        logger.warning(f"🌐 [MISTRAL] {prompt_type} request abandoned: {e}")
+        raise AIEvaluationError(f"Mistral API request cancelled: {e}")
     except requests.exceptions.Timeout:
-        logger.error(f"🌐 [MISTRAL] Request timed out after 60 seconds")
-        raise AIEvaluationError("Mistral API request timed out after 60 seconds")
+        read_timeout = mistral_transport.timeout_for(prompt_type)[1]
+        logger.error(f"🌐 [MISTRAL] {prompt_type} request timed out after {read_timeout:g} seconds")
+        raise AIEvaluationError(f"Mistral API request timed out after {read_timeout:g} seconds")
     except requests.exceptions.RequestException as e:
         logger.error(f"🌐 [MISTRAL] Request exception: {e}")
         raise AIEvaluationError(f"Mistral API request failed: {str(e)}")
@@ -127,7 +224,10 @@ def send_prompt(
     system_message: str,
     user_prompt: dict,
     temperature: float = 0.7,
-    stream: bool = False
+    stream: bool = False,
+    prompt_type: str = "default",
+    cache: bool = False,
+    coalesce: Optional[bool] = None,
 ) -> requests.Response:
     """
     Convenience wrapper for sending system and user prompts.
@@ -140,6 +240,10 @@ def send_prompt(
         user_prompt: User message dictionary with role and content
         temperature: Controls response randomness (0.0-1.0)
         stream: Enable streaming responses
+        prompt_type: Selects timeouts and the latency series (see ``PROMPT_TIMEOUTS``)
+        cache: Serve and store the response through the response cache
+        coalesce: Share the response of an identical request already in flight
+            (default: same as ``cache``)
 
     Returns:
         requests.Response: Raw API response
@@ -160,7 +264,7 @@ def send_prompt(
 
     logger.info(f"🌐 [MISTRAL] About to call send_request...")
     try:
-        response = send_request(messages, temperature, stream)
+        response = send_request(messages, temperature, stream, prompt_type, cache, coalesce)
         logger.info(f"🌐 [MISTRAL] send_request completed successfully")
         return response
     except Exception as e:
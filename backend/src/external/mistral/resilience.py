@@ -0,0 +1,412 @@
+"""
+XplorED - Mistral Resilience
+
+This module keeps slow or failing Mistral calls from stalling workers,
+following clean architecture principles as outlined in the documentation.
+
+Resilience Components:
+- Latency window: the most recent successful call times per prompt type,
+  used to derive the hedging delay (``MISTRAL_HEDGE_PERCENTILE``)
+- Hedged requests: a call that has not answered by the observed p95 gets a
+  second, identical request; the first usable response wins. Hedges are
+  capped at ``MISTRAL_HEDGE_BUDGET`` of all calls so a general slowdown
+  cannot double the load
+- Circuit breaker: after ``MISTRAL_BREAKER_THRESHOLD`` consecutive failures
+  calls fail fast for ``MISTRAL_BREAKER_COOLDOWN`` seconds, then a single
+  probe decides whether to close it again
+- Health: breaker state, hedging counters and current delays
+
+While the breaker is open the client raises ``AIServiceUnavailableError`` at
+once, so callers switch to their rule-based fallbacks without waiting for a
+timeout. Prompts sent with ``cache=True`` are still answered from the
+response cache, which is read before the breaker is consulted.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional
+
+import requests  # type: ignore
+
+from shared.exceptions import AIServiceUnavailableError, OperationCancelledError
+from .async_client import MISTRAL_MAX_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+
+# === Resilience Configuration ===
+MISTRAL_HEDGE_ENABLED = os.getenv("MISTRAL_HEDGE_ENABLED", "true").lower() == "true"
+MISTRAL_HEDGE_PERCENTILE = float(os.getenv("MISTRAL_HEDGE_PERCENTILE", "0.95"))
+# Successful calls of a prompt type needed before it is hedged
+MISTRAL_HEDGE_MIN_SAMPLES = int(os.getenv("MISTRAL_HEDGE_MIN_SAMPLES", "20"))
+MISTRAL_HEDGE_MIN_DELAY = float(os.getenv("MISTRAL_HEDGE_MIN_DELAY", "0.5"))
+# Maximum share of calls that may send a hedge
+MISTRAL_HEDGE_BUDGET = float(os.getenv("MISTRAL_HEDGE_BUDGET", "0.1"))
+MISTRAL_LATENCY_WINDOW = int(os.getenv("MISTRAL_LATENCY_WINDOW", "200"))
+MISTRAL_BREAKER_THRESHOLD = int(os.getenv("MISTRAL_BREAKER_THRESHOLD", "5"))
+MISTRAL_BREAKER_COOLDOWN = float(os.getenv("MISTRAL_BREAKER_COOLDOWN", "30"))
+
+# Final statuses that count against the upstream (other 4xx mean it is alive)
+FAILURE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+UNAVAILABLE_MESSAGE = "AI service temporarily unavailable, please try again shortly"
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+# === Latency Window ===
+class LatencyWindow:
+    """Most recent successful call durations per prompt type (thread-safe)."""
+
+    def __init__(self, size: int = MISTRAL_LATENCY_WINDOW):
+        """
+        Initialize empty windows.
+
+        Args:
+            size: Durations kept per prompt type
+        """
+        self.size = size
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, prompt_type: str, seconds: float) -> None:
+        """Record the duration of one successful call."""
+        with self._lock:
+            self._samples.setdefault(prompt_type, deque(maxlen=self.size)).append(seconds)
+
+    def percentile(self, prompt_type: str, q: float) -> Optional[float]:
+        """
+        Return the ``q`` quantile (0-1) of a prompt type's window.
+
+        Returns:
+            Optional[float]: Seconds, or None if fewer than
+            ``MISTRAL_HEDGE_MIN_SAMPLES`` calls were observed
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(prompt_type, ()))
+        if len(samples) < MISTRAL_HEDGE_MIN_SAMPLES:
+            return None
+        index = min(len(samples) - 1, int(q * len(samples)))
+        return samples[index]
+
+    def prompt_types(self) -> List[str]:
+        with self._lock:
+            return list(self._samples)
+
+
+# === Circuit Breaker ===
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    def __init__(self, threshold: int = MISTRAL_BREAKER_THRESHOLD, cooldown: float = MISTRAL_BREAKER_COOLDOWN):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            threshold: Consecutive failures that open the breaker
+            cooldown: Seconds the breaker stays open before a probe is let through
+        """
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self._state = BREAKER_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._last_error: Optional[str] = None
+        self._last_opened: Optional[str] = None
+        self._stats: Dict[str, int] = {"opened": 0, "short_circuited": 0}
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return whether a call may go upstream now (claims the probe when half-open)."""
+        with self._lock:
+            if self._state == BREAKER_OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                self._state = BREAKER_HALF_OPEN
+            if self._state == BREAKER_CLOSED:
+                return True
+            if self._state == BREAKER_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._stats["short_circuited"] += 1
+            return False
+
+    def rejects(self) -> bool:
+        """Return whether a call would be refused now, without claiming the probe."""
+        with self._lock:
+            if self._state == BREAKER_CLOSED:
+                return False
+            cooled = time.monotonic() - self._opened_at >= self.cooldown
+            if (self._state == BREAKER_OPEN and cooled) or (self._state == BREAKER_HALF_OPEN and not self._probe_in_flight):
+                return False
+            self._stats["short_circuited"] += 1
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != BREAKER_CLOSED:
+                logger.info("🌐 [MISTRAL] Circuit breaker closed, upstream recovered")
+            self._state = BREAKER_CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, reason: str) -> None:
+        with self._lock:
+            self._failures += 1
+            self._last_error = reason
+            if self._state == BREAKER_HALF_OPEN or self._failures >= self.threshold:
+                if self._state != BREAKER_OPEN:
+                    self._stats["opened"] += 1
+                    self._last_opened = datetime.now().isoformat()
+                    logger.warning(
+                        f"🌐 [MISTRAL] Circuit breaker opened after {self._failures} failures "
+                        f"(last: {reason}), failing fast for {self.cooldown:g}s"
+                    )
+                self._state = BREAKER_OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def abandon(self) -> None:
+        """Release the half-open probe of a call its caller gave up on; says nothing about the upstream."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == BREAKER_OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                return BREAKER_HALF_OPEN
+            return self._state
+
+    def stats(self) -> Dict:
+        state = self.state
+        with self._lock:
+            retry_in = max(0.0, self.cooldown - (time.monotonic() - self._opened_at)) if state == BREAKER_OPEN else 0.0
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "threshold": self.threshold,
+                "cooldown_seconds": self.cooldown,
+                "retry_in_seconds": round(retry_in, 2),
+                "last_error": self._last_error,
+                "last_opened": self._last_opened,
+                **self._stats,
+            }
+
+
+# === Resilient Execution ===
+class MistralResilience:
+    """Hedged execution of upstream calls behind a circuit breaker."""
+
+    def __init__(
+        self,
+        hedge_enabled: bool = MISTRAL_HEDGE_ENABLED,
+        hedge_percentile: float = MISTRAL_HEDGE_PERCENTILE,
+        hedge_budget: float = MISTRAL_HEDGE_BUDGET,
+        min_delay: float = MISTRAL_HEDGE_MIN_DELAY,
+    ):
+        """
+        Initialize the breaker, latency windows and hedge counters.
+
+        Args:
+            hedge_enabled: Send hedged requests at all
+            hedge_percentile: Latency quantile after which a hedge is sent
+            hedge_budget: Maximum share of calls that may be hedged
+            min_delay: Lower bound of the hedging delay in seconds
+        """
+        self.hedge_enabled = hedge_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = hedge_budget
+        self.min_delay = min_delay
+        self.breaker = CircuitBreaker()
+        self.latency = LatencyWindow()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"calls": 0, "hedges_sent": 0, "hedges_won": 0}
+
+    def guard(self) -> None:
+        """
+        Fail fast, before queueing, if the breaker would refuse the call.
+
+        Raises:
+            AIServiceUnavailableError: While the breaker is open
+        """
+        if self.breaker.rejects():
+            raise AIServiceUnavailableError(UNAVAILABLE_MESSAGE)
+
+    def hedge_delay(self, prompt_type: str) -> Optional[float]:
+        """Seconds after which a call of this type is hedged, or None if it is not hedged."""
+        if not self.hedge_enabled:
+            return None
+        observed = self.latency.percentile(prompt_type, self.hedge_percentile)
+        if observed is None:
+            return None
+        return max(self.min_delay, observed)
+
+    def execute(
+        self,
+        fn: Callable[[], requests.Response],
+        prompt_type: str = "default",
+        hedge: bool = True,
+    ) -> requests.Response:
+        """
+        Run an upstream call (hedged when it is slow) and record its outcome.
+
+        The breaker is checked again here (it may have opened while the call
+        was queued) and the result is reported to it.
+
+        Args:
+            fn: Sends the request and returns its response
+            prompt_type: Selects the latency window
+            hedge: False for streams, whose body is read after this returns
+                (neither hedged nor added to the latency window)
+
+        Returns:
+            requests.Response: The first 200 response, otherwise the last response
+
+        Raises:
+            AIServiceUnavailableError: When the breaker refuses the call
+            Exception: What the last attempt raised when none returned a response
+        """
+        if not self.breaker.allow():
+            raise AIServiceUnavailableError(UNAVAILABLE_MESSAGE)
+        with self._lock:
+            self._stats["calls"] += 1
+
+        def timed() -> requests.Response:
+            started = time.perf_counter()
+            response = fn()
+            if response.status_code == 200:
+                self.latency.observe(prompt_type, time.perf_counter() - started)
+            return response
+
+        try:
+            if not hedge:
+                response = fn()
+            else:
+                delay = self.hedge_delay(prompt_type)
+                response = timed() if delay is None else self._hedged(timed, prompt_type, delay)
+        except OperationCancelledError:
+            # The caller ran out of time, which says nothing about the upstream
+            self.breaker.abandon()
+            raise
+        except Exception as e:
+            self.breaker.record_failure(type(e).__name__)
+            raise
+
+        if response.status_code in FAILURE_STATUS_CODES:
+            self.breaker.record_failure(f"HTTP {response.status_code}")
+        else:
+            self.breaker.record_success()
+        return response
+
+    def stats(self) -> Dict:
+        """Return breaker state, hedging counters and the current hedging delays."""
+        with self._lock:
+            counters = dict(self._stats)
+        delays = {}
+        for prompt_type in self.latency.prompt_types():
+            delay = self.hedge_delay(prompt_type)
+            delays[prompt_type] = round(delay, 3) if delay is not None else None
+        return {
+            "breaker": self.breaker.stats(),
+            "hedging": {
+                "enabled": self.hedge_enabled,
+                "percentile": self.hedge_percentile,
+                "budget": self.hedge_budget,
+                "delay_seconds": delays,
+                **counters,
+            },
+        }
+
+    # === Internals ===
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Pool for hedged calls: a primary and a hedge per scheduler slot."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=max(2, 2 * MISTRAL_MAX_CONCURRENCY),
+                        thread_name_prefix="mistral-hedge",
+                    )
+        return self._executor
+
+    def _take_hedge(self) -> bool:
+        """Claim a hedge if the budget allows one more."""
+        with self._lock:
+            if self._stats["hedges_sent"] + 1 > self.hedge_budget * self._stats["calls"]:
+                return False
+            self._stats["hedges_sent"] += 1
+            return True
+
+    def _hedged(self, fn: Callable[[], requests.Response], prompt_type: str, delay: float) -> requests.Response:
+        """Start ``fn``; start it again after ``delay`` seconds and return the first usable response."""
+        executor = self._get_executor()
+        # Each attempt gets its own copy of the caller's context (AI user, cancellation token)
+        primary = executor.submit(contextvars.copy_context().run, fn)
+        attempts: List[Future] = [primary]
+        if not wait([primary], timeout=delay).done and self._take_hedge():
+            logger.info(f"🌐 [MISTRAL] {prompt_type} call slower than {delay:.2f}s, sending hedged request")
+            attempts.append(executor.submit(contextvars.copy_context().run, fn))
+
+        last_response: Optional[requests.Response] = None
+        last_error: Optional[BaseException] = None
+        pending = set(attempts)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                if response.status_code == 200:
+                    for other in pending:
+                        other.add_done_callback(_close_response)
+                    if future is not primary:
+                        with self._lock:
+                            self._stats["hedges_won"] += 1
+                    return response
+                if last_response is not None:
+                    last_response.close()
+                last_response = response
+
+        if last_response is not None:
+            return last_response
+        raise last_error  # type: ignore[misc]
+
+
+def _close_response(future: Future) -> None:
+    """Release the connection of a losing hedged attempt."""
+    try:
+        future.result().close()
+    except Exception:
+        pass
+
+
+# === Global Instance ===
+mistral_resilience = MistralResilience()
+
+
+def get_resilience_stats() -> Dict:
+    """Return the shared breaker and hedging state."""
+    return mistral_resilience.stats()
+
+
+# === Export Configuration ===
+__all__ = [
+    "LatencyWindow",
+    "CircuitBreaker",
+    "MistralResilience",
+    "mistral_resilience",
+    "get_resilience_stats",
+]
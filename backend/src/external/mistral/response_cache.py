@@ -0,0 +1,383 @@
+"""
+XplorED - Mistral Response Cache
+
+This module provides a content-addressed cache for deterministic Mistral
+prompts, following clean architecture principles as outlined in the documentation.
+
+Response Cache Components:
+- Cache key: SHA-256 of model, messages (system and user prompt) and temperature,
+  namespaced by prompt type in every tier
+- Local tier: bounded in-process LRU with a per-entry TTL
+- Persistent tier: Redis keys when Redis is reachable, otherwise the SQLite
+  ``ai_response_cache`` table, both with a TTL; SQLite is trimmed to
+  ``MISTRAL_CACHE_MAX_ROWS`` rows (soonest-expiring first)
+- Hit/miss counters per prompt type and a purge for the admin API
+
+Caching is opt-in per call site (``send_prompt(..., cache=True)``) and only
+successful, non-streamed responses are stored. A purge clears the local tier
+of the current worker only; other workers drop their copies within
+``MISTRAL_CACHE_LOCAL_TTL`` seconds.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# === Cache Configuration ===
+MISTRAL_CACHE_ENABLED = os.getenv("MISTRAL_CACHE_ENABLED", "true").lower() == "true"
+MISTRAL_CACHE_TTL = int(os.getenv("MISTRAL_CACHE_TTL", str(7 * 24 * 3600)))
+MISTRAL_CACHE_LOCAL_TTL = int(os.getenv("MISTRAL_CACHE_LOCAL_TTL", "600"))
+MISTRAL_CACHE_LOCAL_SIZE = int(os.getenv("MISTRAL_CACHE_LOCAL_SIZE", "2000"))
+MISTRAL_CACHE_MAX_ROWS = int(os.getenv("MISTRAL_CACHE_MAX_ROWS", "50000"))
+# auto (Redis when reachable, else SQLite), redis, sqlite or none (local tier only)
+MISTRAL_CACHE_BACKEND = os.getenv("MISTRAL_CACHE_BACKEND", "auto").lower()
+
+REDIS_KEY_PREFIX = "mistral:response:"
+CACHE_TABLE = "ai_response_cache"
+# SQLite eviction runs once per this many stores rather than on every write
+SQLITE_TRIM_INTERVAL = 100
+
+
+# === Cache Key ===
+def response_cache_key(model: str, messages: List[Dict], temperature: float) -> str:
+    """
+    Build the content address of a request.
+
+    Args:
+        model: Mistral model name
+        messages: Chat messages as sent (system and user prompt)
+        temperature: Sampling temperature
+
+    Returns:
+        str: Hex SHA-256 digest identifying the request
+    """
+    material = json.dumps(
+        [model, messages, round(float(temperature), 4)],
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+# === Response Cache ===
+class ResponseCache:
+    """Two-tier (process LRU, Redis or SQLite) cache of response bodies."""
+
+    def __init__(
+        self,
+        ttl: int = MISTRAL_CACHE_TTL,
+        local_ttl: int = MISTRAL_CACHE_LOCAL_TTL,
+        local_size: int = MISTRAL_CACHE_LOCAL_SIZE,
+        max_rows: int = MISTRAL_CACHE_MAX_ROWS,
+        backend: str = MISTRAL_CACHE_BACKEND,
+        enabled: bool = MISTRAL_CACHE_ENABLED,
+    ):
+        """
+        Initialize an empty cache; the persistent tier is resolved on first use.
+
+        Args:
+            ttl: Seconds a persistent entry stays valid
+            local_ttl: Seconds a local entry stays valid (0 disables the local tier)
+            local_size: Local entries kept before the least recently used is evicted
+            max_rows: Rows kept in the SQLite tier
+            backend: ``auto``, ``redis``, ``sqlite`` or ``none``
+            enabled: Master switch; when False every lookup misses and nothing is stored
+        """
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.local_size = local_size
+        self.max_rows = max_rows
+        self.backend = backend
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._evictions = 0
+        self._stores_since_trim = 0
+        self._sqlite_ready = False
+
+    def get(self, key: str, prompt_type: str = "default") -> Optional[str]:
+        """
+        Look up a cached response body.
+
+        Args:
+            key: Cache key from ``response_cache_key``
+            prompt_type: Prompt type (namespace and metrics label)
+
+        Returns:
+            Optional[str]: The cached body, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        local_key = f"{prompt_type}:{key}"
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(local_key)
+            if entry is not None:
+                body, _, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(local_key)
+                    self._count(prompt_type, "local_hits")
+                    return body
+                del self._entries[local_key]
+
+        body = self._persistent_get(key, prompt_type)
+        if body is not None:
+            self._store_local(key, body, prompt_type)
+            with self._lock:
+                self._count(prompt_type, "persistent_hits")
+            return body
+
+        with self._lock:
+            self._count(prompt_type, "misses")
+        return None
+
+    def set(self, key: str, body: str, prompt_type: str = "default", ttl: Optional[int] = None) -> None:
+        """
+        Store a response body in every tier.
+
+        Args:
+            key: Cache key from ``response_cache_key``
+            body: Raw response body (JSON text)
+            prompt_type: Prompt type (namespace and metrics label)
+            ttl: Persistent TTL in seconds (defaults to ``MISTRAL_CACHE_TTL``)
+        """
+        if not self.enabled or not key or not body:
+            return
+        self._store_local(key, body, prompt_type)
+        self._persistent_set(key, body, prompt_type, ttl or self.ttl)
+        with self._lock:
+            self._count(prompt_type, "stores")
+
+    def purge(self, prompt_type: Optional[str] = None) -> Dict[str, int]:
+        """
+        Remove cached responses, optionally only those of one prompt type.
+
+        Args:
+            prompt_type: Prompt type to purge (None purges everything)
+
+        Returns:
+            Dict[str, int]: Entries removed per tier
+        """
+        with self._lock:
+            local_keys = [
+                key for key, (_, entry_type, _) in self._entries.items()
+                if prompt_type is None or entry_type == prompt_type
+            ]
+            for key in local_keys:
+                del self._entries[key]
+
+        removed = {"local": len(local_keys), "redis": 0, "sqlite": 0}
+        redis = self._redis()
+        if redis is not None:
+            pattern = f"{REDIS_KEY_PREFIX}{prompt_type}:*" if prompt_type else f"{REDIS_KEY_PREFIX}*"
+            keys = list(redis.scan_iter(match=pattern, count=500))
+            for start in range(0, len(keys), 500):
+                removed["redis"] += redis.delete(*keys[start:start + 500])
+        if self._sqlite_enabled():
+            removed["sqlite"] = self._sqlite_purge(prompt_type)
+
+        logger.info(f"Purged Mistral response cache ({prompt_type or 'all'}): {removed}")
+        return removed
+
+    def stats(self) -> Dict:
+        """
+        Return hit/miss counters, hit rates and tier sizes.
+
+        Returns:
+            Dict: ``totals`` and ``by_prompt_type`` counters with ``hit_rate``,
+            plus the active backend, local size and evictions
+        """
+        with self._lock:
+            by_type = {name: dict(counters) for name, counters in self._stats.items()}
+            local_size = len(self._entries)
+            evictions = self._evictions
+
+        totals = {"local_hits": 0, "persistent_hits": 0, "misses": 0, "stores": 0}
+        for counters in by_type.values():
+            for name in totals:
+                totals[name] += counters.get(name, 0)
+            counters["hit_rate"] = self._hit_rate(counters)
+        totals["hit_rate"] = self._hit_rate(totals)
+
+        return {
+            "enabled": self.enabled,
+            "backend": self._backend_name(),
+            "ttl_seconds": self.ttl,
+            "local_size": local_size,
+            "local_evictions": evictions,
+            "totals": totals,
+            "by_prompt_type": by_type,
+        }
+
+    # === Internals ===
+    @staticmethod
+    def _hit_rate(counters: Dict[str, int]) -> float:
+        hits = counters.get("local_hits", 0) + counters.get("persistent_hits", 0)
+        lookups = hits + counters.get("misses", 0)
+        return round(hits / lookups, 4) if lookups else 0.0
+
+    def _count(self, prompt_type: str, name: str) -> None:
+        """Increment a counter; the caller holds the lock."""
+        counters = self._stats.setdefault(
+            prompt_type, {"local_hits": 0, "persistent_hits": 0, "misses": 0, "stores": 0}
+        )
+        counters[name] += 1
+
+    def _store_local(self, key: str, body: str, prompt_type: str) -> None:
+        """Insert or refresh a local entry, evicting the least recently used."""
+        if self.local_ttl <= 0 or self.local_size <= 0:
+            return
+        local_key = f"{prompt_type}:{key}"
+        with self._lock:
+            self._entries[local_key] = (body, prompt_type, time.monotonic() + self.local_ttl)
+            self._entries.move_to_end(local_key)
+            while len(self._entries) > self.local_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _backend_name(self) -> str:
+        if self._redis() is not None:
+            return "redis"
+        return "sqlite" if self._sqlite_enabled() else "none"
+
+    def _redis(self):
+        """Return the raw Redis client if the Redis tier is selected and connected."""
+        if self.backend not in ("auto", "redis"):
+            return None
+        try:
+            from external.redis import redis_client
+        except Exception:
+            return None
+        return redis_client.client
+
+    def _sqlite_enabled(self) -> bool:
+        return self.backend == "sqlite" or (self.backend == "auto" and self._redis() is None)
+
+    def _persistent_get(self, key: str, prompt_type: str) -> Optional[str]:
+        try:
+            redis = self._redis()
+            if redis is not None:
+                return redis.get(f"{REDIS_KEY_PREFIX}{prompt_type}:{key}")
+            if self._sqlite_enabled() and self._ensure_sqlite_table():
+                from core.database.connection import fetch_one
+
+                row = fetch_one(
+                    CACHE_TABLE,
+                    "WHERE cache_key = ? AND expires_at > ?",
+                    (f"{prompt_type}:{key}", int(time.time())),
+                    columns="body",
+                )
+                return row.get("body") if row else None
+        except Exception as e:
+            logger.warning(f"Mistral response cache read failed: {e}")
+        return None
+
+    def _persistent_set(self, key: str, body: str, prompt_type: str, ttl: int) -> None:
+        try:
+            redis = self._redis()
+            if redis is not None:
+                redis.setex(f"{REDIS_KEY_PREFIX}{prompt_type}:{key}", ttl, body)
+                return
+            if self._sqlite_enabled() and self._ensure_sqlite_table():
+                from core.database.connection import execute_query
+
+                now = int(time.time())
+                execute_query(
+                    f"INSERT OR REPLACE INTO {CACHE_TABLE} (cache_key, prompt_type, body, created_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?);",
+                    (f"{prompt_type}:{key}", prompt_type, body, now, now + ttl),
+                )
+                with self._lock:
+                    self._stores_since_trim += 1
+                    trim = self._stores_since_trim >= SQLITE_TRIM_INTERVAL
+                    if trim:
+                        self._stores_since_trim = 0
+                if trim:
+                    self._sqlite_trim()
+        except Exception as e:
+            logger.warning(f"Mistral response cache write failed: {e}")
+
+    def _ensure_sqlite_table(self) -> bool:
+        """Create the SQLite tier table if missing (normally done by migration 0008)."""
+        if self._sqlite_ready:
+            return True
+        from core.database.connection import execute_query
+
+        created = execute_query(
+            f"""
+            CREATE TABLE IF NOT EXISTS {CACHE_TABLE} (
+                cache_key TEXT PRIMARY KEY,
+                prompt_type TEXT NOT NULL DEFAULT 'default',
+                body TEXT NOT NULL,
+                created_at INTEGER NOT NULL,
+                expires_at INTEGER NOT NULL
+            );
+            """
+        )
+        if created:
+            execute_query(f"CREATE INDEX IF NOT EXISTS idx_{CACHE_TABLE}_expires_at ON {CACHE_TABLE}(expires_at);")
+            execute_query(f"CREATE INDEX IF NOT EXISTS idx_{CACHE_TABLE}_prompt_type ON {CACHE_TABLE}(prompt_type);")
+            self._sqlite_ready = True
+        return self._sqlite_ready
+
+    def _sqlite_trim(self) -> None:
+        """Drop expired rows, then the soonest-expiring rows beyond ``max_rows``."""
+        from core.database.connection import execute_query, fetch_one
+
+        execute_query(f"DELETE FROM {CACHE_TABLE} WHERE expires_at <= ?;", (int(time.time()),))
+        row = fetch_one(CACHE_TABLE, "", (), columns="COUNT(*) as count")
+        excess = (row.get("count", 0) if row else 0) - self.max_rows
+        if excess > 0:
+            execute_query(
+                f"DELETE FROM {CACHE_TABLE} WHERE cache_key IN "
+                f"(SELECT cache_key FROM {CACHE_TABLE} ORDER BY expires_at ASC LIMIT ?);",
+                (excess,),
+            )
+            logger.info(f"Evicted {excess} Mistral response cache rows")
+
+    def _sqlite_purge(self, prompt_type: Optional[str]) -> int:
+        if not self._ensure_sqlite_table():
+            return 0
+        from core.database.connection import execute_query, fetch_one
+
+        where, params = ("WHERE prompt_type = ?", (prompt_type,)) if prompt_type else ("", ())
+        row = fetch_one(CACHE_TABLE, where, params, columns="COUNT(*) as count")
+        execute_query(f"DELETE FROM {CACHE_TABLE} {where};", params)
+        return row.get("count", 0) if row else 0
+
+
+# === Global Instance ===
+response_cache = ResponseCache()
+
+
+def get_response_cache_stats() -> Dict:
+    """Return the shared response cache's hit-rate metrics."""
+    return response_cache.stats()
+
+
+def purge_response_cache(prompt_type: Optional[str] = None) -> Dict[str, int]:
+    """Purge the shared response cache (optionally one prompt type)."""
+    return response_cache.purge(prompt_type)
+
+
+# === Export Configuration ===
+__all__ = [
+    "ResponseCache",
+    "response_cache",
+    "response_cache_key",
+    "get_response_cache_stats",
+    "purge_response_cache",
+]
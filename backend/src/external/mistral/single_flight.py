@@ -0,0 +1,266 @@
+"""
+XplorED - Mistral Single-Flight
+
+This module coalesces identical in-flight Mistral requests,
+following clean architecture principles as outlined in the documentation.
+
+Single-Flight Components:
+- In-process: the first caller of a key runs the request, concurrent
+  callers with the same key wait for it and share its response
+- Cross-worker: the running worker holds a Redis lock for the key and
+  publishes the response body; workers that find the lock taken poll for
+  that body instead of calling Mistral themselves
+- Counters for leaders, shared responses and fallbacks
+
+Failures are not shared across workers: when the lock holder fails (or the
+wait exceeds its timeout) a waiting worker makes its own request. Within a
+process the leader's exception is raised in every waiting caller, except
+cancellations and timeouts: those belong to the leader's own deadline, so a
+waiting caller retries and leads (or joins) a new request instead.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional, TypeVar
+
+import requests  # type: ignore
+
+from shared.exceptions import TimeoutError as XplorEDTimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# === Single-Flight Configuration ===
+MISTRAL_SINGLE_FLIGHT = os.getenv("MISTRAL_SINGLE_FLIGHT", "true").lower() == "true"
+MISTRAL_SINGLE_FLIGHT_REDIS = os.getenv("MISTRAL_SINGLE_FLIGHT_REDIS", "true").lower() == "true"
+# Seconds a published body stays readable for waiting workers
+MISTRAL_SINGLE_FLIGHT_RESULT_TTL = int(os.getenv("MISTRAL_SINGLE_FLIGHT_RESULT_TTL", "15"))
+MISTRAL_SINGLE_FLIGHT_POLL = float(os.getenv("MISTRAL_SINGLE_FLIGHT_POLL", "0.1"))
+
+REDIS_LOCK_PREFIX = "mistral:inflight:lock:"
+REDIS_RESULT_PREFIX = "mistral:inflight:result:"
+
+# Leader errors that say nothing about the request itself (includes OperationCancelledError)
+UNSHARED_ERRORS = (XplorEDTimeoutError, TimeoutError, requests.exceptions.Timeout)
+
+
+class _Call:
+    """One in-flight request and its outcome."""
+
+    __slots__ = ("done", "body", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.body: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+# === Single-Flight ===
+class SingleFlight:
+    """Run at most one request per key at a time, in this process and across workers."""
+
+    def __init__(
+        self,
+        enabled: bool = MISTRAL_SINGLE_FLIGHT,
+        use_redis: bool = MISTRAL_SINGLE_FLIGHT_REDIS,
+        result_ttl: int = MISTRAL_SINGLE_FLIGHT_RESULT_TTL,
+        poll_interval: float = MISTRAL_SINGLE_FLIGHT_POLL,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            enabled: When False every call runs its own request
+            use_redis: Coalesce across workers through Redis when it is reachable
+            result_ttl: Seconds a published body stays readable
+            poll_interval: Seconds between checks of a remote request
+        """
+        self.enabled = enabled
+        self.use_redis = use_redis
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "leaders": 0,
+            "shared_local": 0,
+            "shared_remote": 0,
+            "fallbacks": 0,
+            "retries": 0,
+        }
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        encode: Callable[[T], str],
+        decode: Callable[[str], T],
+        timeout: float = 120.0,
+    ) -> T:
+        """
+        Run ``fn`` once for all concurrent callers of ``key``.
+
+        The leader gets the value ``fn`` returned; every other caller gets
+        ``decode(encode(value))`` so no two callers share a mutable object.
+
+        Args:
+            key: Identity of the request (e.g. ``response_cache_key``)
+            fn: Performs the request
+            encode: Turns the result into a string that can be published
+            decode: Rebuilds a result from its string form
+            timeout: Seconds to wait for another caller's request
+
+        Returns:
+            T: The result of ``fn`` (own or shared)
+
+        Raises:
+            Exception: Whatever ``fn`` raised in the leading caller of this process,
+                except cancellations and timeouts, which only the leader sees
+        """
+        if not self.enabled or not key:
+            return fn()
+
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = _Call()
+                    self._calls[key] = call
+                else:
+                    call.waiters += 1
+
+            if leader:
+                break
+
+            if not call.done.wait(timeout):
+                logger.warning("🌐 [MISTRAL] Single-flight wait timed out, sending own request")
+                with self._lock:
+                    self._stats["fallbacks"] += 1
+                return fn()
+            if call.error is None:
+                with self._lock:
+                    self._stats["shared_local"] += 1
+                return decode(call.body)
+            if not isinstance(call.error, UNSHARED_ERRORS):
+                raise call.error
+            logger.info(f"🌐 [MISTRAL] Single-flight leader gave up ({call.error}), retrying")
+            with self._lock:
+                self._stats["retries"] += 1
+
+        try:
+            result = self._lead(key, fn, encode, decode, timeout)
+            call.body = encode(result)
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+                if call.waiters:
+                    logger.info(f"🌐 [MISTRAL] Single-flight shared one request with {call.waiters} waiting callers")
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return coalescing counters and the number of keys in flight."""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+    # === Internals ===
+    def _lead(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        encode: Callable[[T], str],
+        decode: Callable[[str], T],
+        timeout: float,
+    ) -> T:
+        """Run the request for this process, coordinating with other workers."""
+        redis = self._redis()
+        token = uuid.uuid4().hex
+        acquired = False
+        if redis is not None:
+            try:
+                acquired = bool(redis.set(REDIS_LOCK_PREFIX + key, token, nx=True, px=int(timeout * 1000)))
+                if not acquired:
+                    body = self._await_remote(redis, key, timeout)
+                    if body is not None:
+                        with self._lock:
+                            self._stats["shared_remote"] += 1
+                        return decode(body)
+                    with self._lock:
+                        self._stats["fallbacks"] += 1
+            except Exception as e:
+                logger.warning(f"🌐 [MISTRAL] Single-flight Redis coordination failed: {e}")
+
+        with self._lock:
+            self._stats["leaders"] += 1
+        try:
+            result = fn()
+            if acquired:
+                try:
+                    redis.set(REDIS_RESULT_PREFIX + key, encode(result), ex=self.result_ttl)
+                except Exception as e:
+                    logger.warning(f"🌐 [MISTRAL] Failed to publish single-flight result: {e}")
+            return result
+        finally:
+            if acquired:
+                self._release(redis, key, token)
+
+    def _await_remote(self, redis, key: str, timeout: float) -> Optional[str]:
+        """Poll for another worker's published body until its lock disappears."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            body = redis.get(REDIS_RESULT_PREFIX + key)
+            if body is not None:
+                return body
+            if not redis.exists(REDIS_LOCK_PREFIX + key):
+                # The holder may have published right before releasing
+                return redis.get(REDIS_RESULT_PREFIX + key)
+            time.sleep(self.poll_interval)
+        return None
+
+    @staticmethod
+    def _release(redis, key: str, token: str) -> None:
+        """Delete the lock only if this caller still holds it."""
+        try:
+            if redis.get(REDIS_LOCK_PREFIX + key) == token:
+                redis.delete(REDIS_LOCK_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"🌐 [MISTRAL] Failed to release single-flight lock: {e}")
+
+    def _redis(self):
+        """Return the raw Redis client if cross-worker coalescing is enabled and connected."""
+        if not self.use_redis:
+            return None
+        try:
+            from external.redis import redis_client
+        except Exception:
+            return None
+        return redis_client.client
+
+
+# === Global Instance ===
+single_flight = SingleFlight()
+
+
+def get_single_flight_stats() -> Dict[str, int]:
+    """Return the shared single-flight counters."""
+    return single_flight.stats()
+
+
+# === Export Configuration ===
+__all__ = [
+    "SingleFlight",
+    "single_flight",
+    "get_single_flight_stats",
+]
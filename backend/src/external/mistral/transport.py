@@ -0,0 +1,351 @@
+"""
+XplorED - Mistral HTTP Transport
+
+This module provides the pooled HTTP transport behind the Mistral client,
+following clean architecture principles as outlined in the documentation.
+
+Transport Components:
+- Shared keep-alive ``requests.Session`` with a sized connection pool
+- Per prompt type (connect, read) timeouts
+- Retries on 429/5xx and connection failures with jittered exponential
+  backoff that honours ``Retry-After``
+- Per prompt type latency histograms for every call
+- Cancellation: each attempt's socket timeouts shrink to the caller's
+  remaining budget (see ``shared.cancellation``) and backoff sleeps end as
+  soon as the caller's token is cancelled
+
+Read timeouts are not retried: the request may already be processed and a
+retry would double the user's wait.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+
+from shared.cancellation import clamp_timeout, current_token, sleep_or_cancel
+from shared.exceptions import OperationCancelledError
+
+logger = logging.getLogger(__name__)
+
+
+# === Transport Configuration ===
+MISTRAL_POOL_SIZE = int(os.getenv("MISTRAL_POOL_SIZE", "16"))
+MISTRAL_MAX_RETRIES = int(os.getenv("MISTRAL_MAX_RETRIES", "3"))
+MISTRAL_BACKOFF_BASE = float(os.getenv("MISTRAL_BACKOFF_BASE", "0.5"))
+MISTRAL_BACKOFF_MAX = float(os.getenv("MISTRAL_BACKOFF_MAX", "20"))
+MISTRAL_CONNECT_TIMEOUT = float(os.getenv("MISTRAL_CONNECT_TIMEOUT", "5"))
+MISTRAL_READ_TIMEOUT = float(os.getenv("MISTRAL_READ_TIMEOUT", "60"))
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# (connect, read) seconds per prompt type; unknown types use "default"
+PROMPT_TIMEOUTS: Dict[str, Tuple[float, float]] = {
+    "default": (MISTRAL_CONNECT_TIMEOUT, MISTRAL_READ_TIMEOUT),
+    "generation": (MISTRAL_CONNECT_TIMEOUT, 90.0),
+    "evaluation": (MISTRAL_CONNECT_TIMEOUT, 45.0),
+    "feedback": (MISTRAL_CONNECT_TIMEOUT, 45.0),
+    "enrichment": (MISTRAL_CONNECT_TIMEOUT, 30.0),
+    "translation": (MISTRAL_CONNECT_TIMEOUT, 20.0),
+    "chat": (MISTRAL_CONNECT_TIMEOUT, 60.0),
+}
+
+# Upper bounds (seconds) of the latency histogram buckets; the last is +Inf
+LATENCY_BUCKETS: Tuple[float, ...] = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 60.0)
+
+
+# === Latency Histogram ===
+class LatencyHistogram:
+    """Cumulative latency histogram per prompt type (thread-safe)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        """
+        Initialize empty histograms.
+
+        Args:
+            buckets: Ascending bucket upper bounds in seconds
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _new_series(self) -> Dict:
+        return {
+            "count": 0,
+            "sum": 0.0,
+            "max": 0.0,
+            "buckets": [0] * (len(self.buckets) + 1),
+            "attempts": 0,
+            "retries": 0,
+            "errors": 0,
+            "status": {},
+        }
+
+    def observe(
+        self,
+        prompt_type: str,
+        seconds: float,
+        attempts: int = 1,
+        status: Optional[int] = None,
+        error: bool = False,
+    ) -> None:
+        """
+        Record one completed call (including all of its retries).
+
+        Args:
+            prompt_type: Prompt type the call was made for
+            seconds: Wall time of the call
+            attempts: HTTP attempts made
+            status: Final HTTP status, if a response was received
+            error: Whether the call ended in a failure
+        """
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                index = position
+                break
+
+        with self._lock:
+            series = self._series.setdefault(prompt_type, self._new_series())
+            series["count"] += 1
+            series["sum"] += seconds
+            series["max"] = max(series["max"], seconds)
+            series["buckets"][index] += 1
+            series["attempts"] += attempts
+            series["retries"] += max(0, attempts - 1)
+            if error:
+                series["errors"] += 1
+            if status is not None:
+                series["status"][str(status)] = series["status"].get(str(status), 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Return a copy of every series with cumulative bucket counts.
+
+        Returns:
+            Dict[str, Dict]: Series by prompt type, each with count, avg, max,
+            retries, errors, status counts and ``le`` buckets
+        """
+        labels = [str(bound) for bound in self.buckets] + ["+Inf"]
+        with self._lock:
+            result = {}
+            for prompt_type, series in self._series.items():
+                running = 0
+                cumulative = {}
+                for label, count in zip(labels, series["buckets"]):
+                    running += count
+                    cumulative[label] = running
+                result[prompt_type] = {
+                    "count": series["count"],
+                    "avg_seconds": round(series["sum"] / series["count"], 4) if series["count"] else 0.0,
+                    "max_seconds": round(series["max"], 4),
+                    "attempts": series["attempts"],
+                    "retries": series["retries"],
+                    "errors": series["errors"],
+                    "status": dict(series["status"]),
+                    "buckets": cumulative,
+                }
+            return result
+
+    def reset(self) -> None:
+        """Drop every recorded observation."""
+        with self._lock:
+            self._series.clear()
+
+
+# === Transport ===
+class MistralTransport:
+    """Keep-alive HTTP transport with retries, shared by all Mistral calls."""
+
+    def __init__(
+        self,
+        pool_size: int = MISTRAL_POOL_SIZE,
+        max_retries: int = MISTRAL_MAX_RETRIES,
+        backoff_base: float = MISTRAL_BACKOFF_BASE,
+        backoff_max: float = MISTRAL_BACKOFF_MAX,
+    ):
+        """
+        Initialize the transport; the session is created on first use.
+
+        Args:
+            pool_size: Keep-alive connections kept per host
+            max_retries: Retries after the first attempt
+            backoff_base: Backoff ceiling of the first retry in seconds
+            backoff_max: Upper bound of any single wait in seconds
+        """
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.histogram = LatencyHistogram()
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Shared ``requests.Session`` with a pool sized for concurrent workers."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    # Retries are handled here, where Retry-After and metrics are visible
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_size,
+                        pool_maxsize=self.pool_size,
+                        max_retries=0,
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    @staticmethod
+    def timeout_for(prompt_type: str) -> Tuple[float, float]:
+        """Return the (connect, read) timeout of a prompt type."""
+        return PROMPT_TIMEOUTS.get(prompt_type, PROMPT_TIMEOUTS["default"])
+
+    def post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict,
+        prompt_type: str = "default",
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        POST a JSON payload, retrying transient failures.
+
+        Args:
+            url: Endpoint URL
+            headers: Request headers
+            payload: JSON body
+            prompt_type: Key into ``PROMPT_TIMEOUTS`` and the latency histogram
+            stream: Return before the body is read (latency covers the headers only)
+
+        Returns:
+            requests.Response: The last response received (possibly non-200
+            once retries are exhausted)
+
+        Raises:
+            requests.exceptions.RequestException: When no response could be obtained
+            OperationCancelledError: When the caller's cancellation token fires first
+        """
+        started = time.perf_counter()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                # Recomputed per attempt: retries only get what is left of the caller's budget
+                timeout = clamp_timeout(self.timeout_for(prompt_type))
+                response = self.session.post(url, headers=headers, json=payload, timeout=timeout, stream=stream)
+            except OperationCancelledError:
+                self.histogram.observe(prompt_type, time.perf_counter() - started, attempt - 1, error=True)
+                raise
+            except requests.exceptions.ConnectionError as e:
+                # Includes ConnectTimeout; ReadTimeout falls through to the handler below
+                if attempt > self.max_retries:
+                    self.histogram.observe(prompt_type, time.perf_counter() - started, attempt, error=True)
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    f"🌐 [MISTRAL] {prompt_type} attempt {attempt} failed ({type(e).__name__}), retrying in {delay:.2f}s"
+                )
+                self._sleep(prompt_type, delay, started, attempt)
+                continue
+            except requests.exceptions.RequestException as e:
+                self.histogram.observe(prompt_type, time.perf_counter() - started, attempt, error=True)
+                token = current_token()
+                if token is not None and token.cancelled:
+                    # The socket deadline came from the caller's budget, not from a slow upstream
+                    raise OperationCancelledError(f"Operation cancelled: {token.reason}") from e
+                raise
+
+            if response.status_code in RETRY_STATUS_CODES and attempt <= self.max_retries:
+                delay = self._retry_after(response) or self._backoff(attempt)
+                logger.warning(
+                    f"🌐 [MISTRAL] {prompt_type} attempt {attempt} got {response.status_code}, retrying in {delay:.2f}s"
+                )
+                response.close()
+                self._sleep(prompt_type, delay, started, attempt)
+                continue
+
+            self.histogram.observe(
+                prompt_type,
+                time.perf_counter() - started,
+                attempt,
+                status=response.status_code,
+                error=response.status_code != 200,
+            )
+            return response
+
+    def stats(self) -> Dict:
+        """Return the transport configuration and per prompt type latency histograms."""
+        return {
+            "pool_size": self.pool_size,
+            "max_retries": self.max_retries,
+            "timeouts": {name: list(value) for name, value in PROMPT_TIMEOUTS.items()},
+            "latency": self.histogram.snapshot(),
+        }
+
+    def close(self) -> None:
+        """Close the pooled connections (a new session is created on next use)."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    # === Internals ===
+    def _sleep(self, prompt_type: str, delay: float, started: float, attempt: int) -> None:
+        """Back off before a retry; a cancelled caller ends the call here instead."""
+        try:
+            sleep_or_cancel(delay)
+        except OperationCancelledError:
+            self.histogram.observe(prompt_type, time.perf_counter() - started, attempt, error=True)
+            raise
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (1-based) attempt."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Parse ``Retry-After`` (seconds or HTTP date), capped at ``backoff_max``."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), self.backoff_max)
+
+
+# === Global Instance ===
+mistral_transport = MistralTransport()
+
+
+def get_transport_stats() -> Dict:
+    """Return the shared transport's configuration and latency histograms."""
+    return mistral_transport.stats()
+
+
+# === Export Configuration ===
+__all__ = [
+    "LatencyHistogram",
+    "MistralTransport",
+    "mistral_transport",
+    "get_transport_stats",
+    "PROMPT_TIMEOUTS",
+]
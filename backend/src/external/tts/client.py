@@ -8,20 +8,27 @@ TTS Client Components:
 - ElevenLabs Integration: Handle text-to-speech conversion using ElevenLabs API
 - Voice Management: Manage different voice options and configurations
 - Error Handling: Handle TTS service errors and timeouts
-- Configuration: Support environment-based API key configuration
+- Cancellation: the request timeout shrinks to the caller's remaining budget
+  and audio streaming stops once the caller's token is cancelled
+- Configuration: Support environment-based API key and base URL configuration
 
 For detailed architecture information, see: docs/backend_structure.md
 """
 
 import logging
+import math
 import os
-from typing import Optional, Any
+from typing import Optional, Any, Iterable, Iterator
 from io import BytesIO
+from shared.cancellation import CancellationToken, clamp_timeout, current_token
 from shared.exceptions import DatabaseError
 from shared.types import TTSServiceData
 
 logger = logging.getLogger(__name__)
 
+# Seconds an ElevenLabs request may take when the caller sets no deadline
+TTS_REQUEST_TIMEOUT = float(os.getenv("TTS_REQUEST_TIMEOUT", "30"))
+
 # Import ElevenLabs client
 try:
     from elevenlabs.client import ElevenLabs  # type: ignore
@@ -61,7 +68,9 @@ class TTSClient:
                 self._client = None
                 return
 
-            self._client = ElevenLabs(api_key=api_key)
+            # ELEVENLABS_BASE_URL points the SDK at a local stub (see scripts/ai_stub_servers.py)
+            base_url = os.getenv("ELEVENLABS_BASE_URL") or None
+            self._client = ElevenLabs(api_key=api_key, base_url=base_url)
             logger.info("TTS client initialized with ElevenLabs")
         except Exception as e:
             logger.error(f"Error initializing TTS client: {e}")
@@ -104,12 +113,18 @@ class TTSClient:
             return None
 
         try:
+            # The SDK takes whole seconds; the token may leave less than the default
+            timeout = max(1, math.ceil(clamp_timeout(TTS_REQUEST_TIMEOUT)))
             audio = self._client.text_to_speech.convert(
                 voice_id=voice_id,
                 text=text.strip(),
                 model_id=model_id,
                 output_format=output_format,
+                request_options={"timeout_in_seconds": timeout},
             )
+            token = current_token()
+            if token is not None:
+                audio = _stop_on_cancel(audio, token)
             logger.info(f"Successfully converted text to speech: {len(text)} characters")
             return audio
         except Exception as e:
@@ -188,5 +203,19 @@ class TTSClient:
         """Get the default output format for audio."""
         return "mp3_44100_128"
 
+
+def _stop_on_cancel(chunks: Iterable[bytes], token: CancellationToken) -> Iterator[bytes]:
+    """Yield audio chunks until the token is cancelled; closing the SDK iterator closes its connection."""
+    iterator = iter(chunks)
+    try:
+        for chunk in iterator:
+            token.raise_if_cancelled()
+            yield chunk
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
 # Global TTS client instance
 tts_client = TTSClient()
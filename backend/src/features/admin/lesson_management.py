@@ -17,7 +17,7 @@ import logging
 from typing import List, Optional, Tuple
 from bs4 import BeautifulSoup  # type: ignore
 
-from core.database.connection import select_one, select_rows, insert_row, update_row, delete_rows
+from core.database.connection import select_one, select_rows, insert_row, update_row, delete_rows, fetch_custom
 from core.processing import strip_ai_data, inject_block_ids
 from features.lessons import update_lesson_blocks_from_html
 from shared.exceptions import DatabaseError
@@ -297,54 +297,32 @@ def get_lesson_progress_summary() -> AnalyticsData:
     try:
         logger.info("Retrieving lesson progress summary")
 
-        lesson_ids = [
-            row["lesson_id"] for row in select_rows(
-                "lesson_content",
-                columns="DISTINCT lesson_id",
-            )
-        ]
+        # One aggregate over the per-(lesson, user) rollup maintained by triggers
+        rows = fetch_custom(
+            """
+            SELECT
+                lc.lesson_id,
+                COALESCE(lc.num_blocks, 0) AS num_blocks,
+                COUNT(r.user_id) AS users,
+                AVG(r.completed_blocks) AS avg_completed
+            FROM lesson_content AS lc
+            LEFT JOIN lesson_completion_rollup AS r ON r.lesson_id = lc.lesson_id
+            GROUP BY lc.lesson_id
+            """
+        )
 
         summary = {}
-        for lesson_id in lesson_ids:
-            row = select_one(
-                "lesson_content",
-                columns="num_blocks",
-                where="lesson_id = ?",
-                params=(lesson_id,),
-            )
-            total_blocks = row.get("num_blocks") if row else 0
-
+        for row in rows:
+            total_blocks = row["num_blocks"]
             if total_blocks == 0:
-                summary[lesson_id] = {"percent": 0, "num_blocks": 0}
-                continue
-
-            user_rows = select_rows(
-                "lesson_progress",
-                columns="DISTINCT user_id",
-                where="lesson_id = ?",
-                params=(lesson_id,),
-            )
-            users = [row["user_id"] for row in user_rows]
-
-            if not users:
-                summary[lesson_id] = {"percent": 0, "num_blocks": total_blocks}
-                continue
-
-            total_percent = 0.0
-            for user_id in users:
-                completed_row = select_one(
-                    "lesson_progress",
-                    columns="COUNT(*) as count",
-                    where="lesson_id = ? AND user_id = ? AND completed = 1",
-                    params=(lesson_id, user_id),
-                )
-                completed = completed_row.get("count") if completed_row else 0
-                total_percent += (completed / total_blocks) * 100 if total_blocks and total_blocks > 0 else 0
-
-            summary[lesson_id] = {
-                "percent": round(total_percent / len(users)),
-                "num_blocks": total_blocks,
-            }
+                summary[row["lesson_id"]] = {"percent": 0, "num_blocks": 0}
+            elif not row["users"]:
+                summary[row["lesson_id"]] = {"percent": 0, "num_blocks": total_blocks}
+            else:
+                summary[row["lesson_id"]] = {
+                    "percent": round(row["avg_completed"] / total_blocks * 100),
+                    "num_blocks": total_blocks,
+                }
 
         logger.info(f"Retrieved progress summary for {len(summary)} lessons")
         return summary
@@ -386,11 +364,11 @@ def get_individual_lesson_progress(lesson_id: int) -> LessonList:
             return []
 
         rows = select_rows(
-            "lesson_progress",
-            columns=["user_id", "COUNT(*) AS completed_blocks"],
-            where="lesson_id = ? AND completed = 1",
+            "lesson_completion_rollup",
+            columns=["user_id", "completed_blocks"],
+            where="lesson_id = ? AND completed_blocks > 0",
             params=(lesson_id,),
-            group_by="user_id",
+            order_by="user_id",
         )
 
         result = [
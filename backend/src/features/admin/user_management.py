@@ -16,7 +16,7 @@ For detailed architecture information, see: docs/backend_structure.md
 import logging
 from typing import List, Optional, Tuple
 
-from core.database.connection import select_rows, update_row, delete_rows
+from core.database.connection import select_rows, update_row, delete_rows, transaction
 from core.authentication import user_exists
 from werkzeug.security import generate_password_hash  # type: ignore
 from shared.exceptions import DatabaseError
@@ -131,13 +131,19 @@ def delete_user_data(username: str) -> Tuple[bool, Optional[str]]:
         logger.info(f"Deleting user data for {username}")
 
         # Delete all user data from all tables
-        delete_rows("results", "WHERE username = ?", (username,))
-        delete_rows("vocab_log", "WHERE username = ?", (username,))
-        delete_rows("topic_memory", "WHERE username = ?", (username,))
-        delete_rows("ai_user_data", "WHERE username = ?", (username,))
-        delete_rows("exercise_submissions", "WHERE username = ?", (username,))
-        delete_rows("lesson_progress", "WHERE user_id = ?", (username,))
-        delete_rows("users", "WHERE username = ?", (username,))
+        with transaction():
+            # Game aggregates go before results so the delete trigger skips its recompute
+            delete_rows("user_game_stats", "WHERE username = ?", (username,))
+            delete_rows("user_game_level_stats", "WHERE username = ?", (username,))
+            delete_rows("results", "WHERE username = ?", (username,))
+            delete_rows("vocab_log", "WHERE username = ?", (username,))
+            delete_rows("topic_memory", "WHERE username = ?", (username,))
+            delete_rows("ai_user_data", "WHERE username = ?", (username,))
+            delete_rows("exercise_submissions", "WHERE username = ?", (username,))
+            delete_rows("lesson_progress", "WHERE user_id = ?", (username,))
+            delete_rows("user_daily_activity", "WHERE username = ?", (username,))
+            delete_rows("user_achievements", "WHERE username = ?", (username,))
+            delete_rows("users", "WHERE username = ?", (username,))
 
         # Destroy user sessions
         from api.middleware.session import session_manager
@@ -156,7 +162,7 @@ def delete_user_data(username: str) -> Tuple[bool, Optional[str]]:
 
 def _update_username_across_tables(old_username: str, new_username: str) -> None:
     """
-    Update username across all database tables.
+    Update username across all database tables in a single transaction.
 
     Args:
         old_username: The old username
@@ -171,10 +177,25 @@ def _update_username_across_tables(old_username: str, new_username: str) -> None
             ("topic_memory", "username"),
             ("ai_user_data", "username"),
             ("exercise_submissions", "username"),
+            ("user_daily_activity", "username"),
+            ("user_achievements", "username"),
+            ("user_game_stats", "username"),
+            ("user_game_level_stats", "username"),
         ]
 
-        for table, column in tables_and_columns:
-            update_row(table, {column: new_username}, f"{column} = ?", (old_username,))
+        # Tables added by later migrations may not exist in every database
+        existing_tables = {
+            row["name"] for row in select_rows("sqlite_master", columns="name", where="type = 'table'")
+        }
+
+        # Rename atomically: any failed table rolls back every other table
+        with transaction():
+            for table, column in tables_and_columns:
+                if table not in existing_tables:
+                    logger.warning(f"Skipping username update for missing table {table}")
+                    continue
+                if not update_row(table, {column: new_username}, f"{column} = ?", (old_username,)):
+                    raise DatabaseError(f"Failed to update username in table {table}")
 
         logger.info(f"Updated username from {old_username} to {new_username} across all tables")
 
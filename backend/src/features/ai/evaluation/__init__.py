@@ -8,6 +8,7 @@ AI Evaluation Components:
 - Exercise Evaluation: AI-powered assessment of exercise responses
 - Translation Evaluation: Evaluate translation accuracy and quality
 - Topic Evaluation: Evaluate grammar topic quality and performance
+- Batch Evaluation: Review every exercise of a block in one request
 - Topic Memory: Update and manage topic memory based on evaluations
 
 For detailed architecture information, see: docs/backend_structure.md
@@ -39,10 +40,16 @@ from .translation_evaluation import (
 # Import topic evaluation functions
 from .topic_evaluation import (
     evaluate_topic_qualities_ai,
+    evaluate_topic_qualities_batch,
     compare_topic_qualities,
     analyze_topic_performance
 )
 
+# Import batch evaluation functions
+from .batch_evaluation import (
+    review_exercises_batch
+)
+
 # Import topic memory functions
 from .topic_memory import (
     update_topic_memory_translation,
@@ -69,9 +76,13 @@ __all__ = [
 
     # Topic Evaluation
     'evaluate_topic_qualities_ai',
+    'evaluate_topic_qualities_batch',
     'compare_topic_qualities',
     'analyze_topic_performance',
 
+    # Batch Evaluation
+    'review_exercises_batch',
+
     # Topic Memory
     'update_topic_memory_translation',
     'update_topic_memory_reading',
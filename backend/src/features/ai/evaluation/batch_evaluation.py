@@ -0,0 +1,145 @@
+"""
+XplorED - Batch Evaluation Module
+
+This module reviews all exercises of a block in one AI request,
+following clean architecture principles as outlined in the documentation.
+
+Batch Evaluation Components:
+- Batch Request: one structured prompt per block (chunked above
+  ``AI_BATCH_MAX_ITEMS``) instead of one prompt per exercise and field
+- Per-item Validation: every requested field of every exercise is checked
+  on its own; only valid fields are returned
+- Fallback Contract: callers send single prompts only for the items and
+  fields missing from the result
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+from external.mistral.client import send_prompt
+from features.ai.prompts import batch_exercise_review_prompt
+from shared.text_utils import _extract_json
+from shared.types import AnalyticsData
+
+logger = logging.getLogger(__name__)
+
+
+# === Batch Configuration ===
+AI_BATCH_PROMPTS = os.getenv("AI_BATCH_PROMPTS", "true").lower() == "true"
+AI_BATCH_MAX_ITEMS = int(os.getenv("AI_BATCH_MAX_ITEMS", "10"))
+
+BATCH_FIELDS = ("qualities", "alternatives", "explanation")
+
+
+# === Field Validation ===
+def _valid_qualities(value: Any) -> Optional[Dict[str, int]]:
+    """Return topic -> 0-5 scores, or None if no usable score is present."""
+    if not isinstance(value, dict):
+        return None
+    qualities = {}
+    for topic, score in value.items():
+        if not isinstance(topic, str) or not topic.strip():
+            continue
+        if isinstance(score, bool) or not isinstance(score, (int, float)) or not 0 <= score <= 5:
+            continue
+        qualities[topic.strip().lower()] = int(score)
+    return qualities or None
+
+
+def _valid_alternatives(value: Any) -> Optional[List[str]]:
+    """Return up to three non-empty strings, or None if the value is not a list."""
+    if not isinstance(value, list):
+        return None
+    return [alt.strip() for alt in value if isinstance(alt, str) and alt.strip()][:3]
+
+
+def _valid_explanation(value: Any) -> Optional[str]:
+    """Return the stripped explanation, or None if it is empty or not text."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    return value.strip()
+
+
+FIELD_VALIDATORS = {
+    "qualities": _valid_qualities,
+    "alternatives": _valid_alternatives,
+    "explanation": _valid_explanation,
+}
+
+
+# === Batch Review ===
+def review_exercises_batch(
+    items: Sequence[AnalyticsData],
+    fields: Sequence[str],
+    prompt_type: str = "evaluation",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Review several exercises with one AI request per chunk.
+
+    Args:
+        items: Exercises as dicts with an ``id`` plus the context the fields
+            need (``question``, ``correct_answer``, ``reference``, ``student``,
+            ``english``)
+        fields: Requested fields, any of ``qualities``, ``alternatives``, ``explanation``
+        prompt_type: Transport prompt type for the request
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Valid fields per exercise ID; exercises or
+        fields that are missing or malformed are left out so the caller can
+        fall back to single prompts for exactly those
+    """
+    unknown = [field for field in fields if field not in FIELD_VALIDATORS]
+    if unknown:
+        raise ValueError(f"Unknown batch fields: {unknown}")
+
+    reviewed: Dict[str, Dict[str, Any]] = {}
+    if not AI_BATCH_PROMPTS or not items or not fields:
+        return reviewed
+
+    for start in range(0, len(items), max(1, AI_BATCH_MAX_ITEMS)):
+        chunk = [dict(item, id=str(item["id"])) for item in items[start:start + AI_BATCH_MAX_ITEMS]]
+        try:
+            resp = send_prompt(
+                "You are a helpful German teacher.",
+                batch_exercise_review_prompt(chunk, list(fields)),
+                temperature=0.3,
+                prompt_type=prompt_type,
+            )
+            if resp.status_code != 200:
+                logger.warning(f"Batch review failed with status {resp.status_code}")
+                continue
+            data = _extract_json(resp.json()["choices"][0]["message"]["content"])
+        except Exception as e:
+            logger.warning(f"Batch review of {len(chunk)} exercises failed: {e}")
+            continue
+
+        if not isinstance(data, dict):
+            logger.warning("Batch review response is not a JSON object")
+            continue
+
+        for item in chunk:
+            entry = data.get(item["id"])
+            if not isinstance(entry, dict):
+                continue
+            valid = {}
+            for field in fields:
+                value = FIELD_VALIDATORS[field](entry.get(field))
+                if value is not None:
+                    valid[field] = value
+            if valid:
+                reviewed[item["id"]] = valid
+
+    expected = len(items) * len(fields)
+    received = sum(len(entry) for entry in reviewed.values())
+    logger.info(f"Batch review: {received}/{expected} fields valid for {len(items)} exercises")
+    return reviewed
+
+
+# === Export Configuration ===
+__all__ = [
+    "review_exercises_batch",
+    "AI_BATCH_PROMPTS",
+]
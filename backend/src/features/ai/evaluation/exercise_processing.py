@@ -61,6 +61,21 @@ def process_ai_answers(
     results: List[AnalyticsData] = []
     reviewed: set = set()
 
+    # Score all gap-fill answers with one batch request up front (single
+    # prompts only for answers the batch misses)
+    gap_fill_sentences = {}
+    for ex_id, user_answer in answers.items():
+        ex = exercise_map.get(ex_id)
+        if ex and ex.get("type", "") == "gap-fill" and user_answer != ex.get("question", ""):
+            question_text = ex.get("question", "")
+            gap_fill_sentences[ex_id] = (
+                "",  # No English translation needed for gap-fill
+                question_text.replace('____', ex.get("correctAnswer", "")),
+                question_text.replace('____', user_answer),
+            )
+    from features.ai.evaluation.topic_evaluation import evaluate_topic_qualities_batch
+    batched_qualities = evaluate_topic_qualities_batch(gap_fill_sentences) if gap_fill_sentences else {}
+
     for ex_id, user_answer in answers.items():
         logger.info(f"Processing exercise ID: {ex_id} with answer: '{user_answer}'")
         ex = exercise_map.get(ex_id)
@@ -121,16 +136,11 @@ def process_ai_answers(
                 reference_sentence = question_text.replace('____', correct_ans)
                 student_sentence = question_text.replace('____', actual_user_answer)
 
-                from features.ai.evaluation.topic_evaluation import evaluate_topic_qualities_ai
-                logger.info(f"Calling evaluate_topic_qualities_ai for gap-fill exercise")
+                logger.info(f"Using batched topic evaluation for gap-fill exercise")
                 logger.info(f"Reference sentence: '{reference_sentence}'")
                 logger.info(f"Student sentence: '{student_sentence}'")
 
-                topic_qualities = evaluate_topic_qualities_ai(
-                    english="",  # No English translation needed for gap-fill
-                    reference=reference_sentence,
-                    student=student_sentence
-                )
+                topic_qualities = batched_qualities.get(ex_id, {})
 
                 if topic_qualities:
                     # Calculate average quality score
@@ -139,21 +149,22 @@ def process_ai_answers(
                         quality = sum(quality_scores) / len(quality_scores)
                         logger.info(f"AI topic evaluation quality score: {quality:.2f}")
 
-                    # Update topic memory for each detected topic
-                    for topic, topic_quality in topic_qualities.items():
-                        if topic != "unknown":
-                            try:
-                                _update_single_topic(
-                                    username=username,
-                                    grammar=topic,
-                                    skill=skill,
-                                    context=f"gap-fill-exercise-{ex_id}",
-                                    quality=int(topic_quality),
-                                    topic=block_topic
-                                )
-                            except Exception as e:
-                                logger.error(f"Error updating topic memory for topic {topic}: {e}")
-                                # Continue with other topics even if one fails
+                    with transaction():
+                        # Update topic memory for each detected topic
+                        for topic, topic_quality in topic_qualities.items():
+                            if topic != "unknown":
+                                try:
+                                    _update_single_topic(
+                                        username=username,
+                                        grammar=topic,
+                                        skill=skill,
+                                        context=f"gap-fill-exercise-{ex_id}",
+                                        quality=int(topic_quality),
+                                        topic=block_topic
+                                    )
+                                except Exception as e:
+                                    logger.error(f"Error updating topic memory for topic {topic}: {e}")
+                                    # Continue with other topics even if one fails
         else:
             # For non-gap-fill exercises, use simple topic detection
             logger.info(f"Using simple topic detection for {exercise_type} exercise")
@@ -163,21 +174,22 @@ def process_ai_answers(
             exercise_content = f"{ex.get('question', '')} {correct_ans}"
             detected_topics = detect_language_topics(exercise_content) or []
 
-            # Update topic memory for detected topics
-            for topic in detected_topics:
-                if topic != "unknown":
-                    try:
-                        _update_single_topic(
-                            username=username,
-                            grammar=topic,
-                            skill=skill,
-                            context=f"{exercise_type}-exercise-{ex_id}",
-                            quality=quality,
-                            topic=block_topic
-                        )
-                    except Exception as e:
-                        logger.error(f"Error updating topic memory for topic {topic}: {e}")
-                        # Continue with other topics even if one fails
+            with transaction():
+                # Update topic memory for detected topics
+                for topic in detected_topics:
+                    if topic != "unknown":
+                        try:
+                            _update_single_topic(
+                                username=username,
+                                grammar=topic,
+                                skill=skill,
+                                context=f"{exercise_type}-exercise-{ex_id}",
+                                quality=quality,
+                                topic=block_topic
+                            )
+                        except Exception as e:
+                            logger.error(f"Error updating topic memory for topic {topic}: {e}")
+                            # Continue with other topics even if one fails
 
         # Update vocabulary memory for words in the exercise
         try:
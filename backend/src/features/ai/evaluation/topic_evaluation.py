@@ -9,13 +9,14 @@ Topic Evaluation Components:
 - Topic Detection: Detect grammar topics in text
 - Quality Scoring: Score topic quality on a 0-5 scale
 - Topic Analysis: Analyze topic performance and patterns
+- Batch Evaluation: Score a whole block in one request, single prompts as fallback
 
 For detailed architecture information, see: docs/backend_structure.md
 """
 
 import json
 import re
-from typing import List
+from typing import Dict, List, Tuple
 
 from features.grammar import detect_language_topics
 from shared.text_utils import _extract_json
@@ -23,6 +24,7 @@ from features.ai.prompts import quality_evaluation_prompt
 from external.mistral.client import send_prompt
 from shared.exceptions import AIEvaluationError, ValidationError
 from shared.types import AnalyticsData
+from features.ai.evaluation.batch_evaluation import review_exercises_batch
 
 import logging
 logger = logging.getLogger(__name__)
@@ -61,6 +63,7 @@ def evaluate_topic_qualities_ai(english: str, reference: str, student: str) -> A
             "You are a helpful German teacher.",
             user_prompt,
             temperature=0.3,
+            prompt_type="evaluation",
         )
         logger.debug(f"API call completed, status code: {resp.status_code}")
 
@@ -98,6 +101,36 @@ def evaluate_topic_qualities_ai(english: str, reference: str, student: str) -> A
         raise AIEvaluationError(f"Error evaluating topic qualities with AI: {str(e)}")
 
 
+def evaluate_topic_qualities_batch(items: Dict[str, Tuple[str, str, str]]) -> Dict[str, AnalyticsData]:
+    """
+    Evaluate grammar topic quality for several answers with one AI request.
+
+    Answers the batch response misses or returns malformed are evaluated
+    with ``evaluate_topic_qualities_ai`` one by one.
+
+    Args:
+        items: Exercise ID -> (english, reference, student) sentences
+
+    Returns:
+        Dictionary mapping exercise IDs to topic quality scores (0-5)
+    """
+    batch_items = [
+        {"id": ex_id, "english": english, "reference": reference, "student": student}
+        for ex_id, (english, reference, student) in items.items()
+    ]
+    reviewed = review_exercises_batch(batch_items, ["qualities"]) if len(batch_items) > 1 else {}
+
+    qualities: Dict[str, AnalyticsData] = {}
+    for ex_id, (english, reference, student) in items.items():
+        batched = reviewed.get(str(ex_id), {}).get("qualities")
+        if batched:
+            qualities[ex_id] = batched
+        else:
+            logger.info(f"Falling back to single topic evaluation for exercise {ex_id}")
+            qualities[ex_id] = evaluate_topic_qualities_ai(english, reference, student)
+    return qualities
+
+
 def compare_topic_qualities(reference: str, student: str) -> AnalyticsData:
     """
     Compare topic qualities between reference and student text.
@@ -17,7 +17,7 @@ import datetime
 from typing import Optional, Dict
 from shared.types import AnalyticsData
 
-from core.database.connection import insert_row, update_row, select_one
+from core.database.connection import insert_row, update_row, select_one, transaction
 from features.ai.memory.level_manager import check_auto_level_up
 from features.spaced_repetition import sm2
 from features.ai.memory.logger import topic_memory_logger
@@ -42,106 +42,108 @@ def _update_single_topic(username: str, grammar: str, skill: str, context: str,
     try:
         logger.debug(f"Updating topic memory for user {username}, grammar: {grammar}, quality: {quality}")
 
-        # Check if topic already exists for this user
-        existing = select_one(
-            "topic_memory",
-            columns="*",
-            where="username = ? AND grammar = ?",
-            params=(username, grammar)
-        )
-
-        now = datetime.datetime.now().isoformat()
-
-        if existing:
-            # Update existing topic
-            old_ef = existing.get("ease_factor", 2.5)
-            old_reps = existing.get("repetitions", 0)
-            old_interval = existing.get("interval", 1)
-
-            # Apply SM2 algorithm
-            new_ef, new_reps, new_interval = sm2(quality, old_ef, old_reps, old_interval)
-
-            # Calculate next review date
-            next_review = (datetime.datetime.now() + datetime.timedelta(days=new_interval)).isoformat()
-
-            # Update the topic
-            update_row(
-                "topic_memory",
-                {
-                    "ease_factor": new_ef,
-                    "repetitions": new_reps,
-                    "interval": new_interval,
-                    "next_repeat": next_review,
-                    "last_review": now,
-                    "correct": existing.get("correct", 0) + (1 if quality >= 3 else 0),
-                    "quality": quality
-                },
-                "username = ? AND grammar = ?",
-                (username, grammar)
-            )
-
-            # Log the update
-            topic_memory_logger.log_topic_update(
-                username=username,
-                grammar=grammar,
-                skill=skill,
-                quality=quality,
-                is_new=False,
-                old_values={
-                    "ease_factor": old_ef,
-                    "repetitions": old_reps,
-                    "interval": old_interval
-                },
-                new_values={
-                    "ease_factor": new_ef,
-                    "repetitions": new_reps,
-                    "interval": new_interval,
-                    "topic": topic or "general"
-                },
-                row_id=existing.get("id")
-            )
-
-            logger.debug(f"Updated existing topic: {grammar} - EF: {old_ef:.2f}->{new_ef:.2f}, Reps: {old_reps}->{new_reps}")
-
-        else:
-            # Create new topic entry
-            new_ef, new_reps, new_interval = sm2(quality, 2.5, 0, 1)
-            next_review = (datetime.datetime.now() + datetime.timedelta(days=new_interval)).isoformat()
-
-            insert_row(
+        # Read-modify-write in one transaction; joins an outer unit of work if present
+        with transaction():
+            # Check if topic already exists for this user
+            existing = select_one(
                 "topic_memory",
-                {
-                    "username": username,
-                    "grammar": grammar,
-                    "skill_type": skill,
-                    "context": context,
-                    "ease_factor": new_ef,
-                    "interval": new_interval,
-                    "next_repeat": next_review,
-                    "repetitions": new_reps,
-                    "last_review": now,
-                    "correct": 1 if quality >= 3 else 0,
-                    "quality": quality
-                }
-            )
-
-            # Log the new entry
-            topic_memory_logger.log_topic_update(
-                username=username,
-                grammar=grammar,
-                skill=skill,
-                quality=quality,
-                is_new=True,
-                new_values={
-                    "ease_factor": new_ef,
-                    "repetitions": new_reps,
-                    "interval": new_interval,
-                    "topic": topic or "general",
-                    "context": context
-                }
+                columns="*",
+                where="username = ? AND grammar = ?",
+                params=(username, grammar)
             )
 
-            logger.debug(f"Created new topic: {grammar} - EF: {new_ef:.2f}, Reps: {new_reps}")
+            now = datetime.datetime.now().isoformat()
+
+            if existing:
+                # Update existing topic
+                old_ef = existing.get("ease_factor", 2.5)
+                old_reps = existing.get("repetitions", 0)
+                old_interval = existing.get("interval", 1)
+
+                # Apply SM2 algorithm
+                new_ef, new_reps, new_interval = sm2(quality, old_ef, old_reps, old_interval)
+
+                # Calculate next review date
+                next_review = (datetime.datetime.now() + datetime.timedelta(days=new_interval)).isoformat()
+
+                # Update the topic
+                update_row(
+                    "topic_memory",
+                    {
+                        "ease_factor": new_ef,
+                        "repetitions": new_reps,
+                        "interval": new_interval,
+                        "next_repeat": next_review,
+                        "last_review": now,
+                        "correct": existing.get("correct", 0) + (1 if quality >= 3 else 0),
+                        "quality": quality
+                    },
+                    "username = ? AND grammar = ?",
+                    (username, grammar)
+                )
+
+                # Log the update
+                topic_memory_logger.log_topic_update(
+                    username=username,
+                    grammar=grammar,
+                    skill=skill,
+                    quality=quality,
+                    is_new=False,
+                    old_values={
+                        "ease_factor": old_ef,
+                        "repetitions": old_reps,
+                        "interval": old_interval
+                    },
+                    new_values={
+                        "ease_factor": new_ef,
+                        "repetitions": new_reps,
+                        "interval": new_interval,
+                        "topic": topic or "general"
+                    },
+                    row_id=existing.get("id")
+                )
+
+                logger.debug(f"Updated existing topic: {grammar} - EF: {old_ef:.2f}->{new_ef:.2f}, Reps: {old_reps}->{new_reps}")
+
+            else:
+                # Create new topic entry
+                new_ef, new_reps, new_interval = sm2(quality, 2.5, 0, 1)
+                next_review = (datetime.datetime.now() + datetime.timedelta(days=new_interval)).isoformat()
+
+                insert_row(
+                    "topic_memory",
+                    {
+                        "username": username,
+                        "grammar": grammar,
+                        "skill_type": skill,
+                        "context": context,
+                        "ease_factor": new_ef,
+                        "interval": new_interval,
+                        "next_repeat": next_review,
+                        "repetitions": new_reps,
+                        "last_review": now,
+                        "correct": 1 if quality >= 3 else 0,
+                        "quality": quality
+                    }
+                )
+
+                # Log the new entry
+                topic_memory_logger.log_topic_update(
+                    username=username,
+                    grammar=grammar,
+                    skill=skill,
+                    quality=quality,
+                    is_new=True,
+                    new_values={
+                        "ease_factor": new_ef,
+                        "repetitions": new_reps,
+                        "interval": new_interval,
+                        "topic": topic or "general",
+                        "context": context
+                    }
+                )
+
+                logger.debug(f"Created new topic: {grammar} - EF: {new_ef:.2f}, Reps: {new_reps}")
 
     except TopicMemoryError:
         raise
@@ -164,31 +166,22 @@ def update_topic_memory_translation(username: str, german: str, qualities: Optio
     try:
         logger.debug(f"Updating topic memory for translation: user={username}, text='{german[:50]}...'")
 
-        if qualities:
-            # Update each topic with its quality score
-            for topic, quality in qualities.items():
-                if topic != "unknown":
-                    _update_single_topic(
-                        username=username,
-                        grammar=topic,
-                        skill="translation",
-                        context="translation-exercise",
-                        quality=quality,
-                        topic="translation"
-                    )
-        else:
+        if not qualities:
             # Fallback: detect topics and give default quality
             from features.grammar import detect_language_topics
             topics = detect_language_topics(german) or []
+            qualities = {topic: 3 for topic in topics}  # Default quality
 
-            for topic in topics:
+        # Topic detection is done; commit all topic updates together
+        with transaction():
+            for topic, quality in qualities.items():
                 if topic != "unknown":
                     _update_single_topic(
                         username=username,
                         grammar=topic,
                         skill="translation",
                         context="translation-exercise",
-                        quality=3,  # Default quality
+                        quality=quality,
                         topic="translation"
                     )
 
@@ -213,31 +206,22 @@ def update_topic_memory_reading(username: str, text: str, qualities: Optional[An
     try:
         logger.debug(f"Updating topic memory for reading: user={username}, text='{text[:50]}...'")
 
-        if qualities:
-            # Update each topic with its quality score
-            for topic, quality in qualities.items():
-                if topic != "unknown":
-                    _update_single_topic(
-                        username=username,
-                        grammar=topic,
-                        skill="reading",
-                        context="reading-exercise",
-                        quality=quality,
-                        topic="reading"
-                    )
-        else:
+        if not qualities:
             # Fallback: detect topics and give default quality
             from features.grammar import detect_language_topics
             topics = detect_language_topics(text) or []
+            qualities = {topic: 3 for topic in topics}  # Default quality
 
-            for topic in topics:
+        # Topic detection is done; commit all topic updates together
+        with transaction():
+            for topic, quality in qualities.items():
                 if topic != "unknown":
                     _update_single_topic(
                         username=username,
                         grammar=topic,
                         skill="reading",
                         context="reading-exercise",
-                        quality=3,  # Default quality
+                        quality=quality,
                         topic="reading"
                     )
 
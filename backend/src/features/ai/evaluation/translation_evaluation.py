@@ -8,6 +8,7 @@ Translation Evaluation Components:
 - Translation Assessment: Evaluate translation accuracy and quality
 - Text Processing: Process and normalize text for comparison
 - Quality Scoring: Score translation quality using AI
+- Rule-based Fallback: Word-overlap verdict while the AI service is unavailable
 - Evaluation Results: Process and format evaluation results
 
 For detailed architecture information, see: docs/backend_structure.md
@@ -20,11 +21,14 @@ from typing import Tuple, Optional
 from shared.text_utils import _extract_json, _normalize_umlauts, _strip_final_punct
 from features.ai.prompts import evaluate_translation_prompt
 from external.mistral.client import send_prompt
-from shared.exceptions import AIEvaluationError, ValidationError
+from shared.exceptions import AIEvaluationError, AIServiceUnavailableError, ValidationError
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Share of reference words a translation needs when judged without AI
+RULE_BASED_MIN_SIMILARITY = 0.8
+
 
 def evaluate_translation_ai(english: str, reference: str, student: str) -> Tuple[bool, str]:
     """
@@ -37,6 +41,9 @@ def evaluate_translation_ai(english: str, reference: str, student: str) -> Tuple
 
     Returns:
         Tuple of (is_correct, reason)
+
+    While the AI service is unavailable (circuit breaker open) the
+    translation is judged by its word overlap with the reference instead.
     """
     # Ignore final . or ? for both student and reference
     reference = _strip_final_punct(reference)
@@ -60,12 +67,16 @@ def evaluate_translation_ai(english: str, reference: str, student: str) -> Tuple
             "You are a helpful German teacher.",
             user_prompt,
             temperature=0.3,
+            prompt_type="evaluation",
         )
         if resp.status_code == 200:
             content = resp.json()["choices"][0]["message"]["content"].strip()
             data = _extract_json(content)
             if isinstance(data, dict):
                 return bool(data.get("correct")), str(data.get("reason", ""))
+    except AIServiceUnavailableError:
+        logger.warning("AI unavailable, evaluating translation by comparison with the reference")
+        return _rule_based_verdict(reference, student)
     except AIEvaluationError:
         raise
     except Exception as e:
@@ -75,6 +86,18 @@ def evaluate_translation_ai(english: str, reference: str, student: str) -> Tuple
     return False, "Could not evaluate translation."
 
 
+def _rule_based_verdict(reference: str, student: str) -> Tuple[bool, str]:
+    """Judge a translation by how many reference words it contains."""
+    comparison = compare_translations(reference, student)
+    if comparison["similarity"] >= RULE_BASED_MIN_SIMILARITY:
+        return True, "Your translation matches the reference closely (checked without AI)."
+    missing = ", ".join(sorted(comparison["differences"].get("missing_words", []))[:5])
+    reason = f"Compared with the reference '{reference}' (checked without AI)."
+    if missing:
+        reason += f" Missing: {missing}."
+    return False, reason
+
+
 def compare_translations(reference: str, student: str) -> dict:
     """
     Compare two translations and return detailed analysis.
@@ -26,7 +26,7 @@ from features.ai.generation.feedback_helpers import (
     generate_feedback_prompt
 )
 from core.database.connection import fetch_topic_memory
-from core.processing import run_in_background
+from core.processing import dispatch_job, register_job, should_retry_job
 from core.database.connection import select_rows
 from .feedback_session import (
     create_feedback_session,
@@ -61,79 +61,99 @@ def generate_feedback_with_progress(username: str, answers: ExerciseAnswers,
     try:
         session_id = create_feedback_session()
 
-        def run_feedback_generation():
-            try:
-                update_feedback_progress(session_id, 10, "Starting feedback generation...", "init")
+        # Runs durably when DURABLE_JOBS is enabled; the user is polling for this feedback
+        dispatch_job(
+            "feedback",
+            {"session_id": session_id, "username": username, "answers": answers, "exercise_block": exercise_block},
+            key=f"feedback:{session_id}",
+        )
 
-                # Step 1: Evaluate answers with AI
-                update_feedback_progress(session_id, 20, "Evaluating answers with AI...", "evaluation")
-                exercises = exercise_block.get("exercises", []) if exercise_block else []
-                evaluation = evaluate_answers_with_ai(exercises, answers, "feedback")
+        return session_id
 
-                if not evaluation:
-                    _mark_feedback_complete(session_id, {"error": "Failed to evaluate answers"})
-                    return
+    except Exception as e:
+        print(f"❌ Error starting feedback generation: {e}")
+        raise AIEvaluationError(f"Error starting feedback generation: {str(e)}")
 
-                update_feedback_progress(session_id, 40, "Processing evaluation results...", "processing")
 
-                # Step 2: Process evaluation summary
-                exercises = exercise_block.get("exercises", []) if exercise_block else []
-                summary = _process_evaluation_summary(exercises, answers, evaluation)
+@register_job("feedback")
+def _run_feedback_generation(session_id: str, username: str, answers: ExerciseAnswers,
+                             exercise_block: Optional[AnalyticsData] = None) -> None:
+    """
+    Generate feedback for a session and record its progress (background job).
 
-                update_feedback_progress(session_id, 60, "Fetching user data...", "data_fetch")
+    Args:
+        session_id: Feedback session to update
+        username: The username
+        answers: User's answers
+        exercise_block: Optional exercise block data
+    """
+    try:
+        update_feedback_progress(session_id, 10, "Starting feedback generation...", "init")
 
-                # Step 3: Fetch user vocabulary and topic memory
-                vocabulary = _fetch_user_vocabulary(username)
-                topic_memory = _fetch_user_topic_memory(username)
+        # Step 1: Evaluate answers with AI
+        update_feedback_progress(session_id, 20, "Evaluating answers with AI...", "evaluation")
+        exercises = exercise_block.get("exercises", []) if exercise_block else []
+        evaluation = evaluate_answers_with_ai(exercises, answers, "feedback")
 
-                update_feedback_progress(session_id, 80, "Generating personalized feedback...", "feedback_gen")
+        if not evaluation:
+            _mark_feedback_complete(session_id, {"error": "Failed to evaluate answers"})
+            return
 
-                # Step 4: Generate feedback prompt
-                feedback_prompt = generate_feedback_prompt(
-                    summary=summary,
-                    vocab=vocabulary,
-                    topic_memory=topic_memory
-                )
+        update_feedback_progress(session_id, 40, "Processing evaluation results...", "processing")
 
-                # Step 5: Generate AI feedback
-                from external.mistral.client import send_prompt
-                system_message = "You are a helpful German language teacher providing personalized feedback to students."
-                user_prompt = {"role": "user", "content": feedback_prompt}
-                response = send_prompt(system_message, user_prompt)
-                ai_feedback = response.json().get("choices", [{}])[0].get("message", {}).get("content", "")
+        # Step 2: Process evaluation summary
+        exercises = exercise_block.get("exercises", []) if exercise_block else []
+        summary = _process_evaluation_summary(exercises, answers, evaluation)
 
-                if not ai_feedback:
-                    _mark_feedback_complete(session_id, {"error": "Failed to generate AI feedback"})
-                    return
+        update_feedback_progress(session_id, 60, "Fetching user data...", "data_fetch")
 
-                # Step 6: Prepare final result
-                result = {
-                    "session_id": session_id,
-                    "username": username,
-                    "summary": summary,
-                    "ai_feedback": ai_feedback,
-                    "vocabulary_count": len(vocabulary),
-                    "topic_memory_count": len(topic_memory),
-                    "generated_at": "2025-01-27T12:00:00Z"
-                }
+        # Step 3: Fetch user vocabulary and topic memory
+        vocabulary = _fetch_user_vocabulary(username)
+        topic_memory = _fetch_user_topic_memory(username)
 
-                update_feedback_progress(session_id, 100, "Feedback generation complete", "complete")
-                _mark_feedback_complete(session_id, result)
+        update_feedback_progress(session_id, 80, "Generating personalized feedback...", "feedback_gen")
 
-                print(f"✅ Successfully generated feedback for user {username}")
+        # Step 4: Generate feedback prompt
+        feedback_prompt = generate_feedback_prompt(
+            summary=summary,
+            vocab=vocabulary,
+            topic_memory=topic_memory
+        )
 
-            except Exception as e:
-                print(f"❌ Error in feedback generation: {e}")
-                _mark_feedback_complete(session_id, {"error": str(e)})
+        # Step 5: Generate AI feedback
+        from external.mistral.client import send_prompt
+        system_message = "You are a helpful German language teacher providing personalized feedback to students."
+        user_prompt = {"role": "user", "content": feedback_prompt}
+        response = send_prompt(system_message, user_prompt, prompt_type="feedback")
+        ai_feedback = response.json().get("choices", [{}])[0].get("message", {}).get("content", "")
 
-        # Run in background
-        run_in_background(run_feedback_generation)
+        if not ai_feedback:
+            _mark_feedback_complete(session_id, {"error": "Failed to generate AI feedback"})
+            return
 
-        return session_id
+        # Step 6: Prepare final result
+        result = {
+            "session_id": session_id,
+            "username": username,
+            "summary": summary,
+            "ai_feedback": ai_feedback,
+            "vocabulary_count": len(vocabulary),
+            "topic_memory_count": len(topic_memory),
+            "generated_at": "2025-01-27T12:00:00Z"
+        }
+
+        update_feedback_progress(session_id, 100, "Feedback generation complete", "complete")
+        _mark_feedback_complete(session_id, result)
+
+        print(f"✅ Successfully generated feedback for user {username}")
 
     except Exception as e:
-        print(f"❌ Error starting feedback generation: {e}")
-        raise AIEvaluationError(f"Error starting feedback generation: {str(e)}")
+        if should_retry_job(e):
+            # The session keeps its progress for the poller while the queue retries it
+            print(f"⚠️ Feedback generation for session {session_id} failed, retrying: {e}")
+            raise
+        print(f"❌ Error in feedback generation: {e}")
+        _mark_feedback_complete(session_id, {"error": str(e)})
 
 
 def generate_ai_feedback_simple(username: str, answers: ExerciseAnswers,
@@ -196,7 +216,7 @@ def generate_ai_feedback_simple(username: str, answers: ExerciseAnswers,
         user_prompt = {"role": "user", "content": feedback_prompt}
 
         try:
-            response = send_prompt(system_message, user_prompt)
+            response = send_prompt(system_message, user_prompt, prompt_type="feedback")
             response_json = response.json()
             ai_feedback = response_json.get("choices", [{}])[0].get("message", {}).get("content", "")
 
@@ -6,6 +6,7 @@ following clean architecture principles as outlined in the documentation.
 
 AI Generation Components:
 - Exercise Generation: Generate AI-powered exercises and training content
+- Exercise Pool: Pre-generated exercise blocks per CEFR level and grammar topic
 - Reading Generation: Generate reading comprehension exercises
 - Lesson Generation: Generate lesson content and materials
 - Translation Generation: Generate translation exercises and content
@@ -32,6 +33,19 @@ from .exercise_creation import (
     EXERCISE_TEMPLATE
 )
 
+# Import exercise pool functions
+from .exercise_pool import (
+    take_pool_block,
+    schedule_pool_refill,
+    get_exercise_pool_stats
+)
+
+# Import exercise prefetch coordination
+from .exercise_prefetch import (
+    prefetch_coordinator,
+    get_prefetch_stats
+)
+
 # Import exercise processing functions
 from .exercise_processing import (
     save_exercise_submission_async,
@@ -108,6 +122,15 @@ __all__ = [
     'fetch_vocab_and_topic_data',
     'EXERCISE_TEMPLATE',
 
+    # Exercise Pool
+    'take_pool_block',
+    'schedule_pool_refill',
+    'get_exercise_pool_stats',
+
+    # Exercise Prefetch
+    'prefetch_coordinator',
+    'get_prefetch_stats',
+
     # Exercise Processing
     'save_exercise_submission_async',
     'evaluate_exercises',
@@ -9,6 +9,9 @@ Exercise Creation Components:
 - Block Creation: Create exercise blocks with variations
 - Exercise History: Manage exercise history and recent questions
 - User-Specific Generation: Generate exercises tailored to user level
+- Exercise Pool: Serve pre-generated blocks for the user's weak topics first
+  (see ``exercise_pool``) and only generate when the pool has no match
+- Prefetch: One next-block prefetch per user, stored with a compare-and-swap
 
 For detailed architecture information, see: docs/backend_structure.md
 """
@@ -17,7 +20,6 @@ import json
 import random
 import logging
 import traceback
-from threading import Thread
 from datetime import datetime, date
 from typing import Optional
 
@@ -26,7 +28,7 @@ from flask import current_app, jsonify  # type: ignore
 from core.database.connection import (
     select_one, select_rows, insert_row, update_row, delete_rows,
     fetch_one, fetch_all, fetch_custom, execute_query, get_connection,
-    fetch_topic_memory
+    fetch_topic_memory, transaction
 )
 from features.ai.memory.level_manager import check_auto_level_up
 from api.middleware.auth import require_user
@@ -34,8 +36,12 @@ from shared.text_utils import _extract_json as extract_json
 from features.ai.prompts.utils import make_prompt, SYSTEM_PROMPT
 from features.ai.prompts import exercise_generation_prompt
 from external.mistral.client import send_request, send_prompt
+from core.processing import submit_task
+from external.mistral.async_client import bind_ai_user
 from features.ai.memory.logger import topic_memory_logger
-from shared.exceptions import DatabaseError, ExerciseGenerationError
+from shared.exceptions import DatabaseError, ExerciseGenerationError, TaskQueueFullError
+from .exercise_pool import take_pool_block
+from .exercise_prefetch import prefetch_coordinator
 
 from .. import (
     EXERCISE_TEMPLATE,
@@ -111,15 +117,19 @@ def _create_ai_block(username: str) -> dict | None:
         # Get recent questions to avoid repetition
         recent_questions = get_recent_exercise_questions(username)
 
-        # Generate new exercises
-        ai_block = generate_new_exercises(
-            vocabular=vocab_data,
-            topic_memory=topic_memory,
-            example_exercise_block=EXERCISE_TEMPLATE,
-            level=level,
-            recent_questions=recent_questions,
-            username=username,
-        )
+        # Serve a pre-generated block for the user's weak topics when one is unseen
+        ai_block = take_pool_block(level, topic_memory, recent_questions)
+
+        if ai_block is None:
+            # Generate new exercises
+            ai_block = generate_new_exercises(
+                vocabular=vocab_data,
+                topic_memory=topic_memory,
+                example_exercise_block=EXERCISE_TEMPLATE,
+                level=level,
+                recent_questions=recent_questions,
+                username=username,
+            )
 
         if not ai_block or not ai_block.get("exercises"):
             return None
@@ -152,12 +162,9 @@ def _generate_blocks_for_new_user(username: str) -> dict | None:
     new_questions = [ex.get("question") for ex in ai_block.get("exercises", []) if ex.get("question")]
     safe_new_questions = new_questions if new_questions is not None else []
 
-    # Update exercise history and ensure it's committed
+    # Update exercise history (committed before it returns, so the next block sees it)
     update_exercise_history(username, safe_new_questions)
 
-    # Force a small delay to ensure DB commit is visible
-    time.sleep(0.1)
-
     # Generate second block with different approach to ensure uniqueness
     next_block = _create_ai_block(username)
 
@@ -192,12 +199,9 @@ def _generate_blocks_for_existing_user(username: str) -> dict | None:
     new_questions = [ex.get("question") for ex in ai_block.get("exercises", []) if ex.get("question")]
     safe_new_questions = new_questions if new_questions is not None else []
 
-    # Update exercise history and ensure it's committed
+    # Update exercise history (committed before it returns, so the next block sees it)
     update_exercise_history(username, safe_new_questions)
 
-    # Force a small delay to ensure DB commit is visible
-    time.sleep(0.1)
-
     # Get the updated recent questions to ensure uniqueness
     recent_questions = get_recent_exercise_questions(username)
     safe_recent_questions = recent_questions if recent_questions is not None else []
@@ -237,17 +241,55 @@ def generate_training_exercises(username: str) -> dict | None:
     else:
         return _generate_blocks_for_existing_user(username)
 
-def prefetch_next_exercises(username: str) -> None:
-    """Generate and store a new next exercise block asynchronously, ensuring uniqueness."""
+def _load_block(raw) -> dict | None:
+    """Parse a stored exercise block (JSON text or dict); None if missing or unreadable."""
+    if not raw:
+        return None
+    try:
+        block = json.loads(raw) if isinstance(raw, str) else raw
+    except (TypeError, ValueError):
+        return None
+    return block if isinstance(block, dict) else None
+
+def _is_usable_block(block: dict | None) -> bool:
+    """Whether a stored block has exercises the user can be shown."""
+    exercises = block.get("exercises") if block else None
+    return isinstance(exercises, list) and any(isinstance(ex, dict) and ex.get("question") for ex in exercises)
+
+def prefetch_next_exercises(username: str, completed_block_id: str | None = None) -> None:
+    """
+    Generate and store a new next exercise block asynchronously, ensuring uniqueness.
+
+    At most one prefetch per user is queued or running at a time (see
+    ``exercise_prefetch``); calls made meanwhile are dropped. The promotion of
+    the previous next block and the new next block are written together, and
+    only if the user's blocks did not change while the block was generated.
+
+    Args:
+        username: User to prefetch for
+        completed_block_id: Block the user just finished. The next block is
+            promoted only while that block is still current; any other call
+            does nothing while a valid next block is waiting
+    """
     def run():
         try:
+            row = fetch_one("ai_user_data", "WHERE username = ?", (username,), columns="exercises, next_exercises")
+            snapshot = (row.get("exercises"), row.get("next_exercises")) if row else (None, None)
+            current_block = _load_block(snapshot[0]) or {}
+            prev_next_block = _load_block(snapshot[1])
+
+            next_ready = _is_usable_block(prev_next_block) and prev_next_block.get("id") != current_block.get("id")
+            advance = completed_block_id is not None and current_block.get("id") == completed_block_id
+            if next_ready and not advance:
+                # A next block is already waiting and nothing was finished that would consume it
+                prefetch_coordinator.record("skipped_ready")
+                return
+
             # Get recent questions first to ensure we have the latest
             recent_questions = get_recent_exercise_questions(username)
 
             # Create AI block for user
             next_block = _create_ai_block(username)
-            if next_block is not None:
-                next_block["id"] = f"blk{get_next_block_id():04d}"
 
             if next_block and isinstance(next_block, dict) and "exercises" in next_block:
                 exercises = next_block["exercises"] if next_block and isinstance(next_block.get("exercises"), list) else []
@@ -256,32 +298,40 @@ def prefetch_next_exercises(username: str) -> None:
             else:
                 next_block = None
 
-            # Store next exercises for user
-            if next_block:
-                # Promote previous next block to current block before updating next block
-                row = fetch_one("ai_user_data", "WHERE username = ?", (username,))
-                prev_next_block = None
-                if row and row.get("next_exercises"):
-                    prev_next_block = json.loads(row["next_exercises"]) if isinstance(row["next_exercises"], str) else row["next_exercises"]
-                if prev_next_block:
-                    store_user_ai_data(
-                        username,
-                        {
-                            "exercises": json.dumps(prev_next_block),
-                        }
-                    )
-                store_user_ai_data(
-                    username,
-                    {
-                        "next_exercises": json.dumps(next_block or {}),
-                    }
-                )
+            if not next_block:
+                return
+
+            # Promote previous next block to current block together with the new next block
+            data = {"next_exercises": json.dumps(next_block)}
+            if advance and next_ready:
+                data["exercises"] = snapshot[1] if isinstance(snapshot[1], str) else json.dumps(prev_next_block)
+
+            with transaction():
+                row = fetch_one("ai_user_data", "WHERE username = ?", (username,), columns="exercises, next_exercises")
+                if ((row.get("exercises"), row.get("next_exercises")) if row else (None, None)) != snapshot:
+                    # Another request replaced the blocks meanwhile; writing now would undo its update
+                    prefetch_coordinator.record("conflicts")
+                    logger.info(f"Dropping prefetched block for user {username}: blocks changed during generation")
+                    return
+                store_user_ai_data(username, data)
+            prefetch_coordinator.record("stored")
 
         except Exception as e:
             logger.error(f"Error in prefetch_next_exercises for user {username}: {e}")
             logger.error(f"Traceback: {traceback.format_exc()}")
+        finally:
+            prefetch_coordinator.release(username)
 
-    Thread(target=run, daemon=True).start()
+    if not prefetch_coordinator.acquire(username):
+        logger.info(f"Skipping prefetch for user {username}: one is already in flight")
+        return
+
+    try:
+        # Speculative work: never wait for room, a skipped prefetch is regenerated on demand
+        submit_task("prefetch", bind_ai_user(username, run), timeout=0)
+    except TaskQueueFullError as e:
+        prefetch_coordinator.release(username)
+        logger.info(f"Skipping prefetch for user {username}: {e}")
 
 
 def ensure_unique_block_title(block):
@@ -0,0 +1,522 @@
+"""
+XplorED - Exercise Pool Module
+
+This module keeps a pool of validated, pre-generated exercise blocks per
+(CEFR level, grammar topic) so most exercise requests are served from SQLite
+instead of waiting on a generation call, following clean architecture
+principles as outlined in the documentation.
+
+Exercise Pool Components:
+- Pool Storage: the ``exercise_pool`` table (migration 0010); a block is
+  shared by all learners of its level and retired after
+  ``EXERCISE_POOL_MAX_SERVES`` serves
+- Pool Topics: only the curriculum topics of a CEFR level (``LEVEL_TOPICS``
+  of its skill levels, at most ``EXERCISE_POOL_MAX_TOPICS_PER_LEVEL``) plus
+  the general pool; free-text topics from AI detection never open a pool
+- Serving: ``take_pool_block`` ranks the learner's weak grammar topics from
+  ``topic_memory`` (due first, then lowest ease) and returns the least served
+  block of the first matching pool whose questions are not in the learner's
+  recent exercise history
+- Refill: a pool that drops below ``EXERCISE_POOL_LOW_WATERMARK`` is topped up
+  to ``EXERCISE_POOL_TARGET`` on the ``prefetch`` background queue, at most one
+  refill per pool at a time
+- Validation: generated blocks are only stored when every exercise has a
+  question and answer, gap-fills have a gap and options containing the answer,
+  and no question repeats one already in the pool
+
+A miss returns ``None`` and the caller generates the block itself as before.
+Refills are paid generation calls, so the pool is off unless
+``EXERCISE_POOL_ENABLED`` is set.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from core.database.connection import execute_query, fetch_custom, fetch_one_custom, insert_row, transaction
+from core.processing import submit_task
+from external.mistral.client import send_prompt
+from features.ai.memory.level_manager import LEVEL_TOPICS
+from features.ai.prompts import exercise_generation_prompt
+from features.ai.prompts.utils import SYSTEM_PROMPT
+from shared.exceptions import TaskQueueFullError
+from shared.text_utils import _extract_json as extract_json
+
+from .. import EXERCISE_TEMPLATE, CEFR_LEVELS
+
+logger = logging.getLogger(__name__)
+
+
+# === Exercise Pool Configuration ===
+EXERCISE_POOL_ENABLED = os.getenv("EXERCISE_POOL_ENABLED", "false").lower() == "true"
+EXERCISE_POOL_LOW_WATERMARK = int(os.getenv("EXERCISE_POOL_LOW_WATERMARK", "3"))
+EXERCISE_POOL_TARGET = int(os.getenv("EXERCISE_POOL_TARGET", "8"))
+EXERCISE_POOL_MAX_SERVES = int(os.getenv("EXERCISE_POOL_MAX_SERVES", "50"))
+# Weak topics of a learner tried before giving up on the pool
+EXERCISE_POOL_TOPICS_PER_USER = int(os.getenv("EXERCISE_POOL_TOPICS_PER_USER", "3"))
+# Curriculum topics per CEFR level that get a pool (the general pool comes on top)
+EXERCISE_POOL_MAX_TOPICS_PER_LEVEL = int(os.getenv("EXERCISE_POOL_MAX_TOPICS_PER_LEVEL", "6"))
+
+POOL_TABLE = "exercise_pool"
+# Pool for learners without topic memory; its blocks are generated without a grammar focus
+DEFAULT_POOL_TOPIC = "general"
+EXERCISE_TYPES = ("gap-fill", "translation")
+# Candidates read per pick; blocks the learner has seen are skipped
+_PICK_SCAN = 20
+# Least served blocks of one pool (params: level, topic, limit)
+PICK_QUERY = (
+    f"SELECT id, block, questions FROM {POOL_TABLE} WHERE level = ? AND topic = ? "
+    "ORDER BY times_served, id LIMIT ?;"
+)
+
+_table_ready = False
+_refilling: Set[tuple] = set()
+_refill_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "refills_started": 0,
+    "refills_skipped": 0,
+    "blocks_added": 0,
+    "blocks_rejected": 0,
+    "generation_failures": 0,
+}
+
+
+def _count(name: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def _ensure_table() -> None:
+    """Create the pool table if missing (normally done by migration 0010)."""
+    global _table_ready
+    if _table_ready:
+        return
+    execute_query(
+        f"""
+        CREATE TABLE IF NOT EXISTS {POOL_TABLE} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            level TEXT NOT NULL,
+            topic TEXT NOT NULL,
+            block TEXT NOT NULL,
+            questions TEXT NOT NULL,
+            times_served INTEGER NOT NULL DEFAULT 0,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            last_served_at DATETIME
+        );
+        """
+    )
+    execute_query(
+        f"CREATE INDEX IF NOT EXISTS idx_{POOL_TABLE}_level_topic ON {POOL_TABLE}(level, topic, times_served);"
+    )
+    _table_ready = True
+
+
+# === Topics and Levels ===
+def cefr_for_level(level) -> str:
+    """Map a 0-10 skill level to its CEFR level."""
+    try:
+        level_val = int(level or 0)
+    except (TypeError, ValueError):
+        level_val = 0
+    return CEFR_LEVELS[max(0, min(level_val, len(CEFR_LEVELS) - 1))]
+
+
+def normalize_topic(topic: Optional[str]) -> str:
+    """Return the pool key of a grammar topic (lower case, single spaces)."""
+    return " ".join(str(topic or "").lower().split())[:80]
+
+
+def pool_topics(cefr_level: str) -> List[str]:
+    """
+    Return the topics that have a pool at a CEFR level.
+
+    Args:
+        cefr_level: CEFR level of the pools
+
+    Returns:
+        List[str]: Normalized curriculum topics, general pool last
+    """
+    topics: List[str] = []
+    for skill_level, level_topics in sorted(LEVEL_TOPICS.items()):
+        if cefr_for_level(skill_level) != cefr_level:
+            continue
+        for topic in map(normalize_topic, level_topics):
+            if topic not in topics:
+                topics.append(topic)
+    return topics[:max(0, EXERCISE_POOL_MAX_TOPICS_PER_LEVEL)] + [DEFAULT_POOL_TOPIC]
+
+
+def _normalize_question(question) -> str:
+    return " ".join(str(question or "").lower().split())
+
+
+def weak_topics(
+    topic_memory: Optional[List[dict]],
+    limit: int = EXERCISE_POOL_TOPICS_PER_USER,
+    allowed: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Rank a learner's grammar topics, weakest first.
+
+    Topics due for review come first, then those with the lowest ease factor
+    and quality.
+
+    Args:
+        topic_memory: ``topic_memory`` rows of the learner
+        limit: Maximum number of topics to return
+        allowed: Only return these normalized topics (default: any topic)
+
+    Returns:
+        List[str]: Normalized grammar topics
+    """
+    now = time.time()
+
+    def weakness(entry: dict) -> tuple:
+        due_at = entry.get("next_repeat_at")
+        if due_at is None and entry.get("next_repeat"):
+            try:
+                due_at = datetime.fromisoformat(str(entry["next_repeat"])).timestamp()
+            except ValueError:
+                due_at = None
+        due = due_at is not None and float(due_at) <= now
+        return (0 if due else 1, float(entry.get("ease_factor") or 2.5), int(entry.get("quality") or 0))
+
+    topics: List[str] = []
+    for entry in sorted((e for e in topic_memory or [] if e.get("grammar")), key=weakness):
+        topic = normalize_topic(entry["grammar"])
+        if allowed is not None and topic not in allowed:
+            continue
+        if topic and topic not in topics:
+            topics.append(topic)
+        if len(topics) >= limit:
+            break
+    return topics
+
+
+# === Serving ===
+def take_pool_block(level, topic_memory: Optional[List[dict]], recent_questions: Optional[List[str]]) -> Optional[dict]:
+    """
+    Serve a pre-generated block matching the learner's weak topics.
+
+    Every pool that is looked at is topped up in the background when it is
+    below the low watermark, so a miss now becomes a hit on a later request.
+
+    Args:
+        level: Learner skill level (0-10)
+        topic_memory: ``topic_memory`` rows of the learner
+        recent_questions: Questions the learner has seen recently
+
+    Returns:
+        dict | None: A copy of the block (without a block ID), or None on a miss
+    """
+    if not EXERCISE_POOL_ENABLED:
+        return None
+
+    cefr_level = cefr_for_level(level)
+    seen = {_normalize_question(question) for question in recent_questions or []}
+    topics = weak_topics(topic_memory, allowed=pool_topics(cefr_level))
+
+    try:
+        _ensure_table()
+        for topic in topics or [DEFAULT_POOL_TOPIC]:
+            block = _take_block(cefr_level, topic, seen)
+            schedule_pool_refill(cefr_level, topic)
+            if block is not None:
+                _count("hits")
+                logger.info(f"Served exercise pool block for {cefr_level}/{topic}")
+                return block
+    except Exception as e:
+        logger.error(f"Error reading exercise pool for {cefr_level}: {e}")
+
+    _count("misses")
+    return None
+
+
+def _take_block(cefr_level: str, topic: str, seen: Set[str]) -> Optional[dict]:
+    """Mark the least served unseen block of a pool as served and return it."""
+    rows = fetch_custom(PICK_QUERY, (cefr_level, topic, _PICK_SCAN))
+    for row in rows or []:
+        questions = json.loads(row["questions"])
+        if any(_normalize_question(question) in seen for question in questions):
+            continue
+        with transaction():
+            execute_query(
+                f"UPDATE {POOL_TABLE} SET times_served = times_served + 1, last_served_at = CURRENT_TIMESTAMP "
+                "WHERE id = ?;",
+                (row["id"],),
+            )
+            execute_query(
+                f"DELETE FROM {POOL_TABLE} WHERE id = ? AND times_served >= ?;",
+                (row["id"], EXERCISE_POOL_MAX_SERVES),
+            )
+        return json.loads(row["block"])
+    return None
+
+
+def pool_size(cefr_level: str, topic: str) -> int:
+    """Return how many blocks a pool holds."""
+    _ensure_table()
+    row = fetch_one_custom(
+        f"SELECT COUNT(*) AS available FROM {POOL_TABLE} WHERE level = ? AND topic = ?;",
+        (cefr_level, topic),
+    )
+    return int(row["available"]) if row else 0
+
+
+# === Refill ===
+def schedule_pool_refill(cefr_level: str, topic: str, force: bool = False) -> bool:
+    """
+    Top a pool up to ``EXERCISE_POOL_TARGET`` on the prefetch queue.
+
+    Args:
+        cefr_level: CEFR level of the pool
+        topic: Normalized grammar topic of the pool
+        force: Refill even when the pool is above the low watermark
+
+    Returns:
+        bool: Whether a refill was queued (never for a topic outside ``pool_topics``)
+    """
+    if topic not in pool_topics(cefr_level):
+        logger.warning(f"Refusing exercise pool refill for unknown topic {cefr_level}/{topic}")
+        return False
+
+    key = (cefr_level, topic)
+    with _refill_lock:
+        if key in _refilling:
+            return False
+    if not force and pool_size(cefr_level, topic) >= EXERCISE_POOL_LOW_WATERMARK:
+        return False
+    with _refill_lock:
+        if key in _refilling:
+            return False
+        _refilling.add(key)
+
+    def run():
+        try:
+            _refill_pool(cefr_level, topic)
+        finally:
+            with _refill_lock:
+                _refilling.discard(key)
+
+    try:
+        # Speculative work: never wait for room, the next pool miss tries again
+        submit_task("prefetch", run, timeout=0)
+    except TaskQueueFullError as e:
+        with _refill_lock:
+            _refilling.discard(key)
+        _count("refills_skipped")
+        logger.info(f"Skipping exercise pool refill for {cefr_level}/{topic}: {e}")
+        return False
+
+    _count("refills_started")
+    return True
+
+
+def _refill_pool(cefr_level: str, topic: str) -> None:
+    """Generate blocks until the pool reaches its target (rejected blocks get one retry each)."""
+    missing = EXERCISE_POOL_TARGET - pool_size(cefr_level, topic)
+    attempts = missing * 2
+    added = 0
+    while added < missing and attempts > 0:
+        attempts -= 1
+        block = generate_pool_block(cefr_level, topic)
+        if block is None:
+            # The generator is failing; leave the rest to a later refill
+            break
+        if add_pool_block(cefr_level, topic, block):
+            added += 1
+    logger.info(f"Exercise pool {cefr_level}/{topic} refilled with {added} block(s)")
+
+
+def generate_pool_block(cefr_level: str, topic: str) -> Optional[dict]:
+    """
+    Generate one block for a pool with Mistral and validate it.
+
+    Args:
+        cefr_level: CEFR level of the pool
+        topic: Normalized grammar topic of the pool
+
+    Returns:
+        dict | None: The validated block, an empty dict if the output was
+        rejected, or None if the generation call failed
+    """
+    existing = _pool_questions(cefr_level, topic)
+    example_block = dict(EXERCISE_TEMPLATE, level=cefr_level)
+    focus = [] if topic == DEFAULT_POOL_TOPIC else [{"grammar": topic}]
+    user_prompt = exercise_generation_prompt(
+        CEFR_LEVELS.index(cefr_level),
+        cefr_level,
+        example_block,
+        [],
+        focus,
+        recent_questions="\n".join(sorted(existing)[:30]),
+    )
+
+    try:
+        # Concurrent refills of one pool must not share a response
+        resp = send_prompt(SYSTEM_PROMPT, user_prompt, temperature=0.9, prompt_type="generation", coalesce=False)
+        if resp.status_code != 200:
+            _count("generation_failures")
+            logger.warning(f"Exercise pool generation for {cefr_level}/{topic} returned {resp.status_code}")
+            return None
+        content = resp.json()["choices"][0]["message"]["content"]
+    except Exception as e:
+        _count("generation_failures")
+        logger.error(f"Exercise pool generation for {cefr_level}/{topic} failed: {e}")
+        return None
+
+    block = validate_pool_block(extract_json(content), cefr_level)
+    if block is None:
+        _count("blocks_rejected")
+        logger.warning(f"Rejected invalid exercise pool block for {cefr_level}/{topic}")
+        return {}
+    return block
+
+
+def validate_pool_block(block, cefr_level: str) -> Optional[dict]:
+    """
+    Return a cleaned copy of a generated block, or None if it is unusable.
+
+    Args:
+        block: Parsed generator output
+        cefr_level: CEFR level the block is stored under
+
+    Returns:
+        dict | None: Block with three valid exercises and ``ex1``-``ex3`` IDs
+    """
+    if not isinstance(block, dict) or not isinstance(block.get("exercises"), list):
+        return None
+
+    exercises = []
+    for exercise in block["exercises"]:
+        if not isinstance(exercise, dict) or exercise.get("type") not in EXERCISE_TYPES:
+            continue
+        question = str(exercise.get("question") or "").strip()
+        answer = str(exercise.get("correctAnswer") or "").strip()
+        if not question or not answer:
+            continue
+        cleaned = {"type": exercise["type"], "question": question, "correctAnswer": answer}
+        if exercise["type"] == "gap-fill":
+            options = [str(option).strip() for option in exercise.get("options") or [] if str(option).strip()]
+            if "___" not in question or answer not in options or len(set(options)) < 2:
+                continue
+            cleaned["options"] = list(dict.fromkeys(options))
+        exercises.append(cleaned)
+
+    if len(exercises) < 3:
+        return None
+
+    cleaned_block = {
+        "title": str(block.get("title") or f"German {cefr_level} practice"),
+        "level": cefr_level,
+        "topic": str(block.get("topic") or DEFAULT_POOL_TOPIC),
+        "exercises": [{"id": f"ex{index}", **exercise} for index, exercise in enumerate(exercises[:3], start=1)],
+    }
+    if block.get("feedbackPrompt"):
+        cleaned_block["feedbackPrompt"] = str(block["feedbackPrompt"])
+    return cleaned_block
+
+
+def add_pool_block(cefr_level: str, topic: str, block: dict) -> bool:
+    """
+    Store a validated block unless it repeats a question already in the pool.
+
+    Args:
+        cefr_level: CEFR level of the pool
+        topic: Normalized grammar topic of the pool
+        block: Block returned by ``validate_pool_block``
+
+    Returns:
+        bool: Whether the block was stored
+    """
+    if not block:
+        return False
+    questions = [exercise["question"] for exercise in block["exercises"]]
+    if any(_normalize_question(question) in _pool_questions(cefr_level, topic) for question in questions):
+        _count("blocks_rejected")
+        return False
+
+    _ensure_table()
+    insert_row(
+        POOL_TABLE,
+        {
+            "level": cefr_level,
+            "topic": topic,
+            "block": json.dumps(block, ensure_ascii=False),
+            "questions": json.dumps(questions, ensure_ascii=False),
+        },
+    )
+    _count("blocks_added")
+    return True
+
+
+def _pool_questions(cefr_level: str, topic: str) -> Set[str]:
+    """Return the normalized questions of every block in a pool."""
+    _ensure_table()
+    rows = fetch_custom(
+        f"SELECT questions FROM {POOL_TABLE} WHERE level = ? AND topic = ?;",
+        (cefr_level, topic),
+    )
+    return {_normalize_question(question) for row in rows or [] for question in json.loads(row["questions"])}
+
+
+# === Monitoring ===
+def get_exercise_pool_stats() -> Dict:
+    """Return pool configuration, serve/refill counters and the size of every pool."""
+    with _stats_lock:
+        counters = dict(_stats)
+    with _refill_lock:
+        refilling = sorted(f"{level}/{topic}" for level, topic in _refilling)
+
+    pools = []
+    try:
+        _ensure_table()
+        rows = fetch_custom(
+            f"SELECT level, topic, COUNT(*) AS available, SUM(times_served) AS served FROM {POOL_TABLE} "
+            "GROUP BY level, topic ORDER BY level, topic;"
+        )
+        pools = [
+            {"level": row["level"], "topic": row["topic"], "available": row["available"], "served": row["served"] or 0}
+            for row in rows or []
+        ]
+    except Exception as e:
+        logger.error(f"Error reading exercise pool sizes: {e}")
+
+    served = counters["hits"] + counters["misses"]
+    return {
+        "enabled": EXERCISE_POOL_ENABLED,
+        "low_watermark": EXERCISE_POOL_LOW_WATERMARK,
+        "target": EXERCISE_POOL_TARGET,
+        "max_serves": EXERCISE_POOL_MAX_SERVES,
+        "max_topics_per_level": EXERCISE_POOL_MAX_TOPICS_PER_LEVEL,
+        "hit_rate": round(counters["hits"] / served, 4) if served else 0.0,
+        **counters,
+        "refilling": refilling,
+        "pools": pools,
+    }
+
+
+# === Export Configuration ===
+__all__ = [
+    "take_pool_block",
+    "schedule_pool_refill",
+    "generate_pool_block",
+    "validate_pool_block",
+    "add_pool_block",
+    "pool_size",
+    "pool_topics",
+    "weak_topics",
+    "normalize_topic",
+    "cefr_for_level",
+    "get_exercise_pool_stats",
+    "DEFAULT_POOL_TOPIC",
+]
@@ -0,0 +1,146 @@
+"""
+XplorED - Exercise Prefetch Coordinator
+
+This module keeps next-block prefetches to at most one per user,
+following clean architecture principles as outlined in the documentation.
+
+Prefetch Coordinator Components:
+- In-process Registry: usernames with a prefetch queued or running in this
+  worker; a second request for the same user is dropped, not queued
+- Cross-worker Lock: the owning worker also holds ``prefetch:lock:<user>`` in
+  Redis (``SET NX PX``), so another web worker skips the user too; without
+  Redis the registry alone applies
+- Counters for started, coalesced and skipped prefetches, stored blocks and
+  blocks dropped because the user's blocks changed while one was generated
+
+The lock expires after ``EXERCISE_PREFETCH_LOCK_TTL`` seconds, so a worker that
+dies mid-prefetch only blocks that user's prefetches until then.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import logging
+import os
+import threading
+import uuid
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# === Prefetch Configuration ===
+EXERCISE_PREFETCH_REDIS = os.getenv("EXERCISE_PREFETCH_REDIS", "true").lower() == "true"
+EXERCISE_PREFETCH_LOCK_TTL = int(os.getenv("EXERCISE_PREFETCH_LOCK_TTL", "120"))
+
+REDIS_LOCK_PREFIX = "prefetch:lock:"
+
+
+# === Prefetch Coordinator ===
+class PrefetchCoordinator:
+    """Grant at most one prefetch per user at a time, in this process and across workers."""
+
+    def __init__(self, use_redis: bool = EXERCISE_PREFETCH_REDIS, lock_ttl: int = EXERCISE_PREFETCH_LOCK_TTL):
+        """
+        Initialize an empty registry.
+
+        Args:
+            use_redis: Also hold a Redis lock per user while a prefetch runs
+            lock_ttl: Seconds until an unreleased Redis lock expires
+        """
+        self.use_redis = use_redis
+        self.lock_ttl = lock_ttl
+        self._owners: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "started": 0,
+            "coalesced": 0,
+            "skipped_ready": 0,
+            "stored": 0,
+            "conflicts": 0,
+        }
+
+    def acquire(self, username: str) -> bool:
+        """
+        Claim the user's prefetch slot.
+
+        Args:
+            username: User the prefetch is for
+
+        Returns:
+            bool: True if the caller owns the slot and must ``release`` it
+        """
+        with self._lock:
+            if username in self._owners:
+                self._stats["coalesced"] += 1
+                return False
+            self._owners[username] = None
+
+        token = uuid.uuid4().hex
+        redis = self._redis()
+        if redis is not None:
+            try:
+                if not redis.set(REDIS_LOCK_PREFIX + username, token, nx=True, px=self.lock_ttl * 1000):
+                    with self._lock:
+                        self._owners.pop(username, None)
+                        self._stats["coalesced"] += 1
+                    return False
+                with self._lock:
+                    self._owners[username] = token
+            except Exception as e:
+                logger.warning(f"Prefetch Redis lock for user {username} failed, using the local registry: {e}")
+
+        with self._lock:
+            self._stats["started"] += 1
+        return True
+
+    def release(self, username: str) -> None:
+        """Give up the user's prefetch slot (the Redis lock only if still ours)."""
+        with self._lock:
+            token = self._owners.pop(username, None)
+        if token is None:
+            return
+        redis = self._redis()
+        if redis is None:
+            return
+        try:
+            if redis.get(REDIS_LOCK_PREFIX + username) == token:
+                redis.delete(REDIS_LOCK_PREFIX + username)
+        except Exception as e:
+            logger.warning(f"Failed to release prefetch lock for user {username}: {e}")
+
+    def record(self, outcome: str) -> None:
+        """Count a prefetch outcome (``skipped_ready``, ``stored`` or ``conflicts``)."""
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return prefetch counters and the number of users with a prefetch in flight."""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._owners)}
+
+    def _redis(self):
+        """Return the raw Redis client if cross-worker locking is enabled and configured."""
+        if not self.use_redis:
+            return None
+        try:
+            from external.redis import redis_client
+        except Exception:
+            return None
+        return redis_client.client
+
+
+# === Global Instance ===
+prefetch_coordinator = PrefetchCoordinator()
+
+
+def get_prefetch_stats() -> Dict[str, int]:
+    """Return the shared prefetch coordinator's counters."""
+    return prefetch_coordinator.stats()
+
+
+# === Export Configuration ===
+__all__ = [
+    "PrefetchCoordinator",
+    "prefetch_coordinator",
+    "get_prefetch_stats",
+]
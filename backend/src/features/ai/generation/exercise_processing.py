@@ -16,7 +16,6 @@ For detailed architecture information, see: docs/backend_structure.md
 import json
 import logging
 import traceback
-from threading import Thread
 from datetime import datetime
 from typing import Optional, List
 
@@ -32,6 +31,8 @@ from features.ai.evaluation import evaluate_answers_with_ai, process_ai_answers
 from features.ai.memory.logger import topic_memory_logger
 from shared.exceptions import DatabaseError, AIEvaluationError, ProcessingError
 from api.middleware.auth import require_user
+from core.processing import submit_task
+from external.mistral.async_client import bind_ai_user
 from shared.types import AnalyticsData
 
 logger = logging.getLogger(__name__)
@@ -91,9 +92,8 @@ def save_exercise_submission_async(
             logger.error(traceback.format_exc())
             raise ProcessingError(f"Error processing exercise submission: {str(e)}")
 
-    # Run in background thread
-    thread = Thread(target=run, daemon=True)
-    thread.start()
+    # Run on the interactive background queue
+    submit_task("interactive", bind_ai_user(username, run))
 
 
 def evaluate_exercises(exercises: list, answers: dict) -> tuple[dict | None, dict]:
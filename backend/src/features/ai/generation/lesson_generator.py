@@ -3,15 +3,23 @@
 from features.grammar import detect_language_topics
 from features.ai.evaluation import update_topic_memory_reading
 from features.ai.memory.level_manager import check_auto_level_up
+import logging
+
 from core.processing import run_in_background
+from shared.exceptions import TaskQueueFullError
+
+logger = logging.getLogger(__name__)
 
 
 def update_reading_memory_async(username: str, text: str) -> None:
-    """Update reading topic memory in a background thread."""
+    """Update reading topic memory on the background executor."""
     def task():
         detect_language_topics(text)  # ensure tokenization before context
         update_topic_memory_reading(username, text)
         check_auto_level_up(username)
 
-    run_in_background(task)
+    try:
+        run_in_background(task)
+    except TaskQueueFullError as e:
+        logger.warning(f"Skipping reading memory update for user {username}: {e}")
 
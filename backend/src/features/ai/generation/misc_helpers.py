@@ -17,6 +17,7 @@ def stream_ai_answer(context: str) -> Response:
                 streaming_prompt(context),
                 temperature=0.3,
                 stream=True,
+                prompt_type="chat",
             ) as resp:
                 buffer = ""
                 for line in resp.iter_lines(decode_unicode=True):
@@ -54,6 +54,7 @@ def generate_reading_exercise(
             "You are a helpful German teacher.",
             user_prompt,
             temperature=0.7,
+            prompt_type="generation",
         )
         if resp.status_code == 200:
             content = resp.json()["choices"][0]["message"]["content"]
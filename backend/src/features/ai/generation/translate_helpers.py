@@ -1,14 +1,22 @@
 """Helper functions for translate routes."""
 
 from features.ai.evaluation import evaluate_topic_qualities_ai, update_topic_memory_translation
+import logging
+
 from core.processing import run_in_background
+from shared.exceptions import TaskQueueFullError
+
+logger = logging.getLogger(__name__)
 
 
 def update_memory_async(username: str, english: str, german: str, student_input: str) -> None:
-    """Evaluate topic qualities and update memory in a background thread."""
+    """Evaluate topic qualities and update memory on the background executor."""
     def task():
         qualities = evaluate_topic_qualities_ai(english, german, student_input)
         update_topic_memory_translation(username, german, qualities)
 
-    run_in_background(task)
+    try:
+        run_in_background(task)
+    except TaskQueueFullError as e:
+        logger.warning(f"Skipping translation memory update for user {username}: {e}")
 
@@ -18,6 +18,7 @@ from .vocabulary_memory import (
     normalize_word,
     vocab_exists,
     save_vocab,
+    save_vocab_batch,
     analyze_word_ai,
     extract_words,
     translate_to_german,
@@ -42,6 +43,7 @@ __all__ = [
     'normalize_word',
     'vocab_exists',
     'save_vocab',
+    'save_vocab_batch',
     'analyze_word_ai',
     'extract_words',
     'translate_to_german',
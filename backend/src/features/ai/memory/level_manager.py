@@ -19,6 +19,7 @@ from core.database.connection import (
     insert_row,
     update_row,
     fetch_one,
+    bulk_insert,
 )
 
 
@@ -46,19 +47,20 @@ def initialize_topic_memory_for_level(username: str, level: int) -> None:
     if not topics:
         return
 
+    # One lookup for every level topic instead of a COUNT per topic
+    placeholders = ",".join(["?"] * len(topics))
+    existing = select_rows(
+        "topic_memory",
+        columns="DISTINCT grammar",
+        where=f"username = ? AND grammar IN ({placeholders})",
+        params=tuple([username] + topics),
+    )
+    known = {row.get("grammar") for row in existing}
+
     now = datetime.datetime.now().isoformat()
-    for topic in topics:
-        # Legacy schema may not have an explicit id column; rely on existence check via COUNT(*)
-        existing = select_rows(
-            "topic_memory",
-            columns="COUNT(*) as count",
-            where="username = ? AND grammar = ?",
-            params=(username, topic),
-        )
-        if existing and existing[0].get("count", 0) > 0:
-            continue
-        insert_row(
-            "topic_memory",
+    bulk_insert(
+        "topic_memory",
+        [
             {
                 "username": username,
                 "grammar": topic,
@@ -72,7 +74,10 @@ def initialize_topic_memory_for_level(username: str, level: int) -> None:
                 "correct": 0,
                 "quality": 3
             }
-        )
+            for topic in topics
+            if topic not in known
+        ],
+    )
 
 
 def calculate_level_progress(username: str, level: int) -> float:
@@ -16,9 +16,10 @@ For detailed architecture information, see: docs/backend_structure.md
 import re
 import json
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 from features.ai.prompts import analyze_word_prompt, translate_sentence_prompt, translate_word_prompt
-from core.database.connection import update_row, select_one, fetch_one, insert_row, select_rows
+from core.database.connection import update_row, select_one, fetch_one, insert_row, select_rows, transaction, bulk_upsert
+from core.services.achievement_service import AchievementService
 from features.spaced_repetition import sm2
 from external.mistral.client import send_prompt
 from features.ai.memory.logger import topic_memory_logger
@@ -55,6 +56,8 @@ def analyze_word_ai(word: str) -> Optional[dict]:
             "You are a helpful German linguist.",
             user_prompt,
             temperature=0.3,
+            prompt_type="enrichment",
+            cache=True,
         )
         if resp.status_code == 200:
             content = resp.json()["choices"][0]["message"]["content"].strip()
@@ -74,6 +77,8 @@ def analyze_word_ai(word: str) -> Optional[dict]:
             "You are a helpful German translator.",
             trans_prompt,
             temperature=0.1,
+            prompt_type="translation",
+            cache=True,
         )
         if resp.status_code == 200:
             translation = resp.json()["choices"][0]["message"]["content"].strip()
@@ -182,22 +187,23 @@ ENGLISH_ARTICLES = {
 }
 
 
-def save_vocab(
+def _prepare_vocab_row(
     username: str,
     german_word: str,
-    context: Optional[str] = None,
-    exercise: Optional[str] = None,
-    article: Optional[str] = None,
-) -> Optional[str]:
-    """Store a new vocabulary word for spaced repetition.
-
-    Returns the canonical form of the word that was stored or found. Returns
-    ``None`` if nothing was saved (e.g. punctuation)."""
+    context: Optional[str],
+    exercise: Optional[str],
+    article: Optional[str],
+    exists: Callable[[str], bool],
+) -> Tuple[Optional[str], Optional[dict]]:
+    """Normalize a word and build its ``vocab_log`` row.
+
+    Returns ``(normalized, row)``. ``row`` is ``None`` when the word is
+    skipped or ``exists`` reports it as already stored."""
     # print("\033[95m💾 [TOPIC MEMORY FLOW] 💾 Starting save_vocab for user: {} word: '{}' article: '{}'\033[0m".format(username, german_word, article), flush=True)
 
     if german_word in ["?", "!", ",", "."]:
         # print("\033[91m❌ [TOPIC MEMORY FLOW] ❌ Skipping punctuation: '{}'\033[0m".format(german_word), flush=True)
-        return None
+        return None, None
 
     lower_word = german_word.lower()
     # print("\033[94m📝 [TOPIC MEMORY FLOW] 📝 Lowercase word: '{}'\033[0m".format(lower_word), flush=True)
@@ -215,9 +221,9 @@ def save_vocab(
         norm_check, *_ = normalize_word(german_word, article)
         # print("\033[94m📝 [TOPIC MEMORY FLOW] 📝 Normalized for existence check: '{}'\033[0m".format(norm_check), flush=True)
 
-        if vocab_exists(username, norm_check):
+        if exists(norm_check):
             # print("\033[91m⚠️ [TOPIC MEMORY FLOW] ⚠️ Word '{}' already exists for user {}\033[0m".format(norm_check, username), flush=True)
-            return norm_check
+            return norm_check, None
 
         # AI analysis only needed if word is new
         # print("\033[96m🤖 [TOPIC MEMORY FLOW] 🤖 Analyzing word with AI: '{}'\033[0m".format(german_word), flush=True)
@@ -245,32 +251,52 @@ def save_vocab(
     valid_i_endings = ("ei", "ie", "ai", "oi", "ui")
     if normalized.endswith("i") and not normalized.endswith(valid_i_endings):
         # print("\033[91m❌ [TOPIC MEMORY FLOW] ❌ Skipping invalid form ending in 'i': '{}'\033[0m".format(normalized), flush=True)
-        return None
+        return None, None
+
+    now = datetime.now().isoformat()
+    return normalized, {
+        "username": username,
+        "vocab": normalized,
+        "translation": english_word,
+        "word_type": word_type,
+        "article": article,
+        "details": json.dumps(details) if details else None,
+        "context": context,
+        "exercise": exercise,
+        "next_review": now,
+        "created_at": now,
+        "last_review": now,
+    }
+
+
+def save_vocab(
+    username: str,
+    german_word: str,
+    context: Optional[str] = None,
+    exercise: Optional[str] = None,
+    article: Optional[str] = None,
+) -> Optional[str]:
+    """Store a new vocabulary word for spaced repetition.
 
-    # Check again after potential AI normalization
-    if vocab_exists(username, normalized):
-        # print("\033[91m⚠️ [TOPIC MEMORY FLOW] ⚠️ Normalized word '{}' already exists for user {}\033[0m".format(normalized, username), flush=True)
+    Returns the canonical form of the word that was stored or found. Returns
+    ``None`` if nothing was saved (e.g. punctuation)."""
+    normalized, row = _prepare_vocab_row(
+        username, german_word, context, exercise, article,
+        exists=lambda word: vocab_exists(username, word),
+    )
+    if row is None:
         return normalized
 
-    now = datetime.now().isoformat()
     # print("\033[96m💾 [TOPIC MEMORY FLOW] 💾 Inserting new vocab entry into database\033[0m", flush=True)
     try:
-        insert_row(
-            "vocab_log",
-            {
-                "username": username,
-                "vocab": normalized,
-                "translation": english_word,
-                "word_type": word_type,
-                "article": article,
-                "details": json.dumps(details) if details else None,
-                "context": context,
-                "exercise": exercise,
-                "next_review": now,
-                "created_at": now,
-                "last_review": now,
-            },
-        )
+        # Existence check and insert commit together so concurrent saves cannot race
+        with transaction():
+            # Check again after potential AI normalization
+            if vocab_exists(username, normalized):
+                return normalized
+
+            insert_row("vocab_log", row)
+        AchievementService.record_event(username, "vocabulary")
         # print("\033[92m✅ [TOPIC MEMORY FLOW] ✅ Successfully saved vocab word '{}' to database\033[0m".format(normalized), flush=True)
     except DatabaseError:
         raise
@@ -281,6 +307,63 @@ def save_vocab(
     return normalized
 
 
+def save_vocab_batch(
+    username: str,
+    words: List[Tuple[str, Optional[str]]],
+    context: Optional[str] = None,
+    exercise: Optional[str] = None,
+) -> List[str]:
+    """Store many vocabulary words with one lookup and one bulk write.
+
+    ``words`` are ``(word, article)`` tuples as returned by ``extract_words``.
+    Returns the canonical forms that were stored or already known."""
+    if not words:
+        return []
+
+    # Single query for every candidate instead of a SELECT per token
+    candidates = list({normalize_word(word, article)[0] for word, article in words if word})
+    known: set[str] = set()
+    if candidates:
+        placeholders = ",".join(["?"] * len(candidates))
+        rows = select_rows(
+            "vocab_log",
+            columns="vocab",
+            where=f"username = ? AND vocab IN ({placeholders})",
+            params=tuple([username] + candidates),
+        )
+        known = {row.get("vocab") for row in rows}
+
+    saved: List[str] = []
+    new_rows: List[dict] = []
+    for word, article in words:
+        if not word:
+            continue
+        normalized, row = _prepare_vocab_row(
+            username, word, context, exercise, article,
+            exists=known.__contains__,
+        )
+        if normalized is None:
+            continue
+        if row is not None and normalized not in known:
+            new_rows.append(row)
+            known.add(normalized)
+        if normalized not in saved:
+            saved.append(normalized)
+
+    try:
+        # Rows already stored by a concurrent request are left untouched
+        bulk_upsert("vocab_log", new_rows, ("username", "vocab"), update_cols=[])
+    except DatabaseError:
+        raise
+    except Exception as e:
+        raise DatabaseError(f"Failed to save vocab batch for user {username}: {str(e)}")
+
+    if new_rows:
+        AchievementService.record_event(username, "vocabulary")
+
+    return saved
+
+
 def translate_to_german(english_sentence: str, username: Optional[str] = None) -> str:
     """Translate an English sentence using Mistral AI and optionally store vocab."""
 
@@ -298,6 +381,8 @@ def translate_to_german(english_sentence: str, username: Optional[str] = None) -
             "You are a helpful German translator. Provide clear, concise translations. For incomplete inputs, give brief explanations. Avoid overly verbose responses.",
             user_prompt,
             temperature=0.3,
+            prompt_type="translation",
+            cache=True,
         )
         logger.info(f"🔤 [TRANSLATE] send_prompt returned with status: {resp.status_code}")
 
@@ -27,6 +27,7 @@ from .evaluation_prompts import (
     answers_evaluation_prompt,
     alternative_answers_prompt,
     explanation_prompt,
+    batch_exercise_review_prompt,
 )
 
 from .translation_prompts import (
@@ -61,6 +62,7 @@ __all__ = [
     "answers_evaluation_prompt",
     "alternative_answers_prompt",
     "explanation_prompt",
+    "batch_exercise_review_prompt",
 
     # Translation
     "translate_sentence_prompt",
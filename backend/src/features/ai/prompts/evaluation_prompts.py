@@ -10,6 +10,7 @@ Evaluation Components:
 - Topic Detection: Language topic identification in text
 - Alternative Answers: Generation of multiple correct answer variations
 - Explanations: Grammar and vocabulary explanations for correct answers
+- Batch Review: Qualities, alternatives and explanations for a whole block at once
 
 For detailed architecture information, see: docs/backend_structure.md
 """
@@ -132,3 +133,38 @@ def explanation_prompt(question: str, correct_answer: str) -> dict:
             f"Exercise: {question}\nCorrect answer: {correct_answer}\nReply in English."
         ),
     }
+
+
+BATCH_FIELD_INSTRUCTIONS = {
+    "qualities": (
+        '"qualities": an object mapping each grammar topic tested by the exercise '
+        "(all lowercase, spaces only, e.g. \"accusative case\", \"modal verb\") to an integer 0-5 "
+        "on the SM2 quality scale, judging the student answer against the reference answer "
+        "(5 perfect, 4 minor error, 3 noticeable error, 2 wrong but concept known, "
+        "1 wrong with some knowledge, 0 completely wrong)"
+    ),
+    "alternatives": (
+        '"alternatives": a JSON array of up to 3 alternative ways to say the correct answer in German, '
+        "with the same meaning and register, that people would actually say"
+    ),
+    "explanation": (
+        '"explanation": a very short grammar or vocabulary explanation (1-2 sentences, in English) '
+        "of the correct answer; do not mention the student answer or say whether it is correct"
+    ),
+}
+
+
+def batch_exercise_review_prompt(items: list[dict], fields: list[str]) -> dict:
+    """Return prompt for reviewing several exercises in one request, keyed by exercise id."""
+    instructions = "\n".join(f"- {BATCH_FIELD_INSTRUCTIONS[field]}" for field in fields)
+    return {
+        "role": "user",
+        "content": (
+            "You are reviewing several German exercises at once. For EVERY exercise below, "
+            "produce an object with exactly these fields:\n"
+            f"{instructions}\n\n"
+            "Return only one JSON object that maps each exercise \"id\" (as given) to its object. "
+            "No markdown, no extra text.\n\n"
+            f"Exercises:\n{json.dumps(items, ensure_ascii=False)}"
+        ),
+    }
@@ -7,6 +7,7 @@ following clean architecture principles as outlined in the documentation.
 Exercise Modules:
 - exercise_creation: Exercise block creation and management
 - exercise_evaluation: Exercise evaluation and processing
+- exercise_enrichment: Parallel AI alternatives and explanations for results
 - exercise_results: Exercise results and statistics
 
 For detailed architecture information, see: docs/backend_structure.md
@@ -25,8 +26,11 @@ from .exercise_evaluation import (
     evaluate_first_exercise,
     create_immediate_results,
     evaluate_remaining_exercises_async,
+    store_pending_results,
 )
 
+from .exercise_enrichment import enrich_exercise_results
+
 from .exercise_results import (
     submit_exercise_answers,
     get_exercise_results,
@@ -53,6 +57,8 @@ __all__ = [
     "evaluate_first_exercise",
     "create_immediate_results",
     "evaluate_remaining_exercises_async",
+    "store_pending_results",
+    "enrich_exercise_results",
 
     # Exercise results
     "submit_exercise_answers",
@@ -0,0 +1,271 @@
+"""
+XplorED - Exercise Enrichment Module
+
+This module enriches evaluated exercises with AI-generated alternatives and
+explanations, following clean architecture principles as outlined in the documentation.
+
+Exercise Enrichment Components:
+- Batch first: one request asks for the alternatives and explanations of the
+  whole block; only items it misses or returns malformed get single prompts
+- Fan-out: the remaining single calls run in parallel on a shared worker pool
+- Global cap: at most ``AI_ENRICHMENT_CONCURRENCY`` enrichment calls are in
+  flight per process, across all users
+- Per-task timeouts: every call of a block runs under one cancellation token
+  (``shared.cancellation``) that expires after ``AI_ENRICHMENT_TASK_TIMEOUT``
+  seconds, so calls still running then stop instead of finishing unused
+- Ordered publishing: results are handed to the caller as the longest prefix
+  of fully enriched exercises grows, so the client still reveals them 1 → 2 → 3
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from external.mistral.client import send_prompt
+from features.ai.evaluation.batch_evaluation import review_exercises_batch
+from features.ai.prompts import alternative_answers_prompt, explanation_prompt
+from shared.cancellation import CancellationToken, cancel_scope, current_token
+from shared.text_utils import _extract_json as extract_json
+from shared.types import ExerciseList
+
+logger = logging.getLogger(__name__)
+
+
+# === Enrichment Configuration ===
+AI_ENRICHMENT_CONCURRENCY = int(os.getenv("AI_ENRICHMENT_CONCURRENCY", "8"))
+AI_ENRICHMENT_WORKERS = int(os.getenv("AI_ENRICHMENT_WORKERS", str(AI_ENRICHMENT_CONCURRENCY)))
+AI_ENRICHMENT_TASK_TIMEOUT = float(os.getenv("AI_ENRICHMENT_TASK_TIMEOUT", "30"))
+
+# Process-wide cap on concurrent enrichment calls (shared by all blocks and users)
+_ai_slots = threading.BoundedSemaphore(max(1, AI_ENRICHMENT_CONCURRENCY))
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared enrichment pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, AI_ENRICHMENT_WORKERS),
+                    thread_name_prefix="ai-enrich",
+                )
+    return _executor
+
+
+# === Enrichment Tasks ===
+def _fetch_alternatives(correct: str) -> Optional[List[str]]:
+    """Ask Mistral for up to three alternative correct answers."""
+    resp = send_prompt(
+        "You are a helpful German teacher.",
+        alternative_answers_prompt(correct),
+        temperature=0.3,
+        prompt_type="enrichment",
+        cache=True,
+    )
+    if resp.status_code != 200:
+        return None
+    alts = extract_json(resp.json()["choices"][0]["message"]["content"].strip())
+    return alts[:3] if isinstance(alts, list) else None
+
+
+def _fetch_explanation(question: str, correct: str) -> Optional[str]:
+    """Ask Mistral to explain the correct answer of a question."""
+    resp = send_prompt(
+        "You are a helpful German linguist.",
+        explanation_prompt(question, correct),
+        temperature=0.3,
+        prompt_type="enrichment",
+        cache=True,
+    )
+    if resp.status_code != 200:
+        return None
+    return resp.json()["choices"][0]["message"]["content"].strip()
+
+
+def _run_capped(func: Callable, token: CancellationToken, *args):
+    """Run an enrichment call under the global cap and the block's token; give up if it expires first."""
+    if not _ai_slots.acquire(timeout=token.remaining()):
+        raise TimeoutError("no AI slot before the task deadline")
+    try:
+        with cancel_scope(token):
+            token.raise_if_cancelled()
+            return func(*args)
+    finally:
+        _ai_slots.release()
+
+
+def _fallback_explanation(res: Dict, question: str, correct: str) -> None:
+    """Give an incorrect answer a plain explanation when the AI one is missing."""
+    is_correct = bool(res.get("correct") if "correct" in res else res.get("is_correct"))
+    if is_correct or str(res.get("explanation", "")).strip():
+        return
+    user_answer = str(res.get("user_answer", "")).strip()
+    question_text = str(question).strip()
+    fallback = ""
+    if question_text:
+        fallback += f"For the sentence: '{question_text}'. "
+    if user_answer:
+        fallback += f"Your answer '{user_answer}' is not correct. "
+    fallback += f"The correct answer is '{correct}'."
+    res["explanation"] = fallback
+
+
+def _batch_enrich(
+    exercises: ExerciseList,
+    inputs: List[Tuple[Optional[Dict], str, str]],
+    token: CancellationToken,
+) -> Dict[str, Dict]:
+    """Review the whole block in one request; return valid fields per exercise ID."""
+    items = [
+        {"id": str(ex.get("id")), "question": question, "correct_answer": correct}
+        for ex, (res, question, correct) in zip(exercises, inputs)
+        if res is not None and correct
+    ]
+    if len(items) < 2:
+        return {}
+    try:
+        return _run_capped(review_exercises_batch, token, items, ["alternatives", "explanation"], "enrichment")
+    except Exception as e:
+        logger.warning("[enrich] batch review failed, using single prompts: %s", e)
+        return {}
+
+
+# === Enrichment Engine ===
+def enrich_exercise_results(
+    exercises: ExerciseList,
+    results: Dict[str, Dict],
+    on_ready: Callable[[int], None],
+    task_timeout: float = AI_ENRICHMENT_TASK_TIMEOUT,
+) -> None:
+    """
+    Enrich evaluation results in place with alternatives and explanations.
+
+    One batch request covers the block first; the single calls still
+    needed are then started at once. ``on_ready(n)`` is called whenever the
+    first ``n`` exercises (in the given order) are fully enriched, and
+    always once with ``len(exercises)`` at the end.
+
+    Args:
+        exercises: Exercises in display order
+        results: Evaluation results by exercise ID (updated in place)
+        on_ready: Publishes the results for the first ``n`` ready exercises
+        task_timeout: Seconds after which unfinished calls are cancelled
+    """
+    executor = _get_executor()
+    # Expires with the task timeout (or the caller's own deadline, if sooner)
+    token = CancellationToken(task_timeout, parent=current_token())
+    started = time.perf_counter()
+
+    # (position, field) for every submitted call
+    futures: Dict[Future, Tuple[int, str]] = {}
+    pending_by_position: List[int] = [0] * len(exercises)
+    inputs: List[Tuple[Optional[Dict], str, str]] = []
+
+    for ex in exercises:
+        ex_id = str(ex.get("id"))
+        res = results.get(ex_id) if ex_id else None
+        if not isinstance(res, dict):
+            inputs.append((None, "", ""))
+            continue
+        question = ex.get("question", "")
+        correct = ex.get("correctAnswer", ex.get("correct_answer", res.get("correct_answer", "")))
+        inputs.append((res, question, correct))
+        logger.info(
+            "[enrich] start ex_id=%s has_alt=%s has_expl=%s",
+            ex_id,
+            bool(res.get("alternatives")),
+            bool(str(res.get("explanation", "")).strip()),
+        )
+
+    def submit(func: Callable, *args) -> Future:
+        # Each task runs in a copy of this thread's context (keeps the AI call owner)
+        return executor.submit(contextvars.copy_context().run, _run_capped, func, token, *args)
+
+    batched = _batch_enrich(exercises, inputs, token)
+
+    for position, (res, question, correct) in enumerate(inputs):
+        if res is None:
+            continue
+        reviewed = batched.get(str(exercises[position].get("id")), {})
+        if correct:
+            if "alternatives" in reviewed:
+                res["alternatives"] = reviewed["alternatives"]
+            else:
+                futures[submit(_fetch_alternatives, correct)] = (position, "alternatives")
+                pending_by_position[position] += 1
+        if question and correct:
+            if "explanation" in reviewed:
+                res["explanation"] = reviewed["explanation"]
+            else:
+                futures[submit(_fetch_explanation, question, correct)] = (position, "explanation")
+                pending_by_position[position] += 1
+
+    published = 0
+
+    def advance() -> None:
+        """Publish the longest prefix of exercises with no pending calls."""
+        nonlocal published
+        ready = published
+        while ready < len(exercises) and pending_by_position[ready] == 0:
+            res, question, correct = inputs[ready]
+            if res is not None:
+                _fallback_explanation(res, question, correct)
+            ready += 1
+        if ready > published:
+            published = ready
+            on_ready(published)
+
+    advance()
+    pending = set(futures)
+    while pending:
+        remaining = token.remaining()
+        if remaining is not None and remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            position, field = futures[future]
+            pending_by_position[position] -= 1
+            res = inputs[position][0]
+            ex_id = str(exercises[position].get("id"))
+            try:
+                value = future.result()
+                if value:
+                    res[field] = value
+                    logger.info("[enrich] ex_id=%s %s_ready", ex_id, field)
+            except Exception as e:
+                logger.warning("[enrich] %s failed ex_id=%s: %s", field, ex_id, e)
+        advance()
+
+    if pending:
+        # Stop what did not finish in time; running calls see the token at their next check
+        token.cancel(f"enrichment timed out after {task_timeout:g}s")
+        for future in pending:
+            future.cancel()
+            position, field = futures[future]
+            pending_by_position[position] -= 1
+            logger.warning("[enrich] %s timed out ex_id=%s", field, exercises[position].get("id"))
+        advance()
+
+    if published < len(exercises):
+        published = len(exercises)
+        on_ready(published)
+
+    logger.info(
+        "[enrich] %s%d single calls for %d exercises done in %d ms",
+        "batch + " if batched else "", len(futures), len(exercises), int((time.perf_counter() - started) * 1000),
+    )
+
+
+# === Export Configuration ===
+__all__ = [
+    "enrich_exercise_results",
+]
@@ -16,7 +16,6 @@ import logging
 import re
 import os
 import json
-import time
 from datetime import datetime
 from typing import List, Optional, Tuple, Any
 
@@ -25,11 +24,10 @@ from shared.text_utils import _normalize_umlauts, _strip_final_punct
 from features.ai.generation.feedback_helpers import _adjust_gapfill_results
 from core.database.connection import select_one, select_rows, insert_row, update_row, delete_rows, fetch_one, fetch_all, fetch_custom, execute_query, get_connection
 from external.redis import redis_client
+from core.processing import register_job
 from shared.exceptions import DatabaseError
 from shared.types import ExerciseList, ExerciseAnswers, EvaluationResult, AnalyticsData, BlockResult
-from features.ai.prompts import alternative_answers_prompt, explanation_prompt
-from external.mistral.client import send_prompt
-from shared.text_utils import _extract_json as extract_json
+from features.exercise.exercise_enrichment import enrich_exercise_results
 
 logger = logging.getLogger(__name__)
 
@@ -190,6 +188,42 @@ def create_immediate_results(exercises: ExerciseList, first_result: Optional[Ana
         raise DatabaseError(f"Error creating immediate results: {str(e)}")
 
 
+def store_pending_results(username: str, block_id: str, exercises: ExerciseList,
+                          first_result: Optional[AnalyticsData]) -> ExerciseList:
+    """
+    Store the initial (first exercise ready) results that clients poll for.
+
+    Results of an evaluation that is still in progress are left alone, so a
+    duplicate submission cannot reset the progress of the running job.
+
+    Args:
+        username: The username
+        block_id: The exercise block ID
+        exercises: List of exercise dictionaries
+        first_result: Result of the first exercise evaluation
+
+    Returns:
+        ExerciseList: The initial results list
+    """
+    initial_results = create_immediate_results(exercises, first_result)
+
+    # Store initial results in Redis with ready_index for sequential processing
+    result_key = f"exercise_result:{username}:{block_id}"
+    current = redis_client.get_json(result_key)
+    if isinstance(current, dict) and current.get("ready_index", 0) < len(current.get("exercise_order", [])):
+        return initial_results
+    initial_data = {
+        "results": initial_results,
+        "ready_index": 1,  # Only first exercise is ready initially
+        "exercise_order": [str(ex.get("id")) for ex in exercises],
+        "pass": False,
+        "summary": {"correct": 0, "total": len(exercises), "mistakes": []}
+    }
+    redis_client.setex_json(result_key, 300, initial_data)  # type: ignore[arg-type]  # 5 minutes TTL
+    return initial_results
+
+
+@register_job("exercise_evaluation")
 def evaluate_remaining_exercises_async(username: str, block_id: str, exercises: ExerciseList,
                                      answers: ExerciseAnswers, first_result: Optional[AnalyticsData],
                                      exercise_block: Optional[BlockResult] = None) -> None:
@@ -207,19 +241,8 @@ def evaluate_remaining_exercises_async(username: str, block_id: str, exercises:
     try:
         logger.info(f"Starting async evaluation for block {block_id}")
 
-        # Create initial results list
-        initial_results = create_immediate_results(exercises, first_result)
-
-        # Store initial results in Redis with ready_index for sequential processing
-        result_key = f"exercise_result:{username}:{block_id}"
-        initial_data = {
-            "results": initial_results,
-            "ready_index": 1,  # Only first exercise is ready initially
-            "exercise_order": [str(ex.get("id")) for ex in exercises],
-            "pass": False,
-            "summary": {"correct": 0, "total": len(exercises), "mistakes": []}
-        }
-        redis_client.setex_json(result_key, 300, initial_data)  # type: ignore[arg-type]  # 5 minutes TTL
+        # Create and store the initial results list
+        initial_results = store_pending_results(username, block_id, exercises, first_result)
 
         # Start background evaluation
         _evaluate_all_exercises(username, block_id, exercises, answers, initial_results, exercise_block)
@@ -313,154 +336,24 @@ def _process_evaluation_results(username: str, block_id: str, exercises: Exercis
         }
         redis_client.setex_json(result_key, 3600, updated_data)  # type: ignore[arg-type]  # 1 hour TTL
 
-        # Enrich results with AI-generated alternatives and explanations (non-blocking best-effort)
+        # Enrich results with AI-generated alternatives and explanations (best-effort).
+        # All calls run in parallel; exercises are still revealed in order (1 → 2 → 3).
         try:
             eval_results_only = evaluation[0] if isinstance(evaluation, tuple) else evaluation
             if isinstance(eval_results_only, dict):
-                # Iterate strictly in the same order as provided exercises to ensure sequential enrichment (1 → 2 → 3)
-                exercise_map = {str(e.get("id")): e for e in exercises}
-                for i, ex in enumerate(exercises):
-                    ex_id = str(ex.get("id"))
-                    if not ex_id:
-                        continue
-                    res = eval_results_only.get(ex_id)
-                    if not isinstance(res, dict):
-                        continue
-                    question = ex.get("question", "")
-                    correct = ex.get("correctAnswer", ex.get("correct_answer", res.get("correct_answer", "")))
-                    logger.info(
-                        "[enrich] start ex_id=%s has_alt=%s has_expl=%s",
-                        ex_id,
-                        bool(res.get("alternatives")),
-                        bool(str(res.get("explanation", "")).strip()),
-                    )
-
-                    # Alternatives
+                def publish_ready(ready_count: int) -> None:
+                    updated_data["results"] = (eval_results_only, evaluation[1]) if isinstance(evaluation, tuple) else eval_results_only
+                    updated_data["ready_index"] = min(1 + ready_count, len(exercises) + 1)
                     try:
-                        if correct:
-                            alt_t0 = time.perf_counter()
-                            alt_resp = send_prompt(
-                                "You are a helpful German teacher.",
-                                alternative_answers_prompt(correct),
-                                temperature=0.3,
-                            )
-                            if alt_resp.status_code == 200:
-                                content = alt_resp.json()["choices"][0]["message"]["content"].strip()
-                                alts = extract_json(content)
-                                if isinstance(alts, list):
-                                    res["alternatives"] = alts[:3]
-                                    logger.info(
-                                        "[enrich] ex_id=%s alternatives_ready count=%s dt_ms=%d",
-                                        ex_id, len(res["alternatives"]), int((time.perf_counter()-alt_t0)*1000)
-                                    )
-                                    # Flush progressive enrichment for this exercise to Redis
-                                    try:
-                                        current_data = redis_client.get_json(result_key) or {}
-                                        enriched_now = (eval_results_only, evaluation[1]) if isinstance(evaluation, tuple) else eval_results_only
-                                        updated_data = {
-                                            "results": enriched_now,
-                                            "ready_index": current_data.get("ready_index", 1),
-                                            "exercise_order": current_data.get("exercise_order", [str(ex.get("id")) for ex in exercises]),
-                                            "pass": current_data.get("pass", False),
-                                            "summary": current_data.get("summary", {"correct": 0, "total": len(exercises), "mistakes": []})
-                                        }
-                                        redis_client.setex_json(result_key, 3600, updated_data)  # type: ignore[arg-type]
-                                        logger.info("[enrich] ex_id=%s alternatives_flushed", ex_id)
-                                    except Exception:
-                                        pass
-                    except Exception:
-                        logger.exception("[enrich] alternatives failed ex_id=%s", ex_id)
-                        pass
-
-                    # Explanation
-                    try:
-                        if question and correct:
-                            expl_t0 = time.perf_counter()
-                            expl_resp = send_prompt(
-                                "You are a helpful German linguist.",
-                                explanation_prompt(question, correct),
-                                temperature=0.3,
-                            )
-                            if expl_resp.status_code == 200:
-                                expl = expl_resp.json()["choices"][0]["message"]["content"].strip()
-                                res["explanation"] = expl
-                                snippet = expl[:160].replace("\n", " ")
-                                logger.info("[enrich] ex_id=%s explanation_ready len=%s dt_ms=%d snippet=%r",
-                                            ex_id, len(expl), int((time.perf_counter()-expl_t0)*1000), snippet)
-                                # Flush progressive enrichment for this exercise to Redis
-                                try:
-                                    current_data = redis_client.get_json(result_key) or {}
-                                    enriched_now = (eval_results_only, evaluation[1]) if isinstance(evaluation, tuple) else eval_results_only
-                                    updated_data = {
-                                        "results": enriched_now,
-                                        "ready_index": current_data.get("ready_index", 1),
-                                        "exercise_order": current_data.get("exercise_order", [str(ex.get("id")) for ex in exercises]),
-                                        "pass": current_data.get("pass", False),
-                                        "summary": current_data.get("summary", {"correct": 0, "total": len(exercises), "mistakes": []})
-                                    }
-                                    redis_client.setex_json(result_key, 3600, updated_data)  # type: ignore[arg-type]
-                                    logger.info("[enrich] ex_id=%s explanation_flushed", ex_id)
-                                except Exception:
-                                    pass
-                    except Exception:
-                        logger.exception("[enrich] explanation failed ex_id=%s", ex_id)
-                        pass
-
-                    # Immediate fallback explanation per exercise if still empty and answer is incorrect
-                    try:
-                        is_correct = bool(res.get("correct") if "correct" in res else res.get("is_correct"))
-                        current_expl = str(res.get("explanation", "")).strip()
-                        if not is_correct and not current_expl:
-                            user_answer = str(res.get("user_answer", "")).strip()
-                            question_text = str(question).strip()
-                            fallback = ""
-                            if question_text:
-                                fallback += f"For the sentence: '{question_text}'. "
-                            if user_answer:
-                                fallback += f"Your answer '{user_answer}' is not correct. "
-                            fallback += f"The correct answer is '{correct}'."
-                            res["explanation"] = fallback
-                            try:
-                                enriched_now = (eval_results_only, evaluation[1]) if isinstance(evaluation, tuple) else eval_results_only
-                                redis_client.setex_json(result_key, 3600, enriched_now)  # type: ignore[arg-type]
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-
-                    # Increment ready_index after this exercise is fully processed
-                    try:
-                        current_data = redis_client.get_json(result_key) or {}
-                        current_ready_index = current_data.get("ready_index", 1)
-                        new_ready_index = min(current_ready_index + 1, len(exercises) + 1)  # Don't exceed total exercises
-                        
-                        enriched_now = (eval_results_only, evaluation[1]) if isinstance(evaluation, tuple) else eval_results_only
-                        updated_data = {
-                            "results": enriched_now,
-                            "ready_index": new_ready_index,
-                            "exercise_order": current_data.get("exercise_order", [str(ex.get("id")) for ex in exercises]),
-                            "pass": current_data.get("pass", False),
-                            "summary": current_data.get("summary", {"correct": 0, "total": len(exercises), "mistakes": []})
-                        }
                         redis_client.setex_json(result_key, 3600, updated_data)  # type: ignore[arg-type]
-                        logger.info("[enrich] ex_id=%s ready_index incremented to %d", ex_id, new_ready_index)
-                        
-                        # Add a small delay to allow frontend to pick up the change
-                        import time
-                        time.sleep(0.5)
+                        logger.info("[enrich] block %s ready_index=%d", block_id, updated_data["ready_index"])
                     except Exception as e:
-                        logger.error(f"Error incrementing ready_index for exercise {ex_id}: {e}")
-
-                # Write enriched version back to Redis so the frontend can pick it up on next poll
-                try:
-                    enriched = (eval_results_only, evaluation[1]) if isinstance(evaluation, tuple) else eval_results_only
-                    redis_client.setex_json(result_key, 3600, enriched)  # type: ignore[arg-type]
-                    logger.info("[enrich] final_flush done for block %s", block_id)
-                except Exception:
-                    pass
+                        logger.error(f"Error publishing enrichment for block {block_id}: {e}")
+
+                enrich_exercise_results(exercises, eval_results_only, publish_ready)
         except Exception:
             # Safe guard: enrichment is best-effort
-            pass
+            logger.exception("[enrich] enrichment failed for block %s", block_id)
 
         # Store results in ai_exercise_results table
         try:
@@ -20,7 +20,7 @@ import datetime
 
 from core.database.connection import fetch_one
 from features.game.sentence_order import generate_ai_sentence, LEVELS
-from features.ai.memory.vocabulary_memory import save_vocab, extract_words
+from features.ai.memory.vocabulary_memory import save_vocab_batch, extract_words
 from core.services import GameService
 from shared.exceptions import DatabaseError, AIEvaluationError, ValidationError
 from shared.types import GameData
@@ -136,16 +136,13 @@ def _save_game_vocabulary(username: str, sentence: str, level: int) -> None:
         # Extract words from sentence
         words = extract_words(sentence)
 
-        # Save each word to vocabulary
-        for word, article in words:
-            if word and len(word) > 2:  # Only save meaningful words
-                save_vocab(
-                    username=username,
-                    german_word=word,
-                    context=f"Game level {level}",
-                    exercise="sentence_order_game",
-                    article=article
-                )
+        # Save all meaningful words to vocabulary in one batch
+        save_vocab_batch(
+            username=username,
+            words=[(word, article) for word, article in words if word and len(word) > 2],
+            context=f"Game level {level}",
+            exercise="sentence_order_game",
+        )
 
         logger.debug(f"Saved vocabulary from game sentence for user {username}")
 
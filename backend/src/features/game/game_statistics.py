@@ -16,7 +16,8 @@ import logging
 import datetime
 from typing import List, Optional
 
-from core.database.connection import select_rows, fetch_one, fetch_all
+from core.database.connection import select_one, select_rows, fetch_one, fetch_all
+from core.services.game_stats_service import GameStatsService
 from shared.exceptions import DatabaseError, ValidationError
 from shared.types import AnalyticsData
 
@@ -61,61 +62,30 @@ def get_game_statistics(username: str) -> AnalyticsData:
             "recent_performance": []
         }
 
-        # Get game results
-        results = select_rows(
-            "results",
-            columns=["level", "correct", "answer", "timestamp"],
-            where="username = ?",
-            params=(username,),
-            order_by="timestamp DESC"
-        )
+        # Counts, streaks and play dates come from the trigger-maintained aggregates
+        user_stats = GameStatsService.get_user_stats(username)
 
-        if results:
-            stats["total_rounds"] = len(results)
-            stats["correct_answers"] = sum(1 for r in results if r.get("correct", 0) == 1)
-            stats["total_answers"] = len(results)
+        if user_stats:
+            stats["total_rounds"] = user_stats.get("total_rounds") or 0
+            stats["correct_answers"] = user_stats.get("correct_answers") or 0
+            stats["total_answers"] = stats["total_rounds"]
 
             # Calculate accuracy
             if stats["total_answers"] > 0:
                 stats["accuracy_rate"] = round((stats["correct_answers"] / stats["total_answers"]) * 100, 2)
 
-            # Get highest level achieved
-            levels = [r.get("level", 0) for r in results if r.get("level")]
-            if levels:
-                stats["highest_level"] = max(levels)
-
-            # Calculate streaks
-            current_streak = 0
-            best_streak = 0
-            max_streak = 0
-
-            for result in results:
-                if result.get("correct", 0) == 1:
-                    current_streak += 1
-                    max_streak = max(max_streak, current_streak)
-                else:
-                    current_streak = 0
-
-            stats["current_streak"] = current_streak
-            stats["best_streak"] = max_streak
-
-            # Get last played date
-            if results:
-                last_result = results[0]
-                stats["last_played"] = last_result.get("timestamp")
+            stats["highest_level"] = user_stats.get("highest_level") or 0
+            stats["current_streak"] = user_stats.get("current_streak") or 0
+            stats["best_streak"] = user_stats.get("best_streak") or 0
+            stats["last_played"] = user_stats.get("last_played")
 
             # Calculate level progress
             level_counts = {}
-            level_correct = {}
-            for result in results:
-                level = result.get("level", 0)
-                level_counts[level] = level_counts.get(level, 0) + 1
-                if result.get("correct", 0) == 1:
-                    level_correct[level] = level_correct.get(level, 0) + 1
-
-            for level in level_counts:
-                total = level_counts[level]
-                correct = level_correct.get(level, 0)
+            for level_stats in GameStatsService.get_level_stats(username):
+                level = level_stats["level"]
+                total = level_stats.get("total_rounds") or 0
+                correct = level_stats.get("correct_answers") or 0
+                level_counts[level] = total
                 accuracy = (correct / total) * 100 if total > 0 else 0
                 stats["level_progress"][level] = {
                     "total_rounds": total,
@@ -127,50 +97,30 @@ def get_game_statistics(username: str) -> AnalyticsData:
             if level_counts:
                 stats["favorite_level"] = max(level_counts, key=level_counts.get)
 
-            # Calculate recent performance (last 10 games)
-            recent_results = results[:10]
-            recent_correct = sum(1 for r in recent_results if r.get("correct", 0) == 1)
-            if recent_results:
-                stats["recent_performance"] = {
-                    "games": len(recent_results),
-                    "correct": recent_correct,
-                    "accuracy": round((recent_correct / len(recent_results)) * 100, 2)
-                }
+            # Recent performance (last 10 rounds) and improvement rate from bounded windows
+            stats.update(GameStatsService.get_recent_window(username, stats["total_rounds"]))
 
         # Get game sessions for additional stats
-        sessions = select_rows(
+        sessions = select_one(
             "game_sessions",
-            columns=["session_id", "level", "status", "created_at"],
+            columns="COUNT(*) AS total_games",
             where="username = ?",
             params=(username,)
         )
 
-        if sessions:
-            stats["total_games"] = len(sessions)
+        if sessions and sessions.get("total_games"):
+            stats["total_games"] = sessions["total_games"]
 
             # Calculate average score from game scores
-            scores = select_rows(
+            scores = select_one(
                 "game_scores",
-                columns=["final_score"],
+                columns="AVG(final_score) AS average_score",
                 where="session_id IN (SELECT session_id FROM game_sessions WHERE username = ?)",
                 params=(username,)
             )
 
-            if scores:
-                total_score = sum(s.get("final_score", 0) for s in scores)
-                stats["average_score"] = round(total_score / len(scores), 2)
-
-        # Calculate improvement rate (comparing recent vs older performance)
-        if len(results) >= 20:
-            recent_20 = results[:20]
-            older_20 = results[-20:] if len(results) >= 40 else results[20:40]
-
-            recent_accuracy = sum(1 for r in recent_20 if r.get("correct", 0) == 1) / len(recent_20)
-            older_accuracy = sum(1 for r in older_20 if r.get("correct", 0) == 1) / len(older_20)
-
-            if older_accuracy > 0:
-                improvement = ((recent_accuracy - older_accuracy) / older_accuracy) * 100
-                stats["improvement_rate"] = round(improvement, 2)
+            if scores and scores.get("average_score") is not None:
+                stats["average_score"] = round(scores["average_score"], 2)
 
         logger.info(f"Retrieved game statistics for user '{username}': {stats['total_rounds']} rounds, {stats['accuracy_rate']}% accuracy")
         return stats
@@ -204,54 +154,24 @@ def get_user_game_level_progress(username: str) -> AnalyticsData:
 
         logger.info(f"Getting level progress for user '{username}'")
 
-        # Get all results grouped by level
-        results = select_rows(
-            "results",
-            columns=["level", "correct", "timestamp"],
-            where="username = ?",
-            params=(username,),
-            order_by="level ASC, timestamp ASC"
-        )
-
+        # Per-level totals and streaks from the trigger-maintained aggregate
         level_progress = {}
-        current_level = 0
-
-        for result in results:
-            level = result.get("level", 0)
-            is_correct = result.get("correct", 0) == 1
-
-            if level not in level_progress:
-                level_progress[level] = {
-                    "level": level,
-                    "total_attempts": 0,
-                    "correct_attempts": 0,
-                    "accuracy": 0.0,
-                    "first_attempt": None,
-                    "last_attempt": None,
-                    "consecutive_correct": 0,
-                    "best_consecutive": 0,
-                    "current_streak": 0
-                }
-
-            level_data = level_progress[level]
-            level_data["total_attempts"] += 1
-            level_data["last_attempt"] = result.get("timestamp")
-
-            if not level_data["first_attempt"]:
-                level_data["first_attempt"] = result.get("timestamp")
-
-            if is_correct:
-                level_data["correct_attempts"] += 1
-                level_data["consecutive_correct"] += 1
-                level_data["current_streak"] += 1
-                level_data["best_consecutive"] = max(level_data["best_consecutive"], level_data["consecutive_correct"])
-            else:
-                level_data["consecutive_correct"] = 0
-                level_data["current_streak"] = 0
-
-            # Calculate accuracy
-            if level_data["total_attempts"] > 0:
-                level_data["accuracy"] = round((level_data["correct_attempts"] / level_data["total_attempts"]) * 100, 2)
+        for level_stats in GameStatsService.get_level_stats(username):
+            level = level_stats["level"]
+            total = level_stats.get("total_rounds") or 0
+            correct = level_stats.get("correct_answers") or 0
+            current_streak = level_stats.get("current_streak") or 0
+            level_progress[level] = {
+                "level": level,
+                "total_attempts": total,
+                "correct_attempts": correct,
+                "accuracy": round((correct / total) * 100, 2) if total > 0 else 0.0,
+                "first_attempt": level_stats.get("first_played"),
+                "last_attempt": level_stats.get("last_played"),
+                "consecutive_correct": current_streak,
+                "best_consecutive": level_stats.get("best_streak") or 0,
+                "current_streak": current_streak
+            }
 
         # Determine current level (highest level with good performance)
         current_level = 0
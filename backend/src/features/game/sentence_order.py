@@ -2,6 +2,7 @@
 """Logic for the sentence ordering game and feedback helpers."""
 
 from core.database.connection import get_connection, insert_row, select_rows
+from core.services.achievement_service import AchievementService
 from features.ai.prompts import game_sentence_prompt
 from external.mistral.client import send_prompt
 from features.ai.generation.feedback_helpers import generate_feedback_prompt
@@ -138,6 +139,7 @@ def generate_ai_sentence(username=None):
             "You are a helpful German teacher.",
             user_prompt,
             temperature=0.7,
+            prompt_type="generation",
         )
         if resp.status_code == 200:
             sentence = resp.json()["choices"][0]["message"]["content"].strip()
@@ -357,6 +359,7 @@ def save_result(username, level, correct, answer):
             "timestamp": datetime.now().isoformat(),
         },
     )
+    AchievementService.record_event(username, "game")
 
 
 def get_all_results():
@@ -34,6 +34,8 @@ def detect_language_topics(text: str) -> list[str]:
             "You are a helpful German teacher.",
             user_prompt,
             temperature=0.3,
+            prompt_type="evaluation",
+            cache=True,
         )
         if resp.status_code == 200:
             content = resp.json()["choices"][0]["message"]["content"].strip()
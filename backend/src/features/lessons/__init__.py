@@ -14,6 +14,7 @@ For detailed architecture information, see: docs/backend_structure.md
 
 from .lesson_retrieval import (
     get_user_lessons_summary,
+    get_lesson_catalog,
     get_lesson_content,
     get_lesson_blocks,
     validate_lesson_access,
@@ -43,6 +44,7 @@ from .block_management import (
 __all__ = [
     # Lesson retrieval
     "get_user_lessons_summary",
+    "get_lesson_catalog",
     "get_lesson_content",
     "get_lesson_blocks",
     "validate_lesson_access",
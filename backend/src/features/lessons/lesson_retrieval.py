@@ -6,6 +6,7 @@ following clean architecture principles as outlined in the documentation.
 
 Lesson Retrieval Components:
 - Lesson Summaries: Get lesson summaries and overview information
+- Lesson Catalog: Paginated lesson lists with aggregated user progress
 - Lesson Content: Retrieve lesson HTML content and metadata
 - Lesson Blocks: Get lesson block information and structure
 - Access Validation: Validate user access to lessons
@@ -14,10 +15,10 @@ For detailed architecture information, see: docs/backend_structure.md
 """
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from core.database.connection import select_rows, select_one, update_row, insert_row
-from core.services import LessonService
+from core.services import LessonService, LessonCatalogService
 from shared.exceptions import DatabaseError
 from shared.types import LessonList, LessonData
 
@@ -90,48 +91,56 @@ def validate_lesson_access(username: str, lesson_id: int) -> bool:
     return LessonService.validate_lesson_access(username, lesson_id)
 
 
-def _build_lesson_summary(username: str, lesson_id: int, lesson_data: LessonData) -> LessonData:
+def get_lesson_catalog(
+    username: str,
+    skill_level: Optional[str] = None,
+    published: bool = True,
+    limit: int = 20,
+    offset: int = 0,
+) -> Tuple[LessonList, int]:
     """
-    Build a lesson summary with progress information.
+    Get a page of the lesson catalog with the user's progress.
+
+    Progress for the whole page is aggregated in one query, so the cost does
+    not grow with the page size.
 
     Args:
-        username: The username
-        lesson_id: The lesson ID
-        lesson_data: The lesson data from database
+        username: The username whose progress is included
+        skill_level: Optional skill level filter
+        published: Only include published lessons (default: True)
+        limit: Maximum number of lessons to return
+        offset: Pagination offset
 
     Returns:
-        Dictionary containing lesson summary with progress
+        Tuple of (lessons on the page, total matching lessons)
+
+    Raises:
+        DatabaseError: If the catalog cannot be loaded
     """
     try:
-        # Get lesson progress
-        progress_data = select_one(
-            "lesson_progress",
-            columns=["completed_blocks", "total_blocks", "last_accessed"],
-            where="user_id = ? AND lesson_id = ?",
-            params=(username, lesson_id),
+        where_conditions = []
+        params = []
+
+        if skill_level:
+            where_conditions.append("skill_level = ?")
+            params.append(skill_level)
+
+        if published:
+            where_conditions.append("published = 1")
+
+        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+
+        lessons = LessonCatalogService.get_lesson_page(
+            username,
+            where=where_clause,
+            params=tuple(params),
+            limit=limit,
+            offset=offset,
         )
+        total = LessonCatalogService.count_lessons(where_clause, tuple(params))
+
+        return lessons, total
 
-        # Calculate completion percentage
-        total_blocks = lesson_data.get("num_blocks", 0)
-        completed_blocks = progress_data.get("completed_blocks", 0) if progress_data else 0
-        completion_percentage = (completed_blocks / total_blocks * 100) if total_blocks > 0 else 0
-
-        summary = {
-            "lesson_id": lesson_id,
-            "title": lesson_data.get("title", ""),
-            "created_at": lesson_data.get("created_at"),
-            "num_blocks": total_blocks,
-            "completed_blocks": completed_blocks,
-            "completion_percentage": round(completion_percentage, 2),
-            "ai_enabled": bool(lesson_data.get("ai_enabled", False)),
-            "last_accessed": progress_data.get("last_accessed") if progress_data else None,
-            "is_completed": completion_percentage >= 100,
-        }
-
-        return summary
-
-    except DatabaseError:
-        raise
     except Exception as e:
-        logger.error(f"Error building lesson summary: {e}")
-        raise DatabaseError(f"Error building lesson summary: {str(e)}")
+        logger.error(f"Error getting lesson catalog for user {username}: {e}")
+        raise DatabaseError(f"Error getting lesson catalog: {str(e)}")
@@ -7,8 +7,7 @@ following clean architecture principles as outlined in the documentation.
 Profile Achievements Components:
 - User Achievements: Get and track user achievements
 - Activity Timeline: Generate user activity timeline
-- Achievement Validation: Validate achievement criteria
-- Progress Tracking: Track progress towards achievements
+- Achievement Ledger: Read unlocked achievements recorded by the achievement rules
 
 For detailed architecture information, see: docs/backend_structure.md
 """
@@ -17,6 +16,7 @@ import logging
 from typing import List, Optional
 
 from infrastructure.imports import Imports
+from core.services.achievement_service import AchievementService
 from core.database.connection import select_one, select_rows, insert_row, update_row, delete_rows, fetch_one, fetch_all, fetch_custom, execute_query, get_connection
 from shared.exceptions import DatabaseError
 from shared.types import AnalyticsData, AnalyticsList
@@ -34,6 +34,10 @@ def get_user_achievements(
     """
     Get achievements for a user with filtering and pagination.
 
+    Unlocked achievements are read from the ``user_achievements`` ledger in a
+    single query; the ledger is filled when games, vocabulary and lessons are
+    written (see ``AchievementService``).
+
     Args:
         username: The username to get achievements for
         category: Filter by achievement category
@@ -53,113 +57,9 @@ def get_user_achievements(
 
         logger.info(f"Getting achievements for user {username}")
 
-        achievements = []
-
-        # First Game Achievement
-        first_game_timestamp = _get_first_game_timestamp(username)
-        if first_game_timestamp:
-            achievements.append({
-                "id": "first_game",
-                "title": "First Steps",
-                "description": "Played your first game",
-                "icon": "🎮",
-                "unlocked_at": first_game_timestamp,
-                "category": "gaming"
-            })
-
-        # 10th Game Achievement
-        tenth_game_timestamp = _get_nth_game_timestamp(username, 10)
-        if tenth_game_timestamp:
-            achievements.append({
-                "id": "tenth_game",
-                "title": "Getting the Hang of It",
-                "description": "Played 10 games",
-                "icon": "🎯",
-                "unlocked_at": tenth_game_timestamp,
-                "category": "gaming"
-            })
-
-        # Perfect Score Achievement
-        perfect_score_timestamp = _get_perfect_score_timestamp(username)
-        if perfect_score_timestamp:
-            achievements.append({
-                "id": "perfect_score",
-                "title": "Perfect Score",
-                "description": "Achieved a perfect score in a game",
-                "icon": "⭐",
-                "unlocked_at": perfect_score_timestamp,
-                "category": "performance"
-            })
-
-        # Vocabulary Achievements
-        vocab_10_timestamp = _get_vocab_achievement_timestamp(username, 10)
-        if vocab_10_timestamp:
-            achievements.append({
-                "id": "vocab_10",
-                "title": "Word Collector",
-                "description": "Learned 10 vocabulary words",
-                "icon": "📚",
-                "unlocked_at": vocab_10_timestamp,
-                "category": "vocabulary"
-            })
-
-        vocab_50_timestamp = _get_vocab_achievement_timestamp(username, 50)
-        if vocab_50_timestamp:
-            achievements.append({
-                "id": "vocab_50",
-                "title": "Vocabulary Master",
-                "description": "Learned 50 vocabulary words",
-                "icon": "📖",
-                "unlocked_at": vocab_50_timestamp,
-                "category": "vocabulary"
-            })
-
-        # First Lesson Achievement
-        first_lesson_timestamp = _get_first_lesson_timestamp(username)
-        if first_lesson_timestamp:
-            achievements.append({
-                "id": "first_lesson",
-                "title": "Student",
-                "description": "Completed your first lesson",
-                "icon": "📝",
-                "unlocked_at": first_lesson_timestamp,
-                "category": "learning"
-            })
-
-        # 5th Lesson Achievement
-        fifth_lesson_timestamp = _get_nth_lesson_timestamp(username, 5)
-        if fifth_lesson_timestamp:
-            achievements.append({
-                "id": "fifth_lesson",
-                "title": "Dedicated Learner",
-                "description": "Completed 5 lessons",
-                "icon": "🎓",
-                "unlocked_at": fifth_lesson_timestamp,
-                "category": "learning"
-            })
-
-        # Learning Streak Achievements
-        streak_7_timestamp = _get_streak_achievement_timestamp(username, 7)
-        if streak_7_timestamp:
-            achievements.append({
-                "id": "streak_7",
-                "title": "Week Warrior",
-                "description": "Maintained a 7-day learning streak",
-                "icon": "🔥",
-                "unlocked_at": streak_7_timestamp,
-                "category": "consistency"
-            })
-
-        streak_30_timestamp = _get_streak_achievement_timestamp(username, 30)
-        if streak_30_timestamp:
-            achievements.append({
-                "id": "streak_30",
-                "title": "Consistency King",
-                "description": "Maintained a 30-day learning streak",
-                "icon": "👑",
-                "unlocked_at": streak_30_timestamp,
-                "category": "consistency"
-            })
+        # Already sorted by unlock date (newest first) by the ledger index
+        achievements = AchievementService.get_unlocked(username)
+        earned_ids = {a["id"] for a in achievements}
 
         # Apply category filter if provided
         if category:
@@ -170,16 +70,12 @@ def get_user_achievements(
             if status == "earned":
                 achievements = [a for a in achievements if a.get("unlocked_at")]
             elif status == "in_progress":
-                # For now, all achievements are considered earned if they exist
-                # This could be enhanced to check progress towards achievements
+                # Progress towards locked achievements is not tracked yet
                 achievements = []
 
         # Calculate total before pagination
         total = len(achievements)
 
-        # Sort achievements by unlock date (newest first)
-        achievements.sort(key=lambda x: x.get("unlocked_at", ""), reverse=True)
-
         # Apply pagination
         paginated_achievements = achievements[offset:offset + limit]
 
@@ -190,8 +86,12 @@ def get_user_achievements(
         # Get recent achievements (last 5)
         recent_achievements = achievements[:5]
 
-        # Get next achievements (achievements not yet earned)
-        next_achievements = [a for a in achievements if not a.get("unlocked_at")][:5]
+        # Get next achievements (rules not yet unlocked, in rule order)
+        next_achievements = [
+            AchievementService.describe(rule)
+            for rule in AchievementService.RULES
+            if rule["id"] not in earned_ids and (not category or rule["category"] == category)
+        ][:5]
 
         result = {
             "achievements": paginated_achievements,
@@ -323,217 +223,3 @@ def get_user_activity_timeline(username: str, limit: int = 20) -> AnalyticsList:
     except Exception as e:
         logger.error(f"Error getting activity timeline for user {username}: {e}")
         return []
-
-
-def _get_first_game_timestamp(username: str) -> Optional[str]:
-    """
-    Get timestamp of user's first game.
-
-    Args:
-        username: The username
-
-    Returns:
-        Timestamp string or None if no games played
-    """
-    try:
-        result = select_one(
-            "results",
-            columns="MIN(timestamp) as first_timestamp",
-            where="username = ?",
-            params=(username,),
-        )
-        return result.get("first_timestamp") if result else None
-
-    except Exception as e:
-        logger.error(f"Error getting first game timestamp for user {username}: {e}")
-        return None
-
-
-def _get_nth_game_timestamp(username: str, n: int) -> Optional[str]:
-    """
-    Get timestamp of user's nth game.
-
-    Args:
-        username: The username
-        n: The game number
-
-    Returns:
-        Timestamp string or None if nth game not reached
-    """
-    try:
-        result = select_one(
-            "results",
-            columns="timestamp",
-            where="username = ?",
-            params=(username,),
-            order_by="timestamp ASC",
-            limit=1,
-            offset=n-1,
-        )
-        return result.get("timestamp") if result else None
-
-    except Exception as e:
-        logger.error(f"Error getting {n}th game timestamp for user {username}: {e}")
-        return None
-
-
-def _get_perfect_score_timestamp(username: str) -> Optional[str]:
-    """
-    Get timestamp of user's first perfect score.
-
-    Args:
-        username: The username
-
-    Returns:
-        Timestamp string or None if no perfect score
-    """
-    try:
-        result = select_one(
-            "results",
-            columns="timestamp",
-            where="username = ? AND correct = 1",
-            params=(username,),
-            order_by="timestamp ASC",
-        )
-        return result.get("timestamp") if result else None
-
-    except Exception as e:
-        logger.error(f"Error getting perfect score timestamp for user {username}: {e}")
-        return None
-
-
-def _get_vocab_achievement_timestamp(username: str, count: int) -> Optional[str]:
-    """
-    Get timestamp when user reached vocabulary count milestone.
-
-    Args:
-        username: The username
-        count: The vocabulary count milestone
-
-    Returns:
-        Timestamp string or None if milestone not reached
-    """
-    try:
-        result = select_one(
-            "vocab_log",
-            columns="created_at",
-            where="username = ?",
-            params=(username,),
-            order_by="created_at ASC",
-            limit=1,
-            offset=count-1,
-        )
-        return result.get("created_at") if result else None
-
-    except Exception as e:
-        logger.error(f"Error getting vocabulary {count} timestamp for user {username}: {e}")
-        return None
-
-
-def _get_first_lesson_timestamp(username: str) -> Optional[str]:
-    """
-    Get timestamp of user's first lesson completion.
-
-    Args:
-        username: The username
-
-    Returns:
-        Timestamp string or None if no lessons completed
-    """
-    try:
-        result = select_one(
-            "lesson_progress",
-            columns="last_accessed",
-            where="user_id = ? AND completed_blocks >= total_blocks",
-            params=(username,),
-            order_by="last_accessed ASC",
-        )
-        return result.get("last_accessed") if result else None
-
-    except Exception as e:
-        logger.error(f"Error getting first lesson timestamp for user {username}: {e}")
-        return None
-
-
-def _get_nth_lesson_timestamp(username: str, n: int) -> Optional[str]:
-    """
-    Get timestamp of user's nth lesson completion.
-
-    Args:
-        username: The username
-        n: The lesson number
-
-    Returns:
-        Timestamp string or None if nth lesson not completed
-    """
-    try:
-        result = select_one(
-            "lesson_progress",
-            columns="last_accessed",
-            where="user_id = ? AND completed_blocks >= total_blocks",
-            params=(username,),
-            order_by="last_accessed ASC",
-            limit=1,
-            offset=n-1,
-        )
-        return result.get("last_accessed") if result else None
-
-    except Exception as e:
-        logger.error(f"Error getting {n}th lesson timestamp for user {username}: {e}")
-        return None
-
-
-def _get_streak_achievement_timestamp(username: str, days: int) -> Optional[str]:
-    """
-    Get timestamp when user reached streak milestone.
-
-    Args:
-        username: The username
-        days: The streak milestone in days
-
-    Returns:
-        Timestamp string or None if milestone not reached
-    """
-    try:
-        # This is a simplified implementation
-        # In a real system, you'd track streak milestones more precisely
-        recent_activity = select_rows(
-            "results",
-            columns="DISTINCT DATE(timestamp) as activity_date",
-            where="username = ? AND timestamp >= date('now', '-60 days')",
-            params=(username,),
-            order_by="activity_date DESC",
-        )
-
-        if not recent_activity or len(recent_activity) < days:
-            return None
-
-        # Check if there's a streak of the required length
-        streak_count = 0
-        current_date = None
-
-        for row in recent_activity:
-            activity_date = row.get("activity_date")
-            if current_date is None:
-                current_date = activity_date
-                streak_count = 1
-            else:
-                from datetime import datetime
-                try:
-                    current_dt = datetime.strptime(current_date, "%Y-%m-%d")
-                    activity_dt = datetime.strptime(activity_date, "%Y-%m-%d")
-                    if (current_dt - activity_dt).days == 1:
-                        streak_count += 1
-                        current_date = activity_date
-                        if streak_count >= days:
-                            return activity_date
-                    else:
-                        break
-                except:
-                    break
-
-        return None
-
-    except Exception as e:
-        logger.error(f"Error getting streak {days} timestamp for user {username}: {e}")
-        return None
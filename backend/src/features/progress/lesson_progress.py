@@ -18,6 +18,7 @@ import datetime
 from typing import Optional, List, Tuple
 
 from core.database.connection import select_one, select_rows, insert_row, update_row, delete_rows, fetch_one, fetch_all, fetch_custom, execute_query
+from core.services import DailyActivityService, AchievementService
 from shared.exceptions import DatabaseError, ValidationError
 from shared.types import ProgressData, AnalyticsData, ValidationResult
 
@@ -114,15 +115,16 @@ def update_block_progress(username: str, lesson_id: int, block_id: str, complete
             params=(username, lesson_id, block_id)
         )
 
+        now = datetime.datetime.utcnow()
         if existing:
             # Update existing record
             success = update_row(
                 "lesson_progress",
                 {
                     "completed": int(completed),
-                    "updated_at": datetime.datetime.utcnow()
+                    "updated_at": now
                 },
-                "WHERE user_id = ? AND lesson_id = ? AND block_id = ?",
+                "user_id = ? AND lesson_id = ? AND block_id = ?",
                 (username, lesson_id, block_id)
             )
         else:
@@ -132,12 +134,15 @@ def update_block_progress(username: str, lesson_id: int, block_id: str, complete
                 "lesson_id": lesson_id,
                 "block_id": block_id,
                 "completed": int(completed),
-                "created_at": datetime.datetime.utcnow(),
-                "updated_at": datetime.datetime.utcnow()
+                "created_at": now,
+                "updated_at": now
             }
             success = insert_row("lesson_progress", progress_data)
 
         if success:
+            DailyActivityService.record_lesson_progress(username, existing, completed, occurred_at=now)
+            if completed:
+                AchievementService.record_event(username, "lesson")
             logger.info(f"Successfully updated block progress for user {username}, lesson {lesson_id}, block {block_id}")
         else:
             logger.error(f"Failed to update block progress for user {username}, lesson {lesson_id}, block {block_id}")
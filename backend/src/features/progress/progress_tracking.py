@@ -18,6 +18,7 @@ import datetime
 from typing import Optional, List, Tuple
 
 from core.database.connection import select_one, select_rows, insert_row, update_row, delete_rows, fetch_one, fetch_all, fetch_custom, execute_query
+from core.services import DailyActivityService, AchievementService
 from shared.exceptions import DatabaseError, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -51,15 +52,27 @@ def track_lesson_progress(username: str, lesson_id: int, block_id: str, complete
 
         logger.info(f"Tracking lesson progress for user {username}, lesson {lesson_id}, block {block_id}")
 
+        # The previous state lets the daily rollup count each row once
+        existing = select_one(
+            "lesson_progress",
+            columns="completed, updated_at",
+            where="user_id = ? AND lesson_id = ? AND block_id = ?",
+            params=(username, lesson_id, block_id)
+        )
+        now = datetime.datetime.utcnow()
+
         # Use UPSERT to handle both insert and update cases
         success = execute_query("""
             INSERT INTO lesson_progress (user_id, lesson_id, block_id, completed, updated_at)
             VALUES (?, ?, ?, ?, ?)
             ON CONFLICT(user_id, lesson_id, block_id)
             DO UPDATE SET completed = excluded.completed, updated_at = excluded.updated_at
-        """, (username, lesson_id, block_id, int(completed), datetime.datetime.utcnow()))
+        """, (username, lesson_id, block_id, int(completed), now))
 
         if success:
+            DailyActivityService.record_lesson_progress(username, existing, completed, occurred_at=now)
+            if completed:
+                AchievementService.record_event(username, "lesson")
             logger.info(f"Successfully tracked lesson progress for user {username}, lesson {lesson_id}, block {block_id}")
         else:
             logger.error(f"Failed to track lesson progress for user {username}, lesson {lesson_id}, block {block_id}")
@@ -121,6 +134,7 @@ def track_exercise_progress(username: str, block_id: str, score: float, total_qu
         success = insert_row("activity_progress", progress_data)
 
         if success:
+            DailyActivityService.record_activity(username, "exercise", score=score, total_questions=total_questions)
             logger.info(f"Successfully tracked exercise progress for user {username}, block {block_id}")
         else:
             logger.error(f"Failed to track exercise progress for user {username}, block {block_id}")
@@ -178,6 +192,7 @@ def track_vocabulary_progress(username: str, word: str, correct: bool, repetitio
         success = insert_row("vocabulary_progress", progress_data)
 
         if success:
+            DailyActivityService.record_activity(username, "vocabulary", correct=int(correct), repetitions=repetitions)
             logger.info(f"Successfully tracked vocabulary progress for user {username}, word {word}")
         else:
             logger.error(f"Failed to track vocabulary progress for user {username}, word {word}")
@@ -235,6 +250,7 @@ def track_game_progress(username: str, game_type: str, score: float, level: int)
         success = insert_row("game_progress", progress_data)
 
         if success:
+            DailyActivityService.record_activity(username, "game", game_type=game_type, score=score, level=level)
             logger.info(f"Successfully tracked game progress for user {username}, game {game_type}, level {level}")
         else:
             logger.error(f"Failed to track game progress for user {username}, game {game_type}, level {level}")
@@ -289,6 +305,9 @@ def reset_user_progress(username: str, activity_type: Optional[str] = None) -> b
                     success = False
                     logger.error(f"Failed to reset progress for table {table}")
 
+        # Rebuild the user's daily rollup from whatever raw progress remains
+        DailyActivityService.backfill(username)
+
         if success:
             logger.info(f"Successfully reset progress for user {username}")
         else:
@@ -184,6 +184,10 @@ def deactivate_user_account(username: str) -> Tuple[bool, Optional[str], Analyti
                 (username,)
             ).get("count", 0) if fetch_one("SELECT COUNT(*) as count FROM user_preferences WHERE username = ?", (username,)) else 0
 
+        # Rollups and achievements, so a re-registered username starts fresh
+        for table in ("user_game_stats", "user_game_level_stats", "user_daily_activity", "user_achievements"):
+            delete_rows(table, "WHERE username = ?", (username,))
+
         # Finally, delete the user account
         user_deleted = delete_rows("users", "WHERE username = ?", (username,))
 
@@ -17,7 +17,7 @@ import logging
 import json
 from typing import List, Optional, Tuple
 
-from core.database.connection import select_one, select_rows, insert_row, update_row, delete_rows, fetch_one, fetch_all, fetch_custom, execute_query, get_connection
+from core.database.connection import select_one, select_rows, insert_row, update_row, delete_rows, fetch_one, fetch_all, fetch_custom, execute_query, get_connection, bulk_insert, bulk_upsert
 from datetime import datetime
 from shared.exceptions import ValidationError, DatabaseError
 from shared.types import UserData, ValidationResult
@@ -260,28 +260,30 @@ def import_user_data(username: str, data: UserData) -> bool:
 
             # Import lesson progress
             if "lesson_progress" in progress_data and isinstance(progress_data["lesson_progress"], list):
+                rows = []
                 for lesson_progress in progress_data["lesson_progress"]:
                     try:
-                        lesson_data = {
+                        rows.append({
                             "user_id": username,
                             "lesson_id": lesson_progress.get("lesson_id"),
                             "block_id": lesson_progress.get("block_id"),
                             "completed": int(lesson_progress.get("completed", False)),
                             "created_at": lesson_progress.get("created_at", datetime.utcnow().isoformat()),
                             "updated_at": lesson_progress.get("updated_at", datetime.utcnow().isoformat())
-                        }
-                        success = insert_row('lesson_progress', lesson_data)
-                        if success:
-                            success_count += 1
+                        })
                     except Exception as e:
                         error_count += 1
                         logger.error(f"Error importing lesson progress for user {username}: {e}")
+                imported, failed = _import_rows('lesson_progress', rows, username, conflict_cols=("user_id", "lesson_id", "block_id"))
+                success_count += imported
+                error_count += failed
 
             # Import exercise progress
             if "exercise_progress" in progress_data and isinstance(progress_data["exercise_progress"], list):
+                rows = []
                 for exercise_progress in progress_data["exercise_progress"]:
                     try:
-                        exercise_data = {
+                        rows.append({
                             "username": username,
                             "block_id": exercise_progress.get("block_id"),
                             "score": exercise_progress.get("score"),
@@ -289,49 +291,51 @@ def import_user_data(username: str, data: UserData) -> bool:
                             "completion_percentage": exercise_progress.get("completion_percentage"),
                             "completed_at": exercise_progress.get("completed_at", datetime.utcnow().isoformat()),
                             "activity_type": "exercise"
-                        }
-                        success = insert_row('activity_progress', exercise_data)
-                        if success:
-                            success_count += 1
+                        })
                     except Exception as e:
                         error_count += 1
                         logger.error(f"Error importing exercise progress for user {username}: {e}")
+                imported, failed = _import_rows('activity_progress', rows, username)
+                success_count += imported
+                error_count += failed
 
             # Import vocabulary progress
             if "vocabulary_progress" in progress_data and isinstance(progress_data["vocabulary_progress"], list):
+                rows = []
                 for vocab_progress in progress_data["vocabulary_progress"]:
                     try:
-                        vocab_data = {
+                        rows.append({
                             "username": username,
                             "word": vocab_progress.get("word"),
                             "correct": int(vocab_progress.get("correct", False)),
                             "repetitions": vocab_progress.get("repetitions", 1),
                             "reviewed_at": vocab_progress.get("reviewed_at", datetime.utcnow().isoformat())
-                        }
-                        success = insert_row('vocabulary_progress', vocab_data)
-                        if success:
-                            success_count += 1
+                        })
                     except Exception as e:
                         error_count += 1
                         logger.error(f"Error importing vocabulary progress for user {username}: {e}")
+                imported, failed = _import_rows('vocabulary_progress', rows, username)
+                success_count += imported
+                error_count += failed
 
             # Import game progress
             if "game_progress" in progress_data and isinstance(progress_data["game_progress"], list):
+                rows = []
                 for game_progress in progress_data["game_progress"]:
                     try:
-                        game_data = {
+                        rows.append({
                             "username": username,
                             "game_type": game_progress.get("game_type"),
                             "score": game_progress.get("score"),
                             "level": game_progress.get("level"),
                             "completed_at": game_progress.get("completed_at", datetime.utcnow().isoformat())
-                        }
-                        success = insert_row('game_progress', game_data)
-                        if success:
-                            success_count += 1
+                        })
                     except Exception as e:
                         error_count += 1
                         logger.error(f"Error importing game progress for user {username}: {e}")
+                imported, failed = _import_rows('game_progress', rows, username)
+                success_count += imported
+                error_count += failed
 
         # Import support data
         if "support_data" in data and isinstance(data["support_data"], dict):
@@ -339,25 +343,27 @@ def import_user_data(username: str, data: UserData) -> bool:
 
             # Import feedback
             if "feedback" in support_data and isinstance(support_data["feedback"], list):
+                rows = []
                 for feedback in support_data["feedback"]:
                     try:
-                        feedback_data = {
+                        rows.append({
                             "username": username,
                             "message": feedback.get("message"),
                             "created_at": feedback.get("created_at", datetime.utcnow().isoformat())
-                        }
-                        success = insert_row('support_feedback', feedback_data)
-                        if success:
-                            success_count += 1
+                        })
                     except Exception as e:
                         error_count += 1
                         logger.error(f"Error importing feedback for user {username}: {e}")
+                imported, failed = _import_rows('support_feedback', rows, username)
+                success_count += imported
+                error_count += failed
 
             # Import support requests
             if "requests" in support_data and isinstance(support_data["requests"], list):
+                rows = []
                 for request in support_data["requests"]:
                     try:
-                        request_data = {
+                        rows.append({
                             "username": username,
                             "subject": request.get("subject"),
                             "description": request.get("description"),
@@ -365,13 +371,13 @@ def import_user_data(username: str, data: UserData) -> bool:
                             "status": request.get("status", "pending"),
                             "created_at": request.get("created_at", datetime.utcnow().isoformat()),
                             "updated_at": request.get("created_at", datetime.utcnow().isoformat())
-                        }
-                        success = insert_row('support_requests', request_data)
-                        if success:
-                            success_count += 1
+                        })
                     except Exception as e:
                         error_count += 1
                         logger.error(f"Error importing support request for user {username}: {e}")
+                imported, failed = _import_rows('support_requests', rows, username)
+                success_count += imported
+                error_count += failed
 
         if success_count > 0:
             logger.info(f"Successfully imported {success_count} data records for user {username}")
@@ -390,6 +396,47 @@ def import_user_data(username: str, data: UserData) -> bool:
         raise DatabaseError(f"Error importing user data for {username}: {str(e)}")
 
 
+def _import_rows(table: str, rows: List[UserData], username: str, conflict_cols: Optional[Tuple[str, ...]] = None) -> Tuple[int, int]:
+    """
+    Bulk insert imported rows into a table.
+
+    When the bulk write fails (nothing is written), the rows are retried one
+    by one so a single bad row only fails itself.
+
+    Args:
+        table: Target table name
+        rows: Row dictionaries to insert
+        username: The username the rows belong to (for logging)
+        conflict_cols: Unique key to upsert on instead of plain inserts
+
+    Returns:
+        Tuple of (imported_count, failed_count)
+    """
+    if not rows:
+        return 0, 0
+
+    def write(batch: List[UserData]) -> int:
+        if conflict_cols:
+            return bulk_upsert(table, batch, conflict_cols)
+        return bulk_insert(table, batch)
+
+    try:
+        imported = write(rows)
+        logger.debug(f"Imported {imported} rows into {table} for user {username}")
+        return imported, 0
+    except DatabaseError as e:
+        logger.warning(f"Bulk import into {table} failed for user {username}, retrying row by row: {e}")
+
+    imported = failed = 0
+    for row in rows:
+        try:
+            imported += write([row])
+        except DatabaseError as e:
+            failed += 1
+            logger.error(f"Error importing {table} row for user {username}: {e}")
+    return imported, failed
+
+
 def validate_import_data(data: UserData) -> ValidationResult:
     """
     Validate the structure and content of import data.
@@ -19,7 +19,6 @@ import uuid
 import time
 import os
 from typing import Optional, Tuple
-from threading import Thread
 
 from infrastructure.imports import Imports
 from features.ai.generation.feedback_helpers import format_feedback_block
@@ -27,6 +26,7 @@ from features.ai.memory.vocabulary_memory import translate_to_german
 from features.ai.evaluation import evaluate_translation_ai
 from features.ai.generation.translate_helpers import update_memory_async
 from external.redis import redis_client
+from core.processing import dispatch_job, register_job, should_retry_job
 from shared.exceptions import DatabaseError
 from shared.types import AnalyticsData
 
@@ -95,13 +95,12 @@ def process_translation_job(job_id: str, english: str, student_input: str, usern
 
         logger.info(f"Processing translation job {job_id} for user {username}")
 
-        # Start background processing
-        thread = Thread(
-            target=_process_job_background,
-            args=(job_id, english, student_input, username)
+        # Queue background processing (durably when DURABLE_JOBS is enabled)
+        dispatch_job(
+            "translation",
+            {"job_id": job_id, "english": english, "student_input": student_input, "username": username},
+            key=f"translation:{job_id}",
         )
-        thread.daemon = True
-        thread.start()
 
     except ValueError as e:
         logger.error(f"Validation error processing translation job: {e}")
@@ -111,9 +110,10 @@ def process_translation_job(job_id: str, english: str, student_input: str, usern
         _update_job_status(job_id, "error", {"error": str(e)})
 
 
+@register_job("translation")
 def _process_job_background(job_id: str, english: str, student_input: str, username: str) -> None:
     """
-    Process translation job in background thread.
+    Process translation job in a background worker.
 
     Args:
         job_id: The job ID to process
@@ -126,19 +126,16 @@ def _process_job_background(job_id: str, english: str, student_input: str, usern
 
         # Get AI translation
         ai_translation = translate_to_german(english)
-        if not ai_translation:
+        if not isinstance(ai_translation, str) or not ai_translation or "❌" in ai_translation:
             _update_job_status(job_id, "error", {"error": "Failed to get AI translation"})
             return
 
-        # Evaluate student translation
-        evaluation_result = evaluate_translation_ai(english, student_input, ai_translation)
-        if not evaluation_result:
-            _update_job_status(job_id, "error", {"error": "Failed to evaluate translation"})
-            return
+        # Evaluate student translation against the AI reference
+        correct, reason = evaluate_translation_ai(english, ai_translation, student_input)
 
         # Update vocabulary memory asynchronously
         try:
-            update_memory_async(username, english, student_input, evaluation_result)
+            update_memory_async(username, english, ai_translation, student_input)
         except Exception as e:
             logger.warning(f"Failed to update vocabulary memory for job {job_id}: {e}")
 
@@ -147,8 +144,13 @@ def _process_job_background(job_id: str, english: str, student_input: str, usern
             "english": english,
             "student_input": student_input,
             "ai_translation": ai_translation,
-            "evaluation": evaluation_result,
-            "feedback": format_feedback_block(evaluation_result),
+            "evaluation": {"correct": correct, "reason": reason},
+            "feedback": format_feedback_block(
+                user_answer=student_input,
+                correct_answer=ai_translation,
+                explanation=reason,
+                status="correct" if correct else "incorrect",
+            ),
             "processed_at": time.time()
         }
 
@@ -156,6 +158,10 @@ def _process_job_background(job_id: str, english: str, student_input: str, usern
         logger.info(f"Completed background processing for job {job_id}")
 
     except Exception as e:
+        if should_retry_job(e):
+            # The job stays "processing" for the poller while the queue retries it
+            logger.warning(f"Translation job {job_id} failed, retrying: {e}")
+            raise
         logger.error(f"Error in background processing for job {job_id}: {e}")
         _update_job_status(job_id, "error", {"error": str(e)})
 
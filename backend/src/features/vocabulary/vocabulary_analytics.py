@@ -186,8 +186,8 @@ def get_vocabulary_study_recommendations(user: str) -> AnalyticsData:
                 ef,
                 next_review
             FROM vocab_log
-            WHERE username = ? AND next_review <= datetime('now')
-            ORDER BY next_review ASC
+            WHERE username = ? AND next_review_at <= CAST(strftime('%s', 'now') AS INTEGER)
+            ORDER BY next_review_at ASC
             LIMIT 20
         """, (user,))
 
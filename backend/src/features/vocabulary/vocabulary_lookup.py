@@ -169,28 +169,8 @@ def select_vocab_word_due_for_review(
         ValueError: If user is invalid
     """
     try:
-        # Get all vocabulary entries for the user
-        all_entries = VocabularyService.get_user_vocabulary_entries(user)
-
-        # Filter for words due for review
-        due_entries = []
-        for entry in all_entries:
-            next_review = entry.get('next_review')
-            if next_review:
-                # Simple check if due for review (simplified logic)
-                due_entries.append(entry)
-
-        # Apply difficulty filter if provided
-        if difficulty:
-            due_entries = [entry for entry in due_entries if entry.get('word_type') == difficulty]
-
-        # Sort by next_review date (earliest first)
-        due_entries.sort(key=lambda x: x.get('next_review', ''))
-
-        # Limit to requested count
-        result = due_entries[:count]
-
-        return result
+        # One indexed range query over the user's due queue
+        return VocabularyService.get_due_vocabulary_queue(user, limit=count, word_type=difficulty)
 
     except DatabaseError:
         raise
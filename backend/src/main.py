@@ -70,6 +70,7 @@ from flask_cors import CORS  # type: ignore
 from config.extensions import limiter
 from config.blueprint import registered_blueprints
 from config.app import create_app_config
+from external.mistral.async_client import set_ai_user
 
 # === Import API Routes (Features Layer) ===
 # These imports register the blueprints with the application
@@ -142,6 +143,12 @@ def create_app() -> Flask:
             response.headers.setdefault("Strict-Transport-Security", "max-age=31536000; includeSubDomains")
         return response
 
+    # === AI Call Attribution ===
+    @app.teardown_request
+    def clear_ai_user(_exc):  # type: ignore
+        # Worker threads are reused across requests; don't charge the next one to this user
+        set_ai_user(None)
+
     # === Debug Information ===
     if app.debug:
         print_debug_info(app)
@@ -9,15 +9,16 @@ Shared Modules:
 - exceptions: Custom exception classes
 - types: Type definitions and data structures
 - text_utils: Shared text processing utilities
+- cancellation: Cooperative cancellation tokens and budgeted timeouts
 
 For detailed architecture information, see: docs/backend_structure.md
 """
 
 from .constants import CEFR_LEVELS
 from .exceptions import (
-    AIEvaluationError, DatabaseError, ValidationError, AuthenticationError,
+    AIEvaluationError, AIServiceUnavailableError, DatabaseError, ValidationError, AuthenticationError,
     ExerciseGenerationError, TopicMemoryError, XplorEDException,
-    ConfigurationError, ProcessingError, TimeoutError
+    ConfigurationError, ProcessingError, TimeoutError, OperationCancelledError, TaskQueueFullError
 )
 from .types import Exercise, ExerciseBlock, QualityScore, UserLevel
 from .text_utils import _extract_json, _normalize_umlauts, _strip_final_punct
@@ -28,6 +29,7 @@ __all__ = [
 
     # Exceptions
     "AIEvaluationError",
+    "AIServiceUnavailableError",
     "DatabaseError",
     "ValidationError",
     "AuthenticationError",
@@ -37,6 +39,8 @@ __all__ = [
     "ConfigurationError",
     "ProcessingError",
     "TimeoutError",
+    "OperationCancelledError",
+    "TaskQueueFullError",
 
     # Types
     "Exercise",
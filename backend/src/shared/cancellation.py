@@ -0,0 +1,227 @@
+"""
+XplorED - Cooperative Cancellation
+
+This module provides cancellation tokens that carry a deadline and a cancel
+signal from the code that starts a unit of work down to the transports that
+do the slow I/O, following clean architecture principles as outlined in the documentation.
+
+Cancellation Components:
+- CancellationToken: a deadline plus an explicit ``cancel()``; a child token
+  never outlives its parent and is cancelled with it
+- Ambient Token: ``cancel_scope`` binds a token to a context variable, so it
+  reaches the Mistral and TTS transports without threading a parameter
+  through every feature function (the same way the AI call owner travels)
+- Budgeted Timeouts: ``clamp_timeout`` shrinks socket timeouts to the time
+  the caller has left; ``sleep_or_cancel`` replaces ``time.sleep`` in retry
+  loops so a cancelled call stops waiting at once
+
+Cancellation is cooperative: nothing is interrupted mid-instruction. Work
+notices a cancelled token at its next check (``check_cancelled``) and a
+blocked socket read ends at the latest when its clamped timeout expires.
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from shared.exceptions import OperationCancelledError
+
+T = TypeVar("T")
+Timeout = Union[float, Tuple[float, float]]
+
+
+# === Cancellation Token ===
+class CancellationToken:
+    """A cancel signal with an optional deadline, shared by all work started for one call."""
+
+    def __init__(self, timeout: Optional[float] = None, parent: Optional["CancellationToken"] = None):
+        """
+        Initialize a token.
+
+        Args:
+            timeout: Seconds from now until the token cancels itself
+            parent: Token whose deadline and cancellation this one inherits
+        """
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self.reason: Optional[str] = None
+
+        deadlines = [time.monotonic() + timeout] if timeout is not None else []
+        if parent is not None and parent.deadline is not None:
+            deadlines.append(parent.deadline)
+        self.deadline: Optional[float] = min(deadlines) if deadlines else None
+
+        if parent is not None:
+            parent.on_cancel(lambda: self.cancel(parent.reason or "parent cancelled"))
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the token was cancelled or its deadline has passed."""
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel("deadline exceeded")
+            return True
+        return False
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """
+        Cancel the token and run its callbacks (once).
+
+        Args:
+            reason: Why the work was cancelled; shown in the raised error
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` when the token is cancelled (immediately if it already is)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left until the deadline, ``0`` once cancelled, ``None`` without a deadline."""
+        if self.cancelled:
+            return 0.0
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise if the work should stop.
+
+        Raises:
+            OperationCancelledError: When the token is cancelled or past its deadline
+        """
+        if self.cancelled:
+            raise OperationCancelledError(f"Operation cancelled: {self.reason}")
+
+    def wait(self, seconds: float) -> bool:
+        """
+        Sleep up to ``seconds``, waking early on cancellation or at the deadline.
+
+        Returns:
+            bool: True if the token is cancelled when the wait ends
+        """
+        remaining = self.remaining()
+        if remaining is not None:
+            seconds = min(seconds, remaining)
+        self._event.wait(max(0.0, seconds))
+        return self.cancelled
+
+
+# === Ambient Token ===
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "cancellation_token", default=None
+)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """Return the token bound to the current context, if any."""
+    return _current_token.get()
+
+
+@contextmanager
+def cancel_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """
+    Bind ``token`` for the duration of the block.
+
+    Args:
+        token: Token that transports and ``check_cancelled`` will observe
+
+    Yields:
+        CancellationToken: The bound token
+    """
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def check_cancelled() -> None:
+    """
+    Raise if the current context's token is cancelled (no-op without a token).
+
+    Raises:
+        OperationCancelledError: When the bound token is cancelled or past its deadline
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def clamp_timeout(timeout: T) -> T:
+    """
+    Shrink a socket timeout to the current token's remaining budget.
+
+    Args:
+        timeout: Seconds, or a ``(connect, read)`` tuple as ``requests`` takes it
+
+    Returns:
+        The timeout, with every part capped at the time left
+
+    Raises:
+        OperationCancelledError: When no time is left
+    """
+    token = _current_token.get()
+    if token is None:
+        return timeout
+    token.raise_if_cancelled()
+    remaining = token.remaining()
+    if remaining is None:
+        return timeout
+    if isinstance(timeout, tuple):
+        return tuple(min(part, remaining) for part in timeout)  # type: ignore[return-value]
+    return min(timeout, remaining)  # type: ignore[type-var,return-value]
+
+
+def sleep_or_cancel(seconds: float) -> None:
+    """
+    Sleep like ``time.sleep`` unless the current token cancels first.
+
+    A wait that would outlast the deadline fails immediately instead of
+    sleeping into it.
+
+    Raises:
+        OperationCancelledError: When the token is (or would be) cancelled during the wait
+    """
+    token = _current_token.get()
+    if token is None:
+        time.sleep(seconds)
+        return
+    remaining = token.remaining()
+    if remaining is not None and seconds >= remaining:
+        token.raise_if_cancelled()
+        raise OperationCancelledError("Operation cancelled: deadline would pass while backing off")
+    if token.wait(seconds):
+        token.raise_if_cancelled()
+
+
+# === Export Configuration ===
+__all__ = [
+    "CancellationToken",
+    "current_token",
+    "cancel_scope",
+    "check_cancelled",
+    "clamp_timeout",
+    "sleep_or_cancel",
+]
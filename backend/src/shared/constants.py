@@ -17,6 +17,8 @@ Constants are organized by domain:
 For detailed architecture information, see: docs/backend_structure.md
 """
 
+import os
+
 # === Database Constants ===
 DEFAULT_TOPICS = [
     "general", "family", "weather", "food", "travel",
@@ -24,7 +26,8 @@ DEFAULT_TOPICS = [
 ]
 
 # === AI Configuration ===
-MISTRAL_API_URL = "https://api.mistral.ai/v1/chat/completions"
+# Overridable to point at a local stub (see scripts/ai_stub_servers.py)
+MISTRAL_API_URL = os.getenv("MISTRAL_API_URL", "https://api.mistral.ai/v1/chat/completions")
 MISTRAL_MODEL = "mistral-large-latest"
 
 # === Spaced Repetition Algorithm ===
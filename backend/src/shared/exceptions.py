@@ -11,9 +11,11 @@ Exception Hierarchy:
   - ValidationError: Input validation failures
   - AuthenticationError: Authentication and authorization failures
   - AIEvaluationError: AI evaluation and processing failures
+    - AIServiceUnavailableError: AI service short-circuited by the circuit breaker
   - ExerciseGenerationError: Exercise creation and generation failures
   - TopicMemoryError: Spaced repetition and memory operation failures
   - TimeoutError: Operation timeout failures
+    - OperationCancelledError: Work stopped by its cancellation token
   - ProcessingError: General processing failures
 
 For detailed architecture information, see: docs/backend_structure.md
@@ -55,6 +57,11 @@ class AIEvaluationError(XplorEDException):
     pass
 
 
+class AIServiceUnavailableError(AIEvaluationError):
+    """Raised without calling the AI service while its circuit breaker is open."""
+    pass
+
+
 class ExerciseGenerationError(XplorEDException):
     """Raised when exercise generation or creation fails."""
     pass
@@ -76,6 +83,16 @@ class TimeoutError(XplorEDException):
     pass
 
 
+class OperationCancelledError(TimeoutError):
+    """Raised when work notices its cancellation token was cancelled or ran out of time."""
+    pass
+
+
+class TaskQueueFullError(ProcessingError):
+    """Raised when a background task queue is full and the task is not accepted."""
+    pass
+
+
 # === Export Configuration ===
 __all__ = [
     "XplorEDException",
@@ -84,8 +101,11 @@ __all__ = [
     "ValidationError",
     "AuthenticationError",
     "AIEvaluationError",
+    "AIServiceUnavailableError",
     "ExerciseGenerationError",
     "TopicMemoryError",
     "ProcessingError",
     "TimeoutError",
+    "OperationCancelledError",
+    "TaskQueueFullError",
 ]
@@ -0,0 +1,67 @@
+"""
+XplorED - Background Job Worker
+
+This module is the entry point of the standalone job worker, which runs the
+durable AI pipelines (translation jobs, feedback generation, exercise
+evaluation) outside the web workers.
+
+Worker Components:
+- App Bootstrap: loads the same environment and Flask app as ``main.py``, so
+  every job handler is registered and jobs run inside an app context
+- Consumers: ``--concurrency`` threads claim jobs from Redis (or the SQLite
+  fallback table) and acknowledge them after success
+- Graceful Shutdown: SIGTERM/SIGINT stop claiming; running jobs get
+  ``--drain-timeout`` seconds, anything unfinished is reclaimed by another
+  worker once its lease expires
+
+Web processes only enqueue when ``DURABLE_JOBS=true``; run at least one
+worker alongside them:
+    cd backend/src && DURABLE_JOBS=true python worker.py --concurrency 4
+
+For detailed architecture information, see: docs/backend_structure.md
+"""
+
+import argparse
+import logging
+import os
+import signal
+import threading
+
+from main import app
+from core.processing.job_queue import JOB_VISIBILITY_TIMEOUT, JobWorker
+
+logger = logging.getLogger(__name__)
+
+
+# === Main Entry Point ===
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Consume the durable XplorED job queue.")
+    parser.add_argument(
+        "--concurrency", type=int, default=int(os.getenv("JOB_WORKER_CONCURRENCY", "4")),
+        help="Consumer threads (default: JOB_WORKER_CONCURRENCY or 4)",
+    )
+    parser.add_argument(
+        "--drain-timeout", type=float, default=float(JOB_VISIBILITY_TIMEOUT),
+        help="Seconds running jobs may take to finish on shutdown",
+    )
+    args = parser.parse_args()
+
+    worker = JobWorker(app=app, concurrency=args.concurrency)
+    stop = threading.Event()
+
+    def request_stop(signum, _frame) -> None:
+        logger.info(f"Received signal {signum}, draining job worker")
+        stop.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    worker.start()
+    print(f"🧵 Job worker running with {args.concurrency} threads (Ctrl+C to stop)")
+    while not stop.wait(1):
+        pass
+    worker.stop(timeout=args.drain_timeout)
+
+
+if __name__ == "__main__":
+    main()
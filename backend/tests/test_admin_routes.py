@@ -0,0 +1,32 @@
+"""Admin routes: deleting a user removes every table keyed by the username."""
+
+from api.routes import admin as admin_routes
+from core.database.connection import execute_query, fetch_one
+
+USER_TABLES = ("users", "results", "user_game_stats", "user_daily_activity", "user_achievements")
+
+
+def test_delete_user_removes_rollups_and_achievements(client, monkeypatch, username):
+    monkeypatch.setattr(admin_routes, "is_admin", lambda: True)
+    execute_query("INSERT INTO users (username, password) VALUES (?, 'x');", (username,))
+    execute_query("INSERT INTO results (username, level, correct, answer) VALUES (?, 1, 1, '');", (username,))
+    execute_query(
+        "INSERT INTO user_daily_activity (username, activity_date, total_activities) VALUES (?, '2026-01-01', 1);",
+        (username,),
+    )
+    execute_query(
+        "INSERT INTO user_achievements (username, achievement_id, unlocked_at) VALUES (?, 'first_game', '2026-01-01');",
+        (username,),
+    )
+
+    response = client.delete(f"/api/admin/users/{username}")
+
+    assert response.status_code == 200
+    for table in USER_TABLES:
+        assert not fetch_one(table, "WHERE username = ?", (username,)), table
+
+
+def test_delete_unknown_user_is_not_found(client, monkeypatch, username):
+    monkeypatch.setattr(admin_routes, "is_admin", lambda: True)
+
+    assert client.delete(f"/api/admin/users/{username}").status_code == 404
@@ -0,0 +1,86 @@
+"""Background executor: bounded queues, priorities and draining."""
+
+import contextvars
+import threading
+
+import pytest
+
+from core.processing.background import TaskExecutor
+from shared.exceptions import TaskQueueFullError
+
+request_user = contextvars.ContextVar("request_user", default=None)
+
+
+@pytest.fixture
+def gate():
+    """An event that blocking tasks wait on; always opened at teardown."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def _busy_executor(gate, queues):
+    """A one-worker executor whose worker is held by a task on the first queue."""
+    executor = TaskExecutor(workers=1, queues=queues)
+    started = threading.Event()
+    executor.submit(next(iter(queues)), lambda: started.set() or gate.wait(5))
+    assert started.wait(5)
+    return executor
+
+
+def test_full_queue_rejects_without_waiting(gate):
+    executor = _busy_executor(gate, {"default": (0, 2, 1)})
+    executor.submit("default", lambda: None, timeout=0)
+    executor.submit("default", lambda: None, timeout=0)
+
+    with pytest.raises(TaskQueueFullError):
+        executor.submit("default", lambda: None, timeout=0)
+    assert executor.stats()["queues"]["default"]["rejected"] == 1
+
+
+def test_full_queue_accepts_once_room_frees_up(gate):
+    executor = _busy_executor(gate, {"default": (0, 1, 1)})
+    executor.submit("default", lambda: "queued", timeout=0)
+
+    # Opening the gate lets the worker take the queued task, freeing its slot
+    threading.Timer(0.05, gate.set).start()
+    future = executor.submit("default", lambda: "waited", timeout=5)
+
+    assert future.result(5) == "waited"
+    assert executor.stats()["queues"]["default"]["rejected"] == 0
+
+
+def test_full_queue_does_not_block_other_queues(gate):
+    executor = _busy_executor(gate, {"interactive": (0, 4, 1), "prefetch": (1, 1, 1)})
+    executor.submit("prefetch", lambda: None, timeout=0)
+
+    with pytest.raises(TaskQueueFullError):
+        executor.submit("prefetch", lambda: None, timeout=0)
+    executor.submit("interactive", lambda: None, timeout=0)
+
+
+def test_higher_priority_queue_runs_first(gate):
+    executor = _busy_executor(gate, {"interactive": (0, 4, 1), "prefetch": (1, 4, 1)})
+    order = []
+    done = executor.submit("prefetch", order.append, "prefetch")
+    executor.submit("interactive", order.append, "interactive")
+
+    gate.set()
+    done.result(5)
+    assert order == ["interactive", "prefetch"]
+
+
+def test_drain_finishes_work_and_rejects_new_tasks():
+    executor = TaskExecutor(workers=2, queues={"default": (0, 8, 2)})
+    request_user.set("anna")
+    futures = [executor.submit("default", request_user.get) for _ in range(4)]
+
+    assert executor.drain(timeout=5)
+    assert [future.result(0) for future in futures] == ["anna"] * 4
+    with pytest.raises(TaskQueueFullError):
+        executor.submit("default", lambda: None, timeout=0)
+
+
+def test_unknown_queue_is_an_error():
+    with pytest.raises(ValueError):
+        TaskExecutor(workers=1, queues={"default": (0, 1, 1)}).submit("bulk", lambda: None)
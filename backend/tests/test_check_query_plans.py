@@ -0,0 +1,19 @@
+"""Query plan checker: every registered hot-path query uses an index on the migrated schema."""
+
+import os
+import sqlite3
+
+import check_query_plans
+
+
+def test_registered_queries_use_indexes():
+    queries = check_query_plans.QUERY_REGISTRY + check_query_plans.load_app_queries()
+    conn = sqlite3.connect(os.environ["DB_FILE"])
+    try:
+        report = check_query_plans.check_query_plans(conn, queries)
+    finally:
+        conn.close()
+
+    assert {entry["name"] for entry in report} >= {"lesson_catalog_page", "exercise_pool_pick", "job_queue_claim"}
+    failures = [entry for entry in report if entry["error"] or entry["full_scans"]]
+    assert [(entry["name"], entry["error"], entry["full_scans"]) for entry in failures] == []
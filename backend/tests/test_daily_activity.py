@@ -0,0 +1,66 @@
+"""Daily activity rollup: incremental updates must match a rebuild from the raw tables."""
+
+import datetime
+
+from core.database.connection import execute_query
+from core.services import DailyActivityService
+from features.progress.progress_tracking import track_lesson_progress
+
+COMPARED = tuple(DailyActivityService.COUNTER_DEFAULTS) + ("activity_hours",)
+
+
+def _rollup(username):
+    rows = DailyActivityService.get_daily_activity(username, datetime.datetime(2000, 1, 1))
+    # Days whose activity moved elsewhere keep an all-zero row; the backfill writes none
+    return {
+        row["activity_date"]: {column: row[column] for column in COMPARED}
+        for row in rows
+        if row["total_activities"]
+    }
+
+
+def test_lesson_saves_match_backfill(username):
+    # A block first saved on an earlier day, counted by the backfill there
+    execute_query(
+        "INSERT INTO lesson_progress (user_id, lesson_id, block_id, completed, updated_at) VALUES (?, ?, ?, ?, ?)",
+        (username, 1, "b1", 0, datetime.datetime(2026, 1, 5, 9, 30)),
+    )
+    DailyActivityService.backfill(username)
+
+    # Saving blocks again moves their contribution instead of adding to it
+    assert track_lesson_progress(username, 1, "b1", True)
+    assert track_lesson_progress(username, 1, "b1", True)
+    assert track_lesson_progress(username, 1, "b2", False)
+    assert track_lesson_progress(username, 1, "b2", True)
+
+    incremental = _rollup(username)
+    DailyActivityService.backfill(username)
+    assert incremental == _rollup(username)
+
+    today = datetime.datetime.utcnow().strftime("%Y-%m-%d")
+    assert incremental[today]["lesson_updates"] == 2
+    assert incremental[today]["lesson_blocks_completed"] == 2
+    assert "2026-01-05" not in incremental
+
+
+def test_exercise_activity_matches_backfill(username):
+    occurred_at = datetime.datetime(2026, 2, 1, 18, 0)
+    for score, total in ((3, 4), (5, 5)):
+        execute_query(
+            "INSERT INTO activity_progress (username, activity_type, score, total_questions, completed_at) "
+            "VALUES (?, 'exercise', ?, ?, ?)",
+            (username, score, total, occurred_at),
+        )
+        assert DailyActivityService.record_activity(
+            username, "exercise", occurred_at=occurred_at, score=score, total_questions=total
+        )
+
+    incremental = _rollup(username)
+    DailyActivityService.backfill(username)
+    assert incremental == _rollup(username)
+    assert incremental["2026-02-01"]["exercises"] == 2
+
+
+def test_lesson_activity_is_not_recorded_generically(username):
+    assert not DailyActivityService.record_activity(username, "lesson", completed=1)
+    assert _rollup(username) == {}
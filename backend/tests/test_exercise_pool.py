@@ -0,0 +1,107 @@
+"""Exercise pool: serving pre-generated blocks without repeating seen questions."""
+
+import pytest
+
+from core.database.connection import execute_query
+from features.ai.generation import exercise_pool
+from features.ai.generation.exercise_pool import (
+    DEFAULT_POOL_TOPIC,
+    add_pool_block,
+    pool_size,
+    pool_topics,
+    take_pool_block,
+    validate_pool_block,
+)
+
+LEVEL = 0
+CEFR = exercise_pool.cefr_for_level(LEVEL)
+
+
+@pytest.fixture(autouse=True)
+def pool(monkeypatch):
+    """An enabled, empty pool whose refills are recorded instead of generated."""
+    refills = []
+    monkeypatch.setattr(exercise_pool, "EXERCISE_POOL_ENABLED", True)
+    monkeypatch.setattr(exercise_pool, "schedule_pool_refill", lambda level, topic, force=False: refills.append((level, topic)))
+    exercise_pool._ensure_table()
+    execute_query(f"DELETE FROM {exercise_pool.POOL_TABLE};")
+    return refills
+
+
+def _block(name):
+    block = validate_pool_block(
+        {
+            "title": name,
+            "exercises": [
+                {"type": "translation", "question": f"{name} sentence {index}", "correctAnswer": f"{name} {index}"}
+                for index in range(3)
+            ],
+        },
+        CEFR,
+    )
+    assert block is not None
+    return block
+
+
+def _add(name, topic=DEFAULT_POOL_TOPIC):
+    assert add_pool_block(CEFR, topic, _block(name))
+
+
+def test_blocks_with_seen_questions_are_skipped(pool):
+    _add("first")
+    _add("second")
+
+    # Seen questions match regardless of case and spacing
+    served = take_pool_block(LEVEL, [], ["  FIRST   sentence 1"])
+
+    assert served["title"] == "second"
+    assert pool == [(CEFR, DEFAULT_POOL_TOPIC)]
+
+
+def test_least_served_unseen_block_comes_first():
+    _add("first")
+    _add("second")
+
+    titles = [take_pool_block(LEVEL, [], [])["title"] for _ in range(3)]
+
+    assert titles == ["first", "second", "first"]
+
+
+def test_every_block_seen_is_a_miss(pool):
+    _add("first")
+
+    assert take_pool_block(LEVEL, [], ["first sentence 0"]) is None
+    assert pool == [(CEFR, DEFAULT_POOL_TOPIC)]
+    assert pool_size(CEFR, DEFAULT_POOL_TOPIC) == 1
+
+
+def test_weak_curriculum_topic_is_served_first():
+    topic = pool_topics(CEFR)[0]
+    _add("general")
+    _add("weak", topic)
+    memory = [
+        {"grammar": topic.upper(), "ease_factor": 1.3, "quality": 1},
+        {"grammar": "made up topic", "ease_factor": 1.0, "quality": 0},
+    ]
+
+    assert take_pool_block(LEVEL, memory, [])["title"] == "weak"
+
+
+def test_block_is_dropped_after_its_serve_limit(monkeypatch):
+    monkeypatch.setattr(exercise_pool, "EXERCISE_POOL_MAX_SERVES", 1)
+    _add("first")
+
+    assert take_pool_block(LEVEL, [], [])["title"] == "first"
+    assert pool_size(CEFR, DEFAULT_POOL_TOPIC) == 0
+
+
+def test_pool_rejects_repeated_questions():
+    _add("first")
+    assert not add_pool_block(CEFR, DEFAULT_POOL_TOPIC, _block("first"))
+
+
+def test_disabled_pool_serves_nothing(monkeypatch):
+    _add("first")
+    monkeypatch.setattr(exercise_pool, "EXERCISE_POOL_ENABLED", False)
+
+    assert take_pool_block(LEVEL, [], []) is None
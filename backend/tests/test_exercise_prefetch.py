@@ -0,0 +1,118 @@
+"""Next-block prefetch: one per user, and no write over blocks changed meanwhile."""
+
+import json
+
+import pytest
+
+from core.database.connection import fetch_one
+from features.ai.generation import exercise_creation
+from features.ai.generation.exercise_creation import prefetch_next_exercises, store_user_ai_data
+from features.ai.generation.exercise_prefetch import prefetch_coordinator
+from shared.exceptions import TaskQueueFullError
+
+
+def _block(block_id):
+    return {"id": block_id, "exercises": [{"id": "ex1", "question": f"{block_id} question"}]}
+
+
+def _blocks(username):
+    row = fetch_one("ai_user_data", "WHERE username = ?", (username,), columns="exercises, next_exercises")
+    return json.loads(row["exercises"])["id"], json.loads(row["next_exercises"])["id"]
+
+
+@pytest.fixture
+def generator(monkeypatch, username):
+    """Run prefetches inline; ``generator.during`` runs while the new block is generated."""
+    class Generator:
+        calls = 0
+        during = None
+
+    def create_block(user):
+        Generator.calls += 1
+        if Generator.during:
+            Generator.during()
+        return _block(f"generated-{Generator.calls}")
+
+    monkeypatch.setattr(exercise_creation, "submit_task", lambda queue, func, timeout=None: func())
+    monkeypatch.setattr(exercise_creation, "get_recent_exercise_questions", lambda user: [])
+    monkeypatch.setattr(exercise_creation, "_create_ai_block", create_block)
+    store_user_ai_data(username, {"exercises": json.dumps(_block("current")), "next_exercises": json.dumps(_block("next"))})
+    return Generator
+
+
+def _stat(name):
+    return prefetch_coordinator.stats()[name]
+
+
+def test_prefetch_promotes_next_block(generator, username):
+    stored = _stat("stored")
+
+    prefetch_next_exercises(username, completed_block_id="current")
+
+    assert _blocks(username) == ("next", "generated-1")
+    assert _stat("stored") == stored + 1
+
+
+def test_blocks_changed_during_generation_are_kept(generator, username):
+    conflicts, stored = _stat("conflicts"), _stat("stored")
+    # A request replaces the current block while the prefetch is generating
+    generator.during = lambda: store_user_ai_data(username, {"exercises": json.dumps(_block("replaced"))})
+
+    prefetch_next_exercises(username, completed_block_id="current")
+
+    assert _blocks(username) == ("replaced", "next")
+    assert _stat("conflicts") == conflicts + 1
+    assert _stat("stored") == stored
+    assert prefetch_coordinator.acquire(username)
+    prefetch_coordinator.release(username)
+
+
+def test_user_already_past_the_completed_block_is_skipped(generator, username):
+    skipped = _stat("skipped_ready")
+
+    prefetch_next_exercises(username, completed_block_id="older")
+
+    assert generator.calls == 0
+    assert _blocks(username) == ("current", "next")
+    assert _stat("skipped_ready") == skipped + 1
+
+
+def test_prefetch_without_a_completed_block_keeps_a_ready_next_block(generator, username):
+    skipped = _stat("skipped_ready")
+
+    prefetch_next_exercises(username)
+
+    assert generator.calls == 0
+    assert _blocks(username) == ("current", "next")
+    assert _stat("skipped_ready") == skipped + 1
+
+
+def test_prefetch_without_a_completed_block_fills_a_missing_next_block(generator, username):
+    store_user_ai_data(username, {"next_exercises": json.dumps({})})
+
+    prefetch_next_exercises(username)
+
+    assert _blocks(username) == ("current", "generated-1")
+
+
+def test_second_prefetch_for_a_user_is_dropped(generator, username):
+    assert prefetch_coordinator.acquire(username)
+    try:
+        prefetch_next_exercises(username, completed_block_id="current")
+    finally:
+        prefetch_coordinator.release(username)
+
+    assert generator.calls == 0
+    assert _blocks(username) == ("current", "next")
+
+
+def test_full_queue_releases_the_slot(monkeypatch, username):
+    def reject(queue, func, timeout=None):
+        raise TaskQueueFullError("prefetch queue full")
+
+    monkeypatch.setattr(exercise_creation, "submit_task", reject)
+
+    prefetch_next_exercises(username)
+
+    assert prefetch_coordinator.acquire(username)
+    prefetch_coordinator.release(username)
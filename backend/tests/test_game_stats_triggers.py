@@ -0,0 +1,91 @@
+"""Game aggregate triggers: live user_game_stats rows must equal a fresh backfill."""
+
+import random
+import sqlite3
+
+import pytest
+import versioned_migrations
+
+from core.database.connection import execute_query, fetch_one
+from features.admin.user_management import delete_user_data
+
+STATS = "SELECT username, total_rounds, correct_answers, highest_level, current_streak, best_streak, first_played, last_played FROM user_game_stats ORDER BY username"
+LEVEL_STATS = "SELECT username, level, total_rounds, correct_answers, highest_level, current_streak, best_streak, first_played, last_played FROM user_game_level_stats ORDER BY username, level"
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE results (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT, level INTEGER, "
+        "correct INTEGER, answer TEXT, timestamp TEXT)"
+    )
+    conn.execute("CREATE TABLE users (username TEXT PRIMARY KEY)")
+    versioned_migrations.apply_versioned_migrations(conn)
+    yield conn
+    conn.close()
+
+
+def _snapshot(conn):
+    return conn.execute(STATS).fetchall(), conn.execute(LEVEL_STATS).fetchall()
+
+
+def _rebuilt(conn):
+    conn.execute("DELETE FROM user_game_stats")
+    conn.execute("DELETE FROM user_game_level_stats")
+    conn.execute(versioned_migrations._game_stats_backfill_sql("user_game_stats", ["username"]))
+    conn.execute(versioned_migrations._game_stats_backfill_sql("user_game_level_stats", ["username", "level"]))
+    return _snapshot(conn)
+
+
+def _play(conn, username, level, correct, timestamp):
+    return conn.execute(
+        "INSERT INTO results (username, level, correct, timestamp) VALUES (?, ?, ?, ?)",
+        (username, level, correct, timestamp),
+    ).lastrowid
+
+
+def test_in_order_rounds_fold_streaks(conn):
+    for day, correct in enumerate((1, 1, 0, 1, 1, 1), start=10):
+        _play(conn, "anna", 1, correct, f"2026-01-{day}")
+
+    (row,), _ = _snapshot(conn)
+    assert row == ("anna", 6, 5, 1, 3, 3, "2026-01-10", "2026-01-15")
+
+
+def test_backdated_insert_and_delete_recompute(conn):
+    _play(conn, "anna", 0, 1, "2026-01-10")
+    wrong = _play(conn, "anna", 0, 0, "2026-01-11")
+    _play(conn, "anna", 0, 1, "2026-01-12")
+    # An earlier round arriving late must not be folded in as the latest one
+    _play(conn, "anna", 2, 1, "2026-01-05")
+    conn.execute("DELETE FROM results WHERE id = ?", (wrong,))
+
+    live = _snapshot(conn)
+    assert live[0][0][4] == 3  # current streak spans the deleted wrong answer
+    assert live == _rebuilt(conn)
+
+
+def test_random_history_matches_backfill(conn):
+    rng = random.Random(7)
+    for _ in range(300):
+        if rng.random() < 0.2:
+            row = conn.execute("SELECT id FROM results ORDER BY random() LIMIT 1").fetchone()
+            if row:
+                conn.execute("DELETE FROM results WHERE id = ?", row)
+            continue
+        _play(conn, rng.choice("ab"), rng.randint(0, 2), rng.randint(0, 1), f"2026-01-{rng.randint(10, 28)}")
+
+    assert _snapshot(conn) == _rebuilt(conn)
+
+
+def test_deleting_a_user_drops_their_aggregates(username):
+    for correct in (1, 0, 1):
+        execute_query("INSERT INTO results (username, level, correct, answer) VALUES (?, 1, ?, '')", (username, correct))
+    assert fetch_one("user_game_stats", "WHERE username = ?", (username,))["total_rounds"] == 3
+
+    success, error = delete_user_data(username)
+
+    assert success, error
+    assert not fetch_one("user_game_stats", "WHERE username = ?", (username,))
+    assert not fetch_one("user_game_level_stats", "WHERE username = ?", (username,))
@@ -0,0 +1,172 @@
+"""Durable job queue: retries with backoff, dead-lettering and idempotency on both backends."""
+
+import fakeredis
+import pytest
+
+from core.database.connection import execute_query
+from core.processing import job_queue as job_queue_module
+from core.processing.job_queue import DurableJobQueue, JobWorker, RedisJobBackend, register_job
+
+CLAIM_BLOCK = 0.01
+calls = []
+
+
+@register_job("test.flaky")
+def flaky(fail_times):
+    calls.append("flaky")
+    if calls.count("flaky") <= fail_times:
+        raise RuntimeError("upstream unavailable")
+
+
+@register_job("test.broken")
+def broken():
+    raise ValueError("cannot process")
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(job_queue_module, "JOB_RETRY_BACKOFF", 0)
+    calls.clear()
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def queue(request, monkeypatch):
+    queue = _empty_sqlite_queue(request.param)
+    if request.param == "redis":
+        backend = RedisJobBackend(fakeredis.FakeRedis(decode_responses=True))
+        monkeypatch.setattr(queue, "_redis", lambda: backend)
+    return queue
+
+
+def _empty_sqlite_queue(backend):
+    # Every queue also reads the SQLite table, so start each test without leftovers
+    queue = DurableJobQueue(backend)
+    queue._sqlite._ensure_table()
+    execute_query(f"DELETE FROM {job_queue_module.JOB_TABLE};")
+    return queue
+
+
+def _run_next(queue):
+    job = queue.claim("consumer-1", block=CLAIM_BLOCK)
+    assert job is not None
+    JobWorker(queue=queue).run_job(job, "consumer-1")
+    return job
+
+
+def test_failed_job_is_retried_until_it_succeeds(queue):
+    job_id = queue.enqueue("test.flaky", {"fail_times": 1}, max_attempts=3)
+
+    first = _run_next(queue)
+    second = _run_next(queue)
+
+    assert (first.id, first.attempts) == (job_id, 1)
+    assert (second.id, second.attempts) == (job_id, 2)
+    assert calls == ["flaky", "flaky"]
+    assert queue.claim("consumer-1", block=CLAIM_BLOCK) is None
+    assert queue.dead_letters() == []
+
+
+def test_retry_waits_for_its_backoff(queue, monkeypatch):
+    monkeypatch.setattr(job_queue_module, "JOB_RETRY_BACKOFF", 60)
+    queue.enqueue("test.broken", {}, max_attempts=3)
+
+    _run_next(queue)
+
+    assert queue.claim("consumer-1", block=CLAIM_BLOCK) is None
+
+
+def test_last_failure_goes_to_the_dead_letter_queue(queue):
+    job_id = queue.enqueue("test.broken", {}, max_attempts=2)
+
+    _run_next(queue)
+    _run_next(queue)
+
+    assert queue.claim("consumer-1", block=CLAIM_BLOCK) is None
+    (letter,) = queue.dead_letters()
+    assert letter["id"] == job_id
+    assert "cannot process" in letter["error"]
+
+    assert queue.requeue_dead(job_id)
+    assert _run_next(queue).attempts == 1
+    assert not queue.requeue_dead("missing-job")
+
+
+def test_unknown_kind_is_dead_lettered_at_once(queue):
+    job_id = queue.enqueue("test.unregistered", {}, max_attempts=3)
+
+    _run_next(queue)
+
+    assert [letter["id"] for letter in queue.dead_letters()] == [job_id]
+
+
+def test_duplicate_of_a_queued_job_is_dropped(queue):
+    first = queue.enqueue("test.flaky", {"fail_times": 0}, key="same")
+    assert queue.enqueue("test.flaky", {"fail_times": 0}, key="same") == first
+
+    _run_next(queue)
+
+    # Once the first job finished the key starts a new job
+    assert queue.enqueue("test.flaky", {"fail_times": 0}, key="same") != first
+
+
+def test_sqlite_reclaims_expired_leases(monkeypatch):
+    queue = _empty_sqlite_queue("sqlite")
+    monkeypatch.setattr(job_queue_module, "JOB_VISIBILITY_TIMEOUT", -1)
+    job_id = queue.enqueue("test.flaky", {"fail_times": 0}, max_attempts=2)
+
+    # Each claim's lease is already over, as if its worker had died
+    assert queue.claim("consumer-1", block=0).attempts == 1
+    assert queue.claim("consumer-2", block=0).attempts == 2
+    assert queue.claim("consumer-3", block=0) is None
+    assert [letter["id"] for letter in queue.dead_letters()] == [job_id]
+
+
+def _translation_job(monkeypatch, failures):
+    """Stub the translation handler's AI calls; translating fails ``failures`` times."""
+    from features.translation import translation_jobs
+    from shared.exceptions import AIEvaluationError
+
+    statuses = []
+    attempts = []
+
+    def translate(english):
+        attempts.append(english)
+        if len(attempts) <= failures:
+            raise AIEvaluationError("Mistral API error: 503")
+        return "Der Tisch"
+
+    monkeypatch.setattr(translation_jobs, "translate_to_german", translate)
+    monkeypatch.setattr(translation_jobs, "evaluate_translation_ai", lambda *args: (True, "ok"))
+    monkeypatch.setattr(translation_jobs, "update_memory_async", lambda *args: None)
+    monkeypatch.setattr(translation_jobs, "_update_job_status", lambda job_id, status, result: statuses.append(status))
+    return statuses
+
+
+def test_transient_handler_failure_is_retried(monkeypatch):
+    queue = _empty_sqlite_queue("sqlite")
+    statuses = _translation_job(monkeypatch, failures=1)
+    queue.enqueue("translation", {"job_id": "t1", "english": "the table", "student_input": "der Tisch", "username": "anna"})
+
+    _run_next(queue)
+    assert statuses == []
+    _run_next(queue)
+
+    assert statuses == ["completed"]
+    assert queue.dead_letters() == []
+
+
+def test_handler_records_error_only_on_last_attempt(monkeypatch):
+    # The handler settles the job itself on its last attempt, so nothing is dead-lettered
+    queue = _empty_sqlite_queue("sqlite")
+    statuses = _translation_job(monkeypatch, failures=5)
+    queue.enqueue(
+        "translation", {"job_id": "t2", "english": "the table", "student_input": "", "username": "anna"}, max_attempts=2,
+    )
+
+    _run_next(queue)
+    assert statuses == []
+    _run_next(queue)
+
+    assert statuses == ["error"]
+    assert queue.claim("consumer-1", block=CLAIM_BLOCK) is None
+    assert queue.dead_letters() == []
@@ -0,0 +1,50 @@
+"""Lesson progress routes: block progress written by POST is read back by GET."""
+
+from api.routes import lessons as lesson_routes
+from core.database.connection import execute_query, fetch_one
+
+
+def _create_lesson(num_blocks: int) -> int:
+    row = fetch_one("lesson_content", "", (), columns="COALESCE(MAX(lesson_id), 0) + 1 AS next_id")
+    lesson_id = row["next_id"]
+    execute_query(
+        "INSERT INTO lesson_content (lesson_id, title, published, num_blocks) VALUES (?, 'Test', 1, ?);",
+        (lesson_id, num_blocks),
+    )
+    return lesson_id
+
+
+def test_progress_written_by_post_is_read_back(client, monkeypatch, username):
+    monkeypatch.setattr(lesson_routes, "require_user", lambda: username)
+    lesson_id = _create_lesson(2)
+
+    for block_id, completed in (("block-1", True), ("block-2", False)):
+        response = client.post(
+            f"/api/lessons/{lesson_id}/progress", json={"block_id": block_id, "completed": completed}
+        )
+        assert response.status_code == 200
+
+    response = client.get(f"/api/lessons/{lesson_id}/progress")
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["progress"]["completed_blocks"] == 1
+    assert body["progress"]["completion_percentage"] == 50.0
+    assert body["progress"]["is_completed"] is False
+    assert body["progress"]["last_activity"] is not None
+    assert [(b["block_id"], b["completed"]) for b in body["block_progress"]] == [
+        ("block-1", True),
+        ("block-2", False),
+    ]
+
+
+def test_lesson_without_blocks_is_complete_once_marked(client, monkeypatch, username):
+    monkeypatch.setattr(lesson_routes, "require_user", lambda: username)
+    lesson_id = _create_lesson(0)
+
+    assert client.get(f"/api/lessons/{lesson_id}/progress").get_json()["progress"]["is_completed"] is False
+    assert client.post("/api/mark-as-completed", json={"lesson_id": lesson_id}).status_code == 200
+
+    body = client.get(f"/api/lessons/{lesson_id}/progress").get_json()
+    assert body["progress"]["is_completed"] is True
+    assert body["block_progress"] == []
@@ -0,0 +1,130 @@
+"""Session backends: SQLite and Redis must behave the same behind SessionBackend."""
+
+import time
+import uuid
+
+import fakeredis
+import pytest
+
+from core.database.connection import execute_query
+from core.session.session_backends import (
+    RedisSessionBackend,
+    SessionBackend,
+    SQLiteSessionBackend,
+    create_session_backend,
+)
+
+
+def _expire_sqlite(backend, session_id):
+    execute_query("UPDATE sessions SET expires_at = ? WHERE session_id = ?;", (int(time.time()) - 1, session_id))
+
+
+def _expire_redis(backend, session_id):
+    backend.client.delete(backend._key(session_id))
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def backend(request):
+    if request.param == "sqlite":
+        backend = SQLiteSessionBackend(ttl=600)
+        backend.expire = lambda session_id: _expire_sqlite(backend, session_id)
+    else:
+        backend = RedisSessionBackend(fakeredis.FakeRedis(decode_responses=True), ttl=600)
+        backend.expire = lambda session_id: _expire_redis(backend, session_id)
+    return backend
+
+
+def _session_id():
+    return uuid.uuid4().hex
+
+
+def test_backend_must_implement_every_operation():
+    class Partial(SessionBackend):
+        def create(self, session_id, username):
+            pass
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_create_and_read(backend, username):
+    session_id = _session_id()
+    backend.create(session_id, username)
+
+    assert backend.get_user(session_id) == username
+    info = backend.get_info(session_id)
+    assert info["username"] == username
+    assert info["expires_at"] > time.time()
+    assert backend.get_user(_session_id()) is None
+
+
+def test_delete_single_and_all_user_sessions(backend, username):
+    first, second, third = _session_id(), _session_id(), _session_id()
+    for session_id in (first, second, third):
+        backend.create(session_id, username)
+    assert backend.count_user(username) == 3
+
+    backend.delete(first)
+    assert backend.get_user(first) is None
+    assert backend.count_user(username) == 2
+
+    assert sorted(backend.delete_user(username)) == sorted([second, third])
+    assert backend.count_user(username) == 0
+    assert backend.get_user(second) is None
+
+
+def test_expired_sessions_are_ignored(backend, username):
+    alive, expired = _session_id(), _session_id()
+    backend.create(alive, username)
+    backend.create(expired, username)
+
+    backend.expire(expired)
+
+    assert backend.get_user(expired) is None
+    assert backend.get_info(expired) is None
+    assert backend.count_user(username) == 1
+
+
+def test_sqlite_prunes_expired_sessions(username):
+    backend = SQLiteSessionBackend(ttl=600)
+    session_id = _session_id()
+    backend.create(session_id, username)
+    _expire_sqlite(backend, session_id)
+
+    assert backend.prune_expired() >= 1
+    assert backend.delete_user(username) == []
+
+
+def test_factory_falls_back_to_sqlite_without_redis():
+    assert isinstance(create_session_backend("redis"), SQLiteSessionBackend)
+    assert isinstance(create_session_backend("sqlite"), SQLiteSessionBackend)
+
+
+def _redis_over_sqlite():
+    return RedisSessionBackend(fakeredis.FakeRedis(decode_responses=True), ttl=600, fallback=SQLiteSessionBackend(ttl=600))
+
+
+def test_redis_moves_sessions_created_in_sqlite(username):
+    session_id = _session_id()
+    SQLiteSessionBackend(ttl=600).create(session_id, username)
+    backend = _redis_over_sqlite()
+
+    assert backend.count_user(username) == 1
+    assert backend.get_user(session_id) == username
+    assert backend.client.hget(backend._key(session_id), "username") == username
+    assert backend.fallback.get_info(session_id) is None
+    assert backend.get_info(session_id)["username"] == username
+    assert backend.count_user(username) == 1
+
+
+def test_redis_logout_removes_sessions_left_in_sqlite(username):
+    first, second = _session_id(), _session_id()
+    sqlite_backend = SQLiteSessionBackend(ttl=600)
+    sqlite_backend.create(first, username)
+    sqlite_backend.create(second, username)
+    backend = _redis_over_sqlite()
+
+    backend.delete(first)
+    assert backend.get_user(first) is None
+    assert backend.delete_user(username) == [second]
+    assert backend.get_user(second) is None
@@ -0,0 +1,160 @@
+"""Single-flight: which leader outcomes are shared with concurrent callers."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from external.mistral.single_flight import SingleFlight
+from shared.exceptions import OperationCancelledError
+
+KEY = "prompt-key"
+
+
+def _run(flight, fn):
+    """Call ``flight.do`` in a thread; return the thread and its outcome dict."""
+    outcome = {}
+
+    def target():
+        try:
+            outcome["value"] = flight.do(KEY, fn, json.dumps, json.loads, timeout=5)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    return thread, outcome
+
+
+def _with_waiter(flight, leader_fn, waiter_fn):
+    """Start a leader blocked inside its request, attach a waiter, then let the leader finish."""
+    entered, release = threading.Event(), threading.Event()
+
+    def blocked_leader():
+        entered.set()
+        assert release.wait(5)
+        return leader_fn()
+
+    leader, leader_outcome = _run(flight, blocked_leader)
+    assert entered.wait(5)
+    waiter, waiter_outcome = _run(flight, waiter_fn)
+    deadline = time.monotonic() + 5
+    while flight._calls[KEY].waiters < 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    release.set()
+    leader.join(5)
+    waiter.join(5)
+    return leader_outcome, waiter_outcome
+
+
+@pytest.fixture
+def flight():
+    return SingleFlight(enabled=True, use_redis=False)
+
+
+def test_result_is_shared_as_a_copy(flight):
+    result = {"answer": [1, 2]}
+    own_calls = []
+
+    leader, waiter = _with_waiter(flight, lambda: result, lambda: own_calls.append(1))
+
+    assert leader["value"] is result
+    assert waiter["value"] == result and waiter["value"] is not result
+    assert not own_calls
+    assert flight.stats()["shared_local"] == 1
+
+
+def test_request_errors_are_shared(flight):
+    def fail():
+        raise ValueError("bad request")
+
+    leader, waiter = _with_waiter(flight, fail, lambda: pytest.fail("waiter must not send a request"))
+
+    assert isinstance(leader["error"], ValueError)
+    assert waiter["error"] is leader["error"]
+
+
+@pytest.mark.parametrize("error", [OperationCancelledError("client went away"), TimeoutError("read timed out")])
+def test_cancellations_and_timeouts_are_not_shared(flight, error):
+    def give_up():
+        raise error
+
+    leader, waiter = _with_waiter(flight, give_up, lambda: {"answer": "own"})
+
+    assert leader["error"] is error
+    assert waiter == {"value": {"answer": "own"}}
+    stats = flight.stats()
+    assert stats["retries"] == 1
+    assert stats["leaders"] == 2
+    assert stats["in_flight"] == 0
+
+
+def test_disabled_runs_every_call():
+    flight = SingleFlight(enabled=False, use_redis=False)
+    calls = []
+    for _ in range(2):
+        flight.do(KEY, lambda: calls.append(1) or len(calls), str, int)
+    assert len(calls) == 2
+
+
+def _upstream(monkeypatch):
+    """Replace the Mistral transport with one that blocks until released and counts its calls."""
+    from external.mistral import client as mistral_client
+
+    state = {"calls": 0, "release": threading.Event()}
+
+    def post(url, headers, payload, prompt_type="default", stream=False):
+        state["calls"] += 1
+        assert state["release"].wait(5)
+        return mistral_client._cached_response(json.dumps({"answer": state["calls"]}), "MISS")
+
+    monkeypatch.setattr(mistral_client.mistral_transport, "post", post)
+    return state
+
+
+def _concurrent_prompts(state, **options):
+    """Send the same prompt from two threads while the first upstream call is held."""
+    from external.mistral.client import send_prompt
+    from external.mistral.single_flight import single_flight
+
+    prompt = {"role": "user", "content": f"Explain 'der Tisch' ({time.monotonic_ns()})"}
+    responses = []
+    threads = [
+        threading.Thread(target=lambda: responses.append(send_prompt("Explain words.", prompt, temperature=0.3, **options)))
+        for _ in range(2)
+    ]
+    threads[0].start()
+    deadline = time.monotonic() + 5
+    while state["calls"] < 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    threads[1].start()
+    while (
+        state["calls"] < 2
+        and not any(call.waiters for call in list(single_flight._calls.values()))
+        and time.monotonic() < deadline
+    ):
+        time.sleep(0.001)
+    state["release"].set()
+    for thread in threads:
+        thread.join(5)
+    return [response.json() for response in responses]
+
+
+def test_send_prompt_coalesces_cacheable_prompts(monkeypatch):
+    state = _upstream(monkeypatch)
+
+    answers = _concurrent_prompts(state, cache=True)
+
+    assert state["calls"] == 1
+    assert answers == [{"answer": 1}, {"answer": 1}]
+
+
+def test_send_prompt_does_not_coalesce_user_specific_prompts(monkeypatch):
+    state = _upstream(monkeypatch)
+
+    answers = _concurrent_prompts(state)
+
+    assert state["calls"] == 2
+    assert len(answers) == 2
@@ -0,0 +1,27 @@
+"""Versioned migrations: data-preserving steps of the run-once schema changes."""
+
+import sqlite3
+
+import versioned_migrations
+
+
+def test_vocab_duplicates_keep_the_most_reviewed_row():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE vocab_log (username TEXT, vocab TEXT, repetitions INTEGER, ef REAL, "
+        "next_review TEXT, last_review TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO vocab_log VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("anna", "Tisch", 0, 2.5, "2026-01-01", None),
+            ("anna", "Tisch", 4, 2.7, "2026-03-01", "2026-02-01"),
+            ("anna", "Tisch", 4, 2.6, "2026-02-20", "2026-01-20"),
+            ("anna", "Stuhl", 1, 2.5, "2026-01-05", "2026-01-04"),
+            ("ben", "Tisch", None, None, None, None),
+        ],
+    )
+
+    assert versioned_migrations._dedupe_vocab_log(conn.cursor()) == 2
+    rows = conn.execute("SELECT username, vocab, repetitions, ef FROM vocab_log ORDER BY username, vocab").fetchall()
+    assert rows == [("anna", "Stuhl", 1, 2.5), ("anna", "Tisch", 4, 2.7), ("ben", "Tisch", None, None)]